@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Create REPO# claim items for submissions created before claims existed.
+
+Submission ingestion deduplicates repositories with conditional
+``HACK#<id>/REPO#<normalized url>`` items instead of listing every
+submission. Submissions created earlier have no claim, so their
+repositories could be submitted again until this backfill has run. The
+oldest submission of a repository wins the claim; repositories that were
+already submitted more than once are reported.
+
+Usage:
+    TABLE_NAME=VibeJudgeTable python scripts/backfill_repo_claims.py --dry-run
+    TABLE_NAME=VibeJudgeTable python scripts/backfill_repo_claims.py
+"""
+
+import argparse
+import os
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.services.submission_service import SubmissionService  # noqa: E402
+from src.utils.dynamo import DynamoDBHelper  # noqa: E402
+
+
+def iter_submission_items(db: DynamoDBHelper) -> Any:
+    """Yield every SUBMISSION item in the table (paginated scan)."""
+    scan_kwargs: dict[str, Any] = {
+        "FilterExpression": "entity_type = :type",
+        "ExpressionAttributeValues": {":type": "SUBMISSION"},
+    }
+    while True:
+        response = db.table.scan(**scan_kwargs)
+        yield from response.get("Items", [])
+        if "LastEvaluatedKey" not in response:
+            break
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def backfill(db: DynamoDBHelper, dry_run: bool) -> dict[str, Any]:
+    """Claim the repository of every existing submission.
+
+    Args:
+        db: DynamoDB helper
+        dry_run: If True, only count; do not write
+
+    Returns:
+        Claims written, claims that already existed, and repositories
+        submitted more than once per hackathon
+    """
+    submissions: dict[str, list[dict]] = defaultdict(list)
+    for item in iter_submission_items(db):
+        submissions[item["hack_id"]].append(item)
+
+    claimed = 0
+    existing = 0
+    repeated: dict[str, list[str]] = {}
+    for hack_id, items in sorted(submissions.items()):
+        claims: dict[str, str] = {}
+        for item in sorted(items, key=lambda i: i.get("created_at", "")):
+            repo_key = SubmissionService.normalize_repo_url(item["repo_url"])
+            if repo_key in claims:
+                repeated.setdefault(hack_id, []).append(repo_key)
+                continue
+            claims[repo_key] = item["sub_id"]
+
+        if dry_run:
+            claimed += len(claims)
+            continue
+        written, duplicates = db.claim_repo_urls(hack_id, claims)
+        claimed += len(written)
+        existing += len(duplicates)
+
+    return {"claimed": claimed, "existing": existing, "repeated": repeated}
+
+
+def main() -> None:
+    """Run the backfill and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dry-run", action="store_true", help="Count only, do not write")
+    args = parser.parse_args()
+
+    table_name = os.environ.get("TABLE_NAME", "VibeJudgeTable")
+    report = backfill(DynamoDBHelper(table_name), dry_run=args.dry_run)
+
+    verb = "Would claim" if args.dry_run else "Claimed"
+    print(f"{verb}: {report['claimed']}  Already claimed: {report['existing']}")
+    for hack_id, repo_keys in report["repeated"].items():
+        print(f"{hack_id}: submitted more than once: {', '.join(sorted(set(repo_keys)))}")
+
+
+if __name__ == "__main__":
+    main()
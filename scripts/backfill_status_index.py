@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Add status listing index (GSI3) keys to existing hackathon META items.
+
+The public hackathon listing queries GSI3 (``GSI3PK=HACK_STATUS#<status>``).
+``put_hackathon_detail`` sets the keys on every write, but hackathons that
+have not been written since the index was added are missing from the
+listing until this backfill has run.
+
+Usage:
+    TABLE_NAME=VibeJudgeTable python scripts/backfill_status_index.py --dry-run
+    TABLE_NAME=VibeJudgeTable python scripts/backfill_status_index.py
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.utils.dynamo import DynamoDBHelper  # noqa: E402
+
+
+def iter_hackathon_items(db: DynamoDBHelper) -> Any:
+    """Yield every hackathon META item in the table (paginated scan)."""
+    scan_kwargs: dict[str, Any] = {
+        "FilterExpression": "SK = :meta AND begins_with(PK, :hack)",
+        "ExpressionAttributeValues": {":meta": "META", ":hack": "HACK#"},
+    }
+    while True:
+        response = db.table.scan(**scan_kwargs)
+        yield from response.get("Items", [])
+        if "LastEvaluatedKey" not in response:
+            break
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def backfill(db: DynamoDBHelper, dry_run: bool) -> dict[str, int]:
+    """Set GSI3 keys on hackathon items whose keys are missing or outdated.
+
+    Args:
+        db: DynamoDB helper
+        dry_run: If True, only count; do not write
+
+    Returns:
+        Counts of updated and already indexed items
+    """
+    updated = 0
+    current = 0
+    for item in iter_hackathon_items(db):
+        gsi3pk = f"HACK_STATUS#{item.get('status', 'draft')}"
+        gsi3sk = f"{item.get('created_at', '')}#{item['hack_id']}"
+        if item.get("GSI3PK") == gsi3pk and item.get("GSI3SK") == gsi3sk:
+            current += 1
+            continue
+        if not dry_run:
+            db.table.update_item(
+                Key={"PK": item["PK"], "SK": item["SK"]},
+                UpdateExpression="SET GSI3PK = :pk, GSI3SK = :sk",
+                ExpressionAttributeValues={":pk": gsi3pk, ":sk": gsi3sk},
+            )
+        updated += 1
+    return {"updated": updated, "current": current}
+
+
+def main() -> None:
+    """Run the backfill and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dry-run", action="store_true", help="Count only, do not write")
+    args = parser.parse_args()
+
+    table_name = os.environ.get("TABLE_NAME", "VibeJudgeTable")
+    report = backfill(DynamoDBHelper(table_name), dry_run=args.dry_run)
+
+    verb = "Would update" if args.dry_run else "Updated"
+    print(f"{verb}: {report['updated']}  Already indexed: {report['current']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Scaling benchmark for the columnar commit table used by TeamAnalyzer.
+
+Generates synthetic histories (1k to 50k commits by default) and times:
+
+- ``table``: building the ``CommitTable`` columns.
+- ``silos``: knowledge silo detection (sort-merge overlap sweep).
+- ``pairwise``: the previous pairwise silo check, which compared every
+  commit time of an author with every other author's (only run up to
+  ``--pairwise-max`` commits, since it is quadratic).
+- ``analyze``: the full ``TeamAnalyzer.analyze``.
+
+Histories are built so that one author never overlaps anyone else. This is
+the worst case for the pairwise check, because it can never stop early.
+
+Usage:
+    python scripts/benchmark_commit_table.py
+    python scripts/benchmark_commit_table.py --commits 1000 10000 50000 --pairwise-max 10000
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.analysis.commit_table import CommitTable  # noqa: E402
+from src.analysis.team_analyzer import SILO_OVERLAP_WINDOW_SECONDS, TeamAnalyzer  # noqa: E402
+from src.models.analysis import CommitInfo, RepoData  # noqa: E402
+from src.models.submission import RepoMeta  # noqa: E402
+
+_AUTHORS = ["alice", "bob", "carol", "dan", "erin", "frank", "grace", "dependabot[bot]"]
+
+
+def synthetic_history(commits: int, seed: int = 11) -> list[CommitInfo]:
+    """Build a history where "solo" works alone, well apart from everyone else."""
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    history = []
+    for i in range(commits):
+        solo = i % 10 == 0
+        offset = (
+            timedelta(days=400, hours=2 * i) if solo else timedelta(seconds=rng.randint(0, 10**7))
+        )
+        history.append(
+            CommitInfo(
+                hash=f"{i:040x}",
+                short_hash=f"{i:07x}",
+                message=rng.choice(["Add login form validation", "fix", "Refactor api client"]),
+                author="solo" if solo else rng.choice(_AUTHORS),
+                timestamp=start + offset,
+                files_changed=rng.randint(1, 12),
+                insertions=rng.randint(0, 800),
+                deletions=rng.randint(0, 200),
+            )
+        )
+    return history
+
+
+def pairwise_isolated_authors(commits: list[CommitInfo]) -> set[str]:
+    """Reference: authors with no commit within the window of another author's commit."""
+    by_author: dict[str, list[datetime]] = {}
+    for commit in commits:
+        by_author.setdefault(commit.author, []).append(commit.timestamp)
+
+    isolated = set()
+    for author, times in by_author.items():
+        if not any(
+            abs((c_time - o_time).total_seconds()) < SILO_OVERLAP_WINDOW_SECONDS
+            for other, other_times in by_author.items()
+            if other != author
+            for c_time in times
+            for o_time in other_times
+        ):
+            isolated.add(author)
+    return isolated
+
+
+def timed(fn: Callable[[], object], runs: int) -> float:
+    """Return the fastest wall time of ``fn()`` in milliseconds."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def main() -> None:
+    """Run the benchmark and print one row per history size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commits", type=int, nargs="+", default=[1000, 5000, 10000, 50000])
+    parser.add_argument("--pairwise-max", type=int, default=5000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    # structlog prints every analyzer event to stdout by default
+    import structlog
+
+    structlog.configure(logger_factory=structlog.ReturnLoggerFactory())
+
+    analyzer = TeamAnalyzer()
+    print(
+        f"{'commits':>8} {'table':>10} {'silos':>10} {'pairwise':>12} {'analyze':>11} "
+        f"{'silo authors'}"
+    )
+    for size in args.commits:
+        history = synthetic_history(size)
+        repo = RepoData(
+            repo_url="https://github.com/bench/history",
+            repo_owner="bench",
+            repo_name="history",
+            meta=RepoMeta(),
+            commit_history=history,
+        )
+        table = CommitTable(history)
+        silos = analyzer._detect_knowledge_silos(history, table)
+
+        table_ms = timed(lambda h=history: CommitTable(h), args.runs)
+        silos_ms = timed(
+            lambda h=history, t=table: analyzer._detect_knowledge_silos(h, t), args.runs
+        )
+        analyze_ms = timed(lambda r=repo: analyzer.analyze(r), args.runs)
+        if size <= args.pairwise_max:
+            pairwise_ms = f"{timed(lambda h=history: pairwise_isolated_authors(h), 1):>9.1f} ms"
+        else:
+            pairwise_ms = f"{'skipped':>12}"
+
+        print(
+            f"{size:>8} {table_ms:>7.1f} ms {silos_ms:>7.1f} ms {pairwise_ms} "
+            f"{analyze_ms:>8.1f} ms {', '.join(p.contributors[0] for p in silos)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
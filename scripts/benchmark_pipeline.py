@@ -0,0 +1,706 @@
+#!/usr/bin/env python3
+"""Offline end-to-end benchmark of the analysis pipeline.
+
+Runs a real analysis job through ``lambda_handler.handler`` with every
+external service replaced by a local stand-in:
+
+- GitHub repositories: synthetic git repositories generated on disk.
+  Clones of ``https://github.com/...`` are redirected to them by a git
+  ``url.<base>.insteadOf`` rule passed through the environment, so
+  ``clone_and_extract`` runs unchanged.
+- GitHub REST API: a local HTTP server on a background thread that serves
+  workflow runs and workflow files, with configurable latency.
+- Bedrock: a fake ``bedrock-runtime`` client that replays the recorded
+  agent responses in ``tests/fixtures/complete_mock_responses.py``. Latency,
+  jitter and throttling rate are configurable, and throttles go through
+  ``BedrockClient``'s real retry policy.
+- DynamoDB: moto, or DynamoDB Local when ``DYNAMODB_ENDPOINT_URL`` is set.
+
+The job is created with ``AnalysisService.trigger_analysis``. Its shard
+invocations run on a thread pool, like concurrent Lambda invocations.
+Per-stage p50/p95 come from the pipeline traces stored for each submission.
+Throughput is in submissions per minute of wall time, and peak RSS is the
+process high-water mark.
+
+``--save-baseline`` stores the report. ``--baseline`` compares a run with a
+stored report and exits non-zero when a stage's p95, the throughput or the
+peak RSS is worse than the tolerance allows.
+
+Usage:
+    python scripts/benchmark_pipeline.py
+    python scripts/benchmark_pipeline.py --submissions 16 --workers 4 --shard-size 4
+    python scripts/benchmark_pipeline.py --bedrock-latency-ms 800 --bedrock-throttle-rate 0.1
+    python scripts/benchmark_pipeline.py --save-baseline scripts/baselines/pipeline_benchmark.json
+    python scripts/benchmark_pipeline.py --baseline scripts/baselines/pipeline_benchmark.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import re
+import resource
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+import git
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from botocore.exceptions import ClientError  # noqa: E402
+
+from src.utils.github_client import GitHubClient  # noqa: E402
+from tests.fixtures.complete_mock_responses import (  # noqa: E402
+    AI_DETECTION_RESPONSE,
+    BUG_HUNTER_RESPONSE,
+    INNOVATION_RESPONSE,
+    PERFORMANCE_RESPONSE,
+)
+
+TABLE_NAME = "VibeJudgeBenchmark"
+REPO_OWNER = "bench"
+
+# Recorded response per agent, keyed by the start of the agent's system prompt
+AGENT_RESPONSES = (
+    ("You are BugHunter", BUG_HUNTER_RESPONSE),
+    ("You are PerformanceAnalyzer", PERFORMANCE_RESPONSE),
+    ("You are InnovationScorer", INNOVATION_RESPONSE),
+    ("You are AIDetectionAgent", AI_DETECTION_RESPONSE),
+)
+
+WORKFLOW_YAML = """name: CI
+on: [push, pull_request]
+jobs:
+  test:
+    runs-on: ubuntu-latest
+    steps:
+      - uses: actions/checkout@v4
+      - run: pip install -r requirements.txt
+      - run: pytest --cov
+"""
+
+_AUTHORS = ["alice", "bob", "carol", "dan"]
+
+
+@dataclass
+class BenchmarkConfig:
+    """Scenario of one benchmark run."""
+
+    submissions: int = 8
+    workers: int = 2
+    shard_size: int = 4
+    commits: int = 30
+    files: int = 20
+    bedrock_latency_ms: float = 200.0
+    bedrock_jitter: float = 0.25
+    bedrock_throttle_rate: float = 0.0
+    github_latency_ms: float = 20.0
+    seed: int = 7
+
+
+# ============================================================
+# SYNTHETIC REPOSITORIES
+# ============================================================
+
+
+def _module_source(rng: random.Random, name: str, functions: int) -> str:
+    lines = [f'"""{name.replace("_", " ").title()} module."""', ""]
+    for i in range(functions):
+        lines += [
+            f"def {name}_{i}(value):",
+            f"    if value > {rng.randint(0, 100)}:",
+            f"        return value * {rng.randint(2, 9)}",
+            "    return value",
+            "",
+        ]
+    return "\n".join(lines)
+
+
+def create_synthetic_repo(path: Path, seed: int, commits: int, files: int) -> None:
+    """Create a git repository with a small Python project and a multi-author history.
+
+    Args:
+        path: Repository directory (created)
+        seed: Seed for contents, authors and commit times
+        commits: Number of commits
+        files: Number of source modules
+    """
+    rng = random.Random(seed)
+    repo = git.Repo.init(path, initial_branch="main")
+    authors = _AUTHORS[: rng.randint(1, len(_AUTHORS))]
+    start = datetime(2026, 3, 1, 9, tzinfo=UTC)
+
+    (path / ".github" / "workflows").mkdir(parents=True)
+    (path / ".github" / "workflows" / "ci.yml").write_text(WORKFLOW_YAML)
+    (path / "README.md").write_text(f"# Team {seed}\n\nA synthetic hackathon submission.\n")
+    (path / "src").mkdir()
+    (path / "tests").mkdir()
+
+    pending = [".github/workflows/ci.yml", "README.md"]
+    for i in range(commits):
+        module = f"module_{rng.randrange(files)}"
+        source = f"src/{module}.py"
+        (path / source).write_text(_module_source(rng, module, rng.randint(3, 15)))
+        pending.append(source)
+        if rng.random() < 0.4:
+            test = f"tests/test_{module}.py"
+            (path / test).write_text(f"from src.{module} import *\n\n\ndef test_{module}():\n")
+            pending.append(test)
+
+        repo.index.add(pending)
+        pending = []
+        author = rng.choice(authors)
+        actor = git.Actor(author, f"{author}@example.com")
+        when = (start + timedelta(minutes=37 * i)).strftime("%Y-%m-%dT%H:%M:%S")
+        repo.index.commit(
+            rng.choice(["Add feature", "Fix edge case", "Refactor module", "Add tests"]),
+            author=actor,
+            committer=actor,
+            author_date=when,
+            commit_date=when,
+        )
+
+
+# ============================================================
+# FAKE SERVICES
+# ============================================================
+
+
+class FakeGitHub:
+    """Local GitHub REST API serving workflow runs and workflow files."""
+
+    def __init__(self, latency_ms: float = 0.0) -> None:
+        """Bind the server to a free local port.
+
+        Args:
+            latency_ms: Delay added to every response
+        """
+        self.latency_s = latency_ms / 1000
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        """Serve on a background thread."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Shut the server down."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def respond(self, path: str) -> tuple[int, str, str]:
+        """Return (status, content type, body) for a request path."""
+        with self._lock:
+            self.requests += 1
+        time.sleep(self.latency_s)
+
+        runs = re.fullmatch(r"/repos/([^/]+)/([^/]+)/actions/runs", path)
+        if runs:
+            created = datetime(2026, 3, 2, tzinfo=UTC)
+            workflow_runs = [
+                {
+                    "id": 1000 + i,
+                    "name": "CI",
+                    "status": "completed",
+                    "conclusion": "success" if i % 4 else "failure",
+                    "created_at": (created + timedelta(hours=i)).isoformat(),
+                    "updated_at": (created + timedelta(hours=i, minutes=3)).isoformat(),
+                    "run_attempt": 1,
+                }
+                for i in range(10)
+            ]
+            return 200, "application/json", json.dumps({"workflow_runs": workflow_runs})
+
+        workflows = re.fullmatch(r"/repos/([^/]+)/([^/]+)/contents/\.github/workflows", path)
+        if workflows:
+            owner, repo = workflows.groups()
+            listing = [{"name": "ci.yml", "download_url": f"{self.url}/raw/{owner}/{repo}/ci.yml"}]
+            return 200, "application/json", json.dumps(listing)
+
+        if re.fullmatch(r"/raw/[^/]+/[^/]+/ci\.yml", path):
+            return 200, "text/yaml", WORKFLOW_YAML
+
+        return 404, "application/json", json.dumps({"message": "Not Found"})
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:  # noqa: N802
+                status, content_type, body = fake.respond(urlsplit(self.path).path)
+                payload = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+                pass
+
+        return Handler
+
+
+class FakeBedrockRuntime:
+    """Stand-in for the ``bedrock-runtime`` client's ``converse`` and ``converse_stream`` calls."""
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        jitter: float = 0.0,
+        throttle_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        """Configure the simulated service.
+
+        Args:
+            latency_ms: Mean response latency
+            jitter: Latency varies uniformly by +/- this fraction
+            throttle_rate: Share of calls rejected with ThrottlingException
+            seed: Seed for latency and throttling draws
+        """
+        self.latency_s = latency_ms / 1000
+        self.jitter = jitter
+        self.throttle_rate = throttle_rate
+        self.calls = 0
+        self.throttled = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def converse(self, **kwargs: Any) -> dict[str, Any]:
+        """Return the recorded response for the calling agent after the simulated latency.
+
+        Raises:
+            ClientError: ThrottlingException, at the configured rate
+        """
+        with self._lock:
+            self.calls += 1
+            factor = self._rng.uniform(1 - self.jitter, 1 + self.jitter)
+            throttled = self._rng.random() < self.throttle_rate
+            if throttled:
+                self.throttled += 1
+        time.sleep(self.latency_s * factor)
+        if throttled:
+            raise ClientError(
+                {"Error": {"Code": "ThrottlingException", "Message": "Too many requests"}},
+                "Converse",
+            )
+
+        system_prompt = kwargs["system"][0]["text"]
+        user_message = kwargs["messages"][0]["content"][0]["text"]
+        text = next(text for prefix, text in AGENT_RESPONSES if system_prompt.startswith(prefix))
+        # Roughly four characters per token
+        input_tokens = (len(system_prompt) + len(user_message)) // 4
+        output_tokens = len(text) // 4
+        return {
+            "output": {"message": {"role": "assistant", "content": [{"text": text}]}},
+            "usage": {
+                "inputTokens": input_tokens,
+                "outputTokens": output_tokens,
+                "totalTokens": input_tokens + output_tokens,
+            },
+            "stopReason": "end_turn",
+        }
+
+    def converse_stream(self, **kwargs: Any) -> dict[str, Any]:
+        """Return the ``converse`` response as ConverseStream events.
+
+        The simulated latency passes before the first event.
+
+        Raises:
+            ClientError: ThrottlingException, at the configured rate
+        """
+        response = self.converse(**kwargs)
+        text = response["output"]["message"]["content"][0]["text"]
+        deltas = [
+            {"contentBlockDelta": {"delta": {"text": text[i : i + 64]}, "contentBlockIndex": 0}}
+            for i in range(0, len(text), 64)
+        ]
+        events = [
+            {"messageStart": {"role": "assistant"}},
+            *deltas,
+            {"contentBlockStop": {"contentBlockIndex": 0}},
+            {"messageStop": {"stopReason": response["stopReason"]}},
+            {"metadata": {"usage": response["usage"], "metrics": {"latencyMs": 0}}},
+        ]
+        return {"stream": _FakeEventStream(events)}
+
+
+class _FakeEventStream(list):
+    """List of stream events with the ``close`` of botocore's EventStream."""
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+class FakeLambdaClient:
+    """Collects the analyzer invocations of a job instead of calling AWS."""
+
+    def __init__(self) -> None:
+        """Start with no invocations."""
+        self.payloads: list[dict] = []
+
+    def invoke(self, FunctionName: str, InvocationType: str, Payload: str) -> dict:  # noqa: N803
+        """Record an invocation payload."""
+        self.payloads.append(json.loads(Payload))
+        return {"StatusCode": 202}
+
+
+def create_table(resource_: Any, table_name: str) -> None:
+    """Create the single table with the key schema and GSIs the services use."""
+    throughput = {"ReadCapacityUnits": 5, "WriteCapacityUnits": 5}
+    indexes = [
+        {
+            "IndexName": name,
+            "KeySchema": [
+                {"AttributeName": f"{name}PK", "KeyType": "HASH"},
+                {"AttributeName": f"{name}SK", "KeyType": "RANGE"},
+            ],
+            "Projection": {"ProjectionType": "ALL"},
+            "ProvisionedThroughput": throughput,
+        }
+        for name in ("GSI1", "GSI2", "GSI3")
+    ]
+    resource_.create_table(
+        TableName=table_name,
+        KeySchema=[
+            {"AttributeName": "PK", "KeyType": "HASH"},
+            {"AttributeName": "SK", "KeyType": "RANGE"},
+        ],
+        AttributeDefinitions=[
+            {"AttributeName": name, "AttributeType": "S"}
+            for name in ("PK", "SK", "GSI1PK", "GSI1SK", "GSI2PK", "GSI2SK", "GSI3PK", "GSI3SK")
+        ],
+        GlobalSecondaryIndexes=indexes,
+        BillingMode="PROVISIONED",
+        ProvisionedThroughput=throughput,
+    )
+
+
+@contextmanager
+def _environment(**values: str) -> Iterator[None]:
+    """Set environment variables for the duration of the block."""
+    previous = {name: os.environ.get(name) for name in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+# ============================================================
+# BENCHMARK
+# ============================================================
+
+
+def peak_rss_mb() -> float:
+    """Return the peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_benchmark(config: BenchmarkConfig, workdir: Path) -> dict[str, Any]:
+    """Run one analysis job end to end against the local stand-ins.
+
+    Args:
+        config: Scenario
+        workdir: Scratch directory for the synthetic repositories
+
+    Returns:
+        Report with the job outcome, per-stage percentiles, throughput and peak RSS
+    """
+    from src.analysis import lambda_handler
+    from src.models.common import AgentName
+    from src.models.hackathon import HackathonCreate, RubricConfig, RubricDimension
+    from src.models.submission import SubmissionBatchCreate, SubmissionInput
+    from src.services.analysis_service import AnalysisService
+    from src.services.hackathon_service import HackathonService
+    from src.services.submission_service import SubmissionService
+    from src.utils.clients import close_clients, get_client_registry, get_dynamodb_resource
+    from src.utils.dynamo import get_dynamodb_helper
+    from src.utils.tracing import summarize_durations
+
+    github_root = workdir / "github"
+    for i in range(config.submissions):
+        create_synthetic_repo(
+            github_root / REPO_OWNER / f"team-{i}", config.seed + i, config.commits, config.files
+        )
+
+    fake_github = FakeGitHub(config.github_latency_ms)
+    fake_bedrock = FakeBedrockRuntime(
+        config.bedrock_latency_ms, config.bedrock_jitter, config.bedrock_throttle_rate, config.seed
+    )
+    local_dynamodb = bool(os.environ.get("DYNAMODB_ENDPOINT_URL"))
+    if local_dynamodb:
+        aws_mock: Any = nullcontext()
+    else:
+        from moto import mock_aws
+
+        aws_mock = mock_aws()
+
+    environment = _environment(
+        GIT_CONFIG_COUNT="1",
+        GIT_CONFIG_KEY_0=f"url.{github_root.resolve().as_uri()}/.insteadOf",
+        GIT_CONFIG_VALUE_0="https://github.com/",
+        TABLE_NAME=TABLE_NAME,
+        ANALYZER_LAMBDA_FUNCTION_NAME="analyzer-benchmark",
+        ANALYZER_SHARD_SIZE=str(config.shard_size),
+        AWS_DEFAULT_REGION=os.environ.get("AWS_DEFAULT_REGION", "us-east-1"),
+        AWS_ACCESS_KEY_ID=os.environ.get("AWS_ACCESS_KEY_ID", "benchmark"),
+        AWS_SECRET_ACCESS_KEY=os.environ.get("AWS_SECRET_ACCESS_KEY", "benchmark"),
+    )
+    base_url = GitHubClient.BASE_URL
+    fake_github.start()
+    close_clients()
+    try:
+        with environment, aws_mock:
+            GitHubClient.BASE_URL = fake_github.url
+            get_client_registry().get(
+                ("client", "bedrock-runtime", "us-east-1", None), lambda: fake_bedrock
+            )
+            create_table(get_dynamodb_resource(), TABLE_NAME)
+            db = get_dynamodb_helper(TABLE_NAME)
+
+            agents = [
+                AgentName.BUG_HUNTER,
+                AgentName.PERFORMANCE,
+                AgentName.INNOVATION,
+                AgentName.AI_DETECTION,
+            ]
+            hackathon = HackathonService(db).create_hackathon(
+                "ORG_BENCHMARK",
+                HackathonCreate(
+                    name="Pipeline Benchmark",
+                    rubric=RubricConfig(
+                        dimensions=[
+                            RubricDimension(name=agent.value, agent=agent, weight=0.25)
+                            for agent in agents
+                        ]
+                    ),
+                    agents_enabled=agents,
+                ),
+            )
+            created = SubmissionService(db).create_submissions(
+                hackathon.hack_id,
+                SubmissionBatchCreate(
+                    submissions=[
+                        SubmissionInput(
+                            team_name=f"Team {i}",
+                            repo_url=f"https://github.com/{REPO_OWNER}/team-{i}",
+                        )
+                        for i in range(config.submissions)
+                    ]
+                ),
+            )
+            sub_ids = [s.sub_id for s in created.submissions]
+
+            analysis_service = AnalysisService(db)
+            fake_lambda = FakeLambdaClient()
+            analysis_service._lambda_client = fake_lambda
+            job = analysis_service.trigger_analysis(hackathon.hack_id, sub_ids)
+
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=config.workers) as pool:
+                list(pool.map(lambda p: lambda_handler.handler(p, {}), fake_lambda.payloads))
+            wall_s = time.perf_counter() - started
+
+            record = db.get_analysis_job(hackathon.hack_id, job.job_id) or {}
+            traces = db.get_submission_span_durations(sub_ids)
+    finally:
+        GitHubClient.BASE_URL = base_url
+        close_clients()
+        fake_github.stop()
+
+    return {
+        "config": asdict(config),
+        "status": record.get("status"),
+        "completed": int(record.get("completed_submissions", 0)),
+        "failed": int(record.get("failed_submissions", 0)),
+        "invocations": len(fake_lambda.payloads),
+        "wall_s": round(wall_s, 3),
+        "throughput_per_min": round(config.submissions / wall_s * 60, 2),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "bedrock_calls": fake_bedrock.calls,
+        "bedrock_throttled": fake_bedrock.throttled,
+        "github_requests": fake_github.requests,
+        "stages": summarize_durations(
+            (t.get("span_durations") or {} for t in traces), percentiles=(50, 95)
+        ),
+    }
+
+
+def compare_to_baseline(
+    report: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float = 0.5,
+    min_delta_ms: float = 50.0,
+) -> list[str]:
+    """List the regressions of a report against a baseline report.
+
+    A stage regresses when its p95 exceeds the baseline's by more than
+    ``tolerance`` and by more than ``min_delta_ms`` (sub-millisecond spans
+    are too noisy for a relative check alone). The defaults allow for the
+    run-to-run noise of eight submissions on a shared machine; tighten them
+    with more submissions. Stages missing from either report are ignored.
+
+    Args:
+        report: Current report
+        baseline: Baseline report
+        tolerance: Allowed relative slowdown (0.5 = 50%)
+        min_delta_ms: Allowed absolute slowdown per stage
+
+    Returns:
+        One message per regression (empty when none)
+    """
+    regressions = []
+    for name, expected in sorted(baseline.get("stages", {}).items()):
+        current = report["stages"].get(name)
+        if current is None:
+            continue
+        delta = current["p95"] - expected["p95"]
+        if current["p95"] > expected["p95"] * (1 + tolerance) and delta > min_delta_ms:
+            regressions.append(
+                f"{name}: p95 {current['p95']:.1f} ms (baseline {expected['p95']:.1f} ms)"
+            )
+
+    if report["throughput_per_min"] < baseline["throughput_per_min"] * (1 - tolerance):
+        regressions.append(
+            f"throughput: {report['throughput_per_min']:.1f}/min "
+            f"(baseline {baseline['throughput_per_min']:.1f}/min)"
+        )
+    if report["peak_rss_mb"] > baseline["peak_rss_mb"] * (1 + tolerance):
+        regressions.append(
+            f"peak RSS: {report['peak_rss_mb']:.1f} MiB (baseline {baseline['peak_rss_mb']:.1f} MiB)"
+        )
+    return regressions
+
+
+def print_report(report: dict[str, Any]) -> None:
+    """Print the report as a table."""
+    config = report["config"]
+    print("=" * 80)
+    print(
+        f"PIPELINE BENCHMARK: {config['submissions']} submissions, {config['workers']} workers, "
+        f"shard size {config['shard_size']}, Bedrock {config['bedrock_latency_ms']:.0f} ms "
+        f"(throttle {config['bedrock_throttle_rate']:.0%})"
+    )
+    print("=" * 80)
+    print(
+        f"Job: {report['status']}  completed {report['completed']}  failed {report['failed']}  "
+        f"invocations {report['invocations']}"
+    )
+    print(
+        f"Wall: {report['wall_s']:.2f} s  Throughput: {report['throughput_per_min']:.1f}/min  "
+        f"Peak RSS: {report['peak_rss_mb']:.1f} MiB"
+    )
+    print(
+        f"Bedrock calls: {report['bedrock_calls']} ({report['bedrock_throttled']} throttled)  "
+        f"GitHub requests: {report['github_requests']}"
+    )
+    print(f"\n{'stage':<40} {'count':>6} {'p50 ms':>10} {'p95 ms':>10}")
+    for name, stats in sorted(report["stages"].items(), key=lambda kv: -kv[1]["p95"]):
+        print(f"{name:<40} {stats['count']:>6} {stats['p50']:>10.1f} {stats['p95']:>10.1f}")
+
+
+def main() -> None:
+    """Run the benchmark, print the report and compare it with a baseline."""
+    defaults = BenchmarkConfig()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--submissions", type=int, default=defaults.submissions)
+    parser.add_argument("--workers", type=int, default=defaults.workers)
+    parser.add_argument(
+        "--shard-size", type=int, default=defaults.shard_size, help="0 disables fan-out"
+    )
+    parser.add_argument("--commits", type=int, default=defaults.commits)
+    parser.add_argument("--files", type=int, default=defaults.files)
+    parser.add_argument("--bedrock-latency-ms", type=float, default=defaults.bedrock_latency_ms)
+    parser.add_argument("--bedrock-jitter", type=float, default=defaults.bedrock_jitter)
+    parser.add_argument(
+        "--bedrock-throttle-rate", type=float, default=defaults.bedrock_throttle_rate
+    )
+    parser.add_argument("--github-latency-ms", type=float, default=defaults.github_latency_ms)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--save-baseline", type=Path, help="Write the report to this file")
+    parser.add_argument("--baseline", type=Path, help="Compare with this baseline report")
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    parser.add_argument("--min-delta-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    # structlog and the HTTP/AWS clients log every pipeline event by default
+    import structlog
+
+    structlog.configure(logger_factory=structlog.ReturnLoggerFactory())
+    logging.disable(logging.INFO)
+
+    config = BenchmarkConfig(
+        submissions=args.submissions,
+        workers=args.workers,
+        shard_size=args.shard_size,
+        commits=args.commits,
+        files=args.files,
+        bedrock_latency_ms=args.bedrock_latency_ms,
+        bedrock_jitter=args.bedrock_jitter,
+        bedrock_throttle_rate=args.bedrock_throttle_rate,
+        github_latency_ms=args.github_latency_ms,
+        seed=args.seed,
+    )
+    with tempfile.TemporaryDirectory(prefix="pipeline-benchmark-") as workdir:
+        report = run_benchmark(config, Path(workdir))
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+    if args.save_baseline:
+        args.save_baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.save_baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nBaseline saved to {args.save_baseline}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        if baseline.get("config") != report["config"]:
+            print("\nWarning: baseline was recorded with a different scenario")
+        regressions = compare_to_baseline(report, baseline, args.tolerance, args.min_delta_ms)
+        print(f"\nRegressions against {args.baseline}: {len(regressions) or 'none'}")
+        for regression in regressions:
+            print(f"  {regression}")
+        if regressions:
+            sys.exit(1)
+
+    if report["status"] != "completed" or report["failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""Micro-benchmark the shared source index used by the intelligence analyzers.
+
+Builds synthetic repositories (25 files x 200 lines and 1,000 files x 200
+lines by default) and times:
+
+- ``per-method scans``: the analyzers' keyword questions (every content rule
+  of ``StrategyDetector`` per file, every path rule of ``TeamAnalyzer`` per
+  file and contributor) answered the way they used to be, lower-casing the
+  text for each question and running a separate ``any(keyword in text ...)``
+  loop per rule.
+- ``indexed scans``: the same questions answered from one ``SourceIndex``
+  with the detectors' ``KeywordMatcher`` rule tables.
+- ``strategy + team``: ``StrategyDetector.analyze`` and
+  ``TeamAnalyzer.analyze`` on one shared index, as the orchestrator runs them.
+
+Each measurement keeps the fastest of several runs.
+
+Usage:
+    python scripts/benchmark_source_index.py
+    python scripts/benchmark_source_index.py --files 25 1000 5000 --lines 200 --runs 5
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.analysis.source_index import SourceIndex  # noqa: E402
+from src.analysis.strategy_detector import (  # noqa: E402
+    CONTENT_RULES,
+    PATH_RULES,
+    StrategyDetector,
+)
+from src.analysis.team_analyzer import PATH_RULES as TEAM_PATH_RULES  # noqa: E402
+from src.analysis.team_analyzer import TeamAnalyzer  # noqa: E402
+from src.models.analysis import CommitInfo, RepoData, SourceFile  # noqa: E402
+from src.models.submission import RepoMeta  # noqa: E402
+
+_DIRS = ["src", "src/services", "src/models", "src/api", "app/components", "tests", "lib/core"]
+_NAMES = ["user", "order", "cart", "widget", "client", "report", "session", "config", "utils"]
+_WORDS = [
+    "def", "return", "self", "value", "import", "for", "in", "if", "else", "class", "data",
+    "result", "item", "list", "dict", "none", "true", "Request", "Response", "handler", "CACHE",
+    "TODO", "Auth", "token", "payload", "Query", "async", "await", "logger", "error",
+]  # fmt: skip
+_CONTRIBUTORS = ["Alice", "Bob", "Carol", "Dan", "Eve"]
+
+
+def synthetic_repo(files: int, lines: int, seed: int = 7) -> RepoData:
+    """Build a reproducible repository with mixed code, test and config files."""
+    rng = random.Random(seed)
+    source_files = []
+    for i in range(files):
+        directory = rng.choice(_DIRS)
+        name = rng.choice(_NAMES)
+        ext = rng.choice([".py", ".py", ".ts", ".tsx", ".yml", ".md"])
+        prefix = "test_" if directory == "tests" else ""
+        content = "\n".join(
+            " ".join(rng.choice(_WORDS) for _ in range(rng.randint(4, 10))) for _ in range(lines)
+        )
+        source_files.append(
+            SourceFile(
+                path=f"{directory}/{prefix}{name}_{i}{ext}",
+                content=content,
+                lines=lines,
+                language="Python",
+            )
+        )
+
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    commits = [
+        CommitInfo(
+            hash=f"{i:040x}",
+            short_hash=f"{i:07x}",
+            message=rng.choice(["Add api endpoint", "Fix auth bug", "Update ui style", "wip"]),
+            author=rng.choice(_CONTRIBUTORS),
+            timestamp=start + timedelta(minutes=37 * i),
+            files_changed=3,
+            insertions=40,
+            deletions=5,
+        )
+        for i in range(200)
+    ]
+    return RepoData(
+        repo_url="https://github.com/bench/synthetic",
+        repo_owner="bench",
+        repo_name="synthetic",
+        meta=RepoMeta(),
+        readme_content="## Problem\nTeams need fast feedback.\n## API\nGET /api/items\n",
+        source_files=source_files,
+        commit_history=commits,
+    )
+
+
+def per_method_scans(repo: RepoData) -> int:
+    """Answer every rule question with a fresh lower() and any() loop per rule."""
+    hits = 0
+    for keywords in CONTENT_RULES.rules.values():
+        for source_file in repo.source_files:
+            content_lower = source_file.content.lower()
+            hits += any(keyword in content_lower for keyword in keywords)
+    for keywords in PATH_RULES.rules.values():
+        for source_file in repo.source_files:
+            hits += any(keyword in source_file.path.lower() for keyword in keywords)
+    for _contributor in _CONTRIBUTORS:
+        for keywords in TEAM_PATH_RULES.rules.values():
+            for source_file in repo.source_files:
+                hits += any(keyword in source_file.path.lower() for keyword in keywords)
+    return hits
+
+
+def indexed_scans(repo: RepoData) -> int:
+    """Answer the same rule questions from one shared index."""
+    index = SourceIndex.from_repo_data(repo)
+    hits = 0
+    for rule in CONTENT_RULES.rules:
+        for source_file in repo.source_files:
+            hits += index.content_matches(source_file, CONTENT_RULES, rule)
+    for source_file in repo.source_files:
+        hits += len(index.path_hits(source_file.path, PATH_RULES))
+    for _contributor in _CONTRIBUTORS:
+        for source_file in repo.source_files:
+            hits += len(index.path_hits(source_file.path, TEAM_PATH_RULES))
+    return hits
+
+
+def analyzers(repo: RepoData) -> None:
+    """Run both intelligence analyzers on one shared index."""
+    index = SourceIndex.from_repo_data(repo)
+    TeamAnalyzer().analyze(repo, source_index=index)
+    StrategyDetector().analyze(repo, source_index=index)
+
+
+def best_of(runs: int, fn: Callable[[RepoData], object], repo: RepoData) -> float:
+    """Return the fastest wall time of ``fn(repo)`` in milliseconds."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn(repo)
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def main() -> None:
+    """Run the benchmark and print one row per repository size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, nargs="+", default=[25, 1000])
+    parser.add_argument("--lines", type=int, default=200)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    # structlog prints every analyzer event to stdout by default
+    import structlog
+
+    structlog.configure(logger_factory=structlog.ReturnLoggerFactory())
+
+    print(
+        f"{'files':>6} {'lines':>6} {'per-method scans':>17} {'indexed scans':>14} "
+        f"{'speedup':>8} {'strategy + team':>16}"
+    )
+    for files in args.files:
+        repo = synthetic_repo(files, args.lines)
+        legacy_ms = best_of(args.runs, per_method_scans, repo)
+        indexed_ms = best_of(args.runs, indexed_scans, repo)
+        analyzers_ms = best_of(args.runs, analyzers, repo)
+        print(
+            f"{files:>6} {args.lines:>6} {legacy_ms:>14.1f} ms {indexed_ms:>11.1f} ms "
+            f"{legacy_ms / indexed_ms:>7.1f}x {analyzers_ms:>13.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Re-key API key budget tracking items from the secret to the API key ID.
+
+API key budgets used to be stored under ``BUDGET#api_key#<secret>``; they
+are now keyed by ``api_key_id`` so analysis jobs can reference them. Until
+this migration has run, spend recorded under the old key is ignored and
+each key starts again from zero.
+
+Each legacy item's spend and alert flags are merged into the item under the
+API key ID (which may already hold spend reserved since the change), and
+the legacy item is deleted in the same transaction, so re-running the
+script never double counts.
+
+Usage:
+    TABLE_NAME=VibeJudgeTable python scripts/migrate_budget_api_key_ids.py --dry-run
+    TABLE_NAME=VibeJudgeTable python scripts/migrate_budget_api_key_ids.py
+"""
+
+import argparse
+import os
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.constants import BUDGET_ALERT_THRESHOLDS  # noqa: E402
+from src.utils.dynamo import DynamoDBHelper  # noqa: E402
+
+
+def scan_all(db: DynamoDBHelper, **scan_kwargs: Any) -> Any:
+    """Yield every item matching a scan (paginated)."""
+    while True:
+        response = db.table.scan(**scan_kwargs)
+        yield from response.get("Items", [])
+        if "LastEvaluatedKey" not in response:
+            break
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def api_key_ids_by_secret(db: DynamoDBHelper) -> dict[str, str]:
+    """Map each API key secret to its API key ID."""
+    return {
+        item["api_key"]: item["api_key_id"]
+        for item in scan_all(
+            db,
+            FilterExpression="entity_type = :type",
+            ExpressionAttributeValues={":type": "API_KEY"},
+        )
+        if item.get("api_key") and item.get("api_key_id")
+    }
+
+
+def migrate_item(db: DynamoDBHelper, item: dict[str, Any], api_key_id: str) -> None:
+    """Merge one legacy budget item into its API key ID item and delete it."""
+    values: dict[str, Any] = {
+        ":spend": item.get("current_spend_usd", 0),
+        ":limit": item.get("budget_limit_usd", 0),
+        ":entity_type": "api_key",
+        ":entity_id": api_key_id,
+        ":kind": "BUDGET_TRACKING",
+        ":gsi1pk": "ENTITY#api_key",
+        ":created_at": item.get("created_at") or datetime.now(UTC).isoformat(),
+        ":now": datetime.now(UTC).isoformat(),
+    }
+    set_parts = [
+        "budget_limit_usd = if_not_exists(budget_limit_usd, :limit)",
+        "entity_type = :entity_type",
+        "entity_id = :entity_id",
+        "entity_type_field = :kind",
+        "GSI1PK = :gsi1pk",
+        "created_at = if_not_exists(created_at, :created_at)",
+        "updated_at = :now",
+    ]
+    sent = [t for t in BUDGET_ALERT_THRESHOLDS if item.get(f"alert_{t}_sent")]
+    if sent:
+        values[":true"] = True
+        set_parts.extend(f"alert_{t}_sent = :true" for t in sent)
+
+    # The table resource's client serializes Python values itself
+    db.table.meta.client.transact_write_items(
+        TransactItems=[
+            {
+                "Update": {
+                    "TableName": db.table.name,
+                    "Key": {"PK": f"BUDGET#api_key#{api_key_id}", "SK": "TRACKING"},
+                    "UpdateExpression": (
+                        f"SET {', '.join(set_parts)} ADD current_spend_usd :spend"
+                    ),
+                    "ExpressionAttributeValues": values,
+                }
+            },
+            {
+                "Delete": {
+                    "TableName": db.table.name,
+                    "Key": {"PK": item["PK"], "SK": item["SK"]},
+                    "ConditionExpression": "attribute_exists(PK)",
+                }
+            },
+        ]
+    )
+
+
+def migrate(db: DynamoDBHelper, dry_run: bool) -> dict[str, int]:
+    """Move API key budget items keyed by secret to their API key ID.
+
+    Args:
+        db: DynamoDB helper
+        dry_run: If True, only count; do not write
+
+    Returns:
+        Counts of migrated, already keyed by ID, and orphaned items (whose
+        secret matches no API key; left in place)
+    """
+    ids_by_secret = api_key_ids_by_secret(db)
+    known_ids = set(ids_by_secret.values())
+
+    migrated = current = orphaned = 0
+    for item in scan_all(
+        db,
+        FilterExpression="begins_with(PK, :prefix) AND SK = :sk",
+        ExpressionAttributeValues={":prefix": "BUDGET#api_key#", ":sk": "TRACKING"},
+    ):
+        entity_id = item["PK"].removeprefix("BUDGET#api_key#")
+        if entity_id in known_ids:
+            current += 1
+            continue
+        api_key_id = ids_by_secret.get(entity_id)
+        if api_key_id is None:
+            orphaned += 1
+            continue
+        if not dry_run:
+            migrate_item(db, item, api_key_id)
+        migrated += 1
+    return {"migrated": migrated, "current": current, "orphaned": orphaned}
+
+
+def main() -> None:
+    """Run the migration and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dry-run", action="store_true", help="Count only, do not write")
+    args = parser.parse_args()
+
+    table_name = os.environ.get("TABLE_NAME", "VibeJudgeTable")
+    report = migrate(DynamoDBHelper(table_name), dry_run=args.dry_run)
+
+    verb = "Would migrate" if args.dry_run else "Migrated"
+    print(
+        f"{verb}: {report['migrated']}  Already keyed by ID: {report['current']}  "
+        f"Orphaned: {report['orphaned']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
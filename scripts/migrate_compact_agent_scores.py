@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Rewrite submission items so agent_scores only holds compact numeric summaries.
+
+Older analyzer versions embedded the full ``model_dump()`` of every agent
+response (evidence, observations, summaries) in the ``HACK#/SUB#`` item.
+That detail is already stored in the ``SUB#/SCORE#{agent}`` items, so this
+migration replaces it with ``{"overall_score", "confidence"}`` per agent.
+
+It reports the bytes (and strongly consistent RCUs) that a full
+``list_submissions`` query reads per hackathon, before and after.
+
+Usage:
+    TABLE_NAME=VibeJudgeTable python scripts/migrate_compact_agent_scores.py --dry-run
+    TABLE_NAME=VibeJudgeTable python scripts/migrate_compact_agent_scores.py
+"""
+
+import argparse
+import math
+import os
+import sys
+from collections import defaultdict
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.services.submission_service import SubmissionService  # noqa: E402
+from src.utils.dynamo import DynamoDBHelper, estimate_item_size  # noqa: E402
+
+RCU_BYTES = 4096
+
+
+def is_compact(agent_scores: dict) -> bool:
+    """Return True if agent_scores already only holds numeric summaries."""
+    for value in agent_scores.values():
+        if isinstance(value, dict) and set(value) - {"overall_score", "confidence"}:
+            return False
+    return True
+
+
+def iter_submission_items(db: DynamoDBHelper) -> Any:
+    """Yield every SUBMISSION item in the table (paginated scan)."""
+    scan_kwargs: dict[str, Any] = {
+        "FilterExpression": "entity_type = :type",
+        "ExpressionAttributeValues": {":type": "SUBMISSION"},
+    }
+    while True:
+        response = db.table.scan(**scan_kwargs)
+        yield from response.get("Items", [])
+        if "LastEvaluatedKey" not in response:
+            break
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def to_dynamo(value: Any) -> Any:
+    """Convert floats to Decimal recursively."""
+    if isinstance(value, float):
+        return Decimal(str(value))
+    if isinstance(value, dict):
+        return {k: to_dynamo(v) for k, v in value.items()}
+    return value
+
+
+def migrate(db: DynamoDBHelper, dry_run: bool) -> dict[str, Any]:
+    """Compact agent_scores on every submission item.
+
+    Args:
+        db: DynamoDB helper
+        dry_run: If True, only measure; do not write
+
+    Returns:
+        Per-hackathon before/after byte totals and migration counts
+    """
+    bytes_before: dict[str, int] = defaultdict(int)
+    bytes_after: dict[str, int] = defaultdict(int)
+    migrated = 0
+    skipped = 0
+
+    for item in iter_submission_items(db):
+        hack_id = item.get("hack_id", "unknown")
+        size_before = estimate_item_size(item)
+        bytes_before[hack_id] += size_before
+
+        agent_scores = item.get("agent_scores") or {}
+        if is_compact(agent_scores):
+            bytes_after[hack_id] += size_before
+            skipped += 1
+            continue
+
+        compact = to_dynamo(SubmissionService.compact_agent_scores(agent_scores))
+        bytes_after[hack_id] += estimate_item_size({**item, "agent_scores": compact})
+
+        if not dry_run:
+            db.table.update_item(
+                Key={"PK": item["PK"], "SK": item["SK"]},
+                UpdateExpression="SET agent_scores = :compact",
+                ExpressionAttributeValues={":compact": compact},
+            )
+        migrated += 1
+
+    return {
+        "bytes_before": dict(bytes_before),
+        "bytes_after": dict(bytes_after),
+        "migrated": migrated,
+        "skipped": skipped,
+    }
+
+
+def main() -> None:
+    """Run the migration and print the before/after read-cost report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dry-run", action="store_true", help="Measure only, do not write")
+    args = parser.parse_args()
+
+    table_name = os.environ.get("TABLE_NAME", "VibeJudgeTable")
+    db = DynamoDBHelper(table_name)
+    report = migrate(db, dry_run=args.dry_run)
+
+    print("=" * 80)
+    print(f"COMPACT agent_scores MIGRATION ({'dry run' if args.dry_run else 'applied'})")
+    print("=" * 80)
+    print(f"{'hackathon':30s} {'bytes before':>14s} {'bytes after':>14s} {'RCU':>12s}")
+    total_before = total_after = 0
+    for hack_id, before in sorted(report["bytes_before"].items()):
+        after = report["bytes_after"].get(hack_id, before)
+        total_before += before
+        total_after += after
+        rcu = f"{math.ceil(before / RCU_BYTES)} -> {math.ceil(after / RCU_BYTES)}"
+        print(f"{hack_id:30s} {before:>14,d} {after:>14,d} {rcu:>12s}")
+    print("-" * 80)
+    print(f"{'TOTAL':30s} {total_before:>14,d} {total_after:>14,d}")
+    if total_before:
+        print(f"Reduction: {(1 - total_after / total_before) * 100:.1f}%")
+    print(f"Migrated: {report['migrated']}  Already compact: {report['skipped']}")
+
+
+if __name__ == "__main__":
+    main()
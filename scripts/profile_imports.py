@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Profile API cold-start import time with ``python -X importtime``.
+
+Imports a module (default ``src.api.main``) in a fresh interpreter, parses
+the ``-X importtime`` trace and prints a digest: total time, the slowest
+modules by self time, time per top-level package, and the project modules
+by cumulative time. Runs several times and keeps the fastest run, so the
+numbers are comparable between commits.
+
+Exits non-zero when the import exceeds the startup budget or loads a
+module that must stay lazy (see API_IMPORT_BUDGET_MS / API_LAZY_MODULES in
+src/constants.py), so it can guard cold-start regressions in CI.
+
+Usage:
+    python scripts/profile_imports.py
+    python scripts/profile_imports.py --runs 5 --top 30
+    python scripts/profile_imports.py --json > import_profile.json
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.constants import API_IMPORT_BUDGET_MS, API_LAZY_MODULES  # noqa: E402
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| *(\S+)\s*$")
+
+
+@dataclass
+class ImportRecord:
+    """One line of the ``-X importtime`` trace (times in microseconds)."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(trace: str) -> list[ImportRecord]:
+    """Parse ``-X importtime`` stderr output.
+
+    Args:
+        trace: stderr of ``python -X importtime``
+
+    Returns:
+        Import records in trace order (dependencies before importers)
+    """
+    records = []
+    for line in trace.splitlines():
+        match = _LINE.match(line)
+        if match:
+            records.append(
+                ImportRecord(
+                    module=match.group(3),
+                    self_us=int(match.group(1)),
+                    cumulative_us=int(match.group(2)),
+                )
+            )
+    return records
+
+
+def digest(
+    records: list[ImportRecord],
+    target: str,
+    top: int = 20,
+    lazy_modules: tuple[str, ...] = API_LAZY_MODULES,
+) -> dict[str, Any]:
+    """Summarize an import trace.
+
+    Args:
+        records: Parsed trace
+        target: Module whose import was profiled
+        top: Number of modules to list per section
+        lazy_modules: Modules (or packages) that must not have been imported
+
+    Returns:
+        Dict with total_ms, module_count, slowest_self, packages,
+        project_modules and eager_lazy_modules
+    """
+    total_us = next((r.cumulative_us for r in records if r.module == target), 0)
+
+    packages: dict[str, int] = defaultdict(int)
+    for r in records:
+        packages[r.module.split(".")[0]] += r.self_us
+
+    imported = {r.module for r in records}
+    eager = sorted(
+        m for m in imported if any(m == lazy or m.startswith(lazy + ".") for lazy in lazy_modules)
+    )
+
+    def ms(us: int) -> float:
+        return round(us / 1000, 2)
+
+    by_self = sorted(records, key=lambda r: r.self_us, reverse=True)[:top]
+    project_root = target.split(".")[0]
+    project = sorted(
+        (r for r in records if r.module.split(".")[0] == project_root),
+        key=lambda r: r.cumulative_us,
+        reverse=True,
+    )[:top]
+
+    return {
+        "target": target,
+        "total_ms": ms(total_us),
+        "module_count": len(records),
+        "slowest_self": [{"module": r.module, "self_ms": ms(r.self_us)} for r in by_self],
+        "packages": [
+            {"package": name, "self_ms": ms(us)}
+            for name, us in sorted(packages.items(), key=lambda kv: kv[1], reverse=True)[:top]
+        ],
+        "project_modules": [
+            {"module": r.module, "cumulative_ms": ms(r.cumulative_us), "self_ms": ms(r.self_us)}
+            for r in project
+        ],
+        "eager_lazy_modules": eager,
+    }
+
+
+def profile(target: str = "src.api.main", runs: int = 3) -> list[ImportRecord]:
+    """Import a module in fresh interpreters and return the fastest trace.
+
+    Args:
+        target: Module to import
+        runs: Number of interpreter runs
+
+    Returns:
+        Parsed trace of the fastest run
+    """
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    best: list[ImportRecord] = []
+    best_us = None
+    for _ in range(max(1, runs)):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+            cwd=REPO_ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        records = parse_importtime(result.stderr)
+        total = next((r.cumulative_us for r in records if r.module == target), 0)
+        if best_us is None or total < best_us:
+            best, best_us = records, total
+    return best
+
+
+def main() -> None:
+    """Profile the import, print the digest and enforce the budget."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="src.api.main", help="Module to import")
+    parser.add_argument("--runs", type=int, default=3, help="Runs (fastest is kept)")
+    parser.add_argument("--top", type=int, default=20, help="Modules listed per section")
+    parser.add_argument("--budget-ms", type=float, default=API_IMPORT_BUDGET_MS)
+    parser.add_argument("--json", action="store_true", help="Print the digest as JSON")
+    args = parser.parse_args()
+
+    report = digest(profile(args.module, args.runs), args.module, args.top)
+    report["budget_ms"] = args.budget_ms
+    over_budget = report["total_ms"] > args.budget_ms
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print("=" * 80)
+        print(f"IMPORT PROFILE: {args.module} (best of {args.runs})")
+        print("=" * 80)
+        print(
+            f"Total: {report['total_ms']:.1f} ms  Budget: {args.budget_ms:.0f} ms  "
+            f"Modules: {report['module_count']}"
+        )
+        print("\nSlowest modules (self):")
+        for row in report["slowest_self"]:
+            print(f"  {row['self_ms']:>9.2f} ms  {row['module']}")
+        print("\nTop-level packages (self):")
+        for row in report["packages"]:
+            print(f"  {row['self_ms']:>9.2f} ms  {row['package']}")
+        print("\nProject modules (cumulative):")
+        for row in report["project_modules"]:
+            print(f"  {row['cumulative_ms']:>9.2f} ms  {row['module']}")
+        if report["eager_lazy_modules"]:
+            print("\nImported at startup but expected to be lazy:")
+            for module in report["eager_lazy_modules"]:
+                print(f"  {module}")
+
+    if over_budget or report["eager_lazy_modules"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
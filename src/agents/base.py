@@ -1,16 +1,58 @@
 """Base agent class with shared logic for all AI agents."""
 
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
-from src.constants import AGENT_CONFIGS, AgentConfig
+from pydantic import ValidationError
+
+from src.constants import (
+    AGENT_CONFIGS,
+    BEDROCK_CHARS_PER_TOKEN,
+    BEDROCK_FIRST_TOKEN_TIMEOUT_SECONDS,
+    HEDGE_LOSER_REPORT_SECONDS,
+    AgentConfig,
+)
 from src.models.analysis import RepoData
 from src.models.scores import BaseAgentResponse
-from src.utils.bedrock import BedrockClient
+from src.utils.bedrock import (
+    BedrockCancelledError,
+    BedrockClient,
+    BedrockTimeoutError,
+    CancelToken,
+    get_response_parse_metrics,
+)
+from src.utils.hedging import (
+    HEDGE,
+    PRIMARY,
+    estimate_request_cost,
+    get_hedge_controller,
+    run_hedged,
+)
+from src.utils.json_repair import capture_repairs
 from src.utils.logging import get_logger
+from src.utils.tracing import current_span
 
 logger = get_logger(__name__)
 
+_PARSE_FAILED = "Failed to parse JSON"
+
+
+@dataclass
+class _Attempt:
+    """One Bedrock request of an analysis and its validated response."""
+
+    model_id: str
+    response: dict[str, Any]
+    agent_response: BaseAgentResponse | None
+    error: str
+    repairs: list[str]
+    hedge_won: bool = False
+    hedge_usage: dict[str, Any] | None = None  # of the request that lost a hedged call
+
 
 class BaseAgent(ABC):
     """Base class for all AI agents."""
@@ -33,6 +75,10 @@ class BaseAgent(ABC):
         self.max_tokens = config.get("max_tokens", 2048)
         self.top_p = config.get("top_p", 0.9)
         self.timeout_seconds = config.get("timeout_seconds", 120)
+        self.first_token_timeout_seconds = config.get(
+            "first_token_timeout_seconds", BEDROCK_FIRST_TOKEN_TIMEOUT_SECONDS
+        )
+        self.hedge_model_id: str | None = config.get("hedge_model_id")
 
     @abstractmethod
     def get_system_prompt(self) -> str:
@@ -77,6 +123,14 @@ class BaseAgent(ABC):
     ) -> tuple[BaseAgentResponse, dict]:
         """Run agent analysis on repository data.
 
+        The response is parsed tolerantly and validated into the agent's
+        response model. A correction request is sent to Bedrock only when
+        neither works; its tokens are included in the returned usage. The
+        outcome is counted per model in the response parse metrics.
+
+        ``timeout_seconds`` bounds the whole analysis, correction included,
+        and ``first_token_timeout_seconds`` each Bedrock attempt's first token.
+
         Args:
             repo_data: Extracted repository data
             hackathon_name: Name of the hackathon
@@ -87,6 +141,7 @@ class BaseAgent(ABC):
             Tuple of (agent_response, usage_dict)
 
         Raises:
+            BedrockTimeoutError: If the agent's time limits pass
             Exception: If analysis fails after retries
         """
         logger.info(
@@ -100,61 +155,93 @@ class BaseAgent(ABC):
         system_prompt = self.get_system_prompt()
         user_message = self.build_user_message(repo_data, hackathon_name, team_name, **kwargs)
 
-        # Call Bedrock
+        # Call Bedrock (streamed, so timeout_seconds bounds both calls)
+        started = time.monotonic()
+        deadline = started + self.timeout_seconds
         try:
-            response = self.bedrock.converse(
-                model_id=self.model_id,
-                system_prompt=system_prompt,
-                user_message=user_message,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens,
-                top_p=self.top_p,
-            )
-
-            # Parse JSON response
-            content = response["content"]
-            parsed = self.bedrock.parse_json_response(content)
+            first = self._first_attempt(system_prompt, user_message, deadline)
+            model_id = first.model_id
+            response = first.response
+            usage = response["usage"]
+            latency_ms = response["latency_ms"]
+            agent_response, error, repairs = first.agent_response, first.error, first.repairs
+            outcome = "repaired" if repairs else "clean"
 
-            if not parsed:
-                # Retry with correction
-                logger.warning("agent_json_parse_failed_retrying", agent=self.agent_name)
-                response = self.bedrock.retry_with_correction(
-                    model_id=self.model_id,
+            if agent_response is None:
+                # Only what the repair pass cannot recover costs a second call
+                logger.warning(
+                    "agent_response_invalid_retrying",
+                    agent=self.agent_name,
+                    error=error,
+                    repairs=repairs,
+                    stop_reason=response.get("stop_reason"),
+                )
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise BedrockTimeoutError(
+                        model_id,
+                        "deadline",
+                        int((self.timeout_seconds - remaining) * 1000),
+                        response["content"],
+                    )
+                retry = self.bedrock.retry_with_correction(
+                    model_id=model_id,
                     system_prompt=system_prompt,
                     original_message=user_message,
-                    failed_response=content,
-                    parse_error="Failed to parse JSON",
+                    failed_response=response["content"],
+                    parse_error=error,
                     temperature=self.temperature,
                     max_tokens=self.max_tokens,
+                    deadline_seconds=remaining,
+                    first_token_timeout_seconds=self.first_token_timeout_seconds,
                 )
-                parsed = self.bedrock.parse_json_response(response["content"])
-
-                if not parsed:
-                    raise ValueError(
-                        f"Failed to parse JSON after retry: {response['content'][:200]}"
-                    )
-
-            # Validate and parse into Pydantic model
-            agent_response = self.parse_response(parsed)
+                usage = {
+                    key: usage[key] + retry["usage"][key]
+                    for key in ("input_tokens", "output_tokens", "total_tokens")
+                }
+                latency_ms += retry["latency_ms"]
+
+                with capture_repairs() as repairs:
+                    agent_response, error = self._parse_and_validate(retry["content"])
+                if agent_response is None:
+                    get_response_parse_metrics().record(model_id, "failed", repairs)
+                    if error == _PARSE_FAILED:
+                        raise ValueError(
+                            f"Failed to parse JSON after retry: {retry['content'][:200]}"
+                        )
+                    raise ValueError(f"{error} (after retry)")
+                outcome = "corrected"
+
+            get_response_parse_metrics().record(model_id, outcome, repairs)
+            current_span().set(response_parse=outcome, json_repairs=",".join(repairs))
 
             # Validate evidence
             agent_response = self.validate_evidence(agent_response, repo_data)
 
-            # Calculate cost
-            usage = response["usage"]
+            # Calculate cost (both calls when a correction was needed)
             cost_info = self.bedrock.calculate_cost(
-                model_id=self.model_id,
+                model_id=model_id,
                 input_tokens=usage["input_tokens"],
                 output_tokens=usage["output_tokens"],
             )
 
             usage_dict = {
+                "model_id": model_id,
                 "input_tokens": usage["input_tokens"],
                 "output_tokens": usage["output_tokens"],
                 "total_tokens": usage["total_tokens"],
-                "latency_ms": response["latency_ms"],
+                "latency_ms": latency_ms,
                 **cost_info,
             }
+            if first.hedge_usage is not None:
+                usage_dict["hedge_usage"] = first.hedge_usage
+            get_hedge_controller().record_call(
+                self.agent_name,
+                self.model_id,
+                latency_ms=(time.monotonic() - started) * 1000,
+                cost_usd=cost_info["total_cost_usd"],
+                hedge_won=first.hedge_won,
+            )
 
             logger.info(
                 "agent_analysis_completed",
@@ -174,6 +261,179 @@ class BaseAgent(ABC):
             )
             raise
 
+    def _first_attempt(self, system_prompt: str, user_message: str, deadline: float) -> _Attempt:
+        """Make the first Bedrock request, hedging it when it runs slow.
+
+        Without a ``hedge_model_id``, or before the model's latency is known,
+        this is a single request.
+
+        Args:
+            system_prompt: System prompt text
+            user_message: User message text
+            deadline: ``time.monotonic()`` by which the analysis must finish
+
+        Returns:
+            The first valid attempt, or the primary request's if none is valid;
+            after a hedge, with the losing request's usage
+        """
+        hedging = get_hedge_controller()
+        delay = hedging.delay_seconds(self.model_id) if self.hedge_model_id else None
+        if delay is None or delay >= self.timeout_seconds:
+            return self._attempt(self.model_id, system_prompt, user_message, self.timeout_seconds)
+
+        hedge_model_id: str = self.hedge_model_id  # type: ignore[assignment]
+        prompt_chars = len(system_prompt) + len(user_message)
+        models = {PRIMARY: self.model_id, HEDGE: hedge_model_id}
+        reserved: list[float] = []  # estimate reserved for the hedge request
+        loser_usage: dict[str, Any] = {}
+        loser_reported = threading.Event()
+        report_lock = threading.Lock()
+
+        def primary(cancel: CancelToken) -> _Attempt:
+            return self._attempt(
+                self.model_id, system_prompt, user_message, self.timeout_seconds, cancel
+            )
+
+        def start_hedge() -> Callable[[CancelToken], _Attempt] | None:
+            remaining = deadline - time.monotonic()
+            estimate = estimate_request_cost(hedge_model_id, prompt_chars, self.max_tokens)
+            if remaining <= 0 or not hedging.allow(self.agent_name, self.model_id, estimate):
+                return None
+            reserved.append(estimate)
+            logger.info(
+                "agent_call_hedged",
+                agent=self.agent_name,
+                hedge_model_id=hedge_model_id,
+                after_seconds=round(delay, 3),
+            )
+
+            def hedge(cancel: CancelToken) -> _Attempt:
+                try:
+                    return self._attempt(
+                        hedge_model_id, system_prompt, user_message, remaining, cancel
+                    )
+                finally:
+                    hedging.release(estimate)
+
+            return hedge
+
+        def report_loser(name: str, usage: dict[str, Any]) -> None:
+            with report_lock:
+                if loser_reported.is_set():
+                    return  # already charged
+                loser_usage.update(
+                    model_id=models[name],
+                    input_tokens=usage["input_tokens"],
+                    output_tokens=usage["output_tokens"],
+                )
+                loser_reported.set()
+
+        def on_loser(name: str, attempt: _Attempt | None, error: Exception | None) -> None:
+            usage = attempt.response["usage"] if attempt is not None else None
+            if isinstance(error, BedrockCancelledError):
+                usage = error.usage
+            if usage is None:
+                # Failed before reporting usage: charge the prompt
+                usage = {
+                    "input_tokens": prompt_chars // BEDROCK_CHARS_PER_TOKEN,
+                    "output_tokens": 0,
+                }
+            report_loser(name, usage)
+
+        def charge_loser(loser: str) -> dict[str, Any]:
+            if not loser_reported.wait(HEDGE_LOSER_REPORT_SECONDS):
+                # Still running after it was cancelled: charge all it may use
+                report_loser(
+                    loser,
+                    {
+                        "input_tokens": prompt_chars // BEDROCK_CHARS_PER_TOKEN,
+                        "output_tokens": self.max_tokens,
+                    },
+                )
+            cost = self.bedrock.calculate_cost(
+                model_id=loser_usage["model_id"],
+                input_tokens=loser_usage["input_tokens"],
+                output_tokens=loser_usage["output_tokens"],
+            )["total_cost_usd"]
+            hedging.record_extra_spend(self.agent_name, cost, reserved_usd=reserved[0])
+            return dict(loser_usage)
+
+        try:
+            result = run_hedged(
+                primary, start_hedge, delay, lambda a: a.agent_response is not None, on_loser
+            )
+        except Exception:
+            if reserved:
+                # Neither request produced a result; the hedge has reported
+                charge_loser(HEDGE)
+            raise
+        attempt: _Attempt = result.value
+        if result.hedged:
+            current_span().set(hedged=True, hedge_winner=result.winner)
+            attempt.hedge_usage = charge_loser(HEDGE if result.winner == PRIMARY else PRIMARY)
+        attempt.hedge_won = result.winner == HEDGE
+        return attempt
+
+    def _attempt(
+        self,
+        model_id: str,
+        system_prompt: str,
+        user_message: str,
+        deadline_seconds: float,
+        cancel: CancelToken | None = None,
+    ) -> _Attempt:
+        """Make one Bedrock request and validate its response.
+
+        Args:
+            model_id: Bedrock model ID
+            system_prompt: System prompt text
+            user_message: User message text
+            deadline_seconds: Time limit for the request
+            cancel: Token to abandon the request (hedged requests only)
+
+        Returns:
+            The attempt
+        """
+        hedged = {} if cancel is None else {"cancel": cancel}
+        response = self.bedrock.converse(
+            model_id=model_id,
+            system_prompt=system_prompt,
+            user_message=user_message,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            top_p=self.top_p,
+            deadline_seconds=deadline_seconds,
+            first_token_timeout_seconds=self.first_token_timeout_seconds,
+            **hedged,
+        )
+        # Parse (repairing malformed JSON) and validate into the model
+        with capture_repairs() as repairs:
+            agent_response, error = self._parse_and_validate(response["content"])
+        return _Attempt(model_id, response, agent_response, error, repairs)
+
+    def _parse_and_validate(self, content: str) -> tuple[BaseAgentResponse | None, str]:
+        """Parse a response and validate it into the agent's response model.
+
+        Args:
+            content: Raw LLM response text
+
+        Returns:
+            Tuple of (validated response or None, error for the correction prompt)
+        """
+        parsed = self.bedrock.parse_json_response(content)
+        if not parsed:
+            return None, _PARSE_FAILED
+        try:
+            return self.parse_response(parsed), ""
+        except ValidationError as e:
+            problems = [
+                f"{'.'.join(str(p) for p in err['loc']) or '<root>'}: {err['msg']}"
+                for err in e.errors()[:5]
+            ]
+            return None, "Schema validation failed: " + "; ".join(problems)
+        except (TypeError, ValueError) as e:
+            return None, f"Schema validation failed: {e}"
+
     def validate_evidence(
         self,
         response: BaseAgentResponse,
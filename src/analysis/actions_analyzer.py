@@ -1,7 +1,8 @@
 """GitHub Actions workflow analysis."""
 
-from src.utils.github_client import GitHubClient
+from src.utils.github_client import GitHubClient, get_github_client
 from src.utils.logging import get_logger
+from src.utils.tracing import span
 
 logger = get_logger(__name__)
 
@@ -9,13 +10,14 @@ logger = get_logger(__name__)
 class ActionsAnalyzer:
     """Analyze GitHub Actions workflows and runs."""
 
-    def __init__(self, github_token: str | None = None):
+    def __init__(self, github_token: str | None = None, client: GitHubClient | None = None):
         """Initialize Actions analyzer.
 
         Args:
             github_token: GitHub personal access token (optional)
+            client: Optional GitHub client (default: the shared client for the token)
         """
-        self.client = GitHubClient(token=github_token)
+        self.client = client or get_github_client(github_token)
 
     def analyze(self, owner: str, repo: str) -> dict:
         """Analyze GitHub Actions for a repository.
@@ -36,10 +38,14 @@ class ActionsAnalyzer:
         logger.info("actions_analysis_started", owner=owner, repo=repo)
 
         # Fetch workflow runs
-        workflow_runs = self.client.fetch_workflow_runs(owner, repo, max_runs=50)
+        with span("github.workflow_runs") as fetch:
+            workflow_runs = self.client.fetch_workflow_runs(owner, repo, max_runs=50)
+            fetch.set(runs=len(workflow_runs))
 
         # Fetch workflow definition files
-        workflow_definitions = self.client.fetch_workflow_files(owner, repo)
+        with span("github.workflow_files") as fetch:
+            workflow_definitions = self.client.fetch_workflow_files(owner, repo)
+            fetch.set(files=len(workflow_definitions))
 
         # Check for disqualification: no CI/CD workflows
         disqualified = False
@@ -171,7 +177,9 @@ class ActionsAnalyzer:
         for attempt in range(max_retries):
             try:
                 # GitHub returns logs as a zip file
-                resp = self.client.client.get(url, follow_redirects=True)
+                with span("github.run_logs", run_id=run_id, attempt=attempt + 1) as fetch:
+                    resp = self.client.client.get(url, follow_redirects=True)
+                    fetch.set(status_code=resp.status_code, bytes=len(resp.content))
 
                 # Handle rate limiting
                 if resp.status_code == 403:
@@ -307,8 +315,11 @@ class ActionsAnalyzer:
             return ""
 
     def close(self) -> None:
-        """Close the GitHub client."""
-        self.client.close()
+        """Release the analyzer.
+
+        The GitHub client is shared across analyzers and stays open; it is
+        closed by ``close_clients`` at process shutdown.
+        """
 
     def _parse_linter_output(
         self, log_content: str, repo_files: set[str] | None = None
@@ -0,0 +1,202 @@
+"""Per-file authorship index built from one pass over the commit history.
+
+``git_analyzer.extract_commits`` already asks git for every commit's diff
+stats, which list the files the commit touched. ``AuthorshipIndex`` keeps
+that file list as a compact commit x file x author table so the analyzers can
+answer ownership questions without going back to git: which files an author
+touched, who touched a file, and which commit first introduced it.
+
+Paths and author names are interned to integer ids, and the touched files of
+every commit are stored as one flat ``array`` of path ids with per-commit
+offsets (CSR layout). A touch costs four bytes however long the path is, so
+the index stays small on long histories of large repositories. The per-file
+and per-author views are derived lazily, in one pass, the first time they
+are queried.
+"""
+
+from array import array
+from collections.abc import Iterable
+
+
+class AuthorshipIndex:
+    """Files touched per commit, with interned paths and authors.
+
+    Commits are expected in ``git log`` order (newest first), as
+    ``extract_commits`` produces them, so for commits with the same timestamp
+    the later row is the older commit. Diff stats are computed without
+    rename detection, so a rename shows up as the old path and the new one.
+
+    Attributes:
+        paths: Path per path id (ids follow first appearance)
+        authors: Author name per author id (ids follow first appearance)
+        commit_hashes: Commit hash per row
+        commit_authors: Author id per row
+        commit_times: Commit time per row (epoch seconds)
+        offsets: Row ``i`` touched ``touched[offsets[i]:offsets[i + 1]]``
+        touched: Path ids of all commits, concatenated
+    """
+
+    def __init__(self) -> None:
+        """Create an empty index."""
+        self.paths: list[str] = []
+        self.authors: list[str] = []
+        self.commit_hashes: list[str] = []
+        self.commit_authors = array("i")
+        self.commit_times = array("d")
+        self.offsets = array("I", [0])
+        self.touched = array("i")
+
+        self._path_ids: dict[str, int] = {}
+        self._author_ids: dict[str, int] = {}
+        # Per-author files, per-file authors and first commit per file, built on first query
+        self._cached_views: tuple[list[list[int]], list[list[int]], list[int]] | None = None
+
+    def __len__(self) -> int:
+        """Return the number of commits."""
+        return len(self.commit_hashes)
+
+    def add_commit(
+        self, commit_hash: str, author: str, timestamp: float, paths: Iterable[str]
+    ) -> None:
+        """Record the files touched by one commit.
+
+        Args:
+            commit_hash: Commit SHA
+            author: Commit author name
+            timestamp: Commit time (epoch seconds)
+            paths: Paths the commit touched
+        """
+        author_id = self._author_ids.get(author)
+        if author_id is None:
+            author_id = self._author_ids[author] = len(self.authors)
+            self.authors.append(author)
+
+        for path in paths:
+            path_id = self._path_ids.get(path)
+            if path_id is None:
+                path_id = self._path_ids[path] = len(self.paths)
+                self.paths.append(path)
+            self.touched.append(path_id)
+
+        self.commit_hashes.append(commit_hash)
+        self.commit_authors.append(author_id)
+        self.commit_times.append(timestamp)
+        self.offsets.append(len(self.touched))
+        self._cached_views = None
+
+    def commit_files(self, row: int) -> list[str]:
+        """Return the paths touched by the commit at ``row``."""
+        return [self.paths[p] for p in self.touched[self.offsets[row] : self.offsets[row + 1]]]
+
+    def chronological_key(self, row: int) -> tuple[float, int]:
+        """Return a key that sorts rows from oldest to newest commit."""
+        return (self.commit_times[row], -row)
+
+    def files_by_author(self, author: str) -> list[str]:
+        """Return the paths an author touched, in order of first appearance.
+
+        Args:
+            author: Author name
+
+        Returns:
+            Touched paths (empty for unknown authors)
+        """
+        author_id = self._author_ids.get(author)
+        if author_id is None:
+            return []
+        return [self.paths[p] for p in self._views()[0][author_id]]
+
+    def authors_of(self, path: str) -> list[str]:
+        """Return the authors who touched a path, in order of first appearance.
+
+        Args:
+            path: File path
+
+        Returns:
+            Author names (empty for unknown paths)
+        """
+        path_id = self._path_ids.get(path)
+        if path_id is None:
+            return []
+        return [self.authors[a] for a in self._views()[1][path_id]]
+
+    def first_commit(self, path: str) -> int | None:
+        """Return the row of the oldest commit that touched a path.
+
+        Args:
+            path: File path
+
+        Returns:
+            Commit row, or None if the path never appears in the history
+        """
+        path_id = self._path_ids.get(path)
+        if path_id is None:
+            return None
+        return self._views()[2][path_id]
+
+    def sole_author_files(self) -> list[list[str]]:
+        """Return, per author id, the paths nobody else touched."""
+        files_by_author, authors_by_file, _ = self._views()
+        return [
+            [self.paths[p] for p in files if len(authors_by_file[p]) == 1]
+            for files in files_by_author
+        ]
+
+    def key_authors(self, share: float = 0.5) -> list[str]:
+        """Return the authors whose departure orphans ``share`` of the files.
+
+        Authors are removed greedily, always the one whose departure orphans
+        the most remaining files, then the one who touched the most files (a
+        file is orphaned once all of its authors have left). The length of
+        the result is the repository's bus factor.
+
+        Args:
+            share: Fraction of files that must be orphaned
+
+        Returns:
+            Author names in removal order (empty for an index without files)
+        """
+        files_by_author, authors_by_file, _ = self._views()
+        if not self.paths:
+            return []
+
+        remaining = [len(authors) for authors in authors_by_file]
+        orphaned = 0
+        removed: list[int] = []
+        while orphaned < share * len(self.paths) and len(removed) < len(self.authors):
+            author_id = max(
+                (a for a in range(len(self.authors)) if a not in removed),
+                key=lambda a: (
+                    sum(1 for p in files_by_author[a] if remaining[p] == 1),
+                    len(files_by_author[a]),
+                ),
+            )
+            removed.append(author_id)
+            for path_id in files_by_author[author_id]:
+                remaining[path_id] -= 1
+                if remaining[path_id] == 0:
+                    orphaned += 1
+        return [self.authors[a] for a in removed]
+
+    def _views(self) -> tuple[list[list[int]], list[list[int]], list[int]]:
+        """Build the per-author, per-file and first-commit views in one pass."""
+        if self._cached_views is None:
+            files_by_author: list[list[int]] = [[] for _ in self.authors]
+            authors_by_file: list[list[int]] = [[] for _ in self.paths]
+            first_commit = [-1] * len(self.paths)
+            seen_by_author: list[set[int]] = [set() for _ in self.authors]
+
+            # Oldest row first, so appearance order is chronological
+            for row in sorted(range(len(self)), key=self.chronological_key):
+                author_id = self.commit_authors[row]
+                seen = seen_by_author[author_id]
+                for path_id in self.touched[self.offsets[row] : self.offsets[row + 1]]:
+                    if first_commit[path_id] < 0:
+                        first_commit[path_id] = row
+                    if path_id not in seen:
+                        seen.add(path_id)
+                        files_by_author[author_id].append(path_id)
+                        authors_by_file[path_id].append(author_id)
+
+            self._cached_views = (files_by_author, authors_by_file, first_commit)
+        return self._cached_views
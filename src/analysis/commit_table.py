@@ -0,0 +1,119 @@
+"""Columnar view of a repository's commit history for the team analyzer.
+
+``TeamAnalyzer`` answers per-author and time-window questions about the same
+commit list many times. ``CommitTable`` converts the history once into
+parallel typed arrays (author code, epoch seconds, insertions, deletions).
+Per-author statistics are then single-pass group-by reductions, and temporal
+overlap between authors is a sort-merge sweep instead of comparing every pair
+of commits. The ``array`` columns expose the buffer protocol, so they can be
+wrapped with ``numpy.frombuffer`` without copying if NumPy is ever needed.
+"""
+
+from array import array
+
+from src.models.analysis import CommitInfo
+
+
+class CommitTable:
+    """Commit history stored column-wise, one row per commit.
+
+    Attributes:
+        commits: Source commits, row-aligned with the columns
+        authors: Author name per author code (codes follow first appearance)
+        author_codes: Author code per row
+        timestamps: Commit time per row (epoch seconds)
+        insertions: Lines added per row
+        deletions: Lines deleted per row
+    """
+
+    def __init__(self, commits: list[CommitInfo]) -> None:
+        """Build the columns.
+
+        Args:
+            commits: Commit history
+        """
+        self.commits = commits
+        self.authors: list[str] = []
+        self.author_codes = array("i")
+        self.timestamps = array("d")
+        self.insertions = array("q")
+        self.deletions = array("q")
+
+        codes: dict[str, int] = {}
+        for commit in commits:
+            code = codes.get(commit.author)
+            if code is None:
+                code = codes[commit.author] = len(self.authors)
+                self.authors.append(commit.author)
+            self.author_codes.append(code)
+            self.timestamps.append(commit.timestamp.timestamp())
+            self.insertions.append(commit.insertions)
+            self.deletions.append(commit.deletions)
+
+    def __len__(self) -> int:
+        """Return the number of commits."""
+        return len(self.author_codes)
+
+    def count_by_author(self) -> list[int]:
+        """Return the number of commits per author code."""
+        counts = [0] * len(self.authors)
+        for code in self.author_codes:
+            counts[code] += 1
+        return counts
+
+    def sum_by_author(self, column: array) -> list[int]:
+        """Return the sum of a numeric column per author code.
+
+        Args:
+            column: Row-aligned column (e.g. ``insertions``)
+
+        Returns:
+            Totals indexed by author code
+        """
+        totals = [0] * len(self.authors)
+        for code, value in zip(self.author_codes, column, strict=True):
+            totals[code] += value
+        return totals
+
+    def rows_by_author(self) -> list[list[int]]:
+        """Return the row indices of each author code, in history order."""
+        rows: list[list[int]] = [[] for _ in self.authors]
+        for row, code in enumerate(self.author_codes):
+            rows[code].append(row)
+        return rows
+
+    def time_order(self) -> list[int]:
+        """Return row indices sorted by commit time (stable)."""
+        return sorted(range(len(self)), key=self.timestamps.__getitem__)
+
+    def authors_near_other_authors(self, window_seconds: float) -> set[int]:
+        """Find authors with a commit less than ``window_seconds`` from another author's.
+
+        Sweeps the time-ordered rows once in each direction, tracking the most
+        recent commit overall and the most recent commit by a different author
+        than that one. Those two are enough to know the nearest commit by any
+        other author on each side of every commit, so the whole check is
+        O(N log N) for the sort plus O(N) for the sweeps.
+
+        Args:
+            window_seconds: Overlap window (exclusive)
+
+        Returns:
+            Author codes with at least one overlapping commit
+        """
+        order = self.time_order()
+        near: set[int] = set()
+        for rows, sign in ((order, 1.0), (order[::-1], -1.0)):
+            # (author code, time) of the latest row, and of the latest row by another author
+            latest: tuple[int, float] | None = None
+            runner_up: tuple[int, float] | None = None
+            for row in rows:
+                code = self.author_codes[row]
+                ts = self.timestamps[row]
+                other = runner_up if latest is not None and latest[0] == code else latest
+                if other is not None and sign * (ts - other[1]) < window_seconds:
+                    near.add(code)
+                if latest is not None and latest[0] != code:
+                    runner_up = latest
+                latest = (code, ts)
+        return near
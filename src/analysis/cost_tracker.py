@@ -1,6 +1,6 @@
 """Cost tracking for agent analysis."""
 
-from src.constants import MODEL_RATES
+from src.constants import HEDGE_COST_SUFFIX, MODEL_RATES
 from src.models.common import AgentName, ServiceTier
 from src.models.costs import ComponentPerformanceRecord, CostRecord
 from src.utils.logging import get_logger
@@ -26,6 +26,7 @@ class CostTracker:
         output_tokens: int,
         latency_ms: int,
         service_tier: ServiceTier = ServiceTier.STANDARD,
+        hedge: bool = False,
     ) -> CostRecord:
         """Record cost for a single agent execution.
 
@@ -38,6 +39,7 @@ class CostTracker:
             output_tokens: Output token count
             latency_ms: Response latency in milliseconds
             service_tier: Service tier (standard or flex)
+            hedge: Whether the request lost a hedged call of the agent
 
         Returns:
             CostRecord instance
@@ -61,6 +63,7 @@ class CostTracker:
             total_cost_usd=round(total_cost, 6),
             latency_ms=latency_ms,
             service_tier=service_tier,
+            hedge=hedge,
         )
 
         self.records.append(record)
@@ -68,6 +71,7 @@ class CostTracker:
         logger.info(
             "cost_recorded",
             agent=agent_name,
+            hedge=hedge,
             model=model_id,
             tokens=record.total_tokens,
             cost_usd=record.total_cost_usd,
@@ -150,6 +154,8 @@ class CostTracker:
                 if hasattr(record.agent_name, "value")
                 else str(record.agent_name)
             )
+            if record.hedge:
+                agent += HEDGE_COST_SUFFIX
             costs[agent] = costs.get(agent, 0.0) + record.total_cost_usd
         return costs
 
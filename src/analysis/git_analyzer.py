@@ -9,9 +9,11 @@ from typing import Any
 
 import git
 
+from src.analysis.authorship_index import AuthorshipIndex
 from src.models.analysis import CommitInfo, DiffEntry, RepoData, SourceFile
 from src.models.submission import RepoMeta
 from src.utils.logging import get_logger
+from src.utils.tracing import span
 
 logger = get_logger(__name__)
 
@@ -242,12 +244,16 @@ def get_default_branch(repo: git.Repo) -> str:
     raise ValueError("Repository has no branches")
 
 
-def extract_commits(repo: git.Repo, max_commits: int = 100) -> list[CommitInfo]:
+def extract_commits(
+    repo: git.Repo, max_commits: int = 100, authorship: AuthorshipIndex | None = None
+) -> list[CommitInfo]:
     """Extract commit history from default branch.
 
     Args:
         repo: GitPython Repo object
         max_commits: Maximum number of commits to extract
+        authorship: Optional index that receives the files touched by each
+            commit (read from the same diff stats, in the same pass)
 
     Returns:
         List of CommitInfo objects
@@ -257,25 +263,35 @@ def extract_commits(repo: git.Repo, max_commits: int = 100) -> list[CommitInfo]:
 
     try:
         for commit in repo.iter_commits(branch, max_count=max_commits):
-            stats = commit.stats.total
+            commit_stats = commit.stats
+            stats = commit_stats.total
             # Handle commit message encoding (can be str or bytes)
             message = commit.message
             if isinstance(message, bytes):
                 message = message.decode("utf-8", errors="replace")
             message_str: str = message.strip().split("\n")[0][:200]
 
+            author = commit.author.name or commit.author.email or "unknown"
+
             commits.append(
                 CommitInfo(
                     hash=commit.hexsha,
                     short_hash=commit.hexsha[:8],
                     message=message_str,
-                    author=commit.author.name or commit.author.email or "unknown",
+                    author=author,
                     timestamp=datetime.fromtimestamp(commit.committed_date, tz=UTC),
                     files_changed=stats.get("files", 0),
                     insertions=stats.get("insertions", 0),
                     deletions=stats.get("deletions", 0),
                 )
             )
+            if authorship is not None:
+                authorship.add_commit(
+                    commit.hexsha,
+                    author,
+                    float(commit.committed_date),
+                    (str(path) for path in commit_stats.files),
+                )
     except Exception as e:
         logger.warning("commit_extraction_failed", error=str(e))
 
@@ -671,26 +687,39 @@ def clone_and_extract(
     """
     owner, repo_name = parse_github_url(repo_url)
     clone_path = get_clone_path(submission_id)
+    repo: git.Repo | None = None
 
     try:
         # Clone repository - use shallow clone by default for performance
-        if use_shallow:
-            logger.info("using_shallow_clone_for_performance", sub_id=submission_id)
-            repo = clone_repo_shallow(repo_url, clone_path)
-        else:
-            repo = clone_repo(repo_url, clone_path)
+        with span("git.clone", shallow=use_shallow):
+            if use_shallow:
+                logger.info("using_shallow_clone_for_performance", sub_id=submission_id)
+                repo = clone_repo_shallow(repo_url, clone_path)
+            else:
+                repo = clone_repo(repo_url, clone_path)
 
         # Extract git history (limited to available commits in shallow clone)
-        commits = extract_commits(repo, max_commits=100)
-        diffs = extract_diff_summary(repo, commits, max_diffs=30)
+        with span("git.extract_commits") as extract:
+            authorship = AuthorshipIndex()
+            commits = extract_commits(repo, max_commits=100, authorship=authorship)
+            extract.set(commits=len(commits), files=len(authorship.paths))
+        with span("git.extract_diffs") as extract:
+            diffs = extract_diff_summary(repo, commits, max_diffs=30)
+            extract.set(diffs=len(diffs))
 
         # Extract files
-        file_tree = extract_file_tree(clone_path)
-        source_files = extract_source_files(clone_path)
-        readme = extract_readme(clone_path)
+        with span("git.extract_files") as extract:
+            file_tree = extract_file_tree(clone_path)
+            source_files = extract_source_files(clone_path)
+            readme = extract_readme(clone_path)
+            extract.set(
+                files=len(source_files),
+                bytes=sum(len(f.content.encode("utf-8")) for f in source_files),
+            )
 
         # Build metadata
-        meta = extract_repo_meta(repo, clone_path, commits, workflow_runs)
+        with span("git.repo_meta"):
+            meta = extract_repo_meta(repo, clone_path, commits, workflow_runs)
 
         # Get default branch
         default_branch = get_default_branch(repo)
@@ -715,11 +744,16 @@ def clone_and_extract(
             readme_content=readme,
             source_files=source_files,
             commit_history=commits,
+            authorship=authorship,
             diff_summary=diffs,
             workflow_definitions=workflow_definitions or [],
             workflow_runs=workflow_runs or [],
         )
 
     finally:
+        # Stop GitPython's persistent git cat-file processes and free its
+        # object caches before the clone is removed
+        if repo is not None:
+            repo.close()
         # Always cleanup
         cleanup_clone(submission_id)
@@ -0,0 +1,718 @@
+"""Incrementally maintained aggregates behind the organizer intelligence dashboard.
+
+Each analyzed submission is folded into running aggregates: technology,
+stack and issue histograms, role counters, and bounded rankings (top
+performers, team dynamics, learning journeys, CI/CD, hiring candidates as
+trimmed summaries). The state is plain JSON-compatible data stored as the
+hackathon's INTELLIGENCE item, so the dashboard renders from one item
+instead of every submission and its analyses. Its size does not grow with
+the number of submissions.
+
+Folding a submission that was folded before first retracts its previous
+contribution, so re-analysis does not double count. Contributions (what a
+submission added to the histograms and counters) are kept in
+``contributions``, outside the state: the caller stores each one with its
+submission and hands it back before re-folding or retracting.
+"""
+
+import heapq
+from collections.abc import Callable
+from decimal import Decimal
+from typing import Any
+
+from src.constants import (
+    INTELLIGENCE_CANDIDATES_PER_ROLE,
+    INTELLIGENCE_COMMON_ISSUE_THRESHOLD,
+    INTELLIGENCE_MUST_INTERVIEW_LIMIT,
+    INTELLIGENCE_RETAINED_K,
+    INTELLIGENCE_TOP_K,
+)
+from src.models.dashboard import (
+    CommonIssue,
+    HiringCandidate,
+    HiringIntelligence,
+    OrganizerDashboard,
+    PrizeRecommendation,
+    TechnologyTrends,
+    TopPerformer,
+)
+from src.models.team_dynamics import ContributorRole
+
+GRADE_ORDER = {"A": 0, "B": 1, "C": 2, "D": 3, "F": 4}
+SENIORITY_ORDER = {"senior": 0, "mid": 1, "junior": 2}
+HIRING_ROLES = (
+    ContributorRole.BACKEND.value,
+    ContributorRole.FRONTEND.value,
+    ContributorRole.DEVOPS.value,
+    ContributorRole.FULL_STACK.value,
+)
+
+WORKSHOPS = {
+    "insufficient_testing": "Workshop: Test-Driven Development for Hackathons",
+    "security_vulnerabilities": "Workshop: Secure Coding Practices & OWASP Top 10",
+    "poor_documentation": "Workshop: Technical Writing & Documentation Best Practices",
+    "weak_error_handling": "Workshop: Defensive Programming & Error Handling",
+    "performance_issues": "Workshop: Performance Optimization Fundamentals",
+    "extreme_imbalance": "Workshop: Effective Team Collaboration & Git Workflows",
+    "ghost_contributor": "Workshop: Team Dynamics & Inclusive Collaboration",
+    "general_code_quality": "Workshop: Clean Code Principles",
+}
+
+_RANKINGS = ("top_performers", "team_dynamics", "learning_journeys", "cicd", "must_interview")
+
+
+def _empty_state() -> dict[str, Any]:
+    return {
+        "top_performers": [],
+        "technologies": {},
+        "stacks": {},
+        "issues": {},
+        "role_counts": {},
+        "candidates": {},
+        "must_interview": [],
+        "team_dynamics": [],
+        "learning_journeys": [],
+        "cicd": [],
+        "analyzed_count": 0,
+    }
+
+
+# ============================================================
+# CLASSIFICATION HELPERS
+# ============================================================
+
+
+def categorize_weakness(weakness: str) -> str:
+    """Categorize a weakness into an issue type.
+
+    Args:
+        weakness: Weakness description
+
+    Returns:
+        Issue type category
+    """
+    weakness_lower = weakness.lower()
+
+    if any(keyword in weakness_lower for keyword in ["test", "testing", "coverage"]):
+        return "insufficient_testing"
+    elif any(keyword in weakness_lower for keyword in ["security", "vulnerability", "injection"]):
+        return "security_vulnerabilities"
+    elif any(keyword in weakness_lower for keyword in ["documentation", "readme"]):
+        return "poor_documentation"
+    elif any(keyword in weakness_lower for keyword in ["error handling", "exception"]):
+        return "weak_error_handling"
+    elif any(keyword in weakness_lower for keyword in ["performance", "optimization"]):
+        return "performance_issues"
+    else:
+        return "general_code_quality"
+
+
+def recommend_workshop(issue_type: str) -> str:
+    """Recommend workshop based on issue type.
+
+    Args:
+        issue_type: Type of common issue
+
+    Returns:
+        Workshop recommendation
+    """
+    return WORKSHOPS.get(issue_type, "Workshop: Software Engineering Best Practices")
+
+
+def detect_frameworks(repo_meta: dict[str, Any]) -> list[str]:
+    """Detect frameworks and tooling from repository metadata.
+
+    Languages are counted separately, so only tooling that is not a
+    language (containerization, CI/CD) is reported here.
+
+    Args:
+        repo_meta: Repository metadata
+
+    Returns:
+        List of detected framework names
+    """
+    frameworks = []
+    if repo_meta.get("has_dockerfile"):
+        frameworks.append("Docker")
+    if repo_meta.get("has_ci"):
+        frameworks.append("GitHub Actions")
+    return frameworks
+
+
+def cicd_score(repo_meta: dict[str, Any]) -> float:
+    """Score CI/CD sophistication (0-100).
+
+    Args:
+        repo_meta: Repository metadata
+
+    Returns:
+        30 for having CI, up to 40 for workflow success rate, up to 30 for runs
+    """
+    score = 0.0
+    if repo_meta.get("has_ci"):
+        score += 30
+    success_rate = float(repo_meta.get("workflow_success_rate") or 0)
+    if success_rate > 0:
+        score += success_rate * 40
+    run_count = int(repo_meta.get("workflow_run_count") or 0)
+    if run_count > 0:
+        score += min(run_count * 2, 30)
+    return score
+
+
+def _plain(value: Any) -> Any:
+    """Convert models and DynamoDB values to JSON-compatible Python data."""
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, list | tuple | set):
+        return [_plain(item) for item in value]
+    return value
+
+
+def _retain(entries: list[dict], entry: dict, key: Callable[[dict], Any], limit: int) -> list[dict]:
+    """Insert into a bounded ranking (best first; earlier entries win ties)."""
+    return heapq.nlargest(limit, [*entries, entry], key=key)
+
+
+def _seniority(candidate: dict) -> int:
+    return SENIORITY_ORDER.get(candidate["seniority_level"].lower(), 3)
+
+
+def _increment(counter: dict[str, int], key: str) -> None:
+    counter[key] = counter.get(key, 0) + 1
+
+
+def _decrement(counter: dict[str, int], key: str) -> None:
+    remaining = counter.get(key, 0) - 1
+    if remaining > 0:
+        counter[key] = remaining
+    else:
+        counter.pop(key, None)
+
+
+def _most_common(counter: dict[str, int], limit: int | None) -> list[tuple[str, int]]:
+    return sorted(counter.items(), key=lambda kv: (-kv[1], kv[0]))[:limit]
+
+
+# ============================================================
+# AGGREGATE
+# ============================================================
+
+
+class IntelligenceAggregate:
+    """Running dashboard aggregates for one hackathon."""
+
+    def __init__(self, state: dict[str, Any] | None = None, version: int = 0) -> None:
+        """Initialize from stored state.
+
+        Args:
+            state: Aggregate state (as returned by ``to_state``); empty if None
+            version: Version of the stored item the state was read from
+        """
+        self.state = _empty_state()
+        self.state.update(_plain(state or {}))
+        self.version = version
+        self.contributions: dict[str, dict[str, Any]] = {}
+
+    @classmethod
+    def from_item(cls, item: dict[str, Any]) -> "IntelligenceAggregate":
+        """Load an aggregate from its INTELLIGENCE item.
+
+        Args:
+            item: DynamoDB item
+
+        Returns:
+            IntelligenceAggregate
+        """
+        state = {key: item[key] for key in _empty_state() if item.get(key) is not None}
+        return cls(state, version=int(item.get("version", 0)))
+
+    def to_state(self) -> dict[str, Any]:
+        """Aggregate state for storage."""
+        return self.state
+
+    @property
+    def analyzed_count(self) -> int:
+        """Number of submissions folded in."""
+        return int(self.state["analyzed_count"])
+
+    def load_contribution(self, sub_id: str, contribution: Any) -> None:
+        """Hand back a submission's stored contribution before re-folding or retracting it.
+
+        Args:
+            sub_id: Submission ID
+            contribution: Contribution as stored (None if the submission has none)
+        """
+        if contribution:
+            self.contributions[sub_id] = _plain(contribution)
+
+    def matches_contribution(self, sub_id: str, stored: Any) -> bool:
+        """Whether a stored contribution equals the one folded in here.
+
+        Args:
+            sub_id: Submission ID
+            stored: Contribution as stored (None if none)
+
+        Returns:
+            True if nothing needs to be written
+        """
+        return bool(_plain(stored) == self.contributions.get(sub_id))
+
+    # ------------------------------------------------------------
+    # Folding
+    # ------------------------------------------------------------
+
+    def fold(
+        self,
+        sub_id: str,
+        team_name: str,
+        overall_score: float | None,
+        strengths: list[str] | None = None,
+        weaknesses: list[str] | None = None,
+        repo_meta: Any = None,
+        team_analysis: Any = None,
+        strategy_analysis: Any = None,
+    ) -> None:
+        """Fold one analyzed submission into the aggregates.
+
+        Analyses may be pydantic models or their stored dict form. The
+        submission's contribution is left in ``contributions``.
+
+        Args:
+            sub_id: Submission ID
+            team_name: Team name
+            overall_score: Overall score (None skips the score rankings)
+            strengths: Submission strengths
+            weaknesses: Submission weaknesses
+            repo_meta: Repository metadata
+            team_analysis: Team dynamics analysis
+            strategy_analysis: Strategy analysis
+        """
+        self.retract(sub_id)
+
+        state = self.state
+        repo = _plain(repo_meta) or {}
+        team = _plain(team_analysis) or {}
+        strategy = _plain(strategy_analysis) or {}
+        contribution: dict[str, Any] = {
+            "team_name": team_name,
+            "technologies": [],
+            "stack": None,
+            "issues": [],
+            "roles": [],
+        }
+
+        if overall_score is not None:
+            score = float(overall_score)
+            flags = []
+            if repo.get("has_ci"):
+                flags.append("ci_cd_sophistication")
+            if repo.get("has_dockerfile"):
+                flags.append("containerization")
+            if float(repo.get("workflow_success_rate") or 0) > 0.9:
+                flags.append("high_quality_automation")
+            state["top_performers"] = _retain(
+                state["top_performers"],
+                {
+                    "sub_id": sub_id,
+                    "team_name": team_name,
+                    "overall_score": score,
+                    "key_strengths": list(strengths or [])[:3] or [f"Overall Score: {score:.1f}"],
+                    "sponsor_interest_flags": flags,
+                },
+                key=lambda e: e["overall_score"],
+                limit=INTELLIGENCE_RETAINED_K,
+            )
+
+            cicd = cicd_score(repo)
+            if cicd > 0:
+                state["cicd"] = _retain(
+                    state["cicd"],
+                    {
+                        "sub_id": sub_id,
+                        "team_name": team_name,
+                        "score": cicd,
+                        "has_ci": bool(repo.get("has_ci")),
+                        "workflow_success_rate": float(repo.get("workflow_success_rate") or 0),
+                        "workflow_run_count": int(repo.get("workflow_run_count") or 0),
+                    },
+                    key=lambda e: e["score"],
+                    limit=INTELLIGENCE_RETAINED_K,
+                )
+
+        # Technology histograms
+        technologies = []
+        if repo.get("primary_language"):
+            technologies.append(repo["primary_language"])
+        technologies.extend(detect_frameworks(repo))
+        for technology in technologies:
+            _increment(state["technologies"], technology)
+        contribution["technologies"] = technologies
+
+        languages = repo.get("languages") or {}
+        if languages:
+            top_langs = sorted(languages.items(), key=lambda x: x[1], reverse=True)[:3]
+            stack = " + ".join(lang for lang, _ in top_langs)
+            _increment(state["stacks"], stack)
+            contribution["stack"] = stack
+
+        # Issues: each team counts once per issue type
+        issue_types = [categorize_weakness(w) for w in weaknesses or []]
+        issue_types += [
+            f.get("flag_type") for f in team.get("red_flags") or [] if f.get("flag_type")
+        ]
+        for issue_type in dict.fromkeys(issue_types):
+            issue = state["issues"].setdefault(issue_type, {"count": 0, "examples": []})
+            issue["count"] += 1
+            if len(issue["examples"]) < 3:
+                issue["examples"].append(team_name)
+            contribution["issues"].append(issue_type)
+
+        # Hiring candidates
+        for scorecard in team.get("individual_scorecards") or []:
+            role = str(scorecard.get("role") or "")
+            signals = scorecard.get("hiring_signals") or {}
+            candidate = {
+                "sub_id": sub_id,
+                "team_name": team_name,
+                "contributor_name": scorecard.get("contributor_name") or "",
+                "role": role,
+                "seniority_level": str(signals.get("seniority_level") or ""),
+                "must_interview": signals.get("must_interview") is True,
+            }
+            if role in HIRING_ROLES:
+                _increment(state["role_counts"], role)
+                contribution["roles"].append(role)
+                candidates = [*state["candidates"].get(role, []), candidate]
+                state["candidates"][role] = sorted(candidates, key=_seniority)[
+                    :INTELLIGENCE_CANDIDATES_PER_ROLE
+                ]
+            if candidate["must_interview"]:
+                state["must_interview"] = sorted(
+                    [*state["must_interview"], candidate], key=_seniority
+                )[:INTELLIGENCE_MUST_INTERVIEW_LIMIT]
+
+        grade = team.get("team_dynamics_grade")
+        if grade:
+            state["team_dynamics"] = _retain(
+                state["team_dynamics"],
+                {
+                    "sub_id": sub_id,
+                    "team_name": team_name,
+                    "grade": grade,
+                    "collaboration_patterns": len(team.get("collaboration_patterns") or []),
+                },
+                key=lambda e: (-GRADE_ORDER.get(e["grade"], 5), e["collaboration_patterns"]),
+                limit=INTELLIGENCE_RETAINED_K,
+            )
+
+        journey = strategy.get("learning_journey") or {}
+        if journey.get("impressive"):
+            evidence = list(journey.get("evidence") or [])
+            state["learning_journeys"] = _retain(
+                state["learning_journeys"],
+                {
+                    "sub_id": sub_id,
+                    "team_name": team_name,
+                    "technology": journey.get("technology", ""),
+                    "progression": journey.get("progression", ""),
+                    "evidence": evidence[:3],
+                    "evidence_count": len(evidence),
+                },
+                key=lambda e: e["evidence_count"],
+                limit=INTELLIGENCE_RETAINED_K,
+            )
+
+        state["analyzed_count"] += 1
+        self.contributions[sub_id] = contribution
+
+    def retract(self, sub_id: str) -> bool:
+        """Remove a submission's contribution.
+
+        The submission's ranking entries are removed even if its contribution
+        is unknown; only the histograms and counters need the contribution.
+
+        Args:
+            sub_id: Submission ID
+
+        Returns:
+            True if the submission's contribution was known and removed
+        """
+        state = self.state
+        remaining = {
+            role: [c for c in candidates if c["sub_id"] != sub_id]
+            for role, candidates in state["candidates"].items()
+        }
+        state["candidates"] = {role: kept for role, kept in remaining.items() if kept}
+        for ranking in _RANKINGS:
+            state[ranking] = [e for e in state[ranking] if e["sub_id"] != sub_id]
+
+        contribution = self.contributions.pop(sub_id, None)
+        if contribution is None:
+            return False
+
+        state["analyzed_count"] = max(0, state["analyzed_count"] - 1)
+        for technology in contribution["technologies"]:
+            _decrement(state["technologies"], technology)
+        if contribution["stack"]:
+            _decrement(state["stacks"], contribution["stack"])
+        for issue_type in contribution["issues"]:
+            issue = state["issues"].get(issue_type)
+            if issue is None:
+                continue
+            issue["count"] -= 1
+            if contribution["team_name"] in issue["examples"]:
+                issue["examples"].remove(contribution["team_name"])
+            if issue["count"] <= 0:
+                del state["issues"][issue_type]
+        for role in contribution["roles"]:
+            _decrement(state["role_counts"], role)
+        return True
+
+    # ------------------------------------------------------------
+    # Dashboard sections
+    # ------------------------------------------------------------
+
+    def top_performers(self) -> list[TopPerformer]:
+        """Top teams by overall score."""
+        return [
+            TopPerformer(**entry) for entry in self.state["top_performers"][:INTELLIGENCE_TOP_K]
+        ]
+
+    def hiring_intelligence(self) -> HiringIntelligence:
+        """Candidates by role (senior first) and must-interview candidates."""
+        candidates = self.state["candidates"]
+
+        def summaries(entries: list[dict]) -> list[HiringCandidate]:
+            return [HiringCandidate(**entry) for entry in entries]
+
+        return HiringIntelligence(
+            backend_candidates=summaries(candidates.get("backend", [])),
+            frontend_candidates=summaries(candidates.get("frontend", [])),
+            devops_candidates=summaries(candidates.get("devops", [])),
+            full_stack_candidates=summaries(candidates.get("full_stack", [])),
+            must_interview=summaries(self.state["must_interview"]),
+        )
+
+    def technology_trends(self) -> TechnologyTrends:
+        """Most used technologies, emerging ones (2-5 teams) and popular stacks."""
+        technologies = self.state["technologies"]
+        return TechnologyTrends(
+            most_used=_most_common(technologies, 10),
+            emerging=[tech for tech, count in _most_common(technologies, None) if 2 <= count <= 5],
+            popular_stacks=_most_common(self.state["stacks"], 5),
+        )
+
+    def common_issues(self, total_submissions: int) -> list[CommonIssue]:
+        """Issues affecting at least the common-issue share of submissions.
+
+        Args:
+            total_submissions: Submissions in the hackathon
+
+        Returns:
+            Top 10 common issues with workshop recommendations
+        """
+        if total_submissions <= 0:
+            return []
+
+        threshold = total_submissions * INTELLIGENCE_COMMON_ISSUE_THRESHOLD
+        issues = [
+            CommonIssue(
+                issue_type=issue_type,
+                percentage_affected=(issue["count"] / total_submissions) * 100,
+                workshop_recommendation=recommend_workshop(issue_type),
+                example_teams=issue["examples"],
+            )
+            for issue_type, issue in self.state["issues"].items()
+            if issue["count"] >= threshold
+        ]
+        issues.sort(key=lambda x: x.percentage_affected, reverse=True)
+        return issues[:10]
+
+    def best_overall(self) -> PrizeRecommendation | None:
+        """Highest overall score."""
+        if not self.state["top_performers"]:
+            return None
+        best = self.state["top_performers"][0]
+        return PrizeRecommendation(
+            prize_category="Best Overall",
+            recommended_team=best["team_name"],
+            sub_id=best["sub_id"],
+            justification=f"Highest overall score: {best['overall_score']:.1f}",
+            evidence=[f"Overall Score: {best['overall_score']:.1f}"],
+        )
+
+    def best_team_dynamics(self) -> PrizeRecommendation | None:
+        """Best team dynamics grade (most collaboration patterns on ties)."""
+        if not self.state["team_dynamics"]:
+            return None
+        best = self.state["team_dynamics"][0]
+        return PrizeRecommendation(
+            prize_category="Best Team Dynamics",
+            recommended_team=best["team_name"],
+            sub_id=best["sub_id"],
+            justification=f"Exceptional team collaboration with grade {best['grade']}",
+            evidence=[
+                f"Team dynamics grade: {best['grade']}",
+                "Balanced workload distribution",
+                f"{best['collaboration_patterns']} positive collaboration patterns",
+            ],
+        )
+
+    def best_learning_journey(self) -> PrizeRecommendation | None:
+        """Impressive learning journey with the most evidence."""
+        if not self.state["learning_journeys"]:
+            return None
+        best = self.state["learning_journeys"][0]
+        return PrizeRecommendation(
+            prize_category="Most Improved / Best Learning Journey",
+            recommended_team=best["team_name"],
+            sub_id=best["sub_id"],
+            justification=f"Impressive learning journey with {best['technology']}",
+            evidence=[
+                f"Learned {best['technology']} during hackathon",
+                f"Progression: {best['progression']}",
+                *best["evidence"],
+            ],
+        )
+
+    def best_cicd(self) -> PrizeRecommendation | None:
+        """Best CI/CD practices (score of at least 50)."""
+        if not self.state["cicd"] or self.state["cicd"][0]["score"] < 50:
+            return None
+        best = self.state["cicd"][0]
+        return PrizeRecommendation(
+            prize_category="Best CI/CD Practices",
+            recommended_team=best["team_name"],
+            sub_id=best["sub_id"],
+            justification="Outstanding CI/CD sophistication and automation",
+            evidence=[
+                f"CI/CD enabled: {best['has_ci']}",
+                f"Workflow success rate: {best['workflow_success_rate']:.1%}",
+                f"Total workflow runs: {best['workflow_run_count']}",
+            ],
+        )
+
+    def prize_recommendations(self) -> list[PrizeRecommendation]:
+        """Prize recommendations with evidence."""
+        prizes = [
+            self.best_overall(),
+            self.best_team_dynamics(),
+            self.best_learning_journey(),
+            self.best_cicd(),
+        ]
+        return [prize for prize in prizes if prize is not None]
+
+    def standout_moments(self) -> list[str]:
+        """Standout moments (at most 5)."""
+        state = self.state
+        moments = []
+
+        if state["top_performers"]:
+            top = state["top_performers"][0]
+            moments.append(
+                f"{top['team_name']} achieved highest score: {top['overall_score']:.1f}/100"
+            )
+
+        collaborative = [e for e in state["team_dynamics"] if e["collaboration_patterns"] >= 3]
+        if collaborative:
+            team = max(collaborative, key=lambda e: e["collaboration_patterns"])
+            moments.append(
+                f"{team['team_name']} demonstrated exceptional collaboration with "
+                f"{team['collaboration_patterns']} positive patterns"
+            )
+
+        if state["learning_journeys"]:
+            journey = state["learning_journeys"][0]
+            moments.append(
+                f"{journey['team_name']} learned {journey['technology']} during the hackathon"
+            )
+
+        if self.analyzed_count >= 3:
+            moments.append(
+                f"{self.analyzed_count} teams participated with diverse technical approaches"
+            )
+
+        return moments[:5]
+
+    def render(
+        self, hack_id: str, hackathon_name: str, total_submissions: int
+    ) -> OrganizerDashboard:
+        """Render the organizer dashboard.
+
+        Args:
+            hack_id: Hackathon ID
+            hackathon_name: Hackathon name
+            total_submissions: Submissions in the hackathon (analyzed or not)
+
+        Returns:
+            OrganizerDashboard
+        """
+        total_submissions = max(total_submissions, self.analyzed_count)
+        hiring = self.hiring_intelligence()
+        trends = self.technology_trends()
+        common_issues = self.common_issues(total_submissions)
+
+        return OrganizerDashboard(
+            hack_id=hack_id,
+            hackathon_name=hackathon_name,
+            total_submissions=total_submissions,
+            top_performers=self.top_performers(),
+            hiring_intelligence=hiring,
+            technology_trends=trends,
+            common_issues=common_issues,
+            standout_moments=self.standout_moments(),
+            prize_recommendations=self.prize_recommendations(),
+            next_hackathon_recommendations=self._next_hackathon_recommendations(
+                common_issues, trends
+            ),
+            sponsor_follow_up_actions=self._sponsor_follow_up_actions(trends),
+        )
+
+    def _sponsor_follow_up_actions(self, trends: TechnologyTrends) -> list[str]:
+        actions = []
+
+        must_interview_count = len(self.state["must_interview"])
+        if must_interview_count > 0:
+            actions.append(
+                f"Share {must_interview_count} must-interview candidates with hiring sponsors"
+            )
+
+        if trends.most_used:
+            actions.append(f"Highlight {trends.most_used[0][0]} expertise in candidate pool")
+
+        role_counts = self.state["role_counts"]
+        actions.append(
+            f"Candidate breakdown: {role_counts.get('backend', 0)} backend, "
+            f"{role_counts.get('frontend', 0)} frontend, "
+            f"{role_counts.get('full_stack', 0)} full-stack"
+        )
+        return actions
+
+    def _next_hackathon_recommendations(
+        self, common_issues: list[CommonIssue], technology_trends: TechnologyTrends
+    ) -> list[str]:
+        recommendations = []
+
+        if common_issues:
+            recommendations.append(
+                f"Host pre-hackathon workshop: {common_issues[0].workshop_recommendation}"
+            )
+
+        if technology_trends.most_used:
+            top_tech = technology_trends.most_used[0][0]
+            recommendations.append(f"Consider {top_tech}-focused track or prizes")
+
+        if technology_trends.emerging:
+            recommendations.append(
+                "Provide mentorship for emerging technologies: "
+                f"{', '.join(technology_trends.emerging[:3])}"
+            )
+
+        recommendations.append("Encourage teams to set up CI/CD early in the hackathon")
+        recommendations.append("Provide git collaboration best practices guide")
+        return recommendations
@@ -3,8 +3,10 @@
 import asyncio
 import json
 import os
+import time
 from datetime import UTC, datetime
 from decimal import Decimal
+from pathlib import Path
 from typing import Any
 
 from src.analysis.actions_analyzer import ActionsAnalyzer
@@ -15,13 +17,29 @@ from src.analysis.performance_monitor import (
     PerformanceMonitor,
     log_performance_warning,
 )
+from src.constants import (
+    ANALYZER_CHECKPOINT_RESERVE_MS,
+    ANALYZER_CHECKPOINT_SAFETY_FACTOR,
+    ANALYZER_MAX_MEMORY_CONTINUATIONS,
+    TRACE_MAX_EXPORT_BYTES,
+)
 from src.models.common import AgentName, JobStatus, SubmissionStatus
 from src.services.analysis_service import AnalysisService
 from src.services.cost_service import CostService
 from src.services.hackathon_service import HackathonService
+from src.services.organizer_intelligence_service import OrganizerIntelligenceService
 from src.services.submission_service import SubmissionService
-from src.utils.dynamo import DynamoDBHelper
+from src.utils.bedrock import get_model_latency_metrics, get_response_parse_metrics
+from src.utils.dynamo import DynamoDBHelper, get_dynamodb_helper
+from src.utils.hedging import HedgeBudget, get_hedge_controller, hedge_budget_scope
 from src.utils.logging import get_logger
+from src.utils.memory import (
+    MemoryLedger,
+    checkpoint,
+    get_admission_controller,
+    start_tracemalloc_from_env,
+)
+from src.utils.tracing import Tracer
 
 logger = get_logger(__name__)
 
@@ -29,8 +47,28 @@ logger = get_logger(__name__)
 def handler(event: dict, context: Any) -> dict:
     """Lambda handler for analysis jobs.
 
+    Progress is checkpointed on the JOB# item after every submission. When
+    the remaining Lambda time runs low, the handler re-invokes itself
+    asynchronously with the unprocessed submission IDs and returns, so jobs
+    of any size finish. Submissions already checkpointed are skipped, which
+    makes retried or duplicated invocations idempotent.
+
+    Before each submission the process-wide admission controller checks
+    that the projected memory use stays under its ceiling. A submission that
+    does not fit is handed off the same way, at most
+    ANALYZER_MAX_MEMORY_CONTINUATIONS times per job.
+
+    Large jobs are fanned out by the API into shards, one invocation each.
+    A shard marks itself complete on the job item when done; whichever shard
+    completes last claims finalization and writes the job summary.
+
+    The hourly ``{"action": "expire_stale_jobs"}`` event fails jobs that
+    never finished, which settles their budget reservations.
+
     Args:
         event: Lambda event dict with job_id, hack_id, submission_ids
+            (and ``continuation``, ``memory_continuations``, ``shard_index``,
+            ``shard_count`` when set)
         context: Lambda context
 
     Returns:
@@ -38,6 +76,9 @@ def handler(event: dict, context: Any) -> dict:
     """
     logger.info("analyzer_lambda_invoked", lambda_event=event)
 
+    if event.get("action") == "expire_stale_jobs":
+        return expire_stale_jobs()
+
     try:
         # Parse event
         job_id = event.get("job_id")
@@ -60,7 +101,7 @@ def handler(event: dict, context: Any) -> dict:
 
         # Initialize services
         table_name = os.environ.get("TABLE_NAME", "VibeJudgeTable")
-        db = DynamoDBHelper(table_name)
+        db = get_dynamodb_helper(table_name)
 
         hackathon_service = HackathonService(db)
         submission_service = SubmissionService(db)
@@ -76,289 +117,158 @@ def handler(event: dict, context: Any) -> dict:
                 "body": json.dumps({"error": "Hackathon not found"}),
             }
 
-        # Update job status to running
-        analysis_service.update_job_status(
-            hack_id=hack_id,
-            job_id=job_id,
-            status=JobStatus.RUNNING,
-            started_at=datetime.now(UTC),
+        # Resume support: skip submissions already checkpointed on the job
+        continuation = int(event.get("continuation", 0))
+        memory_continuations = int(event.get("memory_continuations", 0))
+        shard_index = int(event.get("shard_index", 0))
+        shard_count = event.get("shard_count")
+        shard_fields = (
+            {"shard_index": shard_index, "shard_count": shard_count} if shard_count else {}
         )
+        job_record = analysis_service.get_job_record(hack_id, job_id) or {}
+        if job_record.get("status") == JobStatus.FAILED.value:
+            # e.g. a sibling shard could not be started; the job will not finalize
+            logger.warning("analysis_job_already_failed", job_id=job_id)
+            return {
+                "statusCode": 409,
+                "body": json.dumps({"job_id": job_id, "status": "failed"}),
+            }
+        processed_ids = set(job_record.get("processed_submission_ids") or [])
+        pending_ids = [s for s in submission_ids if s not in processed_ids]
+
+        if processed_ids:
+            logger.info(
+                "analysis_job_resumed",
+                job_id=job_id,
+                continuation=continuation,
+                already_processed=len(processed_ids),
+                remaining=len(pending_ids),
+            )
+
+        # Update job status to running (first invocation only; in fan-out
+        # mode shard 0 records started_at)
+        if continuation == 0:
+            analysis_service.update_job_status(
+                hack_id=hack_id,
+                job_id=job_id,
+                status=JobStatus.RUNNING,
+                started_at=datetime.now(UTC) if not shard_index else None,
+            )
 
-        # Process each submission
+        # Process each submission (counts are for this invocation; the job
+        # item accumulates totals across invocations via checkpoints). A
+        # submission starts only when the process has memory for it;
+        # otherwise the rest of the job is handed to a continuation.
+        start_tracemalloc_from_env()
+        admission = get_admission_controller()
         completed = 0
         failed = 0
         total_cost = Decimal("0.0")  # Use Decimal to match DynamoDB type
-
-        for sub_id in submission_ids:
-            try:
-                logger.info("processing_submission", sub_id=sub_id)
-
-                # Get submission
-                submission = submission_service.get_submission(sub_id)
-                if not submission:
-                    logger.warning("submission_not_found", sub_id=sub_id)
-                    failed += 1
-                    continue
-
-                # Update submission status
-                submission_service.update_submission_status(
+        slowest_submission_ms = 0.0
+
+        for index, sub_id in enumerate(pending_ids):
+            # Always make progress on at least one submission per invocation,
+            # and stop handing off for memory once the job has done so enough
+            admitted = admission.admit(
+                sub_id,
+                required=index == 0 or memory_continuations >= ANALYZER_MAX_MEMORY_CONTINUATIONS,
+            )
+            if index > 0 and (not admitted or _should_checkpoint(context, slowest_submission_ms)):
+                remaining_ids = pending_ids[index:]
+                if _continue_job(
+                    analysis_service=analysis_service,
+                    context=context,
                     hack_id=hack_id,
+                    job_id=job_id,
+                    remaining_ids=remaining_ids,
+                    continuation=continuation + 1,
+                    extra_payload={
+                        **shard_fields,
+                        "memory_continuations": memory_continuations + (0 if admitted else 1),
+                    },
+                ):
+                    admission.release(sub_id)
+                    return {
+                        "statusCode": 202,
+                        "body": json.dumps(
+                            {
+                                "job_id": job_id,
+                                "status": "continued",
+                                "completed": completed,
+                                "failed": failed,
+                                "remaining": len(remaining_ids),
+                            }
+                        ),
+                    }
+
+                # No continuation: process it here rather than drop it
+                admission.admit(sub_id, required=True)
+
+            submission_started = time.monotonic()
+            succeeded = False
+            submission_cost = Decimal("0.0")
+            try:
+                succeeded, submission_cost = process_submission(
                     sub_id=sub_id,
-                    status=SubmissionStatus.ANALYZING,
-                )
-
-                # Analyze submission
-                result = analyze_single_submission(
-                    submission=submission,
+                    hack_id=hack_id,
                     hackathon=hackathon,
                     db=db,
+                    submission_service=submission_service,
+                    cost_service=cost_service,
+                    analysis_service=analysis_service,
+                    job_id=job_id,
                 )
-
-                if result["success"]:
-                    # Check if submission was disqualified
-                    if result.get("disqualified", False):
-                        # Mark as disqualified
-                        submission_service.update_submission_status(
-                            hack_id=hack_id,
-                            sub_id=sub_id,
-                            status=SubmissionStatus.DISQUALIFIED,
-                            error_message=result.get("disqualification_reason"),
-                        )
-                        logger.info(
-                            "submission_disqualified",
-                            sub_id=sub_id,
-                            reason=result.get("disqualification_reason"),
-                        )
-                        # Count as completed (not failed) but with no score
-                        completed += 1
-                        continue
-
-                    completed += 1
-                    # Convert cost to Decimal to avoid type mismatch with DynamoDB
-                    total_cost += Decimal(str(result["cost"]))
-
-                    # Update submission with results
-                    submission_service.update_submission_with_scores(
-                        hack_id=hack_id,
-                        sub_id=sub_id,
-                        overall_score=result["overall_score"],
-                        dimension_scores=result["dimension_scores"],
-                        weighted_scores=result["weighted_scores"],
-                        recommendation=result["recommendation"],
-                        confidence=result["confidence"],
-                        agent_scores=result["agent_scores"],
-                        strengths=result["strengths"],
-                        weaknesses=result["weaknesses"],
-                        repo_meta=result["repo_meta"],
-                        total_cost_usd=result["cost"],
-                        total_tokens=result["tokens"],
-                        analysis_duration_ms=result["duration_ms"],
-                    )
-
-                    # Store team analysis if available
-                    team_analysis_data = result.get("team_analysis")
-                    logger.info(
-                        "team_analysis_check",
-                        sub_id=sub_id,
-                        has_team_analysis=team_analysis_data is not None,
-                        type=type(team_analysis_data).__name__ if team_analysis_data else "None",
-                    )
-                    if team_analysis_data is not None:
-                        try:
-                            team_analysis = team_analysis_data
-                            db.put_team_analysis(
-                                {
-                                    "PK": f"SUB#{sub_id}",
-                                    "SK": "TEAM_ANALYSIS",
-                                    "entity_type": "TEAM_ANALYSIS",
-                                    "sub_id": sub_id,
-                                    "hack_id": hack_id,
-                                    "workload_distribution": team_analysis.workload_distribution,
-                                    "collaboration_patterns": [
-                                        p.model_dump() for p in team_analysis.collaboration_patterns
-                                    ],
-                                    "red_flags": [f.model_dump() for f in team_analysis.red_flags],
-                                    "individual_scorecards": [
-                                        s.model_dump() for s in team_analysis.individual_scorecards
-                                    ],
-                                    "team_dynamics_grade": team_analysis.team_dynamics_grade,
-                                    "commit_message_quality": team_analysis.commit_message_quality,
-                                    "panic_push_detected": team_analysis.panic_push_detected,
-                                    "duration_ms": team_analysis.duration_ms,
-                                }
-                            )
-                            logger.info("team_analysis_stored", sub_id=sub_id)
-                        except Exception as e:
-                            logger.error(
-                                "team_analysis_storage_failed", sub_id=sub_id, error=str(e)
-                            )
-
-                    # Store strategy analysis if available
-                    strategy_analysis_data = result.get("strategy_analysis")
-                    logger.info(
-                        "strategy_analysis_check",
-                        sub_id=sub_id,
-                        has_strategy_analysis=strategy_analysis_data is not None,
-                        type=type(strategy_analysis_data).__name__
-                        if strategy_analysis_data
-                        else "None",
-                    )
-                    if strategy_analysis_data is not None:
-                        try:
-                            strategy_analysis = strategy_analysis_data
-                            db.put_strategy_analysis(
-                                {
-                                    "PK": f"SUB#{sub_id}",
-                                    "SK": "STRATEGY_ANALYSIS",
-                                    "entity_type": "STRATEGY_ANALYSIS",
-                                    "sub_id": sub_id,
-                                    "hack_id": hack_id,
-                                    "test_strategy": str(strategy_analysis.test_strategy),
-                                    "critical_path_focus": strategy_analysis.critical_path_focus,
-                                    "tradeoffs": [
-                                        t.model_dump() for t in strategy_analysis.tradeoffs
-                                    ],
-                                    "learning_journey": strategy_analysis.learning_journey.model_dump()
-                                    if strategy_analysis.learning_journey
-                                    else None,
-                                    "maturity_level": str(strategy_analysis.maturity_level),
-                                    "strategic_context": strategy_analysis.strategic_context,
-                                    "duration_ms": strategy_analysis.duration_ms,
-                                }
-                            )
-                            logger.info("strategy_analysis_stored", sub_id=sub_id)
-                        except Exception as e:
-                            logger.error(
-                                "strategy_analysis_storage_failed", sub_id=sub_id, error=str(e)
-                            )
-
-                    # Store actionable feedback if available
-                    if result.get("actionable_feedback"):
-                        try:
-                            actionable_feedback = result["actionable_feedback"]
-                            db.put_actionable_feedback(
-                                {
-                                    "PK": f"SUB#{sub_id}",
-                                    "SK": "ACTIONABLE_FEEDBACK",
-                                    "entity_type": "ACTIONABLE_FEEDBACK",
-                                    "sub_id": sub_id,
-                                    "hack_id": hack_id,
-                                    "feedback_items": [f.model_dump() for f in actionable_feedback],
-                                    "total_count": len(actionable_feedback),
-                                }
-                            )
-                            logger.info(
-                                "actionable_feedback_stored",
-                                sub_id=sub_id,
-                                count=len(actionable_feedback),
-                            )
-                        except Exception as e:
-                            logger.error(
-                                "actionable_feedback_storage_failed", sub_id=sub_id, error=str(e)
-                            )
-
-                    # Record costs
-                    for cost_record in result["cost_records"]:
-                        agent_name_str = "unknown"
-                        model_id = "unknown"
-                        input_tokens = 0
-                        output_tokens = 0
-
-                        try:
-                            # cost_record is a CostRecord Pydantic model
-                            # Extract agent_name as string (handle both enum and string)
-                            agent_name_str = (
-                                cost_record.agent_name.value
-                                if hasattr(cost_record.agent_name, "value")
-                                else str(cost_record.agent_name)
-                            )
-                            model_id = cost_record.model_id
-                            input_tokens = cost_record.input_tokens
-                            output_tokens = cost_record.output_tokens
-
-                            # Log diagnostic information BEFORE attempting to record cost
-                            logger.info(
-                                "recording_agent_cost",
-                                sub_id=sub_id,
-                                agent=agent_name_str,
-                                model_id=model_id,
-                                input_tokens=input_tokens,
-                                output_tokens=output_tokens,
-                                total_tokens=cost_record.total_tokens,
-                            )
-
-                            cost_service.record_agent_cost(
-                                sub_id=sub_id,
-                                agent_name=agent_name_str,
-                                model_id=model_id,
-                                input_tokens=input_tokens,
-                                output_tokens=output_tokens,
-                            )
-
-                            # Log success
-                            logger.info(
-                                "cost_recorded_successfully",
-                                sub_id=sub_id,
-                                agent=agent_name_str,
-                                model_id=model_id,
-                            )
-
-                        except Exception as e:
-                            # Don't fail the entire analysis if cost recording fails
-                            # Log detailed diagnostic information for debugging
-                            logger.error(
-                                "cost_recording_failed",
-                                sub_id=sub_id,
-                                agent=agent_name_str,
-                                model_id=model_id,
-                                input_tokens=input_tokens,
-                                output_tokens=output_tokens,
-                                tokens=input_tokens + output_tokens,
-                                error=str(e),
-                                error_type=type(e).__name__,
-                            )
-
-                    logger.info(
-                        "submission_analyzed",
-                        sub_id=sub_id,
-                        score=result["overall_score"],
-                        cost=result["cost"],
-                    )
-                else:
-                    failed += 1
-                    submission_service.update_submission_status(
-                        hack_id=hack_id,
-                        sub_id=sub_id,
-                        status=SubmissionStatus.FAILED,
-                        error_message=result.get("error", "Analysis failed"),
-                    )
-                    logger.error(
-                        "submission_analysis_failed", sub_id=sub_id, error=result.get("error")
-                    )
-
-            except Exception as e:
-                logger.error("submission_processing_error", sub_id=sub_id, error=str(e))
-                failed += 1
-                submission_service.update_submission_status(
+            finally:
+                admission.release(sub_id)
+                # Checkpoint so a re-invocation skips this submission
+                analysis_service.record_submission_outcome(
                     hack_id=hack_id,
+                    job_id=job_id,
                     sub_id=sub_id,
-                    status=SubmissionStatus.FAILED,
-                    error_message=str(e),
+                    succeeded=succeeded,
+                    cost_usd=submission_cost,
+                )
+                slowest_submission_ms = max(
+                    slowest_submission_ms, (time.monotonic() - submission_started) * 1000
                 )
 
-        # Update job status to completed
-        analysis_service.update_job_status(
-            hack_id=hack_id,
-            job_id=job_id,
-            status=JobStatus.COMPLETED,
-            completed_at=datetime.now(UTC),
-            completed_submissions=completed,
-            failed_submissions=failed,
-            total_cost_usd=total_cost,
-        )
+            if succeeded:
+                completed += 1
+                total_cost += submission_cost
+            else:
+                failed += 1
 
-        # Update hackathon cost summary
-        cost_service.update_hackathon_cost_summary(hack_id)
+        # Write pacing/throttle metrics for this invocation
+        write_metrics = db.write_scheduler.get_metrics()
+
+        # Fan-out: only the invocation that finishes the last shard finalizes
+        if shard_count and not analysis_service.complete_shard(hack_id, job_id, shard_index):
+            logger.info(
+                "analysis_shard_finished",
+                job_id=job_id,
+                shard_index=shard_index,
+                completed=completed,
+                failed=failed,
+                dynamodb_writes=write_metrics,
+                response_parsing=get_response_parse_metrics().get_metrics(),
+                bedrock_latency=get_model_latency_metrics().get_metrics(),
+                hedging=get_hedge_controller().report(),
+            )
+            return {
+                "statusCode": 200,
+                "body": json.dumps(
+                    {
+                        "job_id": job_id,
+                        "status": "shard_completed",
+                        "shard_index": shard_index,
+                        "completed": completed,
+                        "failed": failed,
+                        "total_cost_usd": float(total_cost),
+                    }
+                ),
+            }
+
+        finalize_job(analysis_service, cost_service, hack_id, job_id, write_metrics)
 
         logger.info(
             "analysis_job_completed",
@@ -366,6 +276,10 @@ def handler(event: dict, context: Any) -> dict:
             completed=completed,
             failed=failed,
             total_cost=float(total_cost),  # Convert to float for logging
+            dynamodb_writes=write_metrics,
+            response_parsing=get_response_parse_metrics().get_metrics(),
+            bedrock_latency=get_model_latency_metrics().get_metrics(),
+            hedging=get_hedge_controller().report(),
         )
 
         return {
@@ -387,7 +301,7 @@ def handler(event: dict, context: Any) -> dict:
         # Try to update job status to failed
         if "job_id" in event and "hack_id" in event:
             try:
-                db = DynamoDBHelper(os.environ.get("TABLE_NAME", "VibeJudgeTable"))
+                db = get_dynamodb_helper(os.environ.get("TABLE_NAME", "VibeJudgeTable"))
                 analysis_service = AnalysisService(db)
                 analysis_service.update_job_status(
                     hack_id=event["hack_id"],
@@ -404,6 +318,564 @@ def handler(event: dict, context: Any) -> dict:
         }
 
 
+def _should_checkpoint(context: Any, slowest_submission_ms: float) -> bool:
+    """Check whether the invocation should stop and hand off remaining work.
+
+    Args:
+        context: Lambda context (anything without get_remaining_time_in_millis never yields)
+        slowest_submission_ms: Slowest submission processed so far in this invocation
+
+    Returns:
+        True if another submission might not finish before the Lambda timeout
+    """
+    get_remaining_ms = getattr(context, "get_remaining_time_in_millis", None)
+    if get_remaining_ms is None:
+        return False
+
+    reserve_ms = max(
+        ANALYZER_CHECKPOINT_RESERVE_MS,
+        slowest_submission_ms * ANALYZER_CHECKPOINT_SAFETY_FACTOR,
+    )
+    return bool(get_remaining_ms() < reserve_ms)
+
+
+def _continue_job(
+    analysis_service: AnalysisService,
+    context: Any,
+    hack_id: str,
+    job_id: str,
+    remaining_ids: list[str],
+    continuation: int,
+    extra_payload: dict | None = None,
+) -> bool:
+    """Re-invoke the analyzer asynchronously for the remaining submissions.
+
+    Args:
+        analysis_service: Analysis service (used for the Lambda invocation)
+        context: Lambda context (provides this function's name)
+        hack_id: Hackathon ID
+        job_id: Job ID
+        remaining_ids: Submission IDs not yet processed
+        continuation: Continuation number for the next invocation
+        extra_payload: Additional event fields to carry over (e.g. shard info)
+
+    Returns:
+        True if the continuation was invoked; False means keep processing here
+    """
+    function_name = getattr(context, "function_name", None)
+    invoked = analysis_service.invoke_analyzer(
+        {
+            "job_id": job_id,
+            "hack_id": hack_id,
+            "submission_ids": remaining_ids,
+            "continuation": continuation,
+            **(extra_payload or {}),
+        },
+        function_name=function_name,
+    )
+
+    if not invoked:
+        logger.warning(
+            "analysis_job_continuation_failed",
+            job_id=job_id,
+            remaining=len(remaining_ids),
+        )
+        return False
+
+    analysis_service.update_job_status(
+        hack_id=hack_id,
+        job_id=job_id,
+        status=JobStatus.RUNNING,
+        continuations=continuation,
+        last_checkpoint_at=datetime.now(UTC),
+    )
+    logger.info(
+        "analysis_job_continued",
+        job_id=job_id,
+        continuation=continuation,
+        remaining=len(remaining_ids),
+    )
+    return True
+
+
+def expire_stale_jobs() -> dict:
+    """Fail unfinished jobs past their expiry (scheduled hourly).
+
+    Returns:
+        Response dict with the number of jobs expired
+    """
+    db = get_dynamodb_helper(os.environ.get("TABLE_NAME", "VibeJudgeTable"))
+    expired = AnalysisService(db).expire_stale_jobs()
+    logger.info("stale_jobs_expired", expired=expired)
+    return {"statusCode": 200, "body": json.dumps({"expired": expired})}
+
+
+def finalize_job(
+    analysis_service: AnalysisService,
+    cost_service: CostService,
+    hack_id: str,
+    job_id: str,
+    write_metrics: dict | None = None,
+) -> None:
+    """Mark a job completed, refresh the hackathon cost summary and settle its budget.
+
+    Counters and cost were accumulated on the job item by the
+    per-submission checkpoints, so only status fields are written here,
+    along with percentiles of the span durations of the submissions'
+    traces. Marking the job completed replaces the spend reserved when it
+    was triggered with the actual cost.
+
+    Args:
+        analysis_service: Analysis service
+        cost_service: Cost service
+        hack_id: Hackathon ID
+        job_id: Job ID
+        write_metrics: DynamoDB write metrics to store on the job
+    """
+    analysis_service.update_job_status(
+        hack_id=hack_id,
+        job_id=job_id,
+        status=JobStatus.COMPLETED,
+        completed_at=datetime.now(UTC),
+        dynamodb_write_metrics=write_metrics,
+    )
+    cost_service.update_hackathon_cost_summary(hack_id)
+
+    job = analysis_service.get_job_record(hack_id, job_id)
+    if job:
+        analysis_service.record_trace_summary(
+            hack_id, job_id, list(job.get("processed_submission_ids") or [])
+        )
+
+
+def process_submission(
+    sub_id: str,
+    hack_id: str,
+    hackathon: Any,
+    db: DynamoDBHelper,
+    submission_service: SubmissionService,
+    cost_service: CostService,
+    analysis_service: AnalysisService | None = None,
+    job_id: str | None = None,
+) -> tuple[bool, Decimal]:
+    """Analyze one submission and persist its results.
+
+    Shared by the Lambda handler and the queue worker. Failures are recorded
+    on the submission rather than raised. The whole run is traced, and the
+    trace is stored on the submission's TRACE item together with memory
+    snapshots taken at the stage boundaries.
+
+    Each large intermediate is owned by one stage and dropped as soon as
+    its consumer is done: the CI data once the repository is extracted, the
+    extracted repository once the agents have run, the agent responses once
+    their SCORE items are written, and the intelligence models once they are
+    stored and folded into the dashboard.
+
+    Args:
+        sub_id: Submission ID
+        hack_id: Hackathon ID
+        hackathon: Hackathon config
+        db: DynamoDB helper
+        submission_service: Submission service
+        cost_service: Cost service
+        analysis_service: Analysis service; with job_id, marks the job's current submission
+        job_id: Job ID the submission is analyzed for
+
+    Returns:
+        Tuple of (succeeded, cost in USD); disqualified submissions count as succeeded
+    """
+    tracer = Tracer(sub_id)
+    ledger = MemoryLedger(sub_id)
+    with tracer.activate(), ledger.activate(), tracer.span("submission") as root:
+        ledger.checkpoint("start")
+        succeeded, cost = _process_submission(
+            sub_id,
+            hack_id,
+            hackathon,
+            db,
+            submission_service,
+            cost_service,
+            analysis_service,
+            job_id,
+        )
+        ledger.checkpoint("stored")
+        root.set(
+            succeeded=succeeded,
+            cost_usd=float(cost),
+            peak_rss_mb=ledger.peak_mb,
+            rss_growth_mb=round(ledger.growth_mb, 1),
+        )
+    get_admission_controller().observe(ledger.peak_mb)
+    logger.info("submission_memory", sub_id=sub_id, **ledger.to_record())
+    store_submission_trace(db, tracer, hack_id, sub_id, job_id, ledger)
+    return succeeded, cost
+
+
+def store_submission_trace(
+    db: DynamoDBHelper,
+    tracer: Tracer,
+    hack_id: str,
+    sub_id: str,
+    job_id: str | None = None,
+    ledger: MemoryLedger | None = None,
+) -> None:
+    """Store a submission's trace, and write it to TRACE_EXPORT_DIR when set.
+
+    The item keeps the per-span durations for the job summary, the memory
+    snapshots and, unless it is too large, the Chrome trace JSON (open it in
+    https://ui.perfetto.dev).
+
+    Args:
+        db: DynamoDB helper
+        tracer: Finished tracer of the submission
+        hack_id: Hackathon ID
+        sub_id: Submission ID
+        job_id: Job ID the submission was analyzed for
+        ledger: Memory snapshots of the submission
+    """
+    try:
+        chrome_trace = json.dumps(tracer.to_chrome_trace(), separators=(",", ":"))
+        record: dict[str, Any] = {
+            "PK": f"SUB#{sub_id}",
+            "SK": "TRACE",
+            "entity_type": "SUBMISSION_TRACE",
+            "sub_id": sub_id,
+            "hack_id": hack_id,
+            "job_id": job_id,
+            "span_count": len(tracer.spans),
+            "span_durations": tracer.durations_ms(),
+            "created_at": datetime.now(UTC),
+        }
+        if ledger is not None:
+            record["memory"] = ledger.to_record()
+        if len(chrome_trace) <= TRACE_MAX_EXPORT_BYTES:
+            record["chrome_trace"] = chrome_trace
+        else:
+            logger.warning("trace_export_too_large", sub_id=sub_id, size=len(chrome_trace))
+        db.put_submission_trace(record)
+
+        export_dir = os.environ.get("TRACE_EXPORT_DIR")
+        if export_dir:
+            path = Path(export_dir) / f"{sub_id}.trace.json"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(chrome_trace)
+    except Exception as e:
+        # Tracing is diagnostic only; never fail the analysis over it
+        logger.error("trace_export_failed", sub_id=sub_id, error=str(e))
+
+
+def _process_submission(
+    sub_id: str,
+    hack_id: str,
+    hackathon: Any,
+    db: DynamoDBHelper,
+    submission_service: SubmissionService,
+    cost_service: CostService,
+    analysis_service: AnalysisService | None,
+    job_id: str | None,
+) -> tuple[bool, Decimal]:
+    """Analyze one submission and persist its results (see ``process_submission``)."""
+    try:
+        logger.info("processing_submission", sub_id=sub_id)
+
+        # Get submission
+        submission = submission_service.get_submission(sub_id)
+        if not submission:
+            logger.warning("submission_not_found", sub_id=sub_id)
+            return False, Decimal("0.0")
+
+        # Live progress: show which submission the job is working on
+        if analysis_service is not None and job_id:
+            analysis_service.mark_current_submission(
+                hack_id, job_id, sub_id, getattr(submission, "team_name", None)
+            )
+
+        # Update submission status
+        submission_service.update_submission_status(
+            hack_id=hack_id,
+            sub_id=sub_id,
+            status=SubmissionStatus.ANALYZING,
+        )
+
+        # Analyze submission
+        result = analyze_single_submission(
+            submission=submission,
+            hackathon=hackathon,
+            db=db,
+        )
+
+        if result["success"]:
+            # Check if submission was disqualified
+            if result.get("disqualified", False):
+                # Mark as disqualified
+                submission_service.update_submission_status(
+                    hack_id=hack_id,
+                    sub_id=sub_id,
+                    status=SubmissionStatus.DISQUALIFIED,
+                    error_message=result.get("disqualification_reason"),
+                )
+                logger.info(
+                    "submission_disqualified",
+                    sub_id=sub_id,
+                    reason=result.get("disqualification_reason"),
+                )
+                _update_intelligence(db, submission_service, hack_id, sub_id)
+                # Count as completed (not failed) but with no score
+                return True, Decimal("0.0")
+
+            # Convert cost to Decimal to avoid type mismatch with DynamoDB
+            submission_cost = Decimal(str(result["cost"]))
+
+            # Update submission with results
+            submission_service.update_submission_with_scores(
+                hack_id=hack_id,
+                sub_id=sub_id,
+                overall_score=result["overall_score"],
+                dimension_scores=result["dimension_scores"],
+                weighted_scores=result["weighted_scores"],
+                recommendation=result["recommendation"],
+                confidence=result["confidence"],
+                agent_scores=result["agent_scores"],
+                strengths=result["strengths"],
+                weaknesses=result["weaknesses"],
+                repo_meta=result["repo_meta"],
+                total_cost_usd=result["cost"],
+                total_tokens=result["tokens"],
+                analysis_duration_ms=result["duration_ms"],
+            )
+
+            # Store team analysis if available
+            team_analysis_data = result.get("team_analysis")
+            logger.info(
+                "team_analysis_check",
+                sub_id=sub_id,
+                has_team_analysis=team_analysis_data is not None,
+                type=type(team_analysis_data).__name__ if team_analysis_data else "None",
+            )
+            if team_analysis_data is not None:
+                try:
+                    team_analysis = team_analysis_data
+                    db.put_team_analysis(
+                        {
+                            "PK": f"SUB#{sub_id}",
+                            "SK": "TEAM_ANALYSIS",
+                            "entity_type": "TEAM_ANALYSIS",
+                            "sub_id": sub_id,
+                            "hack_id": hack_id,
+                            "workload_distribution": team_analysis.workload_distribution,
+                            "collaboration_patterns": [
+                                p.model_dump() for p in team_analysis.collaboration_patterns
+                            ],
+                            "red_flags": [f.model_dump() for f in team_analysis.red_flags],
+                            "individual_scorecards": [
+                                s.model_dump() for s in team_analysis.individual_scorecards
+                            ],
+                            "team_dynamics_grade": team_analysis.team_dynamics_grade,
+                            "commit_message_quality": team_analysis.commit_message_quality,
+                            "panic_push_detected": team_analysis.panic_push_detected,
+                            "duration_ms": team_analysis.duration_ms,
+                        }
+                    )
+                    logger.info("team_analysis_stored", sub_id=sub_id)
+                except Exception as e:
+                    logger.error("team_analysis_storage_failed", sub_id=sub_id, error=str(e))
+
+            # Store strategy analysis if available
+            strategy_analysis_data = result.get("strategy_analysis")
+            logger.info(
+                "strategy_analysis_check",
+                sub_id=sub_id,
+                has_strategy_analysis=strategy_analysis_data is not None,
+                type=type(strategy_analysis_data).__name__ if strategy_analysis_data else "None",
+            )
+            if strategy_analysis_data is not None:
+                try:
+                    strategy_analysis = strategy_analysis_data
+                    db.put_strategy_analysis(
+                        {
+                            "PK": f"SUB#{sub_id}",
+                            "SK": "STRATEGY_ANALYSIS",
+                            "entity_type": "STRATEGY_ANALYSIS",
+                            "sub_id": sub_id,
+                            "hack_id": hack_id,
+                            "test_strategy": str(strategy_analysis.test_strategy),
+                            "critical_path_focus": strategy_analysis.critical_path_focus,
+                            "tradeoffs": [t.model_dump() for t in strategy_analysis.tradeoffs],
+                            "learning_journey": strategy_analysis.learning_journey.model_dump()
+                            if strategy_analysis.learning_journey
+                            else None,
+                            "maturity_level": str(strategy_analysis.maturity_level),
+                            "strategic_context": strategy_analysis.strategic_context,
+                            "duration_ms": strategy_analysis.duration_ms,
+                        }
+                    )
+                    logger.info("strategy_analysis_stored", sub_id=sub_id)
+                except Exception as e:
+                    logger.error("strategy_analysis_storage_failed", sub_id=sub_id, error=str(e))
+
+            # Store actionable feedback if available
+            if result.get("actionable_feedback"):
+                try:
+                    actionable_feedback = result["actionable_feedback"]
+                    db.put_actionable_feedback(
+                        {
+                            "PK": f"SUB#{sub_id}",
+                            "SK": "ACTIONABLE_FEEDBACK",
+                            "entity_type": "ACTIONABLE_FEEDBACK",
+                            "sub_id": sub_id,
+                            "hack_id": hack_id,
+                            "feedback_items": [f.model_dump() for f in actionable_feedback],
+                            "total_count": len(actionable_feedback),
+                        }
+                    )
+                    logger.info(
+                        "actionable_feedback_stored",
+                        sub_id=sub_id,
+                        count=len(actionable_feedback),
+                    )
+                except Exception as e:
+                    logger.error("actionable_feedback_storage_failed", sub_id=sub_id, error=str(e))
+
+            _update_intelligence(
+                db,
+                submission_service,
+                hack_id,
+                sub_id,
+                team_name=submission.team_name,
+                result=result,
+            )
+            # The intelligence models are stored and folded into the dashboard
+            for key in ("team_analysis", "strategy_analysis", "actionable_feedback"):
+                result.pop(key, None)
+
+            # Record costs
+            for cost_record in result["cost_records"]:
+                agent_name_str = "unknown"
+                model_id = "unknown"
+                input_tokens = 0
+                output_tokens = 0
+
+                try:
+                    # cost_record is a CostRecord Pydantic model
+                    # Extract agent_name as string (handle both enum and string)
+                    agent_name_str = (
+                        cost_record.agent_name.value
+                        if hasattr(cost_record.agent_name, "value")
+                        else str(cost_record.agent_name)
+                    )
+                    model_id = cost_record.model_id
+                    input_tokens = cost_record.input_tokens
+                    output_tokens = cost_record.output_tokens
+
+                    # Log diagnostic information BEFORE attempting to record cost
+                    logger.info(
+                        "recording_agent_cost",
+                        sub_id=sub_id,
+                        agent=agent_name_str,
+                        model_id=model_id,
+                        input_tokens=input_tokens,
+                        output_tokens=output_tokens,
+                        total_tokens=cost_record.total_tokens,
+                    )
+
+                    cost_service.record_agent_cost(
+                        sub_id=sub_id,
+                        agent_name=agent_name_str,
+                        model_id=model_id,
+                        input_tokens=input_tokens,
+                        output_tokens=output_tokens,
+                        hedge=cost_record.hedge,
+                    )
+
+                    # Log success
+                    logger.info(
+                        "cost_recorded_successfully",
+                        sub_id=sub_id,
+                        agent=agent_name_str,
+                        model_id=model_id,
+                    )
+
+                except Exception as e:
+                    # Don't fail the entire analysis if cost recording fails
+                    # Log detailed diagnostic information for debugging
+                    logger.error(
+                        "cost_recording_failed",
+                        sub_id=sub_id,
+                        agent=agent_name_str,
+                        model_id=model_id,
+                        input_tokens=input_tokens,
+                        output_tokens=output_tokens,
+                        tokens=input_tokens + output_tokens,
+                        error=str(e),
+                        error_type=type(e).__name__,
+                    )
+
+            logger.info(
+                "submission_analyzed",
+                sub_id=sub_id,
+                score=result["overall_score"],
+                cost=result["cost"],
+            )
+            return True, submission_cost
+
+        submission_service.update_submission_status(
+            hack_id=hack_id,
+            sub_id=sub_id,
+            status=SubmissionStatus.FAILED,
+            error_message=result.get("error", "Analysis failed"),
+        )
+        logger.error("submission_analysis_failed", sub_id=sub_id, error=result.get("error"))
+        return False, Decimal("0.0")
+    except Exception as e:
+        logger.error("submission_processing_error", sub_id=sub_id, error=str(e))
+        submission_service.update_submission_status(
+            hack_id=hack_id,
+            sub_id=sub_id,
+            status=SubmissionStatus.FAILED,
+            error_message=str(e),
+        )
+        return False, Decimal("0.0")
+
+
+def _update_intelligence(
+    db: DynamoDBHelper,
+    submission_service: SubmissionService,
+    hack_id: str,
+    sub_id: str,
+    team_name: str = "",
+    result: dict | None = None,
+) -> None:
+    """Fold an analysis result into (or, without one, retract it from) the intelligence item.
+
+    Args:
+        db: DynamoDB helper
+        submission_service: Submission service
+        hack_id: Hackathon ID
+        sub_id: Submission ID
+        team_name: Team name
+        result: Successful analysis result; None retracts the submission
+    """
+    try:
+        intelligence = OrganizerIntelligenceService(db, HackathonService(db), submission_service)
+        if result is None:
+            intelligence.remove_submission(hack_id, sub_id)
+            return
+        intelligence.record_submission(
+            hack_id=hack_id,
+            sub_id=sub_id,
+            team_name=team_name,
+            overall_score=result["overall_score"],
+            strengths=result["strengths"],
+            weaknesses=result["weaknesses"],
+            repo_meta=result["repo_meta"],
+            team_analysis=result.get("team_analysis"),
+            strategy_analysis=result.get("strategy_analysis"),
+        )
+    except Exception as e:
+        # The dashboard rebuilds on demand; never fail the analysis over it
+        logger.error("intelligence_update_failed", sub_id=sub_id, error=str(e))
+
+
 def analyze_single_submission(
     submission: Any,
     hackathon: Any,
@@ -434,6 +906,7 @@ def analyze_single_submission(
             actions_analyzer = ActionsAnalyzer()
             actions_data = actions_analyzer.analyze(owner, repo_name)
             actions_analyzer.close()
+        checkpoint("actions_analyzer")
 
         # Check for disqualification
         if actions_data.get("disqualified", False):
@@ -457,6 +930,9 @@ def analyze_single_submission(
                 workflow_runs=actions_data["workflow_runs"],
                 workflow_definitions=actions_data["workflow_definitions"],
             )
+        # The workflow data now lives on repo_data
+        del actions_data
+        checkpoint("git_clone_and_extract")
 
         logger.info("repo_data_extracted", sub_id=submission.sub_id)
 
@@ -486,8 +962,10 @@ def analyze_single_submission(
             else:
                 agents_enabled.append(agent)
 
-        # Run analysis (async) with performance tracking
-        with perf_monitor.track("orchestrator_analysis"):
+        # Run analysis (async) with performance tracking; hedges are capped by
+        # the hackathon's budget
+        hedge_budget = HedgeBudget.for_hackathon(hackathon.hack_id, hackathon.budget_limit_usd, db)
+        with perf_monitor.track("orchestrator_analysis"), hedge_budget_scope(hedge_budget):
             result = asyncio.run(
                 orchestrator.analyze_submission(
                     repo_data=repo_data,
@@ -503,6 +981,13 @@ def analyze_single_submission(
                 )
             )
 
+        checkpoint("orchestrator_analysis")
+
+        # Only the metadata of the extracted repository is needed from here on
+        repo_meta = repo_data.meta.model_dump()
+        del repo_data, orchestrator
+        checkpoint("repo_released")
+
         logger.info(
             "orchestrator_complete", sub_id=submission.sub_id, score=result["overall_score"]
         )
@@ -524,15 +1009,14 @@ def analyze_single_submission(
                     target_ms=PERFORMANCE_TARGETS[component],
                 )
 
-        # Build agent_scores dict for storage
-        agent_scores = {}
-        for agent_name, response in result["agent_responses"].items():
-            agent_key = agent_name.value if hasattr(agent_name, "value") else str(agent_name)
-            agent_scores[agent_key] = response.model_dump()
+        # Build compact agent_scores summary for the submission item.
+        # Full responses (evidence, observations) are stored in SCORE# items below.
+        agent_responses = result.pop("agent_responses")
+        agent_scores = SubmissionService.compact_agent_scores(agent_responses)
 
         # Store detailed agent score records in DynamoDB
         # Each agent gets a separate record with SK = SCORE#{agent_name}
-        for agent_name, response in result["agent_responses"].items():
+        for agent_name, response in agent_responses.items():
             try:
                 agent_key = agent_name.value if hasattr(agent_name, "value") else str(agent_name)
 
@@ -582,6 +1066,9 @@ def analyze_single_submission(
                     agent=agent_key,
                     error=str(e),
                 )
+        # Full responses (evidence) are persisted; keep only the compact summary
+        del agent_responses
+        checkpoint("agent_scores_stored")
 
         # Build dimension_scores dict
         dimension_scores = {}
@@ -598,7 +1085,7 @@ def analyze_single_submission(
             "agent_scores": agent_scores,
             "strengths": result["strengths"],
             "weaknesses": result["weaknesses"],
-            "repo_meta": repo_data.meta.model_dump(),
+            "repo_meta": repo_meta,
             "cost": result["total_cost_usd"],
             "tokens": result["total_tokens"],
             "duration_ms": result["analysis_duration_ms"],
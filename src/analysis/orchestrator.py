@@ -1,8 +1,14 @@
 """Multi-agent orchestration with parallel execution."""
 
 import asyncio
+import contextvars
+import functools
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, TypeVar
 
 from src.agents.ai_detection import AIDetectionAgent
 from src.agents.bug_hunter import BugHunterAgent
@@ -11,19 +17,97 @@ from src.agents.performance import PerformanceAnalyzerAgent
 from src.analysis.actions_analyzer import ActionsAnalyzer
 from src.analysis.brand_voice_transformer import BrandVoiceTransformer
 from src.analysis.cost_tracker import CostTracker
+from src.analysis.source_index import SourceIndex
 from src.analysis.strategy_detector import StrategyDetector
 from src.analysis.team_analyzer import TeamAnalyzer
-from src.constants import RECOMMENDATION_THRESHOLDS
+from src.constants import ORCHESTRATOR_CPU_WORKERS, RECOMMENDATION_THRESHOLDS
 from src.models.analysis import RepoData
 from src.models.common import AgentName, Recommendation
+from src.models.costs import StageTiming
 from src.models.hackathon import RubricConfig
 from src.models.scores import BaseAgentResponse
+from src.models.strategy import StrategyAnalysisResult
 from src.models.submission import WeightedDimensionScore
+from src.models.team_dynamics import TeamAnalysisResult
 from src.utils.bedrock import BedrockClient
 from src.utils.logging import get_logger
+from src.utils.tracing import current_span, span
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+# Worker threads for the deterministic stages, shared by all orchestrators in
+# the process. Threads rather than processes: Lambda has no /dev/shm for
+# multiprocessing, and pickling RepoData would cost more than the stages.
+_cpu_pool: ThreadPoolExecutor | None = None
+_cpu_pool_lock = threading.Lock()
+
+
+def _get_cpu_pool() -> ThreadPoolExecutor:
+    """Return the shared worker pool for CPU-bound stages, creating it on first use."""
+    global _cpu_pool
+    with _cpu_pool_lock:
+        if _cpu_pool is None:
+            _cpu_pool = ThreadPoolExecutor(
+                max_workers=ORCHESTRATOR_CPU_WORKERS, thread_name_prefix="orchestrator-cpu"
+            )
+        return _cpu_pool
+
+
+class StageTimeline:
+    """Start and end offsets of the stages of one submission's analysis.
+
+    Offsets are milliseconds since the timeline was created, so stages that
+    ran concurrently show up as overlapping intervals.
+    """
+
+    def __init__(self) -> None:
+        """Start the timeline clock."""
+        self._origin = time.perf_counter()
+        self.stages: list[StageTiming] = []
+
+    def timed(self, stage: str, fn: Callable[..., T]) -> Callable[..., T]:
+        """Wrap a function so that each call is recorded as a stage.
+
+        Calls also open a trace span. ``run_in_executor`` does not carry
+        context variables over to the worker thread, so the wrapper runs in
+        a copy of the context it was created in, which keeps the span under
+        the submission's trace.
+
+        Args:
+            stage: Stage name
+            fn: Function to wrap
+
+        Returns:
+            Wrapper with the same signature and result
+        """
+        context = contextvars.copy_context()
+
+        def traced(*args: Any, **kwargs: Any) -> T:
+            with span(stage):
+                return fn(*args, **kwargs)
+
+        def run(*args: Any, **kwargs: Any) -> T:
+            start = time.perf_counter()
+            try:
+                return context.copy().run(traced, *args, **kwargs)
+            finally:
+                end = time.perf_counter()
+                self.stages.append(
+                    StageTiming(
+                        stage=stage,
+                        start_ms=round((start - self._origin) * 1000, 3),
+                        end_ms=round((end - self._origin) * 1000, 3),
+                    )
+                )
+
+        return run
+
+    def get(self, stage: str) -> StageTiming | None:
+        """Return the timing of a stage, or None if it did not run."""
+        return next((timing for timing in self.stages if timing.stage == stage), None)
+
 
 class AnalysisOrchestrator:
     """Orchestrate multi-agent analysis with parallel execution."""
@@ -85,11 +169,14 @@ class AnalysisOrchestrator:
                 - cost_records: List of cost records
                 - total_cost_usd: Total cost
                 - analysis_duration_ms: Total duration
+                - stage_timings: Start/end offsets of each stage (StageTiming)
                 - team_analysis: Team dynamics analysis result
                 - strategy_analysis: Strategy detection result
                 - actionable_feedback: Transformed feedback items
         """
         start_time = datetime.now(UTC)
+        timeline = StageTimeline()
+        cpu_pool = _get_cpu_pool()
 
         logger.info(
             "orchestrator_analysis_started",
@@ -98,73 +185,307 @@ class AnalysisOrchestrator:
             agents=len(agents_enabled),
         )
 
-        # Step 1: Parse CI/CD logs for static findings and test results
-        cicd_findings = None
-        test_results_from_logs = None
-        cicd_start = datetime.now(UTC)
-
+        # The stages form a small DAG. Agents only need the CI/CD findings, team
+        # and strategy analysis run on the CPU pool while the agents wait on
+        # Bedrock, and only the brand voice transformer waits for the strategy.
+        #
+        #   actions_analyzer --+--> agents -------------+--> brand_voice_transformer
+        #                      +--> strategy_detector --+
+        #   source_index ------+--> strategy_detector
+        #                      +--> team_analyzer
+        cicd_task: asyncio.Future[tuple[list | None, Any]]
         if github_token and repo_data.repo_url:
-            try:
-                # Extract owner/repo from URL
-                parts = repo_data.repo_url.rstrip("/").split("/")
-                if len(parts) >= 2:
-                    owner, repo = parts[-2], parts[-1]
+            cicd_task = asyncio.create_task(
+                self._run_stage(
+                    timeline,
+                    "actions_analyzer",
+                    None,
+                    self._parse_cicd_logs,
+                    repo_data,
+                    github_token,
+                    sub_id,
+                    hack_id,
+                )
+            )
+        else:
+            cicd_task = asyncio.get_running_loop().create_future()
+            cicd_task.set_result((None, None))
 
-                    logger.info(
-                        "parsing_cicd_logs",
-                        sub_id=sub_id,
-                        owner=owner,
-                        repo=repo,
-                    )
+        # Lower-cased paths/contents and keyword hits shared by team and strategy
+        index_task = asyncio.create_task(
+            self._run_stage(
+                timeline, "source_index", cpu_pool, SourceIndex.from_repo_data, repo_data
+            )
+        )
 
-                    actions_analyzer = ActionsAnalyzer(github_token)
-                    cicd_analysis = actions_analyzer.analyze(owner, repo)
-                    actions_analyzer.close()
+        async def run_team_analysis() -> TeamAnalysisResult | None:
+            source_index = await index_task
+            return await self._run_stage(
+                timeline,
+                "team_analyzer",
+                cpu_pool,
+                self._analyze_team,
+                repo_data,
+                source_index,
+                sub_id,
+                hack_id,
+            )
 
-                    cicd_findings = cicd_analysis.get("linter_findings", [])
-                    test_results_from_logs = cicd_analysis.get("test_results")
+        async def run_strategy_detection() -> StrategyAnalysisResult | None:
+            _, test_results_from_logs = await cicd_task
+            source_index = await index_task
+            return await self._run_stage(
+                timeline,
+                "strategy_detector",
+                cpu_pool,
+                self._detect_strategy,
+                repo_data,
+                test_results_from_logs,
+                source_index,
+                sub_id,
+                hack_id,
+            )
 
-                    # Track component performance
-                    cicd_duration_ms = int((datetime.now(UTC) - cicd_start).total_seconds() * 1000)
-                    self.cost_tracker.record_component_performance(
-                        sub_id=sub_id,
+        async def run_agents() -> list[tuple[AgentName, Any]]:
+            cicd_findings, _ = await cicd_task
+            names = []
+            tasks = []
+            for agent_name in agents_enabled:
+                if agent_name not in self.agents:
+                    logger.warning("agent_not_found", agent=agent_name)
+                    continue
+
+                names.append(agent_name)
+                tasks.append(
+                    self._run_agent_async(
+                        agent_name=agent_name,
+                        repo_data=repo_data,
+                        hackathon_name=hackathon_name,
+                        team_name=team_name,
                         hack_id=hack_id,
-                        component_name="actions_analyzer",
-                        duration_ms=cicd_duration_ms,
-                        findings_count=len(cicd_findings) if cicd_findings else 0,
-                        success=True,
-                    )
-
-                    logger.info(
-                        "cicd_logs_parsed",
                         sub_id=sub_id,
-                        findings_count=len(cicd_findings) if cicd_findings else 0,
-                        test_results_found=test_results_from_logs is not None,
-                        duration_ms=cicd_duration_ms,
+                        ai_policy_mode=ai_policy_mode,
+                        static_findings=cicd_findings,
+                        timeline=timeline,
                     )
-            except Exception as e:
+                )
+            return list(
+                zip(names, await asyncio.gather(*tasks, return_exceptions=True), strict=True)
+            )
+
+        team_task = asyncio.create_task(run_team_analysis())
+        strategy_task = asyncio.create_task(run_strategy_detection())
+
+        # Wait for all agents to complete
+        results = await run_agents()
+
+        # Process results - filter out exceptions
+        agent_responses: dict[AgentName, BaseAgentResponse] = {}
+        failed_agents: list[AgentName] = []
+
+        for agent_name, agent_result in results:
+            if isinstance(agent_result, BaseException):
+                logger.error(
+                    "agent_failed",
+                    agent=agent_name,
+                    error=str(agent_result),
+                )
+                failed_agents.append(agent_name)
+            else:
+                # agent_result is BaseAgentResponse (mypy needs assertion)
+                assert isinstance(agent_result, BaseAgentResponse)
+                agent_responses[agent_name] = agent_result
+
+        # Check if we have enough successful agents
+        if len(agent_responses) == 0:
+            # Let the CPU stages finish rather than abandon them mid-flight
+            await asyncio.gather(team_task, strategy_task, return_exceptions=True)
+            raise ValueError("All agents failed - cannot complete analysis")
+
+        if len(failed_agents) > 0:
+            logger.warning(
+                "partial_analysis",
+                failed_agents=failed_agents,
+                successful=len(agent_responses),
+            )
+
+        # Aggregate scores
+        aggregation = self._aggregate_scores(
+            agent_responses=agent_responses,
+            rubric=rubric,
+        )
+
+        # Transform feedback with brand voice (needs the strategy context)
+        strategy_analysis = await strategy_task
+        actionable_feedback = await self._run_stage(
+            timeline,
+            "brand_voice_transformer",
+            cpu_pool,
+            self._transform_feedback,
+            agent_responses,
+            strategy_analysis,
+            sub_id,
+            hack_id,
+        )
+        team_analysis = await team_task
+        cicd_findings, _ = await cicd_task
+
+        # Calculate duration
+        duration_ms = int((datetime.now(UTC) - start_time).total_seconds() * 1000)
+
+        result = {
+            "agent_responses": agent_responses,
+            "overall_score": aggregation["overall_score"],
+            "weighted_scores": aggregation["weighted_scores"],
+            "recommendation": aggregation["recommendation"],
+            "confidence": aggregation["confidence"],
+            "strengths": aggregation["strengths"],
+            "weaknesses": aggregation["weaknesses"],
+            "cost_records": self.cost_tracker.get_records(),
+            "component_performance": self.cost_tracker.get_component_records(),
+            "stage_timings": timeline.stages,
+            "total_cost_usd": self.cost_tracker.get_total_cost(),
+            "total_tokens": self.cost_tracker.get_total_tokens(),
+            "total_component_duration_ms": self.cost_tracker.get_total_component_duration_ms(),
+            "analysis_duration_ms": duration_ms,
+            "failed_agents": failed_agents,
+            # New intelligence layer results
+            "team_analysis": team_analysis,
+            "strategy_analysis": strategy_analysis,
+            "actionable_feedback": actionable_feedback,
+            "cicd_findings_count": len(cicd_findings) if cicd_findings else 0,
+        }
+
+        logger.info(
+            "orchestrator_analysis_completed",
+            sub_id=sub_id,
+            overall_score=result["overall_score"],
+            cost_usd=result["total_cost_usd"],
+            duration_ms=duration_ms,
+            team_grade=team_analysis.team_dynamics_grade if team_analysis else None,
+            feedback_items=len(actionable_feedback),
+            stages={t.stage: [round(t.start_ms), round(t.end_ms)] for t in timeline.stages},
+        )
+
+        return result
+
+    async def _run_stage(
+        self,
+        timeline: StageTimeline,
+        stage: str,
+        executor: Executor | None,
+        fn: Callable[..., T],
+        *args: Any,
+    ) -> T:
+        """Run a synchronous stage off the event loop and record when it ran.
+
+        Args:
+            timeline: Stage timeline of the current submission
+            stage: Stage name
+            executor: Executor to run in (None for the loop's default executor)
+            fn: Stage function
+            *args: Positional arguments for fn
+
+        Returns:
+            The stage function's result
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, timeline.timed(stage, fn), *args)
+
+    def _parse_cicd_logs(
+        self, repo_data: RepoData, github_token: str, sub_id: str, hack_id: str
+    ) -> tuple[list | None, Any]:
+        """Parse CI/CD logs for static findings and test results.
+
+        Args:
+            repo_data: Extracted repository data
+            github_token: GitHub token for the Actions API
+            sub_id: Submission ID
+            hack_id: Hackathon ID
+
+        Returns:
+            Tuple of (linter findings, test results), both None if parsing failed
+        """
+        cicd_findings = None
+        test_results_from_logs = None
+        cicd_start = datetime.now(UTC)
+
+        try:
+            # Extract owner/repo from URL
+            parts = repo_data.repo_url.rstrip("/").split("/")
+            if len(parts) >= 2:
+                owner, repo = parts[-2], parts[-1]
+
+                logger.info(
+                    "parsing_cicd_logs",
+                    sub_id=sub_id,
+                    owner=owner,
+                    repo=repo,
+                )
+
+                actions_analyzer = ActionsAnalyzer(github_token)
+                cicd_analysis = actions_analyzer.analyze(owner, repo)
+                actions_analyzer.close()
+
+                cicd_findings = cicd_analysis.get("linter_findings", [])
+                test_results_from_logs = cicd_analysis.get("test_results")
+
+                # Track component performance
                 cicd_duration_ms = int((datetime.now(UTC) - cicd_start).total_seconds() * 1000)
                 self.cost_tracker.record_component_performance(
                     sub_id=sub_id,
                     hack_id=hack_id,
                     component_name="actions_analyzer",
                     duration_ms=cicd_duration_ms,
-                    findings_count=0,
-                    success=False,
-                    error_message=str(e),
+                    findings_count=len(cicd_findings) if cicd_findings else 0,
+                    success=True,
                 )
-                logger.warning(
-                    "cicd_parsing_failed",
+
+                logger.info(
+                    "cicd_logs_parsed",
                     sub_id=sub_id,
-                    error=str(e),
+                    findings_count=len(cicd_findings) if cicd_findings else 0,
+                    test_results_found=test_results_from_logs is not None,
+                    duration_ms=cicd_duration_ms,
                 )
+        except Exception as e:
+            cicd_duration_ms = int((datetime.now(UTC) - cicd_start).total_seconds() * 1000)
+            self.cost_tracker.record_component_performance(
+                sub_id=sub_id,
+                hack_id=hack_id,
+                component_name="actions_analyzer",
+                duration_ms=cicd_duration_ms,
+                findings_count=0,
+                success=False,
+                error_message=str(e),
+            )
+            logger.warning(
+                "cicd_parsing_failed",
+                sub_id=sub_id,
+                error=str(e),
+            )
+
+        return cicd_findings, test_results_from_logs
 
-        # Step 2: Run team dynamics analysis
+    def _analyze_team(
+        self, repo_data: RepoData, source_index: SourceIndex, sub_id: str, hack_id: str
+    ) -> TeamAnalysisResult | None:
+        """Run team dynamics analysis.
+
+        Args:
+            repo_data: Extracted repository data
+            source_index: Source index shared with strategy detection
+            sub_id: Submission ID
+            hack_id: Hackathon ID
+
+        Returns:
+            Team analysis result, or None if the analyzer failed
+        """
         team_analysis = None
         team_start = datetime.now(UTC)
         try:
             logger.info("running_team_analysis", sub_id=sub_id)
-            team_analysis = self.team_analyzer.analyze(repo_data)
+            team_analysis = self.team_analyzer.analyze(repo_data, source_index=source_index)
 
             # Track component performance
             team_duration_ms = int((datetime.now(UTC) - team_start).total_seconds() * 1000)
@@ -202,7 +523,28 @@ class AnalysisOrchestrator:
                 error=str(e),
             )
 
-        # Step 3: Run strategy detection
+        return team_analysis
+
+    def _detect_strategy(
+        self,
+        repo_data: RepoData,
+        test_results_from_logs: Any,
+        source_index: SourceIndex,
+        sub_id: str,
+        hack_id: str,
+    ) -> StrategyAnalysisResult | None:
+        """Run strategy detection.
+
+        Args:
+            repo_data: Extracted repository data
+            test_results_from_logs: Test results parsed from CI/CD logs (if any)
+            source_index: Source index shared with team analysis
+            sub_id: Submission ID
+            hack_id: Hackathon ID
+
+        Returns:
+            Strategy analysis result, or None if the detector failed
+        """
         strategy_analysis = None
         strategy_start = datetime.now(UTC)
         try:
@@ -210,6 +552,7 @@ class AnalysisOrchestrator:
             strategy_analysis = self.strategy_detector.analyze(
                 repo_data=repo_data,
                 test_results=test_results_from_logs,
+                source_index=source_index,
             )
 
             # Track component performance
@@ -247,65 +590,26 @@ class AnalysisOrchestrator:
                 error=str(e),
             )
 
-        # Step 4: Run agents in parallel (with static context)
-        tasks = []
-        for agent_name in agents_enabled:
-            if agent_name not in self.agents:
-                logger.warning("agent_not_found", agent=agent_name)
-                continue
-
-            task = self._run_agent_async(
-                agent_name=agent_name,
-                repo_data=repo_data,
-                hackathon_name=hackathon_name,
-                team_name=team_name,
-                hack_id=hack_id,
-                sub_id=sub_id,
-                ai_policy_mode=ai_policy_mode,
-                static_findings=cicd_findings,
-            )
-            tasks.append(task)
-
-        # Wait for all agents to complete
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Process results - filter out exceptions
-        agent_responses: dict[AgentName, BaseAgentResponse] = {}
-        failed_agents: list[AgentName] = []
-
-        for i, agent_result in enumerate(results):
-            agent_name = agents_enabled[i]
-
-            if isinstance(agent_result, BaseException):
-                logger.error(
-                    "agent_failed",
-                    agent=agent_name,
-                    error=str(agent_result),
-                )
-                failed_agents.append(agent_name)
-            else:
-                # agent_result is BaseAgentResponse (mypy needs assertion)
-                assert isinstance(agent_result, BaseAgentResponse)
-                agent_responses[agent_name] = agent_result
-
-        # Check if we have enough successful agents
-        if len(agent_responses) == 0:
-            raise ValueError("All agents failed - cannot complete analysis")
+        return strategy_analysis
 
-        if len(failed_agents) > 0:
-            logger.warning(
-                "partial_analysis",
-                failed_agents=failed_agents,
-                successful=len(agent_responses),
-            )
+    def _transform_feedback(
+        self,
+        agent_responses: dict[AgentName, BaseAgentResponse],
+        strategy_analysis: StrategyAnalysisResult | None,
+        sub_id: str,
+        hack_id: str,
+    ) -> list:
+        """Transform agent findings into actionable feedback with brand voice.
 
-        # Aggregate scores
-        aggregation = self._aggregate_scores(
-            agent_responses=agent_responses,
-            rubric=rubric,
-        )
+        Args:
+            agent_responses: Successful agent responses
+            strategy_analysis: Strategy context (None if detection failed)
+            sub_id: Submission ID
+            hack_id: Hackathon ID
 
-        # Step 5: Transform feedback with brand voice
+        Returns:
+            Actionable feedback items (empty if the transformation failed)
+        """
         actionable_feedback = []
         feedback_start = datetime.now(UTC)
         try:
@@ -360,42 +664,7 @@ class AnalysisOrchestrator:
                 error=str(e),
             )
 
-        # Calculate duration
-        duration_ms = int((datetime.now(UTC) - start_time).total_seconds() * 1000)
-
-        result = {
-            "agent_responses": agent_responses,
-            "overall_score": aggregation["overall_score"],
-            "weighted_scores": aggregation["weighted_scores"],
-            "recommendation": aggregation["recommendation"],
-            "confidence": aggregation["confidence"],
-            "strengths": aggregation["strengths"],
-            "weaknesses": aggregation["weaknesses"],
-            "cost_records": self.cost_tracker.get_records(),
-            "component_performance": self.cost_tracker.get_component_records(),
-            "total_cost_usd": self.cost_tracker.get_total_cost(),
-            "total_tokens": self.cost_tracker.get_total_tokens(),
-            "total_component_duration_ms": self.cost_tracker.get_total_component_duration_ms(),
-            "analysis_duration_ms": duration_ms,
-            "failed_agents": failed_agents,
-            # New intelligence layer results
-            "team_analysis": team_analysis,
-            "strategy_analysis": strategy_analysis,
-            "actionable_feedback": actionable_feedback,
-            "cicd_findings_count": len(cicd_findings) if cicd_findings else 0,
-        }
-
-        logger.info(
-            "orchestrator_analysis_completed",
-            sub_id=sub_id,
-            overall_score=result["overall_score"],
-            cost_usd=result["total_cost_usd"],
-            duration_ms=duration_ms,
-            team_grade=team_analysis.team_dynamics_grade if team_analysis else None,
-            feedback_items=len(actionable_feedback),
-        )
-
-        return result
+        return actionable_feedback
 
     async def _run_agent_async(
         self,
@@ -407,6 +676,7 @@ class AnalysisOrchestrator:
         sub_id: str,
         ai_policy_mode: str,
         static_findings: list | None = None,
+        timeline: StageTimeline | None = None,
     ) -> BaseAgentResponse:
         """Run a single agent asynchronously.
 
@@ -419,6 +689,7 @@ class AnalysisOrchestrator:
             sub_id: Submission ID
             ai_policy_mode: AI policy mode
             static_findings: Optional static analysis findings from CI/CD logs
+            timeline: Optional stage timeline that records when the agent ran
 
         Returns:
             Agent response
@@ -439,22 +710,47 @@ class AnalysisOrchestrator:
                 "findings": static_findings[:20],  # Top 20 to stay within token budget
             }
 
-        # Use lambda to pass kwargs to analyze
-        response, usage = await loop.run_in_executor(
-            None,
-            lambda: agent.analyze(repo_data, hackathon_name, team_name, **kwargs),
+        # Bind kwargs for analyze
+        def run_agent() -> tuple[BaseAgentResponse, dict]:
+            response, usage = agent.analyze(repo_data, hackathon_name, team_name, **kwargs)
+            current_span().set(
+                model_id=usage.get("model_id", agent.model_id),
+                input_tokens=usage["input_tokens"],
+                output_tokens=usage["output_tokens"],
+            )
+            return response, usage
+
+        # The executor does not carry context variables (trace, hedge budget)
+        call = (
+            functools.partial(contextvars.copy_context().run, run_agent)
+            if timeline is None
+            else timeline.timed(f"agent:{agent_name}", run_agent)
         )
+        response, usage = await loop.run_in_executor(None, call)
 
-        # Record cost
+        # Record cost (against the fallback model when a hedge request won)
         self.cost_tracker.record_agent_cost(
             sub_id=sub_id,
             hack_id=hack_id,
             agent_name=agent_name,
-            model_id=agent.model_id,
+            model_id=usage.get("model_id", agent.model_id),
             input_tokens=usage["input_tokens"],
             output_tokens=usage["output_tokens"],
             latency_ms=usage["latency_ms"],
         )
+        # The request that lost a hedged call is billed too
+        hedge_usage = usage.get("hedge_usage")
+        if hedge_usage:
+            self.cost_tracker.record_agent_cost(
+                sub_id=sub_id,
+                hack_id=hack_id,
+                agent_name=agent_name,
+                model_id=hedge_usage["model_id"],
+                input_tokens=hedge_usage["input_tokens"],
+                output_tokens=hedge_usage["output_tokens"],
+                latency_ms=0,
+                hedge=True,
+            )
 
         return response
 
@@ -5,6 +5,7 @@ from contextlib import contextmanager
 from typing import Any
 
 from src.utils.logging import get_logger
+from src.utils.tracing import span
 
 logger = get_logger(__name__)
 
@@ -26,6 +27,9 @@ class PerformanceMonitor:
     def track(self, component: str) -> Any:
         """Context manager to track component execution time.
 
+        The component is also recorded as a ``pipeline.<component>`` span of
+        the active trace.
+
         Args:
             component: Name of component being tracked
 
@@ -34,7 +38,8 @@ class PerformanceMonitor:
         """
         start = time.time()
         try:
-            yield
+            with span(f"pipeline.{component}"):
+                yield
         finally:
             duration_ms = (time.time() - start) * 1000
             self.timings[component] = duration_ms
@@ -0,0 +1,175 @@
+"""Shared, pre-normalized view of a repository's files for the intelligence analyzers.
+
+``StrategyDetector`` and ``TeamAnalyzer`` answer many "does this file mention
+any of these keywords" questions about the same files. ``SourceIndex`` lowers
+every path, file body and the README once per submission, and
+``KeywordMatcher`` holds an analyzer's keyword rules. Short texts (paths,
+commit messages, the README) are matched against all rules in a single call;
+file contents are matched one rule at a time, on demand, so detectors that
+stop at the first hit keep doing so. Every answer is cached, so a question is
+answered at most once per file no matter how many detectors or contributors
+ask it.
+"""
+
+from collections.abc import Iterable, Mapping, Sequence
+
+from src.models.analysis import RepoData, SourceFile
+
+
+class KeywordMatcher:
+    """Named keyword rules evaluated with substring search.
+
+    A rule hits when any of its keywords is a substring of the text. When all
+    rules are evaluated at once, keywords shared by several rules are searched
+    once and credit every rule that owns them, and a keyword is skipped once
+    all of its rules have already hit. Texts are expected to be lower-cased
+    already; keywords are lower-cased when the matcher is built.
+    """
+
+    def __init__(self, rules: Mapping[str, Iterable[str]]) -> None:
+        """Compile the rule table.
+
+        Args:
+            rules: Rule name -> keywords that trigger the rule
+        """
+        self.rules = {rule: tuple(k.lower() for k in keywords) for rule, keywords in rules.items()}
+
+        owners: dict[str, set[str]] = {}
+        for rule, keywords in self.rules.items():
+            for keyword in keywords:
+                owners.setdefault(keyword, set()).add(rule)
+
+        # Longest keywords first: they are the most selective and, once found,
+        # tend to satisfy rules that shorter keywords would otherwise re-check.
+        self._keywords = tuple(
+            (keyword, frozenset(owners[keyword]))
+            for keyword in sorted(owners, key=len, reverse=True)
+        )
+
+    def match(self, text: str) -> frozenset[str]:
+        """Return the names of all rules with at least one keyword in the text.
+
+        Args:
+            text: Lower-cased text to scan
+
+        Returns:
+            Rule names that hit
+        """
+        hits: set[str] = set()
+        for keyword, rules in self._keywords:
+            if rules <= hits:
+                continue
+            if keyword in text:
+                hits |= rules
+                if len(hits) == len(self.rules):
+                    break
+        return frozenset(hits)
+
+    def matches(self, text: str, rule: str) -> bool:
+        """Return True if any keyword of one rule is in the text.
+
+        Args:
+            text: Lower-cased text to scan
+            rule: Rule name
+
+        Returns:
+            True if the rule hits
+        """
+        return any(keyword in text for keyword in self.rules[rule])
+
+
+class SourceIndex:
+    """Per-submission index of lower-cased paths, contents and rule hits.
+
+    Built once from ``RepoData`` and shared by the analyzers of a submission.
+    Files that were not part of the index (e.g. lists built by callers) are
+    indexed on first use, so every query also works on arbitrary file lists.
+    """
+
+    def __init__(self, source_files: Sequence[SourceFile] = (), readme_content: str = "") -> None:
+        """Index the given files.
+
+        Args:
+            source_files: Repository source files
+            readme_content: README text
+        """
+        self.readme_lower = readme_content.lower()
+        self._paths: dict[str, str] = {}
+        # Keyed by id(); the entry keeps the file alive so its id is never reused.
+        self._contents: dict[int, tuple[SourceFile, str]] = {}
+        self._path_hits: dict[tuple[KeywordMatcher, str], frozenset[str]] = {}
+        self._content_hits: dict[tuple[KeywordMatcher, str, int], bool] = {}
+        for source_file in source_files:
+            self.content_lower(source_file)
+
+    @classmethod
+    def from_repo_data(cls, repo_data: RepoData) -> "SourceIndex":
+        """Build the index for a submission.
+
+        Args:
+            repo_data: Repository data
+
+        Returns:
+            Index over the repository's source files and README
+        """
+        return cls(repo_data.source_files, repo_data.readme_content)
+
+    def path_lower(self, path: str) -> str:
+        """Return the lower-cased path (cached)."""
+        lowered = self._paths.get(path)
+        if lowered is None:
+            lowered = self._paths[path] = path.lower()
+        return lowered
+
+    def content_lower(self, source_file: SourceFile) -> str:
+        """Return the lower-cased file content (cached per file object)."""
+        entry = self._contents.get(id(source_file))
+        if entry is None:
+            entry = (source_file, source_file.content.lower())
+            self._contents[id(source_file)] = entry
+        return entry[1]
+
+    def path_hits(self, path: str, matcher: KeywordMatcher) -> frozenset[str]:
+        """Return the matcher rules that hit the lower-cased path.
+
+        Args:
+            path: File path
+            matcher: Keyword rules
+
+        Returns:
+            Rule names that hit
+        """
+        key = (matcher, path)
+        hits = self._path_hits.get(key)
+        if hits is None:
+            hits = self._path_hits[key] = matcher.match(self.path_lower(path))
+        return hits
+
+    def content_matches(self, source_file: SourceFile, matcher: KeywordMatcher, rule: str) -> bool:
+        """Return True if a matcher rule hits the lower-cased file content.
+
+        Args:
+            source_file: Source file
+            matcher: Keyword rules
+            rule: Rule name
+
+        Returns:
+            True if the rule hits
+        """
+        content = self.content_lower(source_file)
+        key = (matcher, rule, id(source_file))
+        hit = self._content_hits.get(key)
+        if hit is None:
+            hit = self._content_hits[key] = matcher.matches(content, rule)
+        return hit
+
+    def paths_hits(self, paths: Iterable[str], matcher: KeywordMatcher) -> frozenset[str]:
+        """Return the matcher rules that hit any of the paths."""
+        hits: set[str] = set()
+        for path in paths:
+            hits |= self.path_hits(path, matcher)
+        return frozenset(hits)
+
+    def readme_hits(self, matcher: KeywordMatcher) -> frozenset[str]:
+        """Return the matcher rules that hit the lower-cased README."""
+        return matcher.match(self.readme_lower)
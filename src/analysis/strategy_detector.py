@@ -5,6 +5,8 @@ import time
 
 import structlog
 
+from src.analysis.authorship_index import AuthorshipIndex
+from src.analysis.source_index import KeywordMatcher, SourceIndex
 from src.models.analysis import CommitInfo, RepoData, SourceFile
 from src.models.strategy import (
     LearningJourney,
@@ -17,6 +19,189 @@ from src.models.test_execution import TestExecutionResult
 
 logger = structlog.get_logger()
 
+# Critical path keywords (checked in test file paths and contents)
+CRITICAL_PATH_KEYWORDS = [
+    "auth",
+    "login",
+    "payment",
+    "checkout",
+    "order",
+    "transaction",
+    "security",
+    "admin",
+    "user",
+]
+
+# Common frameworks/technologies (checked in file paths and contents, in order)
+TECHNOLOGY_PATTERNS = {
+    "react": ["react", "jsx", "tsx"],
+    "vue": ["vue", ".vue"],
+    "angular": ["angular", "@angular"],
+    "django": ["django", "manage.py"],
+    "flask": ["flask", "app.py"],
+    "fastapi": ["fastapi", "main.py"],
+    "docker": ["dockerfile", "docker-compose"],
+    "kubernetes": ["k8s", "kubernetes", "deployment.yaml"],
+    "graphql": ["graphql", ".graphql"],
+    "typescript": [".ts", ".tsx"],
+}
+
+# Every path rule of the detector, evaluated in one pass per path
+PATH_RULES = KeywordMatcher(
+    {
+        "e2e_test": [
+            "e2e",
+            "end-to-end",
+            "selenium",
+            "cypress",
+            "playwright",
+            "integration/e2e",
+            "tests/e2e",
+            "test/e2e",
+        ],
+        "integration_test": [
+            "integration",
+            "api_test",
+            "api/test",
+            "tests/integration",
+            "test/integration",
+            "functional",
+        ],
+        "critical_path": CRITICAL_PATH_KEYWORDS,
+        **{f"tech:{name}": patterns for name, patterns in TECHNOLOGY_PATTERNS.items()},
+        "service_dir": ["services/", "microservices/", "apps/"],
+        "docker_compose": ["docker-compose"],
+        "api_gateway": ["gateway", "api-gateway", "proxy"],
+        "service_mesh": ["istio", "linkerd", "consul", "envoy"],
+        "models": ["models/", "model/", "entities/"],
+        "views": ["views/", "view/", "templates/"],
+        "controllers": ["controllers/", "controller/"],
+        "services": ["services/", "service/"],
+        "repositories": ["repositories/", "repository/", "repos/"],
+        "handlers": ["handlers/", "handler/"],
+        "commands": ["commands/", "command/"],
+        "queries": ["queries/", "query/"],
+        "domain": ["domain/", "core/"],
+        "infrastructure": ["infrastructure/", "adapters/"],
+        "application": ["application/", "use-cases/", "usecases/"],
+        "readme": ["readme"],
+        "diagram_file": [".png", ".jpg", ".jpeg", ".svg", ".gif", ".drawio", ".mermaid"],
+        "diagram_name": ["architecture", "diagram", "design", "flow", "schema"],
+        "api_docs": [
+            "api.md",
+            "api_docs",
+            "api-docs",
+            "api_documentation",
+            "swagger",
+            "openapi",
+            "postman",
+            "api_reference",
+            "endpoints.md",
+            "routes.md",
+        ],
+    }
+)
+
+# Every content rule of the detector, evaluated on demand per file and rule
+CONTENT_RULES = KeywordMatcher(
+    {
+        "critical_path": CRITICAL_PATH_KEYWORDS,
+        **{f"tech:{name}": patterns for name, patterns in TECHNOLOGY_PATTERNS.items()},
+        # Quick and dirty patterns
+        "fast_implementation": ["todo", "fixme", "hack", "quick fix", "temporary"],
+        "scalability": [
+            "cache",
+            "redis",
+            "queue",
+            "worker",
+            "async",
+            "microservice",
+            "load balancer",
+            "horizontal scaling",
+        ],
+        "mermaid": ["```mermaid"],
+        "api_spec": ["openapi", "swagger"],
+        # Literals every SECURITY_PATTERN match contains; only these files get the regex
+        "security_candidate": ["password", "apikey", "api_key", "api-key", "eval(", "exec("],
+    }
+)
+
+README_RULES = KeywordMatcher(
+    {
+        # Problem statement keywords or a dedicated problem section header
+        "problem_statement": [
+            "problem",
+            "challenge",
+            "issue",
+            "motivation",
+            "why we built",
+            "inspiration",
+            "background",
+            "the need",
+            "pain point",
+            "objective",
+            "goal",
+            "## problem",
+            "## challenge",
+            "## motivation",
+            "## inspiration",
+            "## background",
+            "## objective",
+            "# problem",
+            "# challenge",
+            "# motivation",
+        ],
+        "api_section": [
+            "## api",
+            "## endpoints",
+            "## routes",
+            "## api reference",
+            "## api documentation",
+            "# api",
+            "# endpoints",
+        ],
+        # HTTP methods or endpoint patterns under the API section
+        "api_content": [
+            "get ",
+            "post ",
+            "put ",
+            "delete ",
+            "patch ",
+            "/api/",
+            "endpoint:",
+            "route:",
+        ],
+    }
+)
+
+# Hardcoded passwords, hardcoded API keys, eval usage, exec usage (on lower-cased content)
+SECURITY_PATTERN = re.compile(r'password\s*=\s*["\']|api[_-]?key\s*=\s*["\']|eval\(|exec\(')
+
+# Test file name affixes around the name of the module under test
+# (test_cart.py, cart_test.go, cart.test.ts, CartTest.java)
+TEST_NAME_PREFIXES = ("test_", "spec_")
+TEST_NAME_SUFFIXES = ("_test", "_spec", "tests", "test", "spec")
+
+
+def _file_stem(path: str) -> str:
+    """Return the lower-cased file name up to its first dot."""
+    return path.rsplit("/", 1)[-1].split(".", 1)[0].lower()
+
+
+def _test_subject(path: str) -> str | None:
+    """Return the stem of the module a test file tests, judging by its name."""
+    stem = _file_stem(path)
+    for prefix in TEST_NAME_PREFIXES:
+        if stem.startswith(prefix):
+            stem = stem[len(prefix) :]
+            break
+    else:
+        for suffix in TEST_NAME_SUFFIXES:
+            if stem.endswith(suffix):
+                stem = stem[: -len(suffix)]
+                break
+    return stem.strip("_-") or None
+
 
 class StrategyDetector:
     """Detects strategic thinking behind technical decisions.
@@ -33,17 +218,20 @@ class StrategyDetector:
         self,
         repo_data: RepoData,
         test_results: TestExecutionResult | None = None,
+        source_index: SourceIndex | None = None,
     ) -> StrategyAnalysisResult:
         """Analyze strategic decisions in repository.
 
         Args:
             repo_data: Repository data with commits and files
             test_results: Test execution results (optional)
+            source_index: Index shared with the other analyzers (built if omitted)
 
         Returns:
             StrategyAnalysisResult with strategic context
         """
         start_time = time.time()
+        index = source_index or SourceIndex.from_repo_data(repo_data)
 
         self.logger.info(
             "strategy_analysis_started",
@@ -52,10 +240,13 @@ class StrategyDetector:
         )
 
         # Analyze test strategy (now returns strategy and metrics)
+        authorship = repo_data.authorship
         test_strategy, test_metrics = self._analyze_test_strategy(
             repo_data.source_files,
             test_results,
             repo_data.commit_history,
+            index,
+            authorship if isinstance(authorship, AuthorshipIndex) and authorship.paths else None,
         )
 
         # Log test metrics for debugging
@@ -69,15 +260,17 @@ class StrategyDetector:
         # Detect critical path focus
         critical_path_focus = self._detect_critical_path_focus(
             repo_data.source_files,
+            index,
         )
 
         # Detect architecture tradeoffs
-        tradeoffs = self._detect_architecture_tradeoffs(repo_data)
+        tradeoffs = self._detect_architecture_tradeoffs(repo_data, index)
 
         # Detect learning journey
         learning_journey = self._detect_learning_journey(
             repo_data.commit_history,
             repo_data.source_files,
+            index,
         )
 
         # Classify maturity level
@@ -122,6 +315,8 @@ class StrategyDetector:
         source_files: list[SourceFile],
         test_results: TestExecutionResult | None,
         commit_history: list[CommitInfo],
+        index: SourceIndex | None = None,
+        authorship: AuthorshipIndex | None = None,
     ) -> tuple[TestStrategy, dict[str, float]]:
         """Classify test strategy based on test type distribution.
 
@@ -134,11 +329,16 @@ class StrategyDetector:
             source_files: Repository source files
             test_results: Test execution results
             commit_history: Git commit history
+            index: Shared source index (built from source_files if omitted)
+            authorship: Per-file authorship index (TDD falls back to commit
+                messages if omitted)
 
         Returns:
             Tuple of (TestStrategy classification, metrics dict)
             Metrics include: test_to_code_ratio, tdd_percentage, unit_pct, integration_pct, e2e_pct
         """
+        index = index or SourceIndex(source_files)
+
         # Find test files and production files
         test_files = [f for f in source_files if self._is_test_file(f.path)]
 
@@ -152,7 +352,9 @@ class StrategyDetector:
         test_to_code_ratio = test_lines / production_lines if production_lines > 0 else 0.0
 
         # Detect TDD patterns from commit history
-        tdd_percentage = self._detect_tdd_patterns(commit_history, test_files, production_files)
+        tdd_percentage = self._detect_tdd_patterns(
+            commit_history, test_files, production_files, authorship
+        )
 
         if not test_files:
             # Check if there's polished UI but no tests (demo-first strategy)
@@ -182,35 +384,13 @@ class StrategyDetector:
         e2e_tests = 0
 
         for test_file in test_files:
-            path_lower = test_file.path.lower()
+            path_hits = index.path_hits(test_file.path, PATH_RULES)
 
             # E2E tests
-            if any(
-                keyword in path_lower
-                for keyword in [
-                    "e2e",
-                    "end-to-end",
-                    "selenium",
-                    "cypress",
-                    "playwright",
-                    "integration/e2e",
-                    "tests/e2e",
-                    "test/e2e",
-                ]
-            ):
+            if "e2e_test" in path_hits:
                 e2e_tests += 1
             # Integration tests
-            elif any(
-                keyword in path_lower
-                for keyword in [
-                    "integration",
-                    "api_test",
-                    "api/test",
-                    "tests/integration",
-                    "test/integration",
-                    "functional",
-                ]
-            ):
+            elif "integration_test" in path_hits:
                 integration_tests += 1
             # Unit tests (default)
             else:
@@ -249,9 +429,7 @@ class StrategyDetector:
             return TestStrategy.UNIT_FOCUSED, metrics
         else:
             # Mixed strategy - check for critical path focus
-            if self._detect_critical_path_focus(
-                [f for f in source_files if self._is_test_file(f.path)]
-            ):
+            if self._detect_critical_path_focus(test_files, index):
                 return TestStrategy.CRITICAL_PATH, metrics
             return TestStrategy.UNIT_FOCUSED, metrics
 
@@ -361,6 +539,7 @@ class StrategyDetector:
         commit_history: list[CommitInfo],
         test_files: list[SourceFile],
         production_files: list[SourceFile],
+        authorship: AuthorshipIndex | None = None,
     ) -> float:
         """Detect TDD patterns by analyzing commit order.
 
@@ -371,6 +550,8 @@ class StrategyDetector:
             commit_history: Git commit history (newest first)
             test_files: Test files in repository
             production_files: Production code files in repository
+            authorship: Per-file authorship index (commit messages are used as
+                a proxy if omitted)
 
         Returns:
             Percentage of test files that appear to follow TDD (0.0-1.0)
@@ -378,6 +559,9 @@ class StrategyDetector:
         if not test_files or not commit_history:
             return 0.0
 
+        if authorship is not None:
+            return self._detect_tdd_from_file_history(test_files, production_files, authorship)
+
         # Build a map of file paths to their first commit (earliest appearance)
         # Commits are newest first, so we iterate in reverse
         file_first_commit: dict[str, CommitInfo] = {}
@@ -431,14 +615,65 @@ class StrategyDetector:
 
         return tdd_percentage
 
+    def _detect_tdd_from_file_history(
+        self,
+        test_files: list[SourceFile],
+        production_files: list[SourceFile],
+        authorship: AuthorshipIndex,
+    ) -> float:
+        """Compare when each test file and the code it tests first appeared.
+
+        Tests are paired with production files by name (``test_cart.py`` and
+        ``cart.test.ts`` test ``cart.*``). A pair follows TDD when the test's
+        first commit is the same as, or older than, the implementation's.
+
+        Args:
+            test_files: Test files in repository
+            production_files: Production code files in repository
+            authorship: Per-file authorship index
+
+        Returns:
+            Share of paired test files committed no later than their
+            implementation (0.0-1.0, 0.0 if nothing could be paired)
+        """
+        production_by_stem: dict[str, list[str]] = {}
+        for production_file in production_files:
+            production_by_stem.setdefault(_file_stem(production_file.path), []).append(
+                production_file.path
+            )
+
+        paired = test_first = 0
+        for test_file in test_files:
+            subject = _test_subject(test_file.path)
+            test_row = authorship.first_commit(test_file.path)
+            if subject is None or test_row is None:
+                continue
+
+            impl_rows = [
+                row
+                for path in production_by_stem.get(subject, [])
+                if (row := authorship.first_commit(path)) is not None
+            ]
+            if not impl_rows:
+                continue
+
+            paired += 1
+            impl_row = min(impl_rows, key=authorship.chronological_key)
+            if authorship.chronological_key(test_row) <= authorship.chronological_key(impl_row):
+                test_first += 1
+
+        return test_first / paired if paired else 0.0
+
     def _detect_critical_path_focus(
         self,
         source_files: list[SourceFile],
+        index: SourceIndex | None = None,
     ) -> bool:
         """Check if tests focus on critical paths.
 
         Args:
             source_files: Repository source files
+            index: Shared source index (built from source_files if omitted)
 
         Returns:
             True if critical path focus detected
@@ -448,30 +683,15 @@ class StrategyDetector:
         if not test_files:
             return False
 
-        # Critical path keywords
-        critical_keywords = [
-            "auth",
-            "login",
-            "payment",
-            "checkout",
-            "order",
-            "transaction",
-            "security",
-            "admin",
-            "user",
-        ]
-
-        critical_test_count = 0
-
-        for test_file in test_files:
-            path_lower = test_file.path.lower()
-            content_lower = test_file.content.lower()
+        index = index or SourceIndex(test_files)
 
-            # Check if test file focuses on critical paths
-            if any(
-                keyword in path_lower or keyword in content_lower for keyword in critical_keywords
-            ):
-                critical_test_count += 1
+        # Check if each test file focuses on critical paths (path or content)
+        critical_test_count = sum(
+            1
+            for test_file in test_files
+            if "critical_path" in index.path_hits(test_file.path, PATH_RULES)
+            or index.content_matches(test_file, CONTENT_RULES, "critical_path")
+        )
 
         # If >50% of tests focus on critical paths
         return critical_test_count / len(test_files) > 0.5
@@ -479,6 +699,7 @@ class StrategyDetector:
     def _detect_architecture_decisions(
         self,
         repo_data: RepoData,
+        index: SourceIndex | None = None,
     ) -> tuple[str, list[str], list[Tradeoff]]:
         """Identify architecture decisions from directory structure and code organization.
 
@@ -489,28 +710,33 @@ class StrategyDetector:
 
         Args:
             repo_data: Repository data
+            index: Shared source index (built from repo_data if omitted)
 
         Returns:
             Tuple of (architecture_type, design_patterns, tradeoffs)
         """
         source_files = repo_data.source_files
+        index = index or SourceIndex.from_repo_data(repo_data)
 
         # Detect architecture type
-        architecture_type = self._detect_architecture_type(source_files)
+        architecture_type = self._detect_architecture_type(source_files, index)
 
         # Detect design patterns
-        design_patterns = self._detect_design_patterns(source_files)
+        design_patterns = self._detect_design_patterns(source_files, index)
 
         # Detect tradeoffs
         tradeoffs = self._detect_architecture_tradeoffs_internal(
             source_files,
             architecture_type,
             design_patterns,
+            index,
         )
 
         return architecture_type, design_patterns, tradeoffs
 
-    def _detect_architecture_type(self, source_files: list[SourceFile]) -> str:
+    def _detect_architecture_type(
+        self, source_files: list[SourceFile], index: SourceIndex | None = None
+    ) -> str:
         """Detect if architecture is monolith or microservices.
 
         Indicators:
@@ -520,10 +746,13 @@ class StrategyDetector:
 
         Args:
             source_files: Repository source files
+            index: Shared source index (built from source_files if omitted)
 
         Returns:
             Architecture type: "monolith", "microservices", or "modular_monolith"
         """
+        index = index or SourceIndex(source_files)
+
         # Check for microservices indicators
         service_dirs = set()
         has_docker_compose = False
@@ -531,33 +760,32 @@ class StrategyDetector:
         has_service_mesh = False
 
         for source_file in source_files:
-            path_lower = source_file.path.lower()
+            path_hits = index.path_hits(source_file.path, PATH_RULES)
 
             # Check for service directories (services/, microservices/, apps/)
-            if any(pattern in path_lower for pattern in ["services/", "microservices/", "apps/"]):
+            if "service_dir" in path_hits:
                 # Extract service name
-                parts = path_lower.split("/")
+                parts = index.path_lower(source_file.path).split("/")
                 for i, part in enumerate(parts):
                     if part in ["services", "microservices", "apps"] and i + 1 < len(parts):
                         service_dirs.add(parts[i + 1])
 
             # Check for docker-compose
-            if "docker-compose" in path_lower:
+            if "docker_compose" in path_hits:
                 has_docker_compose = True
                 # Check if multiple services defined
-                if "services:" in source_file.content.lower():
-                    service_count = source_file.content.lower().count(
-                        "image:"
-                    ) + source_file.content.lower().count("build:")
+                content_lower = index.content_lower(source_file)
+                if "services:" in content_lower:
+                    service_count = content_lower.count("image:") + content_lower.count("build:")
                     if service_count > 2:  # More than 2 services = microservices
                         service_dirs.add("docker-services")
 
             # Check for API gateway patterns
-            if any(pattern in path_lower for pattern in ["gateway", "api-gateway", "proxy"]):
+            if "api_gateway" in path_hits:
                 has_api_gateway = True
 
             # Check for service mesh (Istio, Linkerd, Consul)
-            if any(pattern in path_lower for pattern in ["istio", "linkerd", "consul", "envoy"]):
+            if "service_mesh" in path_hits:
                 has_service_mesh = True
 
         # Classify architecture
@@ -568,7 +796,9 @@ class StrategyDetector:
         else:
             return "monolith"
 
-    def _detect_design_patterns(self, source_files: list[SourceFile]) -> list[str]:
+    def _detect_design_patterns(
+        self, source_files: list[SourceFile], index: SourceIndex | None = None
+    ) -> list[str]:
         """Detect design patterns from code organization.
 
         Patterns detected:
@@ -581,6 +811,7 @@ class StrategyDetector:
 
         Args:
             source_files: Repository source files
+            index: Shared source index (built from source_files if omitted)
 
         Returns:
             List of detected design patterns
@@ -588,52 +819,27 @@ class StrategyDetector:
         patterns = []
 
         # Track directory structure
-        has_models = False
-        has_views = False
-        has_controllers = False
-        has_services = False
-        has_repositories = False
-        has_handlers = False
-        has_commands = False
-        has_queries = False
-        has_domain = False
-        has_infrastructure = False
-        has_application = False
+        index = index or SourceIndex(source_files)
+        directories = index.paths_hits((f.path for f in source_files), PATH_RULES)
 
-        for source_file in source_files:
-            path_lower = source_file.path.lower()
-
-            # Check for MVC components
-            if any(pattern in path_lower for pattern in ["models/", "model/", "entities/"]):
-                has_models = True
-            if any(pattern in path_lower for pattern in ["views/", "view/", "templates/"]):
-                has_views = True
-            if any(pattern in path_lower for pattern in ["controllers/", "controller/"]):
-                has_controllers = True
-
-            # Check for layered architecture
-            if any(pattern in path_lower for pattern in ["services/", "service/"]):
-                has_services = True
-            if any(pattern in path_lower for pattern in ["repositories/", "repository/", "repos/"]):
-                has_repositories = True
-            if any(pattern in path_lower for pattern in ["handlers/", "handler/"]):
-                has_handlers = True
-
-            # Check for CQRS
-            if any(pattern in path_lower for pattern in ["commands/", "command/"]):
-                has_commands = True
-            if any(pattern in path_lower for pattern in ["queries/", "query/"]):
-                has_queries = True
-
-            # Check for hexagonal/clean architecture
-            if any(pattern in path_lower for pattern in ["domain/", "core/"]):
-                has_domain = True
-            if any(pattern in path_lower for pattern in ["infrastructure/", "adapters/"]):
-                has_infrastructure = True
-            if any(
-                pattern in path_lower for pattern in ["application/", "use-cases/", "usecases/"]
-            ):
-                has_application = True
+        # MVC components
+        has_models = "models" in directories
+        has_views = "views" in directories
+        has_controllers = "controllers" in directories
+
+        # Layered architecture
+        has_services = "services" in directories
+        has_repositories = "repositories" in directories
+        has_handlers = "handlers" in directories
+
+        # CQRS
+        has_commands = "commands" in directories
+        has_queries = "queries" in directories
+
+        # Hexagonal/clean architecture
+        has_domain = "domain" in directories
+        has_infrastructure = "infrastructure" in directories
+        has_application = "application" in directories
 
         # Identify patterns
         if has_models and has_views and has_controllers:
@@ -667,6 +873,7 @@ class StrategyDetector:
         source_files: list[SourceFile],
         architecture_type: str,
         design_patterns: list[str],
+        index: SourceIndex | None = None,
     ) -> list[Tradeoff]:
         """Identify architecture trade-offs based on detected patterns.
 
@@ -674,15 +881,17 @@ class StrategyDetector:
             source_files: Repository source files
             architecture_type: Detected architecture type
             design_patterns: Detected design patterns
+            index: Shared source index (built from source_files if omitted)
 
         Returns:
             List of detected tradeoffs
         """
         tradeoffs: list[Tradeoff] = []
+        index = index or SourceIndex(source_files)
 
         # Check for speed vs security tradeoff
-        has_security_issues = self._has_security_patterns(source_files)
-        has_fast_implementation = self._has_fast_implementation_patterns(source_files)
+        has_security_issues = self._has_security_patterns(source_files, index)
+        has_fast_implementation = self._has_fast_implementation_patterns(source_files, index)
 
         if has_security_issues and has_fast_implementation:
             tradeoffs.append(
@@ -696,7 +905,7 @@ class StrategyDetector:
 
         # Check for simplicity vs scalability tradeoff
         has_simple_architecture = self._has_simple_architecture(source_files)
-        has_scalability_concerns = self._has_scalability_concerns(source_files)
+        has_scalability_concerns = self._has_scalability_concerns(source_files, index)
 
         if has_simple_architecture and not has_scalability_concerns:
             tradeoffs.append(
@@ -732,7 +941,9 @@ class StrategyDetector:
 
         # Check for quality vs speed tradeoff
         has_tests = any(self._is_test_file(f.path) for f in source_files)
-        has_documentation = any("readme" in f.path.lower() for f in source_files)
+        has_documentation = any(
+            "readme" in index.path_hits(f.path, PATH_RULES) for f in source_files
+        )
 
         if not has_tests and not has_documentation and len(source_files) > 20:
             tradeoffs.append(
@@ -749,70 +960,59 @@ class StrategyDetector:
     def _detect_architecture_tradeoffs(
         self,
         repo_data: RepoData,
+        index: SourceIndex | None = None,
     ) -> list[Tradeoff]:
         """Identify architecture trade-offs (wrapper for backward compatibility).
 
         Args:
             repo_data: Repository data
+            index: Shared source index (built from repo_data if omitted)
 
         Returns:
             List of detected tradeoffs
         """
         architecture_type, design_patterns, tradeoffs = self._detect_architecture_decisions(
-            repo_data
+            repo_data, index
         )
         return tradeoffs
 
-    def _has_security_patterns(self, source_files: list[SourceFile]) -> bool:
+    def _has_security_patterns(
+        self, source_files: list[SourceFile], index: SourceIndex | None = None
+    ) -> bool:
         """Check for security vulnerability patterns.
 
         Args:
             source_files: Repository source files
+            index: Shared source index (built from source_files if omitted)
 
         Returns:
             True if security issues detected
         """
-        security_patterns = [
-            r'password\s*=\s*["\']',  # Hardcoded passwords
-            r'api[_-]?key\s*=\s*["\']',  # Hardcoded API keys
-            r"eval\(",  # Eval usage
-            r"exec\(",  # Exec usage
-        ]
-
-        for source_file in source_files:
-            for pattern in security_patterns:
-                if re.search(pattern, source_file.content, re.IGNORECASE):
-                    return True
-
-        return False
+        index = index or SourceIndex(source_files)
+        return any(
+            index.content_matches(source_file, CONTENT_RULES, "security_candidate")
+            and SECURITY_PATTERN.search(index.content_lower(source_file))
+            for source_file in source_files
+        )
 
-    def _has_fast_implementation_patterns(self, source_files: list[SourceFile]) -> bool:
+    def _has_fast_implementation_patterns(
+        self, source_files: list[SourceFile], index: SourceIndex | None = None
+    ) -> bool:
         """Check for fast implementation patterns.
 
         Args:
             source_files: Repository source files
+            index: Shared source index (built from source_files if omitted)
 
         Returns:
             True if fast implementation detected
         """
-        # Check for rapid development indicators
-        for source_file in source_files:
-            content_lower = source_file.content.lower()
-
-            # Quick and dirty patterns
-            if any(
-                keyword in content_lower
-                for keyword in [
-                    "todo",
-                    "fixme",
-                    "hack",
-                    "quick fix",
-                    "temporary",
-                ]
-            ):
-                return True
-
-        return False
+        # Check for rapid development indicators (quick and dirty patterns)
+        index = index or SourceIndex(source_files)
+        return any(
+            index.content_matches(source_file, CONTENT_RULES, "fast_implementation")
+            for source_file in source_files
+        )
 
     def _has_simple_architecture(self, source_files: list[SourceFile]) -> bool:
         """Check for simple architecture patterns.
@@ -826,43 +1026,36 @@ class StrategyDetector:
         # Count files - simple architecture has fewer files
         return len(source_files) < 50
 
-    def _has_scalability_concerns(self, source_files: list[SourceFile]) -> bool:
+    def _has_scalability_concerns(
+        self, source_files: list[SourceFile], index: SourceIndex | None = None
+    ) -> bool:
         """Check for scalability patterns.
 
         Args:
             source_files: Repository source files
+            index: Shared source index (built from source_files if omitted)
 
         Returns:
             True if scalability patterns detected
         """
-        scalability_keywords = [
-            "cache",
-            "redis",
-            "queue",
-            "worker",
-            "async",
-            "microservice",
-            "load balancer",
-            "horizontal scaling",
-        ]
-
-        for source_file in source_files:
-            content_lower = source_file.content.lower()
-            if any(keyword in content_lower for keyword in scalability_keywords):
-                return True
-
-        return False
+        index = index or SourceIndex(source_files)
+        return any(
+            index.content_matches(source_file, CONTENT_RULES, "scalability")
+            for source_file in source_files
+        )
 
     def _detect_learning_journey(
         self,
         commits: list[CommitInfo],
         source_files: list[SourceFile],
+        index: SourceIndex | None = None,
     ) -> LearningJourney | None:
         """Detect if team learned new technology during hackathon.
 
         Args:
             commits: Commit history
             source_files: Repository source files
+            index: Shared source index (built from source_files if omitted)
 
         Returns:
             LearningJourney if detected, None otherwise
@@ -890,7 +1083,7 @@ class StrategyDetector:
             return None
 
         # Detect technology being learned
-        technology = self._detect_new_technology(source_files, commits)
+        technology = self._detect_new_technology(source_files, commits, index)
 
         if not technology:
             return None
@@ -912,37 +1105,29 @@ class StrategyDetector:
         self,
         source_files: list[SourceFile],
         commits: list[CommitInfo],
+        index: SourceIndex | None = None,
     ) -> str | None:
         """Detect new technology being learned.
 
         Args:
             source_files: Repository source files
             commit: Commit history
+            index: Shared source index (built from source_files if omitted)
 
         Returns:
             Technology name if detected
         """
-        # Common frameworks/technologies
-        technologies = {
-            "react": ["react", "jsx", "tsx"],
-            "vue": ["vue", ".vue"],
-            "angular": ["angular", "@angular"],
-            "django": ["django", "manage.py"],
-            "flask": ["flask", "app.py"],
-            "fastapi": ["fastapi", "main.py"],
-            "docker": ["dockerfile", "docker-compose"],
-            "kubernetes": ["k8s", "kubernetes", "deployment.yaml"],
-            "graphql": ["graphql", ".graphql"],
-            "typescript": [".ts", ".tsx"],
-        }
-
-        for tech_name, patterns in technologies.items():
-            for source_file in source_files:
-                path_lower = source_file.path.lower()
-                content_lower = source_file.content.lower()
-
-                if any(pattern in path_lower or pattern in content_lower for pattern in patterns):
-                    return tech_name
+        index = index or SourceIndex(source_files)
+        in_paths = index.paths_hits((f.path for f in source_files), PATH_RULES)
+
+        # First technology in TECHNOLOGY_PATTERNS order wins
+        for tech_name in TECHNOLOGY_PATTERNS:
+            rule = f"tech:{tech_name}"
+            if rule in in_paths or any(
+                index.content_matches(source_file, CONTENT_RULES, rule)
+                for source_file in source_files
+            ):
+                return tech_name
 
         return None
 
@@ -1326,6 +1511,7 @@ class StrategyDetector:
     def _detect_context_awareness(
         self,
         repo_data: RepoData,
+        index: SourceIndex | None = None,
     ) -> dict[str, bool]:
         """Detect context awareness through documentation quality.
 
@@ -1336,6 +1522,7 @@ class StrategyDetector:
 
         Args:
             repo_data: Repository data
+            index: Shared source index (built from repo_data if omitted)
 
         Returns:
             Dictionary with context awareness indicators:
@@ -1348,120 +1535,44 @@ class StrategyDetector:
             "has_architecture_diagram": False,
             "has_api_docs": False,
         }
+        index = index or SourceIndex.from_repo_data(repo_data)
+        readme_hits = index.readme_hits(README_RULES) if repo_data.readme_content else frozenset()
 
-        # Check README for problem statement
-        if repo_data.readme_content:
-            readme_lower = repo_data.readme_content.lower()
-
-            # Problem statement indicators
-            problem_keywords = [
-                "problem",
-                "challenge",
-                "issue",
-                "motivation",
-                "why we built",
-                "inspiration",
-                "background",
-                "the need",
-                "pain point",
-                "objective",
-                "goal",
-            ]
-
-            # Check if README has a problem statement section
-            has_problem_section = any(keyword in readme_lower for keyword in problem_keywords)
-
-            # Check for structured problem description (headers + content)
-            problem_headers = [
-                "## problem",
-                "## challenge",
-                "## motivation",
-                "## inspiration",
-                "## background",
-                "## objective",
-                "# problem",
-                "# challenge",
-                "# motivation",
-            ]
-
-            has_problem_header = any(header in readme_lower for header in problem_headers)
-
-            # Problem statement detected if keywords present or dedicated section
-            result["has_problem_statement"] = has_problem_section or has_problem_header
-
-        # Check for architecture diagrams
-        diagram_extensions = [".png", ".jpg", ".jpeg", ".svg", ".gif", ".drawio", ".mermaid"]
-        diagram_keywords = ["architecture", "diagram", "design", "flow", "schema"]
+        # Problem statement detected if keywords present or dedicated section
+        result["has_problem_statement"] = "problem_statement" in readme_hits
 
         for source_file in repo_data.source_files:
-            path_lower = source_file.path.lower()
+            path_hits = index.path_hits(source_file.path, PATH_RULES)
 
             # Check for diagram files with architecture-related names
-            if any(ext in path_lower for ext in diagram_extensions) and any(
-                keyword in path_lower for keyword in diagram_keywords
-            ):
+            if "diagram_file" in path_hits and "diagram_name" in path_hits:
                 result["has_architecture_diagram"] = True
                 break
 
             # Check for mermaid diagrams in markdown files
-            if path_lower.endswith(".md") and "```mermaid" in source_file.content.lower():
+            if index.path_lower(source_file.path).endswith(".md") and index.content_matches(
+                source_file, CONTENT_RULES, "mermaid"
+            ):
                 result["has_architecture_diagram"] = True
                 break
 
-        # Check for API documentation
-        api_doc_patterns = [
-            "api.md",
-            "api_docs",
-            "api-docs",
-            "api_documentation",
-            "swagger",
-            "openapi",
-            "postman",
-            "api_reference",
-            "endpoints.md",
-            "routes.md",
-        ]
-
         for source_file in repo_data.source_files:
-            path_lower = source_file.path.lower()
-
             # Check for dedicated API documentation files
-            if any(pattern in path_lower for pattern in api_doc_patterns):
+            if "api_docs" in index.path_hits(source_file.path, PATH_RULES):
                 result["has_api_docs"] = True
                 break
 
             # Check for OpenAPI/Swagger specs
-            if path_lower.endswith((".yaml", ".yml", ".json")):
-                content_lower = source_file.content.lower()
-                if "openapi" in content_lower or "swagger" in content_lower:
-                    result["has_api_docs"] = True
-                    break
-
-        # Also check README for API documentation section
-        if not result["has_api_docs"] and repo_data.readme_content:
-            readme_lower = repo_data.readme_content.lower()
-            api_headers = [
-                "## api",
-                "## endpoints",
-                "## routes",
-                "## api reference",
-                "## api documentation",
-                "# api",
-                "# endpoints",
-            ]
-
-            if any(header in readme_lower for header in api_headers):
-                # Verify it's not just a header but has actual content
-                # Look for HTTP methods or endpoint patterns
-                http_methods = ["get ", "post ", "put ", "delete ", "patch "]
-                endpoint_patterns = ["/api/", "endpoint:", "route:"]
-
-                has_api_content = any(method in readme_lower for method in http_methods) or any(
-                    pattern in readme_lower for pattern in endpoint_patterns
-                )
+            if index.path_lower(source_file.path).endswith(
+                (".yaml", ".yml", ".json")
+            ) and index.content_matches(source_file, CONTENT_RULES, "api_spec"):
+                result["has_api_docs"] = True
+                break
 
-                if has_api_content:
-                    result["has_api_docs"] = True
+        # Also check README for an API documentation section with actual content
+        # (HTTP methods or endpoint patterns), not just a header
+        if not result["has_api_docs"] and "api_section" in readme_hits:
+            result["has_api_docs"] = "api_content" in readme_hits
 
         self.logger.info(
             "context_awareness_detected",
@@ -9,6 +9,9 @@ from collections import defaultdict
 
 import structlog
 
+from src.analysis.authorship_index import AuthorshipIndex
+from src.analysis.commit_table import CommitTable
+from src.analysis.source_index import KeywordMatcher, SourceIndex
 from src.models.analysis import CommitInfo, RepoData
 from src.models.team_dynamics import (
     CollaborationPattern,
@@ -24,6 +27,77 @@ from src.models.team_dynamics import (
 
 logger = structlog.get_logger()
 
+# Role and expertise signals in file paths, evaluated in one pass per path
+PATH_RULES = KeywordMatcher(
+    {
+        "devops": ["dockerfile", "docker-compose", ".yml", ".yaml", "terraform", "jenkinsfile"],
+        ExpertiseArea.DATABASE: [
+            "database",
+            "db",
+            "migration",
+            "schema",
+            ".sql",
+            "postgres",
+            "mysql",
+            "mongo",
+        ],
+        ExpertiseArea.SECURITY: [
+            "auth",
+            "security",
+            "crypto",
+            "jwt",
+            "oauth",
+            "permission",
+            "rbac",
+        ],
+        ExpertiseArea.TESTING: ["test", "spec", "__test__", ".test.", ".spec.", "pytest", "jest"],
+        ExpertiseArea.API: ["api", "endpoint", "route", "controller", "graphql", "rest"],
+        ExpertiseArea.UI_UX: [
+            "component",
+            "ui",
+            "ux",
+            "style",
+            "theme",
+            "design",
+            ".css",
+            ".scss",
+        ],
+        ExpertiseArea.INFRASTRUCTURE: [
+            "docker",
+            "kubernetes",
+            "k8s",
+            "terraform",
+            "ci",
+            "cd",
+            "deploy",
+            "infra",
+        ],
+    }
+)
+
+# Expertise signals in commit messages
+COMMIT_MESSAGE_RULES = KeywordMatcher(
+    {
+        ExpertiseArea.DATABASE: ["database", "migration", "schema", "query"],
+        ExpertiseArea.SECURITY: ["security", "auth", "vulnerability", "fix cve"],
+        ExpertiseArea.TESTING: ["test", "testing", "coverage", "unit test"],
+        ExpertiseArea.API: ["api", "endpoint", "rest", "graphql"],
+        ExpertiseArea.UI_UX: ["ui", "ux", "design", "style", "component"],
+        ExpertiseArea.INFRASTRUCTURE: ["docker", "deploy", "ci/cd", "infrastructure"],
+    }
+)
+
+# Commits by different authors closer than this (seconds) count as overlapping work
+SILO_OVERLAP_WINDOW_SECONDS = 3600
+
+# With per-file history, a silo is an author who alone touched at least this many
+# files, and those files make up at least this share of everything they touched
+SILO_MIN_SOLE_FILES = 5
+SILO_MIN_SOLE_SHARE = 0.8
+
+BACKEND_EXTENSIONS = (".py", ".java", ".go", ".rs", ".rb", ".php", ".cs", ".sql")
+FRONTEND_EXTENSIONS = (".js", ".jsx", ".ts", ".tsx", ".vue", ".html", ".css", ".scss", ".sass")
+
 
 class TeamAnalyzer:
     """Analyzes team dynamics and individual contributions from git history.
@@ -41,11 +115,15 @@ class TeamAnalyzer:
         """Initialize TeamAnalyzer."""
         self.logger = logger.bind(component="team_analyzer")
 
-    def analyze(self, repo_data: RepoData) -> TeamAnalysisResult:
+    def analyze(
+        self, repo_data: RepoData, source_index: SourceIndex | None = None
+    ) -> TeamAnalysisResult:
         """Analyze team dynamics from git history.
 
         Args:
             repo_data: Repository data with commit history
+            source_index: Index shared with the other analyzers (paths are
+                indexed on demand if omitted)
 
         Returns:
             TeamAnalysisResult with dynamics and scorecards
@@ -64,22 +142,24 @@ class TeamAnalyzer:
             return self._empty_result(start_time)
 
         commits = repo_data.commit_history
+        table = CommitTable(commits)
+        authorship = self._authorship(repo_data)
 
         # Extract unique contributors
         contributors = self._extract_contributors(commits)
 
         # Calculate workload distribution
-        workload_dist = self._calculate_workload_distribution(commits)
+        workload_dist = self._calculate_workload_distribution(commits, table)
 
         # Detect collaboration patterns
-        collab_patterns = self._detect_collaboration_patterns(commits)
+        collab_patterns = self._detect_collaboration_patterns(commits, table, authorship)
 
         # Detect red flags
         red_flags = self._detect_red_flags(commits, contributors, workload_dist)
 
         # Generate individual scorecards
         scorecards = self._generate_individual_scorecards(
-            commits, contributors, workload_dist, repo_data
+            commits, contributors, workload_dist, repo_data, source_index, table
         )
 
         # Calculate commit message quality
@@ -115,6 +195,13 @@ class TeamAnalyzer:
             duration_ms=duration_ms,
         )
 
+    def _authorship(self, repo_data: RepoData) -> AuthorshipIndex | None:
+        """Return the per-file authorship index if the extraction produced one with files."""
+        authorship = repo_data.authorship
+        if isinstance(authorship, AuthorshipIndex) and authorship.paths:
+            return authorship
+        return None
+
     def _empty_result(self, start_time: float) -> TeamAnalysisResult:
         """Return empty result for repositories with no commits."""
         duration_ms = max(1, int((time.time() - start_time) * 1000))
@@ -133,11 +220,14 @@ class TeamAnalyzer:
         """Extract unique contributor names from commits."""
         return list({commit.author for commit in commits})
 
-    def _calculate_workload_distribution(self, commits: list[CommitInfo]) -> dict[str, float]:
+    def _calculate_workload_distribution(
+        self, commits: list[CommitInfo], table: CommitTable | None = None
+    ) -> dict[str, float]:
         """Calculate percentage of commits per contributor.
 
         Args:
             commits: List of commit information
+            table: Columnar commit table (built from commits if omitted)
 
         Returns:
             Dictionary mapping contributor name to percentage (0-100)
@@ -146,20 +236,23 @@ class TeamAnalyzer:
             return {}
 
         # Count commits per contributor
-        commit_counts: dict[str, int] = defaultdict(int)
-        for commit in commits:
-            commit_counts[commit.author] += 1
+        table = table or CommitTable(commits)
+        commit_counts = table.count_by_author()
 
         # Calculate percentages
         total_commits = len(commits)
         distribution = {
-            author: (count / total_commits) * 100 for author, count in commit_counts.items()
+            author: (count / total_commits) * 100
+            for author, count in zip(table.authors, commit_counts, strict=True)
         }
 
         return distribution
 
     def _detect_collaboration_patterns(
-        self, commits: list[CommitInfo]
+        self,
+        commits: list[CommitInfo],
+        table: CommitTable | None = None,
+        authorship: AuthorshipIndex | None = None,
     ) -> list[CollaborationPattern]:
         """Detect pair programming, code review, and knowledge silos.
 
@@ -170,6 +263,9 @@ class TeamAnalyzer:
 
         Args:
             commits: List of commit information
+            table: Columnar commit table (built from commits if omitted)
+            authorship: Per-file authorship index (silos fall back to commit
+                timing if omitted)
 
         Returns:
             List of detected collaboration patterns
@@ -184,7 +280,7 @@ class TeamAnalyzer:
         patterns.extend(self._detect_code_review_patterns(commits))
 
         # 3. Identify knowledge silos (files touched by only one person)
-        patterns.extend(self._detect_knowledge_silos(commits))
+        patterns.extend(self._detect_knowledge_silos(commits, table, authorship))
 
         return patterns
 
@@ -306,7 +402,12 @@ class TeamAnalyzer:
 
         return patterns
 
-    def _detect_knowledge_silos(self, commits: list[CommitInfo]) -> list[CollaborationPattern]:
+    def _detect_knowledge_silos(
+        self,
+        commits: list[CommitInfo],
+        table: CommitTable | None = None,
+        authorship: AuthorshipIndex | None = None,
+    ) -> list[CollaborationPattern]:
         """Identify knowledge silos - files touched by only one person.
 
         Analyzes commit history to find files that only one contributor
@@ -315,62 +416,37 @@ class TeamAnalyzer:
 
         Args:
             commits: List of commit information
+            table: Columnar commit table (built from commits if omitted)
+            authorship: Per-file authorship index (commit timing is used as a
+                proxy if omitted)
 
         Returns:
             List of knowledge silo patterns (negative collaboration indicator)
         """
-        patterns: list[CollaborationPattern] = []
+        if authorship is not None:
+            return self._detect_file_ownership_silos(authorship)
 
-        # Build file -> set of contributors mapping
-        # Note: We don't have per-file data in CommitInfo, so we'll use a heuristic
-        # based on commit patterns and file counts
+        patterns: list[CollaborationPattern] = []
 
-        # Track contributors and their commit patterns
-        contributor_commits: dict[str, list[CommitInfo]] = {}
-        for commit in commits:
-            if commit.author not in contributor_commits:
-                contributor_commits[commit.author] = []
-            contributor_commits[commit.author].append(commit)
+        # Without per-file history, use a heuristic based on commit patterns:
+        # contributors who never overlap in timing (indicator of working on
+        # separate parts)
+        table = table or CommitTable(commits)
 
         # If we have multiple contributors, check for isolation patterns
-        if len(contributor_commits) >= 2:
-            # Look for contributors who never overlap in timing
-            # (indicator of working on separate parts)
-            contributors = list(contributor_commits.keys())
-
-            for i, contributor in enumerate(contributors):
-                contributor_commit_times = [c.timestamp for c in contributor_commits[contributor]]
-
-                # Check if this contributor's commits are isolated from others
-                isolated = True
-                for j, other_contributor in enumerate(contributors):
-                    if i == j:
-                        continue
-
-                    other_commit_times = [
-                        c.timestamp for c in contributor_commits[other_contributor]
-                    ]
-
-                    # Check for temporal overlap (commits within same time windows)
-                    for c_time in contributor_commit_times:
-                        for o_time in other_commit_times:
-                            time_diff = abs((c_time - o_time).total_seconds())
-                            # If commits within 1 hour, consider it collaborative
-                            if time_diff < 3600:
-                                isolated = False
-                                break
-                        if not isolated:
-                            break
-                    if not isolated:
-                        break
+        if len(table.authors) >= 2:
+            # Commits within 1 hour of another contributor's are collaborative
+            overlapping = table.authors_near_other_authors(SILO_OVERLAP_WINDOW_SECONDS)
+            commit_counts = table.count_by_author()
 
+            for code, contributor in enumerate(table.authors):
                 # If contributor is isolated and has significant commits
-                if isolated and len(contributor_commits[contributor]) >= 5:
+                if code not in overlapping and commit_counts[code] >= 5:
                     patterns.append(
                         CollaborationPattern(
                             pattern_type="knowledge_silo",
                             contributors=[contributor],
-                            evidence=f"{contributor} has {len(contributor_commits[contributor])} commits "
+                            evidence=f"{contributor} has {commit_counts[code]} commits "
                             f"with no temporal overlap with other contributors",
                             positive=False,  # This is a negative pattern
                         )
@@ -378,6 +454,60 @@ class TeamAnalyzer:
 
         return patterns
 
+    def _detect_file_ownership_silos(
+        self, authorship: AuthorshipIndex
+    ) -> list[CollaborationPattern]:
+        """Identify knowledge silos from per-file authorship.
+
+        A contributor is a silo when most of the files they touched were
+        touched by nobody else. The contributor whose departure alone would
+        orphan half of the files (bus factor 1) is always reported.
+
+        Args:
+            authorship: Per-file authorship index
+
+        Returns:
+            List of knowledge silo patterns (negative collaboration indicator)
+        """
+        patterns: list[CollaborationPattern] = []
+        if len(authorship.authors) < 2:
+            return patterns
+
+        key_authors = authorship.key_authors()
+        single_point = key_authors[0] if len(key_authors) == 1 else None
+        sole_files = authorship.sole_author_files()
+
+        for code, contributor in enumerate(authorship.authors):
+            sole = sole_files[code]
+            touched = authorship.files_by_author(contributor)
+            is_silo = len(sole) >= SILO_MIN_SOLE_FILES and len(sole) >= SILO_MIN_SOLE_SHARE * len(
+                touched
+            )
+            if not is_silo and contributor != single_point:
+                continue
+
+            evidence = (
+                f"{contributor} is the only author of {len(sole)} of the "
+                f"{len(touched)} files they touched"
+            )
+            if sole:
+                evidence += f" ({', '.join(sole[:3])})"
+            if contributor == single_point:
+                evidence += (
+                    f"; bus factor 1: without them, at least half of the "
+                    f"{len(authorship.paths)} files have no other author"
+                )
+            patterns.append(
+                CollaborationPattern(
+                    pattern_type="knowledge_silo",
+                    contributors=[contributor],
+                    evidence=evidence,
+                    positive=False,  # This is a negative pattern
+                )
+            )
+
+        return patterns
+
     def _detect_red_flags(
         self, commits: list[CommitInfo], contributors: list[str], workload_dist: dict[str, float]
     ) -> list[RedFlag]:
@@ -621,6 +751,8 @@ class TeamAnalyzer:
         contributors: list[str],
         workload_dist: dict[str, float],
         repo_data: RepoData,
+        index: SourceIndex | None = None,
+        table: CommitTable | None = None,
     ) -> list[IndividualScorecard]:
         """Generate detailed scorecard for each contributor.
 
@@ -629,6 +761,8 @@ class TeamAnalyzer:
             contributors: List of contributor names
             workload_dist: Workload distribution percentages
             repo_data: Repository data with file information
+            index: Shared source index (paths are indexed on demand if omitted)
+            table: Columnar commit table (built from commits if omitted)
 
         Returns:
             List of individual scorecards
@@ -637,22 +771,35 @@ class TeamAnalyzer:
 
         # Build file path list from repo_data
         all_files = [sf.path for sf in repo_data.source_files]
+        authorship = self._authorship(repo_data)
+        index = index or SourceIndex()
 
-        for contributor in contributors:
-            # Filter commits by this contributor
-            contributor_commits = [c for c in commits if c.author == contributor]
+        # Group commits and per-author totals in one pass over the commit table
+        table = table or CommitTable(commits)
+        codes = {author: code for code, author in enumerate(table.authors)}
+        rows_by_author = table.rows_by_author()
+        added_by_author = table.sum_by_author(table.insertions)
+        deleted_by_author = table.sum_by_author(table.deletions)
 
-            if not contributor_commits:
+        for contributor in contributors:
+            code = codes.get(contributor)
+            if code is None:
                 continue
 
+            # Commits by this contributor, in history order
+            contributor_commits = [table.commits[row] for row in rows_by_author[code]]
+
             # Calculate metrics
             commit_count = len(contributor_commits)
-            lines_added = sum(c.insertions for c in contributor_commits)
-            lines_deleted = sum(c.deletions for c in contributor_commits)
+            lines_added = added_by_author[code]
+            lines_deleted = deleted_by_author[code]
 
-            # For MVP, use all files as files_touched
-            # In production, would track per-commit file changes
-            files_touched = all_files
+            # Files this contributor actually changed, when per-file history
+            # was extracted; otherwise every file is attributed to everyone
+            if authorship is not None:
+                files_touched = authorship.files_by_author(contributor)
+            else:
+                files_touched = all_files
 
             # Detect notable contributions (>500 insertions)
             notable = [
@@ -662,8 +809,8 @@ class TeamAnalyzer:
             ]
 
             # Detect role and expertise from files and commits
-            role = self._detect_role(contributor_commits, all_files)
-            expertise = self._detect_expertise(contributor_commits, all_files)
+            role = self._detect_role(contributor_commits, files_touched, index)
+            expertise = self._detect_expertise(contributor_commits, files_touched, index)
 
             # Generate work style
             work_style = self._analyze_work_style(contributor_commits)
@@ -699,7 +846,9 @@ class TeamAnalyzer:
 
         return scorecards
 
-    def _detect_role(self, commits: list[CommitInfo], files: list[str]) -> ContributorRole:
+    def _detect_role(
+        self, commits: list[CommitInfo], files: list[str], index: SourceIndex | None = None
+    ) -> ContributorRole:
         """Detect contributor role from file patterns.
 
         Analyzes file extensions and paths to determine if contributor
@@ -707,7 +856,8 @@ class TeamAnalyzer:
 
         Args:
             commits: Contributor's commits
-            files: All files in repository
+            files: Files the contributor touched (all files without per-file history)
+            index: Shared source index (paths are indexed on demand if omitted)
 
         Returns:
             Detected contributor role
@@ -716,28 +866,12 @@ class TeamAnalyzer:
             return ContributorRole.UNKNOWN
 
         # Count file types
-        backend_count = 0
-        frontend_count = 0
-        devops_count = 0
-
-        backend_exts = {".py", ".java", ".go", ".rs", ".rb", ".php", ".cs", ".sql"}
-        frontend_exts = {".js", ".jsx", ".ts", ".tsx", ".vue", ".html", ".css", ".scss", ".sass"}
-        devops_files = {"dockerfile", "docker-compose", ".yml", ".yaml", "terraform", "jenkinsfile"}
-
-        for file_path in files:
-            file_lower = file_path.lower()
-
-            # Check backend
-            if any(file_path.endswith(ext) for ext in backend_exts):
-                backend_count += 1
-
-            # Check frontend
-            if any(file_path.endswith(ext) for ext in frontend_exts):
-                frontend_count += 1
-
-            # Check devops
-            if any(keyword in file_lower for keyword in devops_files):
-                devops_count += 1
+        index = index or SourceIndex()
+        backend_count = sum(1 for file_path in files if file_path.endswith(BACKEND_EXTENSIONS))
+        frontend_count = sum(1 for file_path in files if file_path.endswith(FRONTEND_EXTENSIONS))
+        devops_count = sum(
+            1 for file_path in files if "devops" in index.path_hits(file_path, PATH_RULES)
+        )
 
         # Determine role based on file distribution
         total = backend_count + frontend_count + devops_count
@@ -762,7 +896,9 @@ class TeamAnalyzer:
 
         return ContributorRole.UNKNOWN
 
-    def _detect_expertise(self, commits: list[CommitInfo], files: list[str]) -> list[ExpertiseArea]:
+    def _detect_expertise(
+        self, commits: list[CommitInfo], files: list[str], index: SourceIndex | None = None
+    ) -> list[ExpertiseArea]:
         """Identify expertise areas from file patterns and commit messages.
 
         Analyzes file types and commit messages to detect expertise in
@@ -770,117 +906,24 @@ class TeamAnalyzer:
 
         Args:
             commits: Contributor's commits
-            files: All files in repository
+            files: Files the contributor touched (all files without per-file history)
+            index: Shared source index (paths are indexed on demand if omitted)
 
         Returns:
             List of detected expertise areas
         """
-        expertise: set[ExpertiseArea] = set()
+        index = index or SourceIndex()
 
         # Analyze files for expertise signals
-        for file_path in files:
-            file_lower = file_path.lower()
-
-            # Database expertise
-            if any(
-                keyword in file_lower
-                for keyword in [
-                    "database",
-                    "db",
-                    "migration",
-                    "schema",
-                    ".sql",
-                    "postgres",
-                    "mysql",
-                    "mongo",
-                ]
-            ):
-                expertise.add(ExpertiseArea.DATABASE)
-
-            # Security expertise
-            if any(
-                keyword in file_lower
-                for keyword in ["auth", "security", "crypto", "jwt", "oauth", "permission", "rbac"]
-            ):
-                expertise.add(ExpertiseArea.SECURITY)
-
-            # Testing expertise
-            if any(
-                keyword in file_lower
-                for keyword in ["test", "spec", "__test__", ".test.", ".spec.", "pytest", "jest"]
-            ):
-                expertise.add(ExpertiseArea.TESTING)
-
-            # API expertise
-            if any(
-                keyword in file_lower
-                for keyword in ["api", "endpoint", "route", "controller", "graphql", "rest"]
-            ):
-                expertise.add(ExpertiseArea.API)
-
-            # UI/UX expertise
-            if any(
-                keyword in file_lower
-                for keyword in [
-                    "component",
-                    "ui",
-                    "ux",
-                    "style",
-                    "theme",
-                    "design",
-                    ".css",
-                    ".scss",
-                ]
-            ):
-                expertise.add(ExpertiseArea.UI_UX)
-
-            # Infrastructure expertise
-            if any(
-                keyword in file_lower
-                for keyword in [
-                    "docker",
-                    "kubernetes",
-                    "k8s",
-                    "terraform",
-                    "ci",
-                    "cd",
-                    "deploy",
-                    "infra",
-                ]
-            ):
-                expertise.add(ExpertiseArea.INFRASTRUCTURE)
+        expertise = {
+            area for area in index.paths_hits(files, PATH_RULES) if isinstance(area, ExpertiseArea)
+        }
 
-        # Analyze commit messages for additional signals
+        # Analyze commit messages for additional signals (every label is an area)
         for commit in commits:
-            msg_lower = commit.message.lower()
-
-            if any(
-                keyword in msg_lower for keyword in ["database", "migration", "schema", "query"]
-            ):
-                expertise.add(ExpertiseArea.DATABASE)
-
-            if any(
-                keyword in msg_lower for keyword in ["security", "auth", "vulnerability", "fix cve"]
-            ):
-                expertise.add(ExpertiseArea.SECURITY)
-
-            if any(
-                keyword in msg_lower for keyword in ["test", "testing", "coverage", "unit test"]
-            ):
-                expertise.add(ExpertiseArea.TESTING)
-
-            if any(keyword in msg_lower for keyword in ["api", "endpoint", "rest", "graphql"]):
-                expertise.add(ExpertiseArea.API)
-
-            if any(
-                keyword in msg_lower for keyword in ["ui", "ux", "design", "style", "component"]
-            ):
-                expertise.add(ExpertiseArea.UI_UX)
-
-            if any(
-                keyword in msg_lower for keyword in ["docker", "deploy", "ci/cd", "infrastructure"]
-            ):
-                expertise.add(ExpertiseArea.INFRASTRUCTURE)
+            expertise |= {
+                ExpertiseArea(label) for label in COMMIT_MESSAGE_RULES.match(commit.message.lower())
+            }
 
         return list(expertise)
 
@@ -0,0 +1,362 @@
+"""Queue-backed analyzer worker - long-lived alternative to the Lambda handler.
+
+Workers pull one submission per message from a work queue (SQS, or SQLite
+for local runs without AWS) and analyze it in a process pool. Throughput
+scales by adding processes or hosts. While a submission is being analyzed
+the worker extends the message's visibility timeout (heartbeats); on
+SIGTERM/SIGINT it stops receiving, lets in-flight submissions finish, and
+releases anything still running back to the queue.
+
+Usage:
+    python -m src.analysis.worker --queue-url sqlite:///analysis-queue.db --workers 4
+
+The API enqueues work instead of invoking the analyzer Lambda when
+ANALYSIS_QUEUE_URL is set.
+"""
+
+import argparse
+import os
+import signal
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any
+
+from src.analysis.lambda_handler import finalize_job, process_submission
+from src.constants import (
+    ANALYZER_WORKER_CONCURRENCY,
+    ANALYZER_WORKER_SHUTDOWN_TIMEOUT,
+    ANALYZER_WORKER_VISIBILITY_TIMEOUT,
+)
+from src.models.common import JobStatus
+from src.services.analysis_service import AnalysisService
+from src.services.cost_service import CostService
+from src.services.hackathon_service import HackathonService
+from src.services.submission_service import SubmissionService
+from src.utils.dynamo import get_dynamodb_helper
+from src.utils.logging import get_logger, setup_logging
+from src.utils.memory import start_tracemalloc_from_env
+from src.utils.work_queue import WorkItem, WorkQueue, get_work_queue
+
+logger = get_logger(__name__)
+
+# Extend visibility once this fraction of the timeout has elapsed
+HEARTBEAT_FRACTION = 0.5
+
+# Per-process service cache (each pool process builds its own clients)
+_services: dict[str, Any] | None = None
+
+
+def _get_services() -> dict[str, Any]:
+    """Build (once per process) the services used to process work items."""
+    global _services
+    if _services is None:
+        start_tracemalloc_from_env()
+        db = get_dynamodb_helper(os.environ.get("TABLE_NAME", "VibeJudgeTable"))
+        _services = {
+            "db": db,
+            "hackathon": HackathonService(db),
+            "submission": SubmissionService(db),
+            "analysis": AnalysisService(db),
+            "cost": CostService(db),
+        }
+    return _services
+
+
+def run_work_item(body: dict[str, Any]) -> dict[str, Any]:
+    """Process one queued submission. Runs inside a pool process.
+
+    Idempotent: a redelivered message for an already checkpointed submission
+    is acknowledged without re-analysis, as is any message for a failed job.
+
+    Args:
+        body: Message body with job_id, hack_id, sub_id
+
+    Returns:
+        Outcome dict (status, succeeded, finalized)
+    """
+    job_id = body["job_id"]
+    hack_id = body["hack_id"]
+    sub_id = body["sub_id"]
+    services = _get_services()
+    analysis_service: AnalysisService = services["analysis"]
+
+    job = analysis_service.get_job_record(hack_id, job_id)
+    if not job:
+        logger.warning("worker_job_not_found", job_id=job_id, sub_id=sub_id)
+        return {"status": "job_not_found"}
+    if sub_id in (job.get("processed_submission_ids") or []):
+        logger.info("worker_duplicate_delivery", job_id=job_id, sub_id=sub_id)
+        return {"status": "duplicate"}
+    if job.get("status") == JobStatus.FAILED.value:
+        # e.g. the rest of the job could not be enqueued; it will not finalize
+        logger.warning("analysis_job_already_failed", job_id=job_id, sub_id=sub_id)
+        return {"status": "job_failed"}
+
+    if job.get("status") == JobStatus.QUEUED.value:
+        analysis_service.update_job_status(
+            hack_id=hack_id,
+            job_id=job_id,
+            status=JobStatus.RUNNING,
+            started_at=datetime.now(UTC),
+        )
+
+    succeeded, cost = False, Decimal("0")
+    hackathon = services["hackathon"].get_hackathon(hack_id)
+    if hackathon:
+        succeeded, cost = process_submission(
+            sub_id=sub_id,
+            hack_id=hack_id,
+            hackathon=hackathon,
+            db=services["db"],
+            submission_service=services["submission"],
+            cost_service=services["cost"],
+            analysis_service=analysis_service,
+            job_id=job_id,
+        )
+    else:
+        logger.error("hackathon_not_found", hack_id=hack_id, sub_id=sub_id)
+
+    analysis_service.record_submission_outcome(
+        hack_id=hack_id,
+        job_id=job_id,
+        sub_id=sub_id,
+        succeeded=succeeded,
+        cost_usd=cost,
+    )
+
+    finalized = analysis_service.claim_drained_job(hack_id, job_id)
+    if finalized:
+        finalize_job(
+            analysis_service,
+            services["cost"],
+            hack_id,
+            job_id,
+            services["db"].write_scheduler.get_metrics(),
+        )
+        logger.info("analysis_job_completed", job_id=job_id, finalized_by=sub_id)
+
+    return {"status": "processed", "succeeded": succeeded, "finalized": finalized}
+
+
+def _ignore_sigint() -> None:
+    """Pool initializer: leave Ctrl-C handling to the parent for graceful shutdown."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+@dataclass
+class _InFlight:
+    """A received work item being processed."""
+
+    item: WorkItem
+    last_heartbeat: float
+
+
+class AnalysisWorker:
+    """Pulls analysis work items from a queue and runs them in a worker pool."""
+
+    def __init__(
+        self,
+        queue: WorkQueue,
+        concurrency: int = ANALYZER_WORKER_CONCURRENCY,
+        visibility_timeout: int = ANALYZER_WORKER_VISIBILITY_TIMEOUT,
+        shutdown_timeout: float = ANALYZER_WORKER_SHUTDOWN_TIMEOUT,
+        poll_wait_seconds: float = 1.0,
+        executor: Executor | None = None,
+        handler: Callable[[dict[str, Any]], Any] = run_work_item,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize worker.
+
+        Args:
+            queue: Work queue to consume
+            concurrency: Maximum work items processed at once
+            visibility_timeout: Message visibility timeout in seconds
+            shutdown_timeout: Seconds to wait for in-flight items on shutdown
+            poll_wait_seconds: Long-poll duration when idle
+            executor: Executor to run items on (default: a process pool owned by the worker)
+            handler: Work item handler (must be picklable for process pools)
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.queue = queue
+        self.concurrency = max(1, concurrency)
+        self.visibility_timeout = visibility_timeout
+        self.shutdown_timeout = shutdown_timeout
+        self.poll_wait_seconds = poll_wait_seconds
+        self.handler = handler
+        self._executor = executor
+        self._clock = clock
+        self._stop = threading.Event()
+        self.stats = {"processed": 0, "errors": 0, "heartbeats": 0, "released": 0}
+
+    def request_shutdown(self, *_args: Any) -> None:
+        """Stop receiving new work; in-flight items are allowed to finish."""
+        if not self._stop.is_set():
+            logger.info("worker_shutdown_requested")
+        self._stop.set()
+
+    def run(self, drain: bool = False) -> dict[str, int]:
+        """Process work items until shutdown (or until the queue is empty).
+
+        Args:
+            drain: Return once the queue is empty and nothing is in flight
+
+        Returns:
+            Worker stats (processed, errors, heartbeats, released)
+        """
+        executor = self._executor or ProcessPoolExecutor(
+            max_workers=self.concurrency, initializer=_ignore_sigint
+        )
+        previous_handlers = self._install_signal_handlers()
+        in_flight: dict[Future, _InFlight] = {}
+        logger.info("worker_started", concurrency=self.concurrency, drain=drain)
+
+        try:
+            while not self._stop.is_set():
+                free_slots = self.concurrency - len(in_flight)
+                if free_slots > 0:
+                    items = self.queue.receive(
+                        max_messages=free_slots,
+                        visibility_timeout=self.visibility_timeout,
+                        wait_seconds=0 if in_flight else self.poll_wait_seconds,
+                    )
+                    for item in items:
+                        future = executor.submit(self.handler, item.body)
+                        in_flight[future] = _InFlight(item=item, last_heartbeat=self._clock())
+                    if drain and not items and not in_flight:
+                        break
+
+                if in_flight:
+                    done, _ = wait(
+                        in_flight, timeout=self.poll_wait_seconds, return_when=FIRST_COMPLETED
+                    )
+                    self._settle(done, in_flight)
+                self._heartbeat(in_flight)
+
+            # Graceful shutdown: no new work, let in-flight items finish
+            deadline = self._clock() + self.shutdown_timeout
+            while in_flight and self._clock() < deadline:
+                done, _ = wait(
+                    in_flight,
+                    timeout=min(self.poll_wait_seconds, max(0.0, deadline - self._clock())),
+                    return_when=FIRST_COMPLETED,
+                )
+                self._settle(done, in_flight)
+                self._heartbeat(in_flight)
+
+            # Anything still running goes back to the queue for another worker
+            for future, entry in list(in_flight.items()):
+                future.cancel()
+                self._release(entry.item)
+        finally:
+            self._restore_signal_handlers(previous_handlers)
+            if self._executor is None:
+                executor.shutdown(wait=not in_flight, cancel_futures=True)
+
+        logger.info("worker_stopped", **self.stats)
+        return dict(self.stats)
+
+    def _settle(self, done: set[Future], in_flight: dict[Future, _InFlight]) -> None:
+        """Acknowledge finished items; release failed ones for redelivery."""
+        for future in done:
+            entry = in_flight.pop(future)
+            try:
+                future.result()
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(
+                    "worker_item_failed",
+                    message_id=entry.item.message_id,
+                    receive_count=entry.item.receive_count,
+                    error=str(e),
+                )
+                self._release(entry.item)
+                continue
+
+            try:
+                self.queue.delete(entry.item.receipt_handle)
+                self.stats["processed"] += 1
+            except Exception as e:
+                # Redelivery is harmless: work items are idempotent
+                logger.error("worker_delete_failed", message_id=entry.item.message_id, error=str(e))
+
+    def _heartbeat(self, in_flight: dict[Future, _InFlight]) -> None:
+        """Extend visibility for items that have been running a while."""
+        now = self._clock()
+        for entry in in_flight.values():
+            if now - entry.last_heartbeat < self.visibility_timeout * HEARTBEAT_FRACTION:
+                continue
+            try:
+                self.queue.change_visibility(entry.item.receipt_handle, self.visibility_timeout)
+                entry.last_heartbeat = now
+                self.stats["heartbeats"] += 1
+            except Exception as e:
+                logger.error(
+                    "worker_heartbeat_failed", message_id=entry.item.message_id, error=str(e)
+                )
+
+    def _release(self, item: WorkItem) -> None:
+        """Make an item visible again immediately."""
+        try:
+            self.queue.change_visibility(item.receipt_handle, 0)
+            self.stats["released"] += 1
+        except Exception as e:
+            logger.error("worker_release_failed", message_id=item.message_id, error=str(e))
+
+    def _install_signal_handlers(self) -> dict[int, Any]:
+        """Route SIGTERM/SIGINT to request_shutdown (main thread only)."""
+        if threading.current_thread() is not threading.main_thread():
+            return {}
+        previous: dict[int, Any] = {}
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            previous[sig] = signal.signal(sig, self.request_shutdown)
+        return previous
+
+    @staticmethod
+    def _restore_signal_handlers(previous: dict[int, Any]) -> None:
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Worker entry point."""
+    parser = argparse.ArgumentParser(description="VibeJudge analyzer queue worker")
+    parser.add_argument(
+        "--queue-url",
+        default=os.environ.get("ANALYSIS_QUEUE_URL"),
+        help="SQS queue URL or sqlite:///path (default: $ANALYSIS_QUEUE_URL)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("ANALYZER_WORKER_CONCURRENCY", ANALYZER_WORKER_CONCURRENCY)),
+        help="Worker processes",
+    )
+    parser.add_argument(
+        "--visibility-timeout",
+        type=int,
+        default=ANALYZER_WORKER_VISIBILITY_TIMEOUT,
+        help="Message visibility timeout in seconds",
+    )
+    parser.add_argument("--drain", action="store_true", help="Exit once the queue is empty")
+    args = parser.parse_args(argv)
+
+    if not args.queue_url:
+        parser.error("--queue-url or ANALYSIS_QUEUE_URL is required")
+
+    setup_logging()
+    worker = AnalysisWorker(
+        queue=get_work_queue(args.queue_url),
+        concurrency=args.workers,
+        visibility_timeout=args.visibility_timeout,
+    )
+    stats = worker.run(drain=args.drain)
+    return 1 if stats["errors"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,22 +1,24 @@
 """FastAPI dependency injection for AWS services and authentication."""
 
 import os
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any
 
-import boto3
 import structlog
 from fastapi import Depends, HTTPException
 from fastapi.security import APIKeyHeader
 
-from src.services import (
-    AnalysisService,
-    CostService,
-    HackathonService,
-    OrganizerIntelligenceService,
-    OrganizerService,
-    SubmissionService,
-)
+from src.services.analysis_service import AnalysisService
+from src.services.hackathon_service import HackathonService
+from src.services.organizer_service import OrganizerService
+from src.services.submission_service import SubmissionService
+from src.utils.clients import get_aws_client
 from src.utils.dynamo import DynamoDBHelper
+from src.utils.dynamo import get_dynamodb_helper as get_shared_dynamodb_helper
+
+if TYPE_CHECKING:
+    # Only used by rarely called routes; imported on first use to keep cold starts short
+    from src.services.cost_service import CostService
+    from src.services.organizer_intelligence_service import OrganizerIntelligenceService
 
 logger = structlog.get_logger()
 
@@ -29,36 +31,30 @@ api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 # ============================================================
 
 
-def get_dynamodb_table() -> Any:
-    """Get DynamoDB table resource."""
-    table_name = os.environ.get("TABLE_NAME", "VibeJudgeTable")
-    endpoint_url = os.environ.get("DYNAMODB_ENDPOINT_URL")
+# Clients come from the process-wide registry (src.utils.clients): they are
+# created on the first request and reused, with their connection pools, by
+# every later request handled by the same process.
 
-    if endpoint_url:
-        # Local DynamoDB
-        dynamodb = boto3.resource("dynamodb", endpoint_url=endpoint_url, region_name="us-east-1")
-    else:
-        # AWS DynamoDB
-        dynamodb = boto3.resource("dynamodb")
 
-    return dynamodb.Table(table_name)
+def get_dynamodb_table() -> Any:
+    """Get DynamoDB table resource."""
+    return get_dynamodb_helper().table
 
 
 def get_dynamodb_helper() -> DynamoDBHelper:
-    """Get DynamoDB helper instance."""
+    """Get the shared DynamoDB helper."""
     table_name = os.environ.get("TABLE_NAME", "VibeJudgeTable")
-    return DynamoDBHelper(table_name)
+    return get_shared_dynamodb_helper(table_name)
 
 
 def get_bedrock_client() -> Any:
-    """Get Bedrock Runtime client."""
-    region = os.environ.get("AWS_REGION", "us-east-1")
-    return boto3.client("bedrock-runtime", region_name=region)
+    """Get the shared Bedrock Runtime client."""
+    return get_aws_client("bedrock-runtime")
 
 
 def get_s3_client() -> Any:
-    """Get S3 client."""
-    return boto3.client("s3")
+    """Get the shared S3 client."""
+    return get_aws_client("s3")
 
 
 # ============================================================
@@ -96,8 +92,10 @@ def get_analysis_service(
 
 def get_cost_service(
     db: DynamoDBHelper = Depends(get_dynamodb_helper),
-) -> CostService:
+) -> "CostService":
     """Get cost service instance."""
+    from src.services.cost_service import CostService
+
     return CostService(db)
 
 
@@ -105,8 +103,10 @@ def get_organizer_intelligence_service(
     db: DynamoDBHelper = Depends(get_dynamodb_helper),
     hackathon_service: HackathonService = Depends(get_hackathon_service),
     submission_service: SubmissionService = Depends(get_submission_service),
-) -> OrganizerIntelligenceService:
+) -> "OrganizerIntelligenceService":
     """Get organizer intelligence service instance."""
+    from src.services.organizer_intelligence_service import OrganizerIntelligenceService
+
     return OrganizerIntelligenceService(db, hackathon_service, submission_service)
 
 
@@ -124,9 +124,9 @@ OrganizerServiceDep = Annotated[OrganizerService, Depends(get_organizer_service)
 HackathonServiceDep = Annotated[HackathonService, Depends(get_hackathon_service)]
 SubmissionServiceDep = Annotated[SubmissionService, Depends(get_submission_service)]
 AnalysisServiceDep = Annotated[AnalysisService, Depends(get_analysis_service)]
-CostServiceDep = Annotated[CostService, Depends(get_cost_service)]
+CostServiceDep = Annotated["CostService", Depends(get_cost_service)]
 OrganizerIntelligenceServiceDep = Annotated[
-    OrganizerIntelligenceService, Depends(get_organizer_intelligence_service)
+    "OrganizerIntelligenceService", Depends(get_organizer_intelligence_service)
 ]
 
 
@@ -23,8 +23,10 @@ from src.api.routes import (
     submissions,
     usage,
 )
+from src.services.usage_tracking_service import get_usage_buffer
+from src.utils.clients import close_clients
 from src.utils.config import settings
-from src.utils.dynamo import DynamoDBHelper
+from src.utils.dynamo import get_dynamodb_helper
 
 # Configure structured logging
 structlog.configure(
@@ -70,7 +72,7 @@ app.add_middleware(
 # Initialize DynamoDB helper for middleware
 # Use environment variable directly to avoid Settings default value issue
 table_name = os.environ.get("TABLE_NAME", "vibejudge-dev")
-db_helper = DynamoDBHelper(table_name=table_name)
+db_helper = get_dynamodb_helper(table_name)
 
 # Add middleware stack (order matters - last added runs first)
 # Execution order: SecurityLogger → Budget → RateLimit → Routes
@@ -202,7 +204,9 @@ async def startup_event() -> None:
 
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
-    """Log application shutdown."""
+    """Flush buffered usage counters, close shared clients and log shutdown."""
+    get_usage_buffer(db_helper).flush()
+    close_clients()
     logger.info("vibejudge_api_shutting_down")
 
 
@@ -0,0 +1,24 @@
+"""Run work after the response has been sent."""
+
+from collections.abc import Callable
+
+from fastapi import Response
+from starlette.background import BackgroundTask, BackgroundTasks
+
+
+def add_background_task(response: Response, func: Callable[[], object]) -> None:
+    """Attach func to run after the response body is sent.
+
+    Keeps any background work already attached to the response. Sync
+    callables run in the threadpool, so flushes never block the event loop.
+
+    Args:
+        response: Outgoing response
+        func: Zero-argument callable
+    """
+    if response.background is None:
+        response.background = BackgroundTask(func)
+        return
+    tasks = BackgroundTasks([response.background])
+    tasks.add_task(func)
+    response.background = tasks
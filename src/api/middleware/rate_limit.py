@@ -7,10 +7,12 @@ from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
+from src.api.middleware.background import add_background_task
 from src.models.api_key import APIKey
+from src.services.usage_tracking_service import get_usage_buffer
 from src.utils.dynamo import DynamoDBHelper
-from src.utils.id_gen import generate_id
 from src.utils.logging import get_logger
+from src.utils.usage_buffer import UsageWriteBuffer
 
 logger = get_logger(__name__)
 
@@ -27,6 +29,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     6. Returns 429 if limits exceeded
     7. Adds RFC 6585 rate limit headers to all responses
     8. Exempts /health and /docs endpoints
+    9. Records usage in a write-behind buffer, flushed after the response
     """
 
     def __init__(
@@ -34,6 +37,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         app: ASGIApp,
         db_helper: DynamoDBHelper,
         exempt_paths: list[str] | None = None,
+        usage_buffer: UsageWriteBuffer | None = None,
     ) -> None:
         """Initialize rate limit middleware.
 
@@ -41,9 +45,11 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             app: ASGI application
             db_helper: DynamoDB helper instance
             exempt_paths: List of paths to exempt from rate limiting (supports * wildcard)
+            usage_buffer: Usage write buffer (default: the process-wide buffer for the table)
         """
         super().__init__(app)
         self.db_helper = db_helper
+        self.usage_buffer = usage_buffer or get_usage_buffer(db_helper)
         self.exempt_paths = exempt_paths or [
             "/health",
             "/api/v1/health",  # Health check with prefix
@@ -179,7 +185,9 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         request.state.api_key_data = api_key_data
 
         # Process request
+        started = time.perf_counter()
         response = await call_next(request)
+        self._record_usage(request, response, api_key, (time.perf_counter() - started) * 1000)
 
         # Add rate limit headers to response
         response.headers["X-RateLimit-Limit"] = str(api_key_data.rate_limit_per_second)
@@ -190,6 +198,38 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         return response
 
+    def _record_usage(
+        self, request: Request, response: Response, api_key: str, response_time_ms: float
+    ) -> None:
+        """Count the request in the usage buffer and schedule a flush if due.
+
+        The flush runs as a response background task, after the body has
+        been sent, so it never adds latency to the request.
+
+        Args:
+            request: Handled request
+            response: Response about to be sent
+            api_key: API key that made the request
+            response_time_ms: Handler time in milliseconds
+        """
+        date_str = time.strftime("%Y-%m-%d", time.gmtime())
+        self.usage_buffer.add(
+            api_key=api_key,
+            date=date_str,
+            endpoint=request.url.path,
+            status_code=response.status_code,
+            cost_usd=getattr(request.state, "cost_usd", 0.0),
+        )
+        logger.debug(
+            "usage_buffered",
+            api_key_prefix=api_key[:8],
+            status_code=response.status_code,
+            response_time_ms=round(response_time_ms, 1),
+        )
+
+        if self.usage_buffer.flush_due():
+            add_background_task(response, self.usage_buffer.flush)
+
     async def _get_api_key(self, api_key: str) -> APIKey | None:
         """Get API key metadata from DynamoDB using Advanced API key system.
 
@@ -373,9 +413,8 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             if current_usage >= daily_quota:
                 return False, current_usage, 0
 
-            # Increment usage counter
-            await self._increment_usage_counter(api_key, date)
-
+            # The request itself is counted by the usage buffer after the
+            # response (one batched atomic ADD instead of a write per request)
             new_usage = current_usage + 1
             remaining = max(0, daily_quota - new_usage)
 
@@ -394,59 +433,3 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             logger.error("daily_quota_check_failed", error=str(e))
             # Fail open to avoid blocking legitimate traffic
             return True, 0, daily_quota
-
-    async def _increment_usage_counter(
-        self,
-        api_key: str,
-        date: str,
-    ) -> None:
-        """Increment daily usage counter.
-
-        Args:
-            api_key: API key string
-            date: Date in YYYY-MM-DD format
-        """
-        try:
-            from datetime import datetime
-            from decimal import Decimal
-
-            self.db_helper.table.update_item(
-                Key={
-                    "PK": f"USAGE#{api_key}#{date}",
-                    "SK": "SUMMARY",
-                },
-                UpdateExpression=(
-                    "SET request_count = if_not_exists(request_count, :zero) + :inc, "
-                    "last_updated = :updated, "
-                    "api_key = :api_key, "
-                    "#date = :date, "
-                    "usage_id = if_not_exists(usage_id, :usage_id), "
-                    "successful_requests = if_not_exists(successful_requests, :zero), "
-                    "failed_requests = if_not_exists(failed_requests, :zero), "
-                    "total_cost_usd = if_not_exists(total_cost_usd, :zero_decimal), "
-                    "bedrock_cost_usd = if_not_exists(bedrock_cost_usd, :zero_decimal), "
-                    "lambda_cost_usd = if_not_exists(lambda_cost_usd, :zero_decimal), "
-                    "entity_type = :entity_type, "
-                    "GSI1PK = :gsi1pk, "
-                    "GSI1SK = :gsi1sk"
-                ),
-                ExpressionAttributeNames={
-                    "#date": "date",
-                },
-                ExpressionAttributeValues={
-                    ":zero": 0,
-                    ":zero_decimal": Decimal("0.0"),
-                    ":inc": 1,
-                    ":updated": datetime.utcnow().isoformat(),
-                    ":api_key": api_key,
-                    ":date": date,
-                    ":usage_id": generate_id(),
-                    ":entity_type": "USAGE_RECORD",
-                    ":gsi1pk": f"APIKEY#{api_key}",
-                    ":gsi1sk": f"DATE#{date}",
-                },
-            )
-
-        except Exception as e:
-            logger.error("increment_usage_counter_failed", error=str(e))
-            # Don't raise - usage tracking is not critical for request processing
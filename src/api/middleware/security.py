@@ -8,13 +8,23 @@ from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
+from src.api.middleware.background import add_background_task
+from src.constants import SECURITY_ANOMALY_WINDOW_SECONDS, SECURITY_EVENT_TTL_DAYS
 from src.models.rate_limit import SecurityEvent, Severity
 from src.utils.dynamo import DynamoDBHelper
 from src.utils.id_gen import generate_id
 from src.utils.logging import get_logger
+from src.utils.security_events import (
+    SecurityEventSink,
+    SlidingWindowCounter,
+    get_security_event_sink,
+)
 
 logger = get_logger(__name__)
 
+# api_key_prefix recorded for requests without an X-API-Key header
+ANONYMOUS_KEY_PREFIX = "-" * 8
+
 
 class SecurityLoggerMiddleware(BaseHTTPMiddleware):
     """Middleware for logging security events and detecting anomalies.
@@ -23,9 +33,10 @@ class SecurityLoggerMiddleware(BaseHTTPMiddleware):
     1. Logs all authentication failures (401/403)
     2. Logs rate limit violations (429)
     3. Logs budget exceeded events (402)
-    4. Detects unusual patterns (>100 req/min from single API key)
+    4. Detects unusual patterns (>100 req/min from single API key) in memory
     5. Masks sensitive data (only logs first 8 chars of API keys)
-    6. Stores events in DynamoDB with 30-day TTL
+    6. Stores events in DynamoDB with 30-day TTL, sampled and batched
+       after the response is sent
     7. Triggers CloudWatch alarms for critical anomalies
     """
 
@@ -34,6 +45,8 @@ class SecurityLoggerMiddleware(BaseHTTPMiddleware):
         app: ASGIApp,
         db_helper: DynamoDBHelper,
         anomaly_threshold: int = 100,  # requests per minute
+        event_sink: SecurityEventSink | None = None,
+        request_counter: SlidingWindowCounter | None = None,
     ) -> None:
         """Initialize security logger middleware.
 
@@ -41,14 +54,23 @@ class SecurityLoggerMiddleware(BaseHTTPMiddleware):
             app: ASGI application
             db_helper: DynamoDB helper instance
             anomaly_threshold: Requests per minute threshold for anomaly detection
+            event_sink: Event sink (default: the process-wide sink for the table)
+            request_counter: Per-key request rate window (default: a new one-minute window)
         """
         super().__init__(app)
         self.db_helper = db_helper
         self.anomaly_threshold = anomaly_threshold
+        self.event_sink = event_sink or get_security_event_sink(db_helper)
+        self.request_counter = request_counter or SlidingWindowCounter(
+            threshold=anomaly_threshold, window_seconds=SECURITY_ANOMALY_WINDOW_SECONDS
+        )
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """Process request and log security events.
 
+        Nothing here waits on DynamoDB: events are queued in memory and
+        written by a background task once the response has been sent.
+
         Args:
             request: Incoming HTTP request
             call_next: Next middleware/route handler
@@ -58,7 +80,7 @@ class SecurityLoggerMiddleware(BaseHTTPMiddleware):
         """
         # Extract API key (may be None for unauthenticated requests)
         api_key = request.headers.get("X-API-Key")
-        api_key_prefix = api_key[:8] if api_key else "NONE"
+        api_key_prefix = _mask_api_key(api_key)
 
         # Record request start time
         start_time = time.time()
@@ -79,7 +101,10 @@ class SecurityLoggerMiddleware(BaseHTTPMiddleware):
 
         # Check for anomalies if API key is present
         if api_key:
-            await self._detect_and_log_anomalies(api_key, api_key_prefix)
+            await self._detect_and_log_anomalies(api_key, api_key_prefix, request.url.path)
+
+        if self.event_sink.flush_due():
+            add_background_task(response, self.event_sink.flush)
 
         return response
 
@@ -144,38 +169,43 @@ class SecurityLoggerMiddleware(BaseHTTPMiddleware):
         severity: Severity,
         details: dict,
     ) -> None:
-        """Log a security event to DynamoDB.
+        """Queue a security event for the background DynamoDB writer.
 
         Args:
-            event_type: Type of security event (auth_failure, rate_limit, budget_exceeded, anomaly)
+            event_type: Type of security event (auth_failure, rate_limit, budget_exceeded,
+                server_error, anomaly)
             api_key_prefix: First 8 characters of API key (masked)
             severity: Event severity level
-            details: Additional event details
+            details: Additional event details (path and status_code are promoted
+                to the event's endpoint and status_code)
         """
         try:
-            # Create security event
+            timestamp = datetime.utcnow()
             event = SecurityEvent(
                 event_id=generate_id(),
                 event_type=event_type,
                 api_key_prefix=api_key_prefix,
                 severity=severity,
-                timestamp=datetime.utcnow(),
-                details=details,
+                timestamp=timestamp,
+                ip_address=details.get("ip_address"),
+                endpoint=details.get("path", "unknown"),
+                status_code=details.get("status_code", 429),
+                metadata=dict(details),
+                ttl=SecurityEvent.calculate_ttl(timestamp, days=SECURITY_EVENT_TTL_DAYS),
             )
-
-            # Set DynamoDB keys
             event.set_dynamodb_keys()
 
-            # Store in DynamoDB
-            self.db_helper.table.put_item(Item=event.model_dump())
+            if not self.event_sink.submit(event):
+                # Sampled out (a repeat) or queue full - counted in sink stats
+                return
 
             # Log to CloudWatch
             logger.warning(
                 "security_event",
                 event_type=event_type,
                 api_key_prefix=api_key_prefix,
-                severity=severity.value,
-                details=details,
+                severity=str(severity),
+                details=event.metadata,
             )
 
             # Trigger CloudWatch alarm for critical events
@@ -190,39 +220,40 @@ class SecurityLoggerMiddleware(BaseHTTPMiddleware):
                 error=str(e),
             )
 
-    async def _detect_and_log_anomalies(self, api_key: str, api_key_prefix: str) -> None:
-        """Detect unusual patterns and log anomalies.
+    async def _detect_and_log_anomalies(
+        self, api_key: str, api_key_prefix: str, path: str = "unknown"
+    ) -> None:
+        """Count the request in the sliding window; log when the threshold is crossed.
+
+        Only the crossing is logged - a key stays flagged without further
+        events until its rate drops back below the threshold.
 
         Args:
             api_key: Full API key string
             api_key_prefix: First 8 characters (masked)
+            path: Request path that crossed the threshold
         """
         try:
-            # Check request rate in last minute
-            current_time = int(time.time())
-            one_minute_ago = current_time - 60
-
-            # Count requests in last minute from rate limit counters
-            request_count = await self._count_recent_requests(
-                api_key=api_key,
-                start_time=one_minute_ago,
-                end_time=current_time,
-            )
+            request_count = self.request_counter.hit(api_key)
+            if request_count is None:
+                return
 
-            # Check if threshold exceeded
-            if request_count > self.anomaly_threshold:
-                await self.log_security_event(
-                    event_type="anomaly",
-                    api_key_prefix=api_key_prefix,
-                    severity=Severity.CRITICAL,
-                    details={
-                        "anomaly_type": "high_request_rate",
-                        "request_count": request_count,
-                        "threshold": self.anomaly_threshold,
-                        "time_window_seconds": 60,
-                        "message": f"Detected {request_count} requests in last minute (threshold: {self.anomaly_threshold})",
-                    },
-                )
+            window = self.request_counter.window_seconds
+            await self.log_security_event(
+                event_type="anomaly",
+                api_key_prefix=api_key_prefix,
+                severity=Severity.CRITICAL,
+                details={
+                    "path": path,
+                    # Excessive request rate is reported as Too Many Requests
+                    "status_code": 429,
+                    "anomaly_type": "high_request_rate",
+                    "request_count": request_count,
+                    "threshold": self.anomaly_threshold,
+                    "time_window_seconds": window,
+                    "message": f"Detected {request_count} requests in last {window}s (threshold: {self.anomaly_threshold})",
+                },
+            )
 
         except Exception as e:
             logger.error(
@@ -231,38 +262,6 @@ class SecurityLoggerMiddleware(BaseHTTPMiddleware):
                 error=str(e),
             )
 
-    async def _count_recent_requests(self, api_key: str, start_time: int, end_time: int) -> int:
-        """Count requests from API key in time window.
-
-        Args:
-            api_key: API key string
-            start_time: Start of time window (Unix timestamp)
-            end_time: End of time window (Unix timestamp)
-
-        Returns:
-            Total request count in time window
-        """
-        try:
-            total_count = 0
-
-            # Query rate limit counters for each second in the window
-            for timestamp in range(start_time, end_time + 1):
-                counter_data = self.db_helper.table.get_item(
-                    Key={
-                        "PK": f"RATELIMIT#{api_key}#{timestamp}",
-                        "SK": "COUNTER",
-                    }
-                ).get("Item")
-
-                if counter_data:
-                    total_count += counter_data.get("request_count", 0)
-
-            return total_count
-
-        except Exception as e:
-            logger.error("count_recent_requests_failed", error=str(e))
-            return 0
-
     async def _trigger_cloudwatch_alarm(self, event: SecurityEvent) -> None:
         """Trigger CloudWatch alarm for critical security events.
 
@@ -276,8 +275,8 @@ class SecurityLoggerMiddleware(BaseHTTPMiddleware):
                 event_id=event.event_id,
                 event_type=event.event_type,
                 api_key_prefix=event.api_key_prefix,
-                severity=event.severity.value,
-                details=event.details,
+                severity=str(event.severity),
+                metadata=event.metadata,
             )
 
             # TODO: In production, publish custom CloudWatch metric
@@ -299,3 +298,10 @@ class SecurityLoggerMiddleware(BaseHTTPMiddleware):
 
         except Exception as e:
             logger.error("cloudwatch_alarm_trigger_failed", error=str(e))
+
+
+def _mask_api_key(api_key: str | None) -> str:
+    """Return the 8-character prefix logged for an API key."""
+    if not api_key:
+        return ANONYMOUS_KEY_PREFIX
+    return api_key[:8].ljust(8, "*")
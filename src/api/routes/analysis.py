@@ -1,6 +1,8 @@
 """Analysis job management endpoints."""
 
-from fastapi import APIRouter, HTTPException
+from datetime import datetime
+
+from fastapi import APIRouter, HTTPException, Query, Request
 
 from src.api.dependencies import (
     AnalysisServiceDep,
@@ -9,7 +11,15 @@ from src.api.dependencies import (
     HackathonServiceDep,
     SubmissionServiceDep,
 )
-from src.models.analysis import AnalysisJobResponse, AnalysisStatusResponse, AnalysisTrigger
+from src.models.analysis import (
+    AnalysisCurrentSubmission,
+    AnalysisJobListResponse,
+    AnalysisJobResponse,
+    AnalysisProgress,
+    AnalysisStatusResponse,
+    AnalysisTrigger,
+)
+from src.models.common import JobStatus, SubmissionStatus
 from src.models.costs import CostEstimate
 
 router = APIRouter(tags=["analysis"])
@@ -19,6 +29,7 @@ router = APIRouter(tags=["analysis"])
 async def trigger_analysis(
     hack_id: str,
     data: AnalysisTrigger,
+    request: Request,
     analysis_service: AnalysisServiceDep,
     hackathon_service: HackathonServiceDep,
     current_organizer: CurrentOrganizer,
@@ -43,8 +54,15 @@ async def trigger_analysis(
             status_code=403, detail="You do not have permission to access this hackathon"
         )
 
+    # Spend reserved by BudgetMiddleware; reconciled when the job completes
+    reservation = getattr(request.state, "budget_reservation", None)
+
     try:
-        return analysis_service.trigger_analysis(hack_id, data.submission_ids)
+        return analysis_service.trigger_analysis(
+            hack_id,
+            data.submission_ids,
+            budget_reservation=reservation.to_record() if reservation else None,
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to trigger analysis: {str(e)}") from e
 
@@ -58,44 +76,72 @@ async def get_analysis_status(
 
     GET /api/v1/hackathons/{hack_id}/analyze/status
 
-    Returns the most recent analysis job status.
+    Returns the most recent analysis job status, including the submission
+    currently being analyzed and the cost accumulated so far.
     """
-    jobs = service.list_analysis_jobs(hack_id)
+    job_record = service.get_latest_job_record(hack_id)
 
-    if not jobs:
+    if not job_record:
         raise HTTPException(status_code=404, detail="No analysis jobs found for this hackathon")
 
-    # Return most recent job (jobs are sorted by created_at desc)
-    latest_job = jobs[0]
-
-    # Build progress object
-    from src.models.analysis import AnalysisProgress
-
+    snapshot = service.progress_snapshot(job_record)
     progress = AnalysisProgress(
-        total_submissions=latest_job.total_submissions,
-        completed=latest_job.completed_submissions,
-        failed=latest_job.failed_submissions,
-        remaining=latest_job.total_submissions
-        - latest_job.completed_submissions
-        - latest_job.failed_submissions,
-        percent_complete=(latest_job.completed_submissions / latest_job.total_submissions * 100)
-        if latest_job.total_submissions > 0
-        else 0,
+        total_submissions=snapshot["total_submissions"],
+        completed=snapshot["completed"],
+        failed=snapshot["failed"],
+        remaining=snapshot["remaining"],
+        percent_complete=snapshot["percent_complete"],
     )
 
+    current_submission = None
+    if snapshot["current_sub_id"]:
+        current_submission = AnalysisCurrentSubmission(
+            sub_id=snapshot["current_sub_id"],
+            team_name=snapshot["current_team_name"] or "",
+            status=SubmissionStatus.ANALYZING.value,
+        )
+
+    processed = snapshot["completed"] + snapshot["failed"]
     return AnalysisStatusResponse(
-        job_id=latest_job.job_id,
-        hack_id=latest_job.hack_id,
-        status=latest_job.status,
+        job_id=job_record["job_id"],
+        hack_id=job_record["hack_id"],
+        status=JobStatus(snapshot["status"]),
         progress=progress,
-        current_submission=None,  # Not tracked in MVP
-        cost_so_far=None,  # Not tracked in MVP
+        current_submission=current_submission,
+        cost_so_far={
+            "total_usd": snapshot["cost_usd"],
+            "average_per_submission_usd": snapshot["cost_usd"] / processed if processed else 0.0,
+        },
         errors=[],  # Not tracked in MVP
-        started_at=latest_job.started_at,
-        estimated_completion=latest_job.completed_at,  # Use completed_at as estimate
+        started_at=_parse_datetime(job_record.get("started_at")),
+        estimated_completion=_parse_datetime(job_record.get("completed_at")),
     )
 
 
+@router.get("/hackathons/{hack_id}/analyze/jobs", response_model=AnalysisJobListResponse)
+async def list_analysis_jobs(
+    hack_id: str,
+    service: AnalysisServiceDep,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+) -> AnalysisJobListResponse:
+    """List analysis job history for hackathon, newest first.
+
+    GET /api/v1/hackathons/{hack_id}/analyze/jobs?limit=20&cursor=...
+
+    Pass next_cursor from the previous page to continue.
+    """
+    try:
+        return service.list_analysis_jobs_page(hack_id, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    """Parse an ISO timestamp stored on a job record."""
+    return datetime.fromisoformat(value) if value else None
+
+
 @router.post("/hackathons/{hack_id}/analyze/estimate", response_model=CostEstimate)
 async def estimate_analysis_cost(
     hack_id: str,
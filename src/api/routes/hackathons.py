@@ -333,6 +333,9 @@ async def get_organizer_intelligence(
     - Next hackathon recommendations
     - Sponsor follow-up actions
 
+    Served from the hackathon's precomputed aggregate, which the analyzer
+    updates as each submission is scored; it is built on the first request.
+
     Requires X-API-Key header for authentication.
     """
     # Get hackathon first to verify ownership
@@ -355,3 +358,38 @@ async def get_organizer_intelligence(
         raise HTTPException(
             status_code=500, detail=f"Failed to generate intelligence dashboard: {str(e)}"
         ) from e
+
+
+@router.post("/{hack_id}/intelligence/refresh", response_model=OrganizerDashboard)
+async def refresh_organizer_intelligence(
+    hack_id: str,
+    hackathon_service: HackathonServiceDep,
+    intelligence_service: OrganizerIntelligenceServiceDep,
+    current_organizer: CurrentOrganizer,
+) -> OrganizerDashboard:
+    """Rebuild the organizer intelligence dashboard from all submissions.
+
+    POST /api/v1/hackathons/{hack_id}/intelligence/refresh
+
+    The dashboard is normally kept up to date as submissions are analyzed;
+    this recomputes it from scratch (e.g. after submissions were edited).
+
+    Requires X-API-Key header for authentication.
+    """
+    hackathon = hackathon_service.get_hackathon(hack_id)
+    if not hackathon:
+        raise HTTPException(status_code=404, detail="Hackathon not found")
+
+    if hackathon.org_id != current_organizer["org_id"]:
+        raise HTTPException(
+            status_code=403, detail="You do not have permission to access this hackathon"
+        )
+
+    try:
+        return intelligence_service.generate_dashboard(hack_id, refresh=True)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to refresh intelligence dashboard: {str(e)}"
+        ) from e
@@ -1,9 +1,10 @@
 """Public endpoints (no authentication required)."""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Response
 
 from src.api.dependencies import HackathonServiceDep, SubmissionServiceDep
-from src.models.hackathon import PublicHackathonInfo, PublicHackathonListResponse
+from src.constants import PUBLIC_HACKATHONS_CACHE_TTL_SECONDS
+from src.models.hackathon import PublicHackathonListResponse
 from src.models.submission import (
     SubmissionBatchCreate,
     SubmissionBatchCreateResponse,
@@ -15,35 +16,32 @@ router = APIRouter(prefix="/public", tags=["public"])
 @router.get("/hackathons", response_model=PublicHackathonListResponse)
 async def list_public_hackathons(
     service: HackathonServiceDep,
+    response: Response,
+    limit: int = Query(50, ge=1, le=100),
+    cursor: str | None = None,
 ) -> PublicHackathonListResponse:
     """List public hackathons (no authentication required).
 
     GET /api/v1/public/hackathons
 
-    Returns only CONFIGURED hackathons with minimal public information.
+    Returns only CONFIGURED hackathons with minimal public information,
+    one page at a time (pass ``next_cursor`` back as ``cursor``). Pages are
+    cached briefly, so a newly activated hackathon can take up to
+    PUBLIC_HACKATHONS_CACHE_TTL_SECONDS to appear.
     No API key required - this is a public endpoint for submission portals.
     """
     try:
-        all_hackathons = service.list_all_configured_hackathons()
-
-        public_hackathons = [
-            PublicHackathonInfo(
-                hack_id=h.hack_id,
-                name=h.name,
-                description=h.description,
-                start_date=h.start_date,
-                end_date=h.end_date,
-                submission_count=h.submission_count,
-            )
-            for h in all_hackathons
-        ]
-
-        return PublicHackathonListResponse(hackathons=public_hackathons)
+        page = service.list_public_hackathons(limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to list public hackathons: {str(e)}"
         ) from e
 
+    response.headers["Cache-Control"] = f"public, max-age={PUBLIC_HACKATHONS_CACHE_TTL_SECONDS}"
+    return page
+
 
 @router.post(
     "/hackathons/{hack_id}/submissions",
@@ -77,14 +75,13 @@ async def create_public_submission(
         )
 
     try:
+        # Also updates the hackathon's submission count
         result = submission_service.create_submissions(hack_id, data)
-
-        # Update hackathon submission count
-        for _ in range(result.created):
-            hackathon_service.increment_submission_count(hack_id)
-
-        return result
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to create submissions: {str(e)}"
         ) from e
+
+    if result.created == 0:
+        raise HTTPException(status_code=409, detail=result.model_dump(mode="json"))
+    return result
@@ -1,6 +1,6 @@
 """Submission management endpoints."""
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
 
 from src.api.dependencies import (
     CostServiceDep,
@@ -8,6 +8,7 @@ from src.api.dependencies import (
     HackathonServiceDep,
     SubmissionServiceDep,
 )
+from src.constants import HEDGE_COST_SUFFIX, SUBMISSION_UPLOAD_MAX_BYTES
 from src.models.costs import CostRecord, SubmissionCostResponse
 from src.models.submission import (
     IndividualScorecardsResponse,
@@ -42,18 +43,91 @@ async def create_submissions(
         raise HTTPException(status_code=404, detail="Hackathon not found")
 
     try:
+        # Also updates the hackathon's submission count
         result = submission_service.create_submissions(hack_id, data)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to create submissions: {str(e)}"
+        ) from e
+
+    if result.created == 0:
+        raise HTTPException(status_code=409, detail=result.model_dump(mode="json"))
+    return result
+
+
+# Content types accepted by the bulk upload endpoint
+UPLOAD_CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/csv": "csv",
+    "application/x-ndjson": "jsonl",
+    "application/jsonl": "jsonl",
+    "application/x-jsonlines": "jsonl",
+}
+
+
+@router.post(
+    "/hackathons/{hack_id}/submissions/upload",
+    response_model=SubmissionBatchCreateResponse,
+    status_code=201,
+)
+async def upload_submissions(
+    hack_id: str,
+    request: Request,
+    submission_service: SubmissionServiceDep,
+    hackathon_service: HackathonServiceDep,
+    current_organizer: CurrentOrganizer,
+    upload_format: str | None = Query(None, alias="format", pattern="^(csv|jsonl)$"),
+) -> SubmissionBatchCreateResponse:
+    """Bulk-import submissions from a CSV or JSONL request body.
+
+    POST /api/v1/hackathons/{hack_id}/submissions/upload
 
-        # Update hackathon submission count
-        for _ in range(result.created):
-            hackathon_service.increment_submission_count(hack_id)
+    The format comes from the ``format`` query parameter or the
+    Content-Type (text/csv, application/x-ndjson). CSV needs ``team_name``
+    and ``repo_url`` header columns; JSONL has one object per line.
+    Invalid and duplicate rows are skipped and reported per row.
 
-        return result
+    Requires X-API-Key header for authentication.
+    """
+    hackathon = hackathon_service.get_hackathon(hack_id)
+    if not hackathon:
+        raise HTTPException(status_code=404, detail="Hackathon not found")
+
+    if hackathon.org_id != current_organizer["org_id"]:
+        raise HTTPException(status_code=403, detail="You do not have permission to add submissions")
+
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    fmt = upload_format or UPLOAD_CONTENT_TYPES.get(content_type)
+    if fmt is None:
+        raise HTTPException(
+            status_code=415,
+            detail="Upload must be CSV (text/csv) or JSONL (application/x-ndjson)",
+        )
+
+    body = await request.body()
+    if len(body) > SUBMISSION_UPLOAD_MAX_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Upload exceeds {SUBMISSION_UPLOAD_MAX_BYTES} bytes",
+        )
+    try:
+        content = body.decode("utf-8-sig")
+    except UnicodeDecodeError as e:
+        raise HTTPException(status_code=400, detail="Upload must be UTF-8 encoded") from e
+
+    try:
+        result = submission_service.upload_submissions(hack_id, content, fmt)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         raise HTTPException(
-            status_code=500, detail=f"Failed to create submissions: {str(e)}"
+            status_code=500, detail=f"Failed to upload submissions: {str(e)}"
         ) from e
 
+    if result.created == 0:
+        raise HTTPException(status_code=409, detail=result.model_dump(mode="json"))
+    return result
+
 
 @router.get("/hackathons/{hack_id}/submissions", response_model=SubmissionListResponse)
 async def list_submissions(
@@ -155,11 +229,13 @@ async def get_submission_costs(
         # Convert dict records to CostRecord models
         agent_records = []
         for record in cost_data.get("agent_costs", []):
+            agent_name = record["agent_name"]
             agent_records.append(
                 CostRecord(
                     sub_id=record["sub_id"],
                     hack_id=record.get("hack_id", ""),
-                    agent_name=record["agent_name"],
+                    agent_name=agent_name.removesuffix(HEDGE_COST_SUFFIX),
+                    hedge=agent_name.endswith(HEDGE_COST_SUFFIX),
                     model_id=record["model_id"],
                     input_tokens=record["input_tokens"],
                     output_tokens=record["output_tokens"],
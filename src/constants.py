@@ -57,6 +57,9 @@ class AgentConfig(TypedDict):
     max_tokens: int
     top_p: float
     timeout_seconds: int
+    first_token_timeout_seconds: int
+    # Model for the hedge request sent when a call runs slow (None: no hedging)
+    hedge_model_id: str | None
 
 
 AGENT_CONFIGS: dict[str, AgentConfig] = {
@@ -66,6 +69,8 @@ AGENT_CONFIGS: dict[str, AgentConfig] = {
         "max_tokens": 2048,
         "top_p": 0.9,
         "timeout_seconds": 120,
+        "first_token_timeout_seconds": 20,
+        "hedge_model_id": "amazon.nova-lite-v1:0",
     },
     "performance": {
         "model_id": "amazon.nova-lite-v1:0",
@@ -73,6 +78,8 @@ AGENT_CONFIGS: dict[str, AgentConfig] = {
         "max_tokens": 2048,
         "top_p": 0.9,
         "timeout_seconds": 120,
+        "first_token_timeout_seconds": 20,
+        "hedge_model_id": "amazon.nova-lite-v1:0",
     },
     "innovation": {
         "model_id": "us.anthropic.claude-sonnet-4-6",  # Latest Claude Sonnet 4.6 (Feb 2026)
@@ -80,6 +87,8 @@ AGENT_CONFIGS: dict[str, AgentConfig] = {
         "max_tokens": 3000,
         "top_p": 0.95,
         "timeout_seconds": 180,
+        "first_token_timeout_seconds": 30,
+        "hedge_model_id": "amazon.nova-pro-v1:0",  # Cheaper fallback
     },
     "ai_detection": {
         "model_id": "amazon.nova-micro-v1:0",
@@ -87,6 +96,8 @@ AGENT_CONFIGS: dict[str, AgentConfig] = {
         "max_tokens": 1500,
         "top_p": 0.9,
         "timeout_seconds": 90,
+        "first_token_timeout_seconds": 15,
+        "hedge_model_id": "amazon.nova-micro-v1:0",
     },
 }
 
@@ -204,6 +215,18 @@ MAX_FILE_TREE_DEPTH = 4
 # Includes all enabled agents (BugHunter, Performance, Innovation, AIDetection)
 COST_PER_SUBMISSION = 0.053
 
+# Seconds the budget middleware caches a hackathon's budget limit and
+# submission count in process (reservations are reconciled with actual cost)
+BUDGET_LIMIT_CACHE_TTL_SECONDS = 60
+
+# Budget usage percentages that trigger an alert (each sent once)
+BUDGET_ALERT_THRESHOLDS = (50, 80, 90, 100)
+
+# Jobs still queued or running this long after creation are failed by the
+# hourly sweep, which settles their budget reservation and unlocks the
+# hackathon (continuations let a healthy job run for hours, not a day)
+ANALYSIS_JOB_EXPIRY_SECONDS = 24 * 3600
+
 # ============================================================
 # CLONE CONFIGURATION
 # ============================================================
@@ -315,6 +338,258 @@ BEDROCK_RETRY_ATTEMPTS = 3
 BEDROCK_RETRY_WAIT_SECONDS = 2
 BEDROCK_RETRY_BACKOFF_MULTIPLIER = 2
 
+# ============================================================
+# BEDROCK STREAMING
+# ============================================================
+
+# Time-to-first-token limit for agents without their own
+BEDROCK_FIRST_TOKEN_TIMEOUT_SECONDS = 30
+
+# Calls per model kept for the latency and throughput percentiles
+BEDROCK_LATENCY_WINDOW = 200
+
+# Rough characters per token, for usage of a stream cut off before Bedrock
+# reported it
+BEDROCK_CHARS_PER_TOKEN = 4
+
+# ============================================================
+# HEDGED AGENT CALLS
+# ============================================================
+
+# A hedge request is sent when an agent call outlasts this percentile of its
+# model's recent latency
+HEDGE_LATENCY_PERCENTILE = 95
+
+# Recent calls of a model needed before its latency percentile is trusted
+HEDGE_MIN_SAMPLES = 20
+
+# Largest estimated cost (USD) of a single hedge request
+HEDGE_MAX_REQUEST_COST_USD = 0.05
+
+# Hedge spend of a hackathon with a budget may reach this share of its
+# budget limit (tracked on its budget item, so shared by every process)
+HEDGE_MAX_BUDGET_SHARE = 0.05
+
+# Without a hackathon budget, hedge spend may reach this share of the process's
+# primary request spend, plus the allowance (USD) that lets its first hedges
+# through
+HEDGE_MAX_SPEND_RATIO = 0.1
+HEDGE_SPEND_ALLOWANCE_USD = 0.10
+
+# How long a hedged call waits for the losing request to report its usage
+# after cancelling it; past that, its full estimated cost is charged
+HEDGE_LOSER_REPORT_SECONDS = 2.0
+
+# Suffix of the agent name on cost records of requests that lost a hedged call
+HEDGE_COST_SUFFIX = ":hedge"
+
+# ============================================================
+# ANALYZER CHECKPOINTING
+# ============================================================
+
+# Stop and re-invoke the analyzer when less than this much Lambda time remains
+# (one ~90s submission plus time to persist results and checkpoint)
+ANALYZER_CHECKPOINT_RESERVE_MS = 120_000
+
+# Multiplier on the slowest submission seen so far in this invocation
+ANALYZER_CHECKPOINT_SAFETY_FACTOR = 1.5
+
+# Fan-out: submissions per analyzer invocation (0 = one invocation per job).
+# Overridden by the ANALYZER_SHARD_SIZE environment variable.
+ANALYZER_SHARD_SIZE = 0
+
+# Attempts to start each fan-out shard before the job is failed, and the
+# delay (seconds) before the first retry, doubled for each further retry
+ANALYZER_INVOKE_ATTEMPTS = 3
+ANALYZER_INVOKE_RETRY_SECONDS = 0.5
+
+# ============================================================
+# ANALYZER WORKERS (queue mode)
+# ============================================================
+
+# Worker processes per analyzer worker host
+ANALYZER_WORKER_CONCURRENCY = 2
+
+# Seconds a received work item stays hidden from other workers; extended by
+# heartbeats while the submission is being analyzed
+ANALYZER_WORKER_VISIBILITY_TIMEOUT = 300
+
+# Seconds to let in-flight submissions finish after SIGTERM/SIGINT
+ANALYZER_WORKER_SHUTDOWN_TIMEOUT = 120
+
+# ============================================================
+# ANALYZER MEMORY
+# ============================================================
+
+# Highest projected RSS (MiB) at which another submission is admitted outside
+# Lambda. Overridden by the ANALYZER_MEMORY_CEILING_MB environment variable
+# (0 disables the check).
+ANALYZER_MEMORY_CEILING_MB = 1536
+
+# In Lambda, the ceiling is this share of AWS_LAMBDA_FUNCTION_MEMORY_SIZE,
+# leaving headroom for native allocations Python does not see
+ANALYZER_MEMORY_CEILING_FRACTION = 0.75
+
+# Continuation invocations a job may start because memory ran short; beyond
+# this, submissions that do not fit run anyway (time-based continuations are
+# not limited, since each one follows a full invocation of progress)
+ANALYZER_MAX_MEMORY_CONTINUATIONS = 5
+
+# Initial (and minimum) memory footprint estimate of one submission in MiB
+ANALYZER_SUBMISSION_MEMORY_MB = 256
+
+# Seconds a submission waits for in-flight ones to free memory before it is
+# deferred to a continuation invocation
+ANALYZER_ADMISSION_WAIT_SECONDS = 30
+
+# ============================================================
+# ORCHESTRATOR STAGES
+# ============================================================
+
+# Threads for the deterministic stages (source index, team, strategy, feedback)
+# that run alongside the agents' Bedrock calls
+ORCHESTRATOR_CPU_WORKERS = 2
+
+# ============================================================
+# ANALYSIS TRACING
+# ============================================================
+
+# Percentiles of span durations in the per-job trace summary
+TRACE_SUMMARY_PERCENTILES = (50, 90, 99)
+
+# Largest Chrome trace (JSON bytes) stored on a submission's TRACE item; the
+# per-span durations are always stored (DynamoDB items are capped at 400 KB)
+TRACE_MAX_EXPORT_BYTES = 300_000
+
+# ============================================================
+# USAGE TRACKING (write-behind)
+# ============================================================
+
+# Seconds usage counters are coalesced in memory before one atomic update
+# per (API key, day). Lambda environments freeze between invocations, so
+# there the buffer flushes after every response (interval 0).
+# Overridden by the USAGE_FLUSH_INTERVAL_SECONDS environment variable.
+USAGE_FLUSH_INTERVAL_SECONDS = 5.0
+
+# Flush early once this many distinct (API key, day) records are pending
+USAGE_BUFFER_MAX_KEYS = 500
+
+# ============================================================
+# SECURITY EVENTS
+# ============================================================
+
+# Events waiting to be written; further events are dropped (and counted)
+SECURITY_EVENT_QUEUE_SIZE = 1000
+
+# Events per BatchWriteItem call (DynamoDB maximum)
+SECURITY_EVENT_BATCH_SIZE = 25
+
+# Seconds between flushes outside Lambda (Lambda flushes after every response).
+# Overridden by the SECURITY_EVENT_FLUSH_INTERVAL_SECONDS environment variable.
+SECURITY_EVENT_FLUSH_INTERVAL_SECONDS = 5.0
+
+# Repeats of the same event (key, type, endpoint, status) within this window
+# are sampled: the first few are kept, then one in SAMPLE_RATE, each kept
+# event carrying the number suppressed since the previous one
+SECURITY_EVENT_DEDUP_WINDOW_SECONDS = 60
+SECURITY_EVENT_SAMPLE_FIRST = 3
+SECURITY_EVENT_SAMPLE_RATE = 20
+
+# Sliding window for per-key request rate anomaly detection
+SECURITY_ANOMALY_WINDOW_SECONDS = 60
+
+# Keys tracked in memory by the sampler / anomaly window before idle ones are evicted
+SECURITY_TRACKED_KEYS_MAX = 10_000
+
+# Security events expire after this many days
+SECURITY_EVENT_TTL_DAYS = 30
+
+# ============================================================
+# CLIENT POOLS
+# ============================================================
+
+# HTTP connections per shared boto3 client (botocore default is 10; the API
+# and analyzer threads share one DynamoDB / Bedrock client per process)
+AWS_MAX_POOL_CONNECTIONS = 50
+
+# Shared httpx clients (GitHub API)
+HTTP_MAX_CONNECTIONS = 20
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 10
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 30.0
+
+# ============================================================
+# API COLD START
+# ============================================================
+
+# Budget for ``import src.api.main`` (best of several runs, measured with
+# ``python -X importtime``; includes creating the shared DynamoDB resource,
+# which Lambda does during init). Checked by scripts/profile_imports.py.
+API_IMPORT_BUDGET_MS = 2500
+
+# Modules the API must not import at startup: analyzer-only dependencies and
+# services behind rarely used routes are loaded on first use
+API_LAZY_MODULES = (
+    "httpx",
+    "src.agents",
+    "src.analysis",
+    "src.services.cost_service",
+    "src.services.organizer_intelligence_service",
+)
+
+# ============================================================
+# ORGANIZER INTELLIGENCE
+# ============================================================
+
+# Teams shown in the dashboard's top performers
+INTELLIGENCE_TOP_K = 10
+
+# Entries kept per ranking on the materialized item. The headroom over
+# INTELLIGENCE_TOP_K keeps the top list full when a re-analyzed submission
+# drops out of it.
+INTELLIGENCE_RETAINED_K = 20
+
+# Hiring candidates kept per role / flagged for interview
+INTELLIGENCE_CANDIDATES_PER_ROLE = 20
+INTELLIGENCE_MUST_INTERVIEW_LIMIT = 10
+
+# An issue is "common" once it affects this share of submissions
+INTELLIGENCE_COMMON_ISSUE_THRESHOLD = 0.2
+
+# Optimistic-concurrency attempts to fold a submission into the item before
+# marking it stale (the next dashboard read then rebuilds it)
+INTELLIGENCE_FOLD_ATTEMPTS = 5
+
+# ============================================================
+# PUBLIC HACKATHON LISTING
+# ============================================================
+
+# Seconds a page of the public hackathon listing is served from the
+# in-process cache (also advertised via Cache-Control max-age)
+PUBLIC_HACKATHONS_CACHE_TTL_SECONDS = 30
+
+# Listing pages kept in the cache (distinct page size / cursor combinations)
+PUBLIC_HACKATHONS_CACHE_MAX_PAGES = 256
+
+# ============================================================
+# SUBMISSION INGESTION
+# ============================================================
+
+# Bulk upload limits (CSV / JSONL request body)
+SUBMISSION_UPLOAD_MAX_BYTES = 2 * 1024 * 1024
+SUBMISSION_UPLOAD_MAX_ROWS = 5000
+
+# DynamoDB request limits used to chunk ingestion writes and batched reads
+DYNAMODB_TRANSACT_MAX_ITEMS = 100
+DYNAMODB_BATCH_WRITE_MAX_ITEMS = 25
+DYNAMODB_BATCH_GET_MAX_ITEMS = 100
+
+# BatchGetItem requests per chunk while DynamoDB returns unprocessed keys
+DYNAMODB_BATCH_GET_ATTEMPTS = 5
+
+# TransactWriteItems attempts per chunk of repository claims (each attempt
+# drops the rows whose repository is already claimed)
+REPO_CLAIM_ATTEMPTS = 5
+
 # ============================================================
 # TTL CONFIGURATION
 # ============================================================
@@ -1,200 +1,122 @@
 """VibeJudge AI — Pydantic Models.
 
 All request/response schemas, agent output schemas, and internal data models.
-"""
-
-# Common
-# Analysis
-from src.models.analysis import (
-    AnalysisCurrentSubmission,
-    AnalysisError,
-    AnalysisJobResponse,
-    AnalysisProgress,
-    AnalysisStatusResponse,
-    AnalysisTrigger,
-    CommitInfo,
-    DiffEntry,
-    RepoData,
-    SourceFile,
-    WorkflowRun,
-)
-from src.models.common import (
-    AgentName,
-    AIPolicyMode,
-    HackathonStatus,
-    JobStatus,
-    Recommendation,
-    ServiceTier,
-    Severity,
-    SubmissionStatus,
-    Tier,
-    TimestampMixin,
-    VibeJudgeBase,
-)
 
-# Costs
-from src.models.costs import (
-    AgentCostEstimate,
-    BudgetCheck,
-    BudgetInfo,
-    CostEstimate,
-    CostEstimateDetail,
-    CostRange,
-    CostRecord,
-    HackathonCostResponse,
-    SubmissionCostResponse,
-)
-
-# Errors
-from src.models.errors import ErrorDetail, ErrorResponse
+Submodules are imported on first attribute access, so importing a single
+model module (e.g. ``src.models.api_key``) does not load every schema.
+"""
 
-# Hackathon
-from src.models.hackathon import (
-    HackathonCreate,
-    HackathonListItem,
-    HackathonListResponse,
-    HackathonResponse,
-    HackathonUpdate,
-    RubricConfig,
-    RubricDimension,
-)
+import importlib
+from typing import Any
 
-# Leaderboard
-from src.models.leaderboard import (
-    LeaderboardEntry,
-    LeaderboardHackathonInfo,
-    LeaderboardResponse,
-    LeaderboardStats,
-)
+# Submodule -> names it exports
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    "analysis": (
+        "AnalysisTrigger",
+        "AnalysisJobResponse",
+        "AnalysisProgress",
+        "AnalysisCurrentSubmission",
+        "AnalysisError",
+        "AnalysisStatusResponse",
+        "SourceFile",
+        "CommitInfo",
+        "DiffEntry",
+        "WorkflowRun",
+        "RepoData",
+    ),
+    "common": (
+        "HackathonStatus",
+        "SubmissionStatus",
+        "JobStatus",
+        "AgentName",
+        "AIPolicyMode",
+        "Tier",
+        "Severity",
+        "Recommendation",
+        "ServiceTier",
+        "VibeJudgeBase",
+        "TimestampMixin",
+    ),
+    "costs": (
+        "CostRecord",
+        "BudgetInfo",
+        "SubmissionCostResponse",
+        "HackathonCostResponse",
+        "CostRange",
+        "AgentCostEstimate",
+        "BudgetCheck",
+        "CostEstimateDetail",
+        "CostEstimate",
+    ),
+    "errors": (
+        "ErrorDetail",
+        "ErrorResponse",
+    ),
+    "hackathon": (
+        "RubricDimension",
+        "RubricConfig",
+        "HackathonCreate",
+        "HackathonUpdate",
+        "HackathonResponse",
+        "HackathonListItem",
+        "HackathonListResponse",
+    ),
+    "leaderboard": (
+        "LeaderboardEntry",
+        "LeaderboardStats",
+        "LeaderboardHackathonInfo",
+        "LeaderboardResponse",
+    ),
+    "organizer": (
+        "OrganizerCreate",
+        "OrganizerLogin",
+        "OrganizerResponse",
+        "OrganizerCreateResponse",
+        "OrganizerLoginResponse",
+        "OrganizerRecord",
+    ),
+    "scores": (
+        "BugHunterEvidence",
+        "PerformanceEvidence",
+        "InnovationEvidence",
+        "AIDetectionEvidence",
+        "CIObservations",
+        "PerformanceCIObservations",
+        "TechStackAssessment",
+        "CommitAnalysis",
+        "BaseAgentResponse",
+        "BugHunterScores",
+        "BugHunterResponse",
+        "PerformanceScores",
+        "PerformanceResponse",
+        "InnovationScores",
+        "InnovationResponse",
+        "AIDetectionScores",
+        "AIDetectionResponse",
+        "AGENT_RESPONSE_MODELS",
+    ),
+    "submission": (
+        "SubmissionInput",
+        "SubmissionBatchCreate",
+        "RepoMeta",
+        "WeightedDimensionScore",
+        "SubmissionResponse",
+        "SubmissionListItem",
+        "SubmissionListResponse",
+        "SubmissionBatchCreateResponse",
+    ),
+}
 
-# Organizer
-from src.models.organizer import (
-    OrganizerCreate,
-    OrganizerCreateResponse,
-    OrganizerLogin,
-    OrganizerLoginResponse,
-    OrganizerRecord,
-    OrganizerResponse,
-)
+_MODULE_FOR_NAME = {name: module for module, names in _EXPORTS.items() for name in names}
 
-# Scores
-from src.models.scores import (
-    AGENT_RESPONSE_MODELS,
-    AIDetectionEvidence,
-    AIDetectionResponse,
-    AIDetectionScores,
-    BaseAgentResponse,
-    BugHunterEvidence,
-    BugHunterResponse,
-    BugHunterScores,
-    CIObservations,
-    CommitAnalysis,
-    InnovationEvidence,
-    InnovationResponse,
-    InnovationScores,
-    PerformanceCIObservations,
-    PerformanceEvidence,
-    PerformanceResponse,
-    PerformanceScores,
-    TechStackAssessment,
-)
+__all__ = list(_MODULE_FOR_NAME)
 
-# Submission
-from src.models.submission import (
-    RepoMeta,
-    SubmissionBatchCreate,
-    SubmissionBatchCreateResponse,
-    SubmissionInput,
-    SubmissionListItem,
-    SubmissionListResponse,
-    SubmissionResponse,
-    WeightedDimensionScore,
-)
 
-__all__ = [
-    # Common
-    "HackathonStatus",
-    "SubmissionStatus",
-    "JobStatus",
-    "AgentName",
-    "AIPolicyMode",
-    "Tier",
-    "Severity",
-    "Recommendation",
-    "ServiceTier",
-    "VibeJudgeBase",
-    "TimestampMixin",
-    # Organizer
-    "OrganizerCreate",
-    "OrganizerLogin",
-    "OrganizerResponse",
-    "OrganizerCreateResponse",
-    "OrganizerLoginResponse",
-    "OrganizerRecord",
-    # Hackathon
-    "RubricDimension",
-    "RubricConfig",
-    "HackathonCreate",
-    "HackathonUpdate",
-    "HackathonResponse",
-    "HackathonListItem",
-    "HackathonListResponse",
-    # Submission
-    "SubmissionInput",
-    "SubmissionBatchCreate",
-    "RepoMeta",
-    "WeightedDimensionScore",
-    "SubmissionResponse",
-    "SubmissionListItem",
-    "SubmissionListResponse",
-    "SubmissionBatchCreateResponse",
-    # Scores
-    "BugHunterEvidence",
-    "PerformanceEvidence",
-    "InnovationEvidence",
-    "AIDetectionEvidence",
-    "CIObservations",
-    "PerformanceCIObservations",
-    "TechStackAssessment",
-    "CommitAnalysis",
-    "BaseAgentResponse",
-    "BugHunterScores",
-    "BugHunterResponse",
-    "PerformanceScores",
-    "PerformanceResponse",
-    "InnovationScores",
-    "InnovationResponse",
-    "AIDetectionScores",
-    "AIDetectionResponse",
-    "AGENT_RESPONSE_MODELS",
-    # Costs
-    "CostRecord",
-    "BudgetInfo",
-    "SubmissionCostResponse",
-    "HackathonCostResponse",
-    "CostRange",
-    "AgentCostEstimate",
-    "BudgetCheck",
-    "CostEstimateDetail",
-    "CostEstimate",
-    # Analysis
-    "AnalysisTrigger",
-    "AnalysisJobResponse",
-    "AnalysisProgress",
-    "AnalysisCurrentSubmission",
-    "AnalysisError",
-    "AnalysisStatusResponse",
-    "SourceFile",
-    "CommitInfo",
-    "DiffEntry",
-    "WorkflowRun",
-    "RepoData",
-    # Leaderboard
-    "LeaderboardEntry",
-    "LeaderboardStats",
-    "LeaderboardHackathonInfo",
-    "LeaderboardResponse",
-    # Errors
-    "ErrorDetail",
-    "ErrorResponse",
-]
+def __getattr__(name: str) -> Any:
+    """Import an exported name's submodule on first access (PEP 562)."""
+    module = _MODULE_FOR_NAME.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
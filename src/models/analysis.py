@@ -1,6 +1,7 @@
 """Analysis job and orchestration models."""
 
 from datetime import datetime
+from typing import Any
 
 from pydantic import Field
 
@@ -36,6 +37,14 @@ class AnalysisJobResponse(VibeJudgeBase):
     created_at: datetime
 
 
+class AnalysisJobListResponse(VibeJudgeBase):
+    """GET /api/v1/hackathons/{hack_id}/analyze/jobs"""
+
+    jobs: list[AnalysisJobResponse]
+    next_cursor: str | None = None
+    has_more: bool = False
+
+
 class AnalysisProgress(VibeJudgeBase):
     """Detailed progress information."""
 
@@ -142,6 +151,9 @@ class RepoData(VibeJudgeBase):
     readme_content: str = ""
     source_files: list[SourceFile] = Field(default_factory=list)
     commit_history: list[CommitInfo] = Field(default_factory=list)
+    # src.analysis.authorship_index.AuthorshipIndex built alongside commit_history.
+    # Typed loosely so API imports of the models stay free of src.analysis.
+    authorship: Any = Field(default=None, exclude=True, repr=False)
     diff_summary: list[DiffEntry] = Field(default_factory=list)
     workflow_definitions: list[str] = Field(default_factory=list)
     workflow_runs: list[WorkflowRun] = Field(default_factory=list)
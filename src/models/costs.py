@@ -20,6 +20,7 @@ class CostRecord(VibeJudgeBase):
     service_tier: ServiceTier = ServiceTier.STANDARD
     cache_read_tokens: int = 0
     cache_write_tokens: int = 0
+    hedge: bool = False  # Request that lost a hedged call of the agent
 
 
 class ComponentPerformanceRecord(VibeJudgeBase):
@@ -40,6 +41,23 @@ class ComponentPerformanceRecord(VibeJudgeBase):
     error_message: str | None = None
 
 
+class StageTiming(VibeJudgeBase):
+    """When one orchestrator stage ran, relative to the start of the submission.
+
+    Stages run concurrently, so comparing start/end offsets shows how much
+    of the deterministic analysis was hidden behind the agents' Bedrock calls.
+    """
+
+    stage: str  # e.g. actions_analyzer, team_analyzer, agent:bug_hunter
+    start_ms: float
+    end_ms: float
+
+    @property
+    def duration_ms(self) -> float:
+        """Wall time of the stage in milliseconds."""
+        return self.end_ms - self.start_ms
+
+
 class BudgetInfo(VibeJudgeBase):
     """Budget utilization info."""
 
@@ -3,7 +3,7 @@
 from pydantic import Field
 
 from src.models.common import VibeJudgeBase
-from src.models.team_dynamics import IndividualScorecard
+from src.models.team_dynamics import ContributorRole
 
 # ============================================================
 # DASHBOARD MODELS
@@ -20,14 +20,25 @@ class TopPerformer(VibeJudgeBase):
     sponsor_interest_flags: list[str] = Field(default_factory=list)
 
 
+class HiringCandidate(VibeJudgeBase):
+    """Hiring candidate summary (full scorecard: /submissions/{sub_id}/individual-scorecards)."""
+
+    sub_id: str
+    team_name: str = ""
+    contributor_name: str
+    role: ContributorRole
+    seniority_level: str = ""  # junior | mid | senior
+    must_interview: bool = False
+
+
 class HiringIntelligence(VibeJudgeBase):
     """Hiring intelligence by role."""
 
-    backend_candidates: list[IndividualScorecard] = Field(default_factory=list)
-    frontend_candidates: list[IndividualScorecard] = Field(default_factory=list)
-    devops_candidates: list[IndividualScorecard] = Field(default_factory=list)
-    full_stack_candidates: list[IndividualScorecard] = Field(default_factory=list)
-    must_interview: list[IndividualScorecard] = Field(default_factory=list)
+    backend_candidates: list[HiringCandidate] = Field(default_factory=list)
+    frontend_candidates: list[HiringCandidate] = Field(default_factory=list)
+    devops_candidates: list[HiringCandidate] = Field(default_factory=list)
+    full_stack_candidates: list[HiringCandidate] = Field(default_factory=list)
+    must_interview: list[HiringCandidate] = Field(default_factory=list)
 
 
 class TechnologyTrends(VibeJudgeBase):
@@ -146,3 +146,5 @@ class PublicHackathonListResponse(VibeJudgeBase):
     """GET /api/v1/public/hackathons"""
 
     hackathons: list[PublicHackathonInfo]
+    next_cursor: str | None = None
+    has_more: bool = False
@@ -194,7 +194,9 @@ class SecurityEvent(VibeJudgeBase):
     """Security event log for monitoring and incident response."""
 
     event_id: str = Field(description="ULID identifier")
-    event_type: str = Field(description="auth_failure | rate_limit | budget_exceeded | anomaly")
+    event_type: str = Field(
+        description="auth_failure | rate_limit | budget_exceeded | server_error | anomaly"
+    )
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
     # Request context
@@ -223,8 +225,8 @@ class SecurityEvent(VibeJudgeBase):
     @field_validator("event_type")
     @classmethod
     def validate_event_type(cls, v: str) -> str:
-        """Ensure event_type is one of: auth_failure, rate_limit, budget_exceeded, anomaly."""
-        valid_types = ["auth_failure", "rate_limit", "budget_exceeded", "anomaly"]
+        """Ensure event_type is one of the supported security event types."""
+        valid_types = ["auth_failure", "rate_limit", "budget_exceeded", "server_error", "anomaly"]
         if v not in valid_types:
             raise ValueError(f"event_type must be one of: {', '.join(valid_types)}")
         return v
@@ -113,12 +113,23 @@ class SubmissionListResponse(VibeJudgeBase):
     has_more: bool = False
 
 
+class SubmissionRowError(VibeJudgeBase):
+    """A submission row that was not created."""
+
+    row: int = Field(..., description="1-based row (line for JSONL) in the request")
+    team_name: str | None = None
+    repo_url: str | None = None
+    error: str
+
+
 class SubmissionBatchCreateResponse(VibeJudgeBase):
     """POST /api/v1/hackathons/{hack_id}/submissions response."""
 
     created: int
     submissions: list[SubmissionListItem]
     hackathon_submission_count: int
+    rejected: int = 0
+    errors: list[SubmissionRowError] = Field(default_factory=list)
 
 
 # --- Scorecard Models ---
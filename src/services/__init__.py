@@ -1,20 +1,34 @@
 """VibeJudge AI — Service Layer.
 
 Business logic layer that orchestrates between API routes and data/AI layers.
+
+Services are imported on first attribute access, so the API does not load
+rarely used services (organizer intelligence, costs) at startup.
 """
 
-from src.services.analysis_service import AnalysisService
-from src.services.cost_service import CostService
-from src.services.hackathon_service import HackathonService
-from src.services.organizer_intelligence_service import OrganizerIntelligenceService
-from src.services.organizer_service import OrganizerService
-from src.services.submission_service import SubmissionService
-
-__all__ = [
-    "OrganizerService",
-    "HackathonService",
-    "SubmissionService",
-    "AnalysisService",
-    "CostService",
-    "OrganizerIntelligenceService",
-]
+import importlib
+from typing import Any
+
+# Submodule -> names it exports
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    "analysis_service": ("AnalysisService",),
+    "cost_service": ("CostService",),
+    "hackathon_service": ("HackathonService",),
+    "organizer_intelligence_service": ("OrganizerIntelligenceService",),
+    "organizer_service": ("OrganizerService",),
+    "submission_service": ("SubmissionService",),
+}
+
+_MODULE_FOR_NAME = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_MODULE_FOR_NAME)
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name's submodule on first access (PEP 562)."""
+    module = _MODULE_FOR_NAME.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
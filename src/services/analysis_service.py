@@ -2,18 +2,28 @@
 
 import json
 import os
-from datetime import UTC, datetime
+import time
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
-import boto3
 from botocore.exceptions import ClientError
 
-from src.constants import COST_PER_SUBMISSION
-from src.models.analysis import AnalysisJobResponse
+from src.constants import (
+    ANALYSIS_JOB_EXPIRY_SECONDS,
+    ANALYZER_INVOKE_ATTEMPTS,
+    ANALYZER_INVOKE_RETRY_SECONDS,
+    ANALYZER_SHARD_SIZE,
+    COST_PER_SUBMISSION,
+)
+from src.models.analysis import AnalysisJobListResponse, AnalysisJobResponse
 from src.models.common import JobStatus, SubmissionStatus
-from src.utils.dynamo import DynamoDBHelper
+from src.services.budget_service import BudgetReservation, BudgetService
+from src.utils.clients import get_aws_client
+from src.utils.dynamo import DynamoDBHelper, decode_cursor, encode_cursor
 from src.utils.id_gen import generate_job_id
 from src.utils.logging import get_logger
+from src.utils.tracing import summarize_durations
+from src.utils.work_queue import WorkQueue, get_work_queue
 
 logger = get_logger(__name__)
 
@@ -29,31 +39,46 @@ class AnalysisService:
         """
         self.db = db
         self._lambda_client = None
+        self._work_queue: WorkQueue | None = None
 
     @property
     def lambda_client(self) -> Any:
         """Lazy-load Lambda client."""
         if self._lambda_client is None:
-            region = os.environ.get("AWS_REGION", "us-east-1")
-            self._lambda_client = boto3.client("lambda", region_name=region)
+            self._lambda_client = get_aws_client("lambda")
         return self._lambda_client
 
+    @property
+    def work_queue(self) -> WorkQueue | None:
+        """Lazy-load the analysis work queue (None unless ANALYSIS_QUEUE_URL is set)."""
+        if self._work_queue is None:
+            queue_url = os.environ.get("ANALYSIS_QUEUE_URL")
+            if queue_url:
+                self._work_queue = get_work_queue(queue_url)
+        return self._work_queue
+
     def trigger_analysis(
         self,
         hack_id: str,
         submission_ids: list[str] | None = None,
+        budget_reservation: dict | None = None,
     ) -> AnalysisJobResponse:
         """Trigger analysis for submissions.
 
         Args:
             hack_id: Hackathon ID
             submission_ids: Optional list of submission IDs (None = all pending)
+            budget_reservation: Spend reserved by the budget middleware, kept on
+                the job and reconciled with the actual cost when it completes
 
         Returns:
             Analysis job response
 
         Raises:
             ValueError: If estimated cost exceeds budget limit
+            RuntimeError: If the job could not be created, or a fan-out shard
+                could not be started or a submission enqueued (the job is then
+                marked failed)
         """
         job_id = generate_job_id()
         now = datetime.now(UTC)
@@ -87,49 +112,43 @@ class AnalysisService:
                 f"Estimated cost ${estimated_cost:.2f} exceeds budget limit ${budget_limit:.2f}"
             )
 
+        # Nothing to analyze: the job is complete as soon as it is recorded,
+        # since no analyzer invocation or worker would ever finalize it
+        empty = not submission_ids
+
         # Atomic conditional write to prevent concurrent analysis
         # This ensures only one analysis job can be created at a time
-        try:
-            self.db.table.update_item(
-                Key={"PK": f"HACK#{hack_id}", "SK": "META"},
-                UpdateExpression="SET analysis_status = :in_progress",
-                ConditionExpression="attribute_not_exists(analysis_status) OR analysis_status = :not_started",
-                ExpressionAttributeValues={
-                    ":in_progress": "in_progress",
-                    ":not_started": "not_started",
-                },
-            )
-        except ClientError as e:
-            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
-                logger.warning(
-                    "concurrent_analysis_prevented",
-                    hackathon_id=hack_id,
-                    message="Analysis already in progress",
-                )
-                raise ValueError("Analysis already in progress") from None
-            raise
+        if not empty:
+            self._lock_hackathon_analysis(hack_id)
+
+        # Fan-out: split large jobs into shards, one analyzer invocation each
+        shards = self._split_into_shards(submission_ids, self._shard_size())
 
         # Create analysis job record
-        job_record = {
+        status = JobStatus.COMPLETED if empty else JobStatus.QUEUED
+        job_record: dict[str, Any] = {
             "PK": f"HACK#{hack_id}",
             "SK": f"JOB#{job_id}",
             "entity_type": "ANALYSIS_JOB",
             "job_id": job_id,
             "hack_id": hack_id,
-            "status": JobStatus.QUEUED.value,
+            "status": status.value,
             "submission_ids": submission_ids,
             "total_submissions": len(submission_ids),
             "completed_submissions": 0,
             "failed_submissions": 0,
             "total_cost_usd": 0.0,
             "started_at": None,
-            "completed_at": None,
+            "completed_at": now.isoformat() if empty else None,
             "error_message": None,
-            "GSI2PK": f"JOB_STATUS#{JobStatus.QUEUED.value}",
+            "shard_count": len(shards),
+            "GSI2PK": f"JOB_STATUS#{status.value}",
             "GSI2SK": now.isoformat(),
             "created_at": now.isoformat(),
             "updated_at": now.isoformat(),
         }
+        if budget_reservation and not empty:
+            job_record["budget_reservation"] = budget_reservation
 
         success = self.db.put_analysis_job(job_record)
         if not success:
@@ -143,55 +162,363 @@ class AnalysisService:
             submission_count=len(submission_ids),
         )
 
-        # Invoke Analyzer Lambda asynchronously
-        lambda_function_name = os.environ.get("ANALYZER_LAMBDA_FUNCTION_NAME")
-
-        if lambda_function_name:
-            try:
+        # Queue mode: one message per submission, pulled by analyzer workers.
+        # Otherwise invoke the Analyzer Lambda (once per shard in fan-out mode).
+        if empty:
+            if budget_reservation:
+                BudgetService(self.db).release(BudgetReservation.from_record(budget_reservation))
+        elif self.work_queue is not None:
+            for index, sub_id in enumerate(submission_ids):
+                try:
+                    self.work_queue.send({"job_id": job_id, "hack_id": hack_id, "sub_id": sub_id})
+                except Exception as e:
+                    # As with a shard that cannot start: workers skip messages
+                    # already sent for the failed job, and the request's failure
+                    # response releases the reservation.
+                    error = f"Failed to enqueue submission {index + 1} of {len(submission_ids)}"
+                    logger.error("analysis_job_enqueue_failed", job_id=job_id, error=str(e))
+                    self.db.take_job_budget_reservation(hack_id, job_id)
+                    self.update_job_status(
+                        hack_id=hack_id,
+                        job_id=job_id,
+                        status=JobStatus.FAILED,
+                        error_message=error,
+                        completed_at=datetime.now(UTC),
+                    )
+                    raise RuntimeError(error) from e
+            logger.info("analysis_job_enqueued", job_id=job_id, messages=len(submission_ids))
+        elif len(shards) > 1:
+            for shard_index, shard_ids in enumerate(shards):
                 payload = {
                     "job_id": job_id,
                     "hack_id": hack_id,
-                    "submission_ids": submission_ids,
+                    "submission_ids": shard_ids,
+                    "shard_index": shard_index,
+                    "shard_count": len(shards),
                 }
-
-                response = self.lambda_client.invoke(
-                    FunctionName=lambda_function_name,
-                    InvocationType="Event",  # Async invocation
-                    Payload=json.dumps(payload),
-                )
-
-                logger.info(
-                    "analyzer_lambda_invoked",
-                    job_id=job_id,
-                    status_code=response["StatusCode"],
-                )
-            except Exception as e:
-                logger.error(
-                    "analyzer_lambda_invocation_failed",
-                    job_id=job_id,
-                    error=str(e),
-                )
-                # Don't fail the request - job is created, can be retried
+                if not self._invoke_shard(payload):
+                    # The job can never finalize without this shard. The
+                    # reservation goes back to the request, whose failure
+                    # response makes the budget middleware release it.
+                    error = f"Failed to start analysis shard {shard_index + 1} of {len(shards)}"
+                    self.db.take_job_budget_reservation(hack_id, job_id)
+                    self.update_job_status(
+                        hack_id=hack_id,
+                        job_id=job_id,
+                        status=JobStatus.FAILED,
+                        error_message=error,
+                        completed_at=datetime.now(UTC),
+                    )
+                    raise RuntimeError(error)
+            logger.info("analysis_job_fanned_out", job_id=job_id, shard_count=len(shards))
         else:
-            logger.warning(
-                "analyzer_lambda_not_configured",
-                job_id=job_id,
-                message="Set ANALYZER_LAMBDA_FUNCTION_NAME env var to enable Lambda invocation",
+            self.invoke_analyzer(
+                {
+                    "job_id": job_id,
+                    "hack_id": hack_id,
+                    "submission_ids": submission_ids,
+                }
             )
 
         return AnalysisJobResponse(
             job_id=job_id,
             hack_id=hack_id,
-            status=JobStatus.QUEUED,
+            status=status,
             total_submissions=len(submission_ids),
             completed_submissions=0,
             failed_submissions=0,
             estimated_cost_usd=len(submission_ids) * COST_PER_SUBMISSION,
             started_at=None,
-            completed_at=None,
+            completed_at=now if empty else None,
             created_at=now,
         )
 
+    def _lock_hackathon_analysis(self, hack_id: str) -> None:
+        """Mark a hackathon's analysis in progress unless a job already runs.
+
+        Args:
+            hack_id: Hackathon ID
+
+        Raises:
+            ValueError: If an analysis is already in progress
+        """
+        try:
+            self.db.table.update_item(
+                Key={"PK": f"HACK#{hack_id}", "SK": "META"},
+                UpdateExpression="SET analysis_status = :in_progress",
+                ConditionExpression="attribute_not_exists(analysis_status) OR analysis_status = :not_started",
+                ExpressionAttributeValues={
+                    ":in_progress": "in_progress",
+                    ":not_started": "not_started",
+                },
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                logger.warning(
+                    "concurrent_analysis_prevented",
+                    hackathon_id=hack_id,
+                    message="Analysis already in progress",
+                )
+                raise ValueError("Analysis already in progress") from None
+            raise
+
+    def _invoke_shard(self, payload: dict) -> bool:
+        """Invoke the analyzer for one fan-out shard, retrying with backoff.
+
+        Args:
+            payload: Shard event
+
+        Returns:
+            True if an invocation was accepted within ANALYZER_INVOKE_ATTEMPTS
+        """
+        for attempt in range(ANALYZER_INVOKE_ATTEMPTS):
+            if attempt:
+                time.sleep(ANALYZER_INVOKE_RETRY_SECONDS * 2 ** (attempt - 1))
+            if self.invoke_analyzer(payload):
+                return True
+        return False
+
+    @staticmethod
+    def _shard_size() -> int:
+        """Get the fan-out shard size (0 = single invocation per job)."""
+        try:
+            return max(0, int(os.environ.get("ANALYZER_SHARD_SIZE", ANALYZER_SHARD_SIZE)))
+        except ValueError:
+            return ANALYZER_SHARD_SIZE
+
+    @staticmethod
+    def _split_into_shards(submission_ids: list[str], shard_size: int) -> list[list[str]]:
+        """Split submission IDs into consecutive shards of at most shard_size.
+
+        Args:
+            submission_ids: Submission IDs for the job
+            shard_size: Maximum submissions per shard (0 = no sharding)
+
+        Returns:
+            List of shards (a single shard when sharding is disabled)
+        """
+        if shard_size <= 0 or len(submission_ids) <= shard_size:
+            return [submission_ids]
+        return [
+            submission_ids[i : i + shard_size] for i in range(0, len(submission_ids), shard_size)
+        ]
+
+    def complete_shard(self, hack_id: str, job_id: str, shard_index: int) -> bool:
+        """Record a finished shard and decide whether this caller finalizes the job.
+
+        Args:
+            hack_id: Hackathon ID
+            job_id: Job ID
+            shard_index: Index of the shard that finished
+
+        Returns:
+            True exactly once per job: for the caller that completed the last shard
+        """
+        job = self.db.record_job_shard_completed(hack_id, job_id, shard_index)
+        if not job:
+            return False
+
+        done = len(job.get("completed_shards") or [])
+        total = int(job.get("shard_count") or 1)
+        logger.info(
+            "analysis_shard_completed",
+            job_id=job_id,
+            shard_index=shard_index,
+            shards_done=done,
+            shard_count=total,
+        )
+        if done < total:
+            return False
+        return self.db.claim_job_finalization(hack_id, job_id)
+
+    def claim_drained_job(self, hack_id: str, job_id: str) -> bool:
+        """Decide whether this caller finalizes a job processed item by item.
+
+        Used by queue workers, where there is no "last invocation": the job
+        is drained once every submission has a recorded outcome.
+
+        Args:
+            hack_id: Hackathon ID
+            job_id: Job ID
+
+        Returns:
+            True exactly once per job: for the first caller to see it drained
+        """
+        job = self.db.get_analysis_job(hack_id, job_id)
+        if not job:
+            return False
+
+        processed = int(job.get("completed_submissions", 0)) + int(job.get("failed_submissions", 0))
+        if processed < int(job.get("total_submissions", 0)):
+            return False
+        return self.db.claim_job_finalization(hack_id, job_id)
+
+    def invoke_analyzer(self, payload: dict, function_name: str | None = None) -> bool:
+        """Invoke the Analyzer Lambda asynchronously.
+
+        Failures are logged, not raised: the job record already exists and
+        can be retried.
+
+        Args:
+            payload: Analyzer event (job_id, hack_id, submission_ids, ...)
+            function_name: Lambda function name (defaults to ANALYZER_LAMBDA_FUNCTION_NAME)
+
+        Returns:
+            True if the invocation was accepted
+        """
+        job_id = payload.get("job_id")
+        lambda_function_name = function_name or os.environ.get("ANALYZER_LAMBDA_FUNCTION_NAME")
+
+        if not lambda_function_name:
+            logger.warning(
+                "analyzer_lambda_not_configured",
+                job_id=job_id,
+                message="Set ANALYZER_LAMBDA_FUNCTION_NAME env var to enable Lambda invocation",
+            )
+            return False
+
+        try:
+            response = self.lambda_client.invoke(
+                FunctionName=lambda_function_name,
+                InvocationType="Event",  # Async invocation
+                Payload=json.dumps(payload),
+            )
+
+            logger.info(
+                "analyzer_lambda_invoked",
+                job_id=job_id,
+                status_code=response["StatusCode"],
+            )
+            return True
+        except Exception as e:
+            logger.error(
+                "analyzer_lambda_invocation_failed",
+                job_id=job_id,
+                error=str(e),
+            )
+            return False
+
+    def get_job_record(self, hack_id: str, job_id: str) -> dict | None:
+        """Get the raw analysis job record.
+
+        Args:
+            hack_id: Hackathon ID
+            job_id: Job ID
+
+        Returns:
+            Job record dict or None if not found
+        """
+        return self.db.get_analysis_job(hack_id, job_id)
+
+    def record_submission_outcome(
+        self,
+        hack_id: str,
+        job_id: str,
+        sub_id: str,
+        succeeded: bool,
+        cost_usd: Any = 0,
+    ) -> bool:
+        """Checkpoint a processed submission on the job record.
+
+        Args:
+            hack_id: Hackathon ID
+            job_id: Job ID
+            sub_id: Submission ID
+            succeeded: Whether the submission completed (or was disqualified)
+            cost_usd: Analysis cost for the submission
+
+        Returns:
+            True if recorded, False if it was already recorded or the write failed
+        """
+        return self.db.record_job_submission_outcome(
+            hack_id=hack_id,
+            job_id=job_id,
+            sub_id=sub_id,
+            succeeded=succeeded,
+            cost_usd=cost_usd,
+        )
+
+    def record_trace_summary(
+        self, hack_id: str, job_id: str, sub_ids: list[str]
+    ) -> dict[str, dict[str, float]]:
+        """Store percentiles of the job's span durations on the job record.
+
+        Args:
+            hack_id: Hackathon ID
+            job_id: Job ID
+            sub_ids: Submissions processed by the job
+
+        Returns:
+            Per span name: count, percentiles and max duration in milliseconds
+            (empty if no submission was traced)
+        """
+        records = self.db.get_submission_span_durations(sub_ids)
+        summary = summarize_durations(r.get("span_durations") or {} for r in records)
+        if summary:
+            self.db.update_analysis_job(hack_id, job_id, trace_summary=summary)
+        return summary
+
+    def get_latest_job_record(self, hack_id: str) -> dict | None:
+        """Get the most recent raw analysis job record for a hackathon.
+
+        Args:
+            hack_id: Hackathon ID
+
+        Returns:
+            Job record dict or None if the hackathon has no jobs
+        """
+        return self.db.get_latest_analysis_job(hack_id)
+
+    def mark_current_submission(
+        self, hack_id: str, job_id: str, sub_id: str, team_name: str | None = None
+    ) -> bool:
+        """Record which submission the analyzer is working on (for live progress).
+
+        Args:
+            hack_id: Hackathon ID
+            job_id: Job ID
+            sub_id: Submission ID being analyzed
+            team_name: Team name for display
+
+        Returns:
+            True if updated
+        """
+        return self.db.update_analysis_job(
+            hack_id,
+            job_id,
+            current_sub_id=sub_id,
+            current_team_name=team_name,
+            updated_at=datetime.now(UTC).isoformat(),
+        )
+
+    @staticmethod
+    def progress_snapshot(job_record: dict) -> dict[str, Any]:
+        """Build a JSON-safe progress view of a job record.
+
+        Args:
+            job_record: Raw analysis job record
+
+        Returns:
+            Progress dict (counts, percent, cost so far, current submission)
+        """
+        total = int(job_record.get("total_submissions", 0))
+        completed = int(job_record.get("completed_submissions", 0))
+        failed = int(job_record.get("failed_submissions", 0))
+        status = job_record.get("status", JobStatus.QUEUED.value)
+        running = status in (JobStatus.QUEUED.value, JobStatus.RUNNING.value)
+        return {
+            "job_id": job_record.get("job_id"),
+            "status": status,
+            "total_submissions": total,
+            "completed": completed,
+            "failed": failed,
+            "remaining": max(0, total - completed - failed),
+            "percent_complete": round(completed / total * 100, 1) if total else 0.0,
+            "cost_usd": float(job_record.get("total_cost_usd", 0) or 0),
+            "current_sub_id": job_record.get("current_sub_id") if running else None,
+            "current_team_name": job_record.get("current_team_name") if running else None,
+        }
+
     def get_analysis_status(self, hack_id: str, job_id: str) -> AnalysisJobResponse | None:
         """Get analysis job status.
 
@@ -202,16 +529,59 @@ class AnalysisService:
         Returns:
             Analysis job response or None if not found
         """
-        # Query for job record
-        jobs = self.db.list_analysis_jobs(hack_id)
-        job_record = next(
-            (j for j in jobs if j.get("job_id") == job_id),
-            None,
-        )
+        job_record = self.db.get_analysis_job(hack_id, job_id)
 
         if not job_record:
             return None
 
+        return self._to_job_response(job_record)
+
+    def list_analysis_jobs(self, hack_id: str) -> list[AnalysisJobResponse]:
+        """List analysis jobs for hackathon.
+
+        Args:
+            hack_id: Hackathon ID
+
+        Returns:
+            List of analysis job responses
+        """
+        records = self.db.list_analysis_jobs(hack_id)
+
+        return [self._to_job_response(r) for r in records]
+
+    def list_analysis_jobs_page(
+        self,
+        hack_id: str,
+        limit: int = 20,
+        cursor: str | None = None,
+    ) -> AnalysisJobListResponse:
+        """List analysis job history for a hackathon, newest first.
+
+        Args:
+            hack_id: Hackathon ID
+            limit: Page size
+            cursor: Cursor from the previous page
+
+        Returns:
+            Page of analysis jobs with the cursor for the next page
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        records, last_key = self.db.list_analysis_jobs_page(
+            hack_id, limit=limit, exclusive_start_key=decode_cursor(cursor)
+        )
+        next_cursor = encode_cursor(last_key)
+
+        return AnalysisJobListResponse(
+            jobs=[self._to_job_response(r) for r in records],
+            next_cursor=next_cursor,
+            has_more=next_cursor is not None,
+        )
+
+    @staticmethod
+    def _to_job_response(job_record: dict) -> AnalysisJobResponse:
+        """Convert a raw job record to an API response."""
         return AnalysisJobResponse(
             job_id=job_record["job_id"],
             hack_id=job_record["hack_id"],
@@ -229,35 +599,6 @@ class AnalysisService:
             created_at=datetime.fromisoformat(job_record["created_at"]),
         )
 
-    def list_analysis_jobs(self, hack_id: str) -> list[AnalysisJobResponse]:
-        """List analysis jobs for hackathon.
-
-        Args:
-            hack_id: Hackathon ID
-
-        Returns:
-            List of analysis job responses
-        """
-        records = self.db.list_analysis_jobs(hack_id)
-
-        return [
-            AnalysisJobResponse(
-                job_id=r["job_id"],
-                hack_id=r["hack_id"],
-                status=JobStatus(r["status"]),
-                total_submissions=r["total_submissions"],
-                completed_submissions=r.get("completed_submissions", 0),
-                failed_submissions=r.get("failed_submissions", 0),
-                estimated_cost_usd=r.get("total_cost_usd", 0.0),
-                started_at=datetime.fromisoformat(r["started_at"]) if r.get("started_at") else None,
-                completed_at=datetime.fromisoformat(r["completed_at"])
-                if r.get("completed_at")
-                else None,
-                created_at=datetime.fromisoformat(r["created_at"]),
-            )
-            for r in records
-        ]
-
     def update_job_status(
         self,
         hack_id: str,
@@ -276,31 +617,75 @@ class AnalysisService:
         Returns:
             True if successful
         """
-        jobs = self.db.list_analysis_jobs(hack_id)
-        job_record = next(
-            (j for j in jobs if j.get("job_id") == job_id),
-            None,
-        )
+        fields: dict[str, Any] = {
+            "status": status.value,
+            "updated_at": datetime.now(UTC).isoformat(),
+            "GSI2PK": f"JOB_STATUS#{status.value}",
+        }
+        fields.update(kwargs)
 
-        if not job_record:
-            return False
+        # Only the given fields are set, so progress counters written by the
+        # analyzer's per-submission checkpoints are preserved.
+        updated = self.db.update_analysis_job(hack_id, job_id, **fields)
+
+        # Reset hackathon analysis_status and settle the reserved spend when
+        # the job completes or fails
+        if updated and status in [JobStatus.COMPLETED, JobStatus.FAILED]:
+            self._reset_hackathon_analysis_status(hack_id)
+            self.settle_budget_reservation(hack_id, job_id)
 
-        job_record["status"] = status.value
-        job_record["updated_at"] = datetime.now(UTC).isoformat()
-        job_record["GSI2PK"] = f"JOB_STATUS#{status.value}"
+        return updated
 
-        for key, value in kwargs.items():
-            if value is not None:
-                if isinstance(value, datetime):
-                    job_record[key] = value.isoformat()
-                else:
-                    job_record[key] = value
+    def settle_budget_reservation(self, hack_id: str, job_id: str) -> None:
+        """Replace a finished job's reserved spend with its actual cost.
 
-        # Reset hackathon analysis_status when job completes or fails
-        if status in [JobStatus.COMPLETED, JobStatus.FAILED]:
-            self._reset_hackathon_analysis_status(hack_id)
+        The reservation is taken off the job item atomically, so it is
+        settled once even if the job is both completed and failed (e.g. by
+        the expiry sweep).
 
-        return self.db.put_analysis_job(job_record)
+        Args:
+            hack_id: Hackathon ID
+            job_id: Job ID
+        """
+        record = self.db.take_job_budget_reservation(hack_id, job_id)
+        if not record:
+            return
+        job = self.get_job_record(hack_id, job_id) or {}
+        try:
+            BudgetService(self.db).reconcile(
+                BudgetReservation.from_record(record), job.get("total_cost_usd", 0)
+            )
+        except Exception as e:
+            logger.error("budget_settlement_failed", job_id=job_id, error=str(e))
+
+    def expire_stale_jobs(self, max_age_seconds: float = ANALYSIS_JOB_EXPIRY_SECONDS) -> int:
+        """Fail jobs that have been queued or running for too long.
+
+        A job whose analyzer invocations all died never finalizes, which
+        would hold its budget reservation and the hackathon's analysis lock
+        forever. Failing it settles both.
+
+        Args:
+            max_age_seconds: Age after which an unfinished job is expired
+
+        Returns:
+            Number of jobs expired
+        """
+        now = datetime.now(UTC)
+        cutoff = (now - timedelta(seconds=max_age_seconds)).isoformat()
+        expired = 0
+        for status in (JobStatus.QUEUED, JobStatus.RUNNING):
+            for job in self.db.list_jobs_by_status(status.value, created_before=cutoff):
+                if self.update_job_status(
+                    hack_id=job["hack_id"],
+                    job_id=job["job_id"],
+                    status=JobStatus.FAILED,
+                    error_message=f"Job expired after {max_age_seconds / 3600:g} hours",
+                    completed_at=now,
+                ):
+                    expired += 1
+                    logger.warning("analysis_job_expired", job_id=job["job_id"])
+        return expired
 
     def _reset_hackathon_analysis_status(self, hack_id: str) -> None:
         """Reset hackathon analysis_status to allow new analysis jobs.
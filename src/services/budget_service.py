@@ -0,0 +1,245 @@
+"""Budget service — atomic spend reservation and reconciliation.
+
+Analysis requests reserve their estimated cost against the API key and
+hackathon budgets before they run. Each level is one conditional update
+("reserve if current + estimate <= limit"), so concurrent requests cannot
+both slip under a limit. A request that fails releases its reservation;
+a job that completes replaces the reservation with its actual cost.
+
+Limits come from the API key record already loaded by the rate limiter and
+from the hackathon record, cached in process for a short TTL.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.constants import (
+    BUDGET_ALERT_THRESHOLDS,
+    BUDGET_LIMIT_CACHE_TTL_SECONDS,
+    COST_PER_SUBMISSION,
+)
+from src.utils.dynamo import DynamoDBHelper
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class BudgetReservation:
+    """Spend reserved for one request across budget levels."""
+
+    amount: float
+    levels: list[tuple[str, str]] = field(default_factory=list)
+
+    def to_record(self) -> dict[str, Any]:
+        """Serialize for storage on the analysis job item."""
+        return {
+            "amount": str(self.amount),
+            "levels": [{"entity_type": t, "entity_id": i} for t, i in self.levels],
+        }
+
+    @classmethod
+    def from_record(cls, record: dict[str, Any]) -> "BudgetReservation":
+        """Rebuild from a job item's ``budget_reservation`` attribute."""
+        return cls(
+            amount=float(record.get("amount", 0)),
+            levels=[(lv["entity_type"], lv["entity_id"]) for lv in record.get("levels", [])],
+        )
+
+
+@dataclass
+class BudgetDecision:
+    """Outcome of a reservation attempt."""
+
+    allowed: bool
+    reservation: BudgetReservation | None = None
+    level: str | None = None
+    limit: float | None = None
+    current: float | None = None
+    message: str | None = None
+
+
+@dataclass
+class _HackathonBudget:
+    limit: float | None
+    submission_count: int
+    fetched_at: float
+
+
+class BudgetService:
+    """Service for reserving and reconciling spend against budget limits."""
+
+    def __init__(
+        self,
+        db: DynamoDBHelper,
+        cache_ttl_seconds: float = BUDGET_LIMIT_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize budget service.
+
+        Args:
+            db: DynamoDB helper instance
+            cache_ttl_seconds: Seconds hackathon limits are cached
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.db = db
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._hackathons: dict[str, _HackathonBudget] = {}
+
+    def get_hackathon_budget(self, hack_id: str) -> tuple[float | None, int]:
+        """Get a hackathon's budget limit and submission count (cached).
+
+        Args:
+            hack_id: Hackathon ID
+
+        Returns:
+            Tuple of (budget limit or None, submission count)
+        """
+        now = self._clock()
+        with self._lock:
+            cached = self._hackathons.get(hack_id)
+        if cached and now - cached.fetched_at < self.cache_ttl_seconds:
+            return cached.limit, cached.submission_count
+
+        record = self.db.get_hackathon(hack_id) or {}
+        limit = record.get("budget_limit_usd")
+        entry = _HackathonBudget(
+            limit=float(limit) if limit is not None else None,
+            submission_count=int(record.get("submission_count", 0)),
+            fetched_at=now,
+        )
+        with self._lock:
+            self._hackathons[hack_id] = entry
+        return entry.limit, entry.submission_count
+
+    def estimate_analysis_cost(self, hack_id: str | None) -> float:
+        """Estimate the cost of analyzing a hackathon's submissions.
+
+        Args:
+            hack_id: Hackathon ID (None for a single submission)
+
+        Returns:
+            Estimated cost in USD
+        """
+        if not hack_id:
+            return COST_PER_SUBMISSION
+        _, submission_count = self.get_hackathon_budget(hack_id)
+        return round(submission_count * COST_PER_SUBMISSION, 6)
+
+    def reserve(
+        self,
+        api_key_id: str,
+        api_key_limit: float | None,
+        hack_id: str | None,
+        amount: float,
+    ) -> BudgetDecision:
+        """Reserve spend against the API key and hackathon budgets.
+
+        Levels are reserved in order; if a later level denies, earlier
+        reservations are released. A level without a positive limit is not
+        enforced. DynamoDB errors fail open, like the rate limiter.
+
+        Args:
+            api_key_id: API key ID
+            api_key_limit: API key budget limit in USD
+            hack_id: Hackathon ID if the request targets one
+            amount: Estimated cost in USD
+
+        Returns:
+            Budget decision (with the reservation when allowed)
+        """
+        amount = round(amount, 6)
+        levels: list[tuple[str, str, float | None]] = [("api_key", api_key_id, api_key_limit)]
+        if hack_id:
+            levels.append(("hackathon", hack_id, self.get_hackathon_budget(hack_id)[0]))
+
+        reservation = BudgetReservation(amount=amount)
+        for entity_type, entity_id, limit in levels:
+            if not limit or limit <= 0 or amount <= 0:
+                continue
+            try:
+                reserved, attributes = self.db.reserve_budget(entity_type, entity_id, amount, limit)
+            except Exception as e:
+                logger.error(
+                    "budget_reservation_failed",
+                    entity_type=entity_type,
+                    entity_id=entity_id,
+                    error=str(e),
+                )
+                continue
+
+            if not reserved:
+                self.release(reservation)
+                current = float(attributes.get("current_spend_usd", 0))
+                label = "API key" if entity_type == "api_key" else "Hackathon"
+                return BudgetDecision(
+                    allowed=False,
+                    level=entity_type,
+                    limit=limit,
+                    current=current,
+                    message=(
+                        f"{label} budget limit exceeded. Current: ${current:.4f}, "
+                        f"Limit: ${limit:.4f}"
+                    ),
+                )
+
+            reservation.levels.append((entity_type, entity_id))
+            self._send_alerts(entity_type, entity_id, attributes, limit)
+
+        return BudgetDecision(allowed=True, reservation=reservation)
+
+    def release(self, reservation: BudgetReservation) -> None:
+        """Return a reservation's spend (the request did not run).
+
+        Args:
+            reservation: Reservation to release
+        """
+        for entity_type, entity_id in reservation.levels:
+            self.db.adjust_budget_spend(
+                entity_type, entity_id, -reservation.amount, -reservation.amount
+            )
+        if reservation.levels:
+            logger.info("budget_reservation_released", amount=reservation.amount)
+
+    def reconcile(self, reservation: BudgetReservation, actual_cost: Any) -> None:
+        """Replace a reservation with the actual cost.
+
+        Args:
+            reservation: Reservation made when the job was triggered
+            actual_cost: Actual cost in USD
+        """
+        delta = float(actual_cost) - reservation.amount
+        for entity_type, entity_id in reservation.levels:
+            self.db.adjust_budget_spend(entity_type, entity_id, delta, -reservation.amount)
+        logger.info(
+            "budget_reservation_reconciled",
+            reserved=reservation.amount,
+            actual=float(actual_cost),
+            levels=len(reservation.levels),
+        )
+
+    def _send_alerts(
+        self, entity_type: str, entity_id: str, attributes: dict[str, Any], limit: float
+    ) -> None:
+        """Log an alert for each threshold newly reached (each sent once)."""
+        spend = float(attributes.get("current_spend_usd", 0))
+        usage_pct = spend / limit * 100
+        for threshold in BUDGET_ALERT_THRESHOLDS:
+            if usage_pct < threshold or attributes.get(f"alert_{threshold}_sent"):
+                continue
+            if not self.db.mark_budget_alert_sent(entity_type, entity_id, threshold):
+                continue
+            logger.warning(
+                "budget_alert",
+                entity_type=entity_type,
+                entity_id=entity_id,
+                threshold=threshold,
+                current_spend=spend,
+                budget_limit=limit,
+                usage_percentage=f"{usage_pct:.1f}%",
+            )
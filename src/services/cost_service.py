@@ -2,7 +2,7 @@
 
 from datetime import UTC, datetime
 
-from src.constants import AGENT_MODELS, MODEL_RATES
+from src.constants import AGENT_MODELS, HEDGE_COST_SUFFIX, MODEL_RATES
 from src.models.costs import (
     AgentCostEstimate,
     BudgetCheck,
@@ -37,6 +37,7 @@ class CostService:
         model_id: str,
         input_tokens: int,
         output_tokens: int,
+        hedge: bool = False,
     ) -> CostRecord:
         """Record cost for a single agent execution.
 
@@ -46,6 +47,8 @@ class CostService:
             model_id: Model ID used
             input_tokens: Input tokens
             output_tokens: Output tokens
+            hedge: Whether the request lost a hedged call (recorded under
+                ``<agent>:hedge``)
 
         Returns:
             Cost record
@@ -55,6 +58,8 @@ class CostService:
         """
         # Convert agent_name to string if it's an enum
         agent_name_str = agent_name.value if hasattr(agent_name, "value") else str(agent_name)
+        if hedge:
+            agent_name_str += HEDGE_COST_SUFFIX
 
         # Calculate cost
         rates = MODEL_RATES.get(model_id, {"input": 0, "output": 0})
@@ -1,7 +1,10 @@
 """Hackathon service — CRUD operations and validation."""
 
+import threading
+import time
 from datetime import UTC, datetime
 
+from src.constants import PUBLIC_HACKATHONS_CACHE_MAX_PAGES, PUBLIC_HACKATHONS_CACHE_TTL_SECONDS
 from src.models.common import HackathonStatus
 from src.models.hackathon import (
     HackathonCreate,
@@ -9,13 +12,25 @@ from src.models.hackathon import (
     HackathonListResponse,
     HackathonResponse,
     HackathonUpdate,
+    PublicHackathonInfo,
+    PublicHackathonListResponse,
 )
-from src.utils.dynamo import DynamoDBHelper
+from src.utils.dynamo import DynamoDBHelper, decode_cursor, encode_cursor
 from src.utils.id_gen import generate_hack_id
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Process-wide cache of public listing pages: (limit, cursor) -> (fetched_at, page)
+_public_pages: dict[tuple[int, str | None], tuple[float, PublicHackathonListResponse]] = {}
+_public_pages_lock = threading.Lock()
+
+
+def clear_public_listing_cache() -> None:
+    """Drop cached public listing pages (after a status or listing field change)."""
+    with _public_pages_lock:
+        _public_pages.clear()
+
 
 class HackathonService:
     """Service for hackathon operations."""
@@ -231,6 +246,7 @@ class HackathonService:
             logger.error("hackathon_update_failed", hack_id=hack_id)
             raise RuntimeError("Failed to update hackathon")
 
+        clear_public_listing_cache()
         logger.info("hackathon_updated", hack_id=hack_id)
 
         updated_hackathon = self.get_hackathon(hack_id)
@@ -258,6 +274,7 @@ class HackathonService:
 
         success = self.db.put_hackathon_detail(record)
         if success:
+            clear_public_listing_cache()
             logger.info("hackathon_deleted", hack_id=hack_id)
 
         return success
@@ -311,6 +328,7 @@ class HackathonService:
             logger.error("hackathon_activation_failed", hack_id=hack_id)
             raise RuntimeError("Failed to activate hackathon")
 
+        clear_public_listing_cache()
         logger.info("hackathon_activated", hack_id=hack_id, org_id=org_id)
 
         updated_hackathon = self.get_hackathon(hack_id)
@@ -321,55 +339,74 @@ class HackathonService:
     def increment_submission_count(self, hack_id: str) -> bool:
         """Increment submission count for hackathon.
 
+        One atomic ADD, so concurrent submissions are all counted.
+
         Args:
             hack_id: Hackathon ID
 
         Returns:
             True if successful
         """
-        record = self.db.get_hackathon(hack_id)
-        if not record:
-            return False
+        return self.db.add_submission_count(hack_id, 1) is not None
 
-        record["submission_count"] = record.get("submission_count", 0) + 1
-        record["updated_at"] = datetime.now(UTC).isoformat()
+    def list_public_hackathons(
+        self,
+        limit: int = 50,
+        cursor: str | None = None,
+        max_age_seconds: float = PUBLIC_HACKATHONS_CACHE_TTL_SECONDS,
+    ) -> PublicHackathonListResponse:
+        """List CONFIGURED hackathons across all organizers (for public endpoint).
 
-        return self.db.put_hackathon_detail(record)
+        One query page of the status index (GSI3), whose projection holds
+        every listed field, so no per-hackathon reads follow. Pages are
+        cached in process for ``max_age_seconds``.
 
-    def list_all_configured_hackathons(self) -> list[HackathonResponse]:
-        """List all CONFIGURED hackathons across all organizers (for public endpoint).
+        Args:
+            limit: Page size
+            cursor: Cursor from the previous page
+            max_age_seconds: Maximum age of a cached page (0 disables the cache)
 
         Returns:
-            List of configured hackathons
-        """
-        # Use scan instead of GSI query since we need all hackathons across all organizers
-        # GSI1 is organized by organizer (GSI1PK = ORG#xxx), not suitable for cross-org queries
-        try:
-            response = self.db.table.scan(
-                FilterExpression="SK = :meta AND #status = :configured",
-                ExpressionAttributeNames={"#status": "status"},
-                ExpressionAttributeValues={
-                    ":meta": "META",
-                    ":configured": HackathonStatus.CONFIGURED.value,
-                },
-            )
-
-            records = response.get("Items", [])
+            Page of public hackathon info with the cursor for the next page
 
-            # Convert to HackathonResponse objects
-            configured_hackathons = []
-            for record in records:
-                hackathon = self.get_hackathon(record["hack_id"])
-                if hackathon:
-                    configured_hackathons.append(hackathon)
-
-            logger.info(
-                "public_hackathons_listed",
-                configured_count=len(configured_hackathons),
-            )
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        key = (limit, cursor)
+        now = time.monotonic()
+        with _public_pages_lock:
+            cached = _public_pages.get(key)
+        if cached and now - cached[0] < max_age_seconds:
+            return cached[1]
+
+        records, last_key = self.db.list_hackathons_by_status_page(
+            HackathonStatus.CONFIGURED.value,
+            limit=limit,
+            exclusive_start_key=decode_cursor(cursor),
+        )
+        next_cursor = encode_cursor(last_key)
+        page = PublicHackathonListResponse(
+            hackathons=[
+                PublicHackathonInfo(
+                    hack_id=r["hack_id"],
+                    name=r["name"],
+                    description=r.get("description") or "",
+                    start_date=datetime.fromisoformat(r["start_date"])
+                    if r.get("start_date")
+                    else None,
+                    end_date=datetime.fromisoformat(r["end_date"]) if r.get("end_date") else None,
+                    submission_count=int(r.get("submission_count", 0)),
+                )
+                for r in records
+            ],
+            next_cursor=next_cursor,
+            has_more=next_cursor is not None,
+        )
 
-            return configured_hackathons
+        with _public_pages_lock:
+            if len(_public_pages) >= PUBLIC_HACKATHONS_CACHE_MAX_PAGES:
+                _public_pages.clear()
+            _public_pages[key] = (now, page)
 
-        except Exception as e:
-            logger.error("list_all_configured_hackathons_failed", error=str(e))
-            return []
+        logger.info("public_hackathons_listed", configured_count=len(page.hackathons))
+        return page
@@ -1,20 +1,24 @@
-"""Organizer intelligence dashboard service."""
+"""Organizer intelligence dashboard service.
+
+The dashboard is served from a materialized per-hackathon INTELLIGENCE item
+(``IntelligenceAggregate`` state). The analyzer folds each analyzed
+submission into it, so a dashboard read is a single item read. The item is
+rebuilt from the submissions only on demand: when it does not exist yet,
+when it was marked stale (or predates per-submission contributions), or
+when an organizer asks for a refresh.
+
+What each submission contributed is stored on its SUB item
+(``intelligence_contribution``), so re-analysis and disqualification can
+retract it without the INTELLIGENCE item growing with the submissions.
+"""
 
-from collections import Counter, defaultdict
 from typing import Any
 
 import structlog
 
-from src.models.dashboard import (
-    CommonIssue,
-    HiringIntelligence,
-    OrganizerDashboard,
-    PrizeRecommendation,
-    TechnologyTrends,
-    TopPerformer,
-)
-from src.models.submission import SubmissionListItem
-from src.models.team_dynamics import ContributorRole
+from src.analysis.intelligence_aggregate import IntelligenceAggregate
+from src.constants import INTELLIGENCE_FOLD_ATTEMPTS
+from src.models.dashboard import OrganizerDashboard
 from src.services.hackathon_service import HackathonService
 from src.services.submission_service import SubmissionService
 from src.utils.dynamo import DynamoDBHelper
@@ -22,6 +26,12 @@ from src.utils.dynamo import DynamoDBHelper
 logger = structlog.get_logger()
 
 
+def _needs_rebuild(item: dict) -> bool:
+    """Whether an INTELLIGENCE item must be rebuilt before it can be used."""
+    # Items written before contributions moved to the SUB items have no count
+    return bool(item.get("stale")) or "analyzed_count" not in item
+
+
 class OrganizerIntelligenceService:
     """Generates organizer intelligence dashboard."""
 
@@ -42,11 +52,12 @@ class OrganizerIntelligenceService:
         self.hackathon_service = hackathon_service
         self.submission_service = submission_service
 
-    def generate_dashboard(self, hack_id: str) -> OrganizerDashboard:
-        """Generate intelligence dashboard for hackathon.
+    def generate_dashboard(self, hack_id: str, refresh: bool = False) -> OrganizerDashboard:
+        """Get the intelligence dashboard for a hackathon.
 
         Args:
             hack_id: Hackathon ID
+            refresh: Rebuild the aggregate from all submissions first
 
         Returns:
             OrganizerDashboard with aggregated insights
@@ -54,419 +65,168 @@ class OrganizerIntelligenceService:
         Raises:
             ValueError: If hackathon not found
         """
-        logger.info("generating_organizer_dashboard", hack_id=hack_id)
-
-        # Get hackathon details
         hackathon = self.hackathon_service.get_hackathon(hack_id)
         if not hackathon:
             raise ValueError(f"Hackathon not found: {hack_id}")
 
-        # Get all submissions
-        submissions_response = self.submission_service.list_submissions(hack_id)
-        submissions = submissions_response.submissions
-
-        # Filter to analyzed submissions only
-        analyzed_submissions = [s for s in submissions if s.overall_score is not None]
+        item = None if refresh else self.db.get_intelligence(hack_id)
+        rebuilt = item is None or _needs_rebuild(item)
+        if item is not None and not rebuilt:
+            aggregate = IntelligenceAggregate.from_item(item)
+        else:
+            aggregate = self.rebuild(hack_id)
 
         logger.info(
-            "dashboard_data_loaded",
-            hack_id=hack_id,
-            total_submissions=len(submissions),
-            analyzed_submissions=len(analyzed_submissions),
-        )
-
-        # Generate dashboard components
-        top_performers = self._aggregate_top_performers(analyzed_submissions)
-        hiring_intelligence = self._generate_hiring_intelligence(analyzed_submissions)
-        technology_trends = self._analyze_technology_trends(analyzed_submissions)
-        common_issues = self._identify_common_issues(analyzed_submissions)
-        prize_recommendations = self._recommend_prizes(analyzed_submissions)
-        standout_moments = self._identify_standout_moments(analyzed_submissions)
-        next_hackathon_recommendations = self._generate_next_hackathon_recommendations(
-            common_issues, technology_trends
-        )
-        sponsor_follow_up_actions = self._generate_sponsor_follow_up_actions(
-            analyzed_submissions, technology_trends
-        )
-
-        dashboard = OrganizerDashboard(
+            "dashboard_generated",
             hack_id=hack_id,
-            hackathon_name=hackathon.name,
-            total_submissions=len(submissions),
-            top_performers=top_performers,
-            hiring_intelligence=hiring_intelligence,
-            technology_trends=technology_trends,
-            common_issues=common_issues,
-            standout_moments=standout_moments,
-            prize_recommendations=prize_recommendations,
-            next_hackathon_recommendations=next_hackathon_recommendations,
-            sponsor_follow_up_actions=sponsor_follow_up_actions,
+            analyzed_submissions=aggregate.analyzed_count,
+            rebuilt=rebuilt,
         )
+        return aggregate.render(hack_id, hackathon.name, hackathon.submission_count)
 
-        logger.info("dashboard_generated", hack_id=hack_id)
-        return dashboard
+    def rebuild(self, hack_id: str) -> IntelligenceAggregate:
+        """Recompute the aggregate from every analyzed submission and store it.
 
-    def _aggregate_top_performers(self, submissions: list[Any]) -> list[TopPerformer]:
-        """Identify top teams with key strengths.
+        Submissions whose stored contribution differs from the recomputed one
+        (e.g. never stored) get it rewritten.
 
         Args:
-            submissions: List of analyzed submissions
-
-        Returns:
-            List of top performers (top 10)
-        """
-        if not submissions:
-            return []
-
-        # Sort by overall score
-        sorted_submissions = sorted(submissions, key=lambda x: x.overall_score or 0, reverse=True)
-
-        top_performers = []
-        for submission in sorted_submissions[:10]:  # Top 10
-            # Extract key strengths from scorecard if available
-            key_strengths: list[str] = []
-            sponsor_interest_flags: list[str] = []
-
-            # Try to get scorecard for team dynamics
-            scorecard = self.submission_service.get_submission_scorecard(submission.sub_id)
-            if scorecard and scorecard.get("team_dynamics"):
-                team_dynamics = scorecard["team_dynamics"]
-                if isinstance(team_dynamics, dict) and "key_strengths" in team_dynamics:
-                    key_strengths = team_dynamics["key_strengths"][:3]  # Top 3 strengths
-
-            # Default strengths based on scores
-            if not key_strengths:
-                key_strengths = [f"Overall Score: {submission.overall_score:.1f}"]
-
-            top_performers.append(
-                TopPerformer(
-                    team_name=submission.team_name,
-                    sub_id=submission.sub_id,
-                    overall_score=submission.overall_score or 0.0,
-                    key_strengths=key_strengths,
-                    sponsor_interest_flags=sponsor_interest_flags,
-                )
-            )
-
-        return top_performers
-
-    def _generate_hiring_intelligence(self, submissions: list[Any]) -> HiringIntelligence:
-        """Categorize candidates by role and seniority.
-
-        Args:
-            submissions: List of analyzed submissions
-
-        Returns:
-            HiringIntelligence with categorized candidates
-        """
-        backend_candidates: list[Any] = []
-        frontend_candidates: list[Any] = []
-        devops_candidates: list[Any] = []
-        full_stack_candidates: list[Any] = []
-        must_interview: list[Any] = []
-
-        for submission in submissions:
-            # Get scorecard with team dynamics
-            scorecard = self.submission_service.get_submission_scorecard(submission.sub_id)
-            if not scorecard:
-                continue
-
-            team_dynamics = scorecard.get("team_dynamics")
-            if not team_dynamics or not isinstance(team_dynamics, dict):
-                continue
-
-            individual_scorecards = team_dynamics.get("individual_scorecards", [])
-
-            for scorecard_item in individual_scorecards:
-                # Categorize by role (scorecard_item is a dict from DynamoDB)
-                role = scorecard_item.get("role")
-                if role == "backend" or role == ContributorRole.BACKEND:
-                    backend_candidates.append(scorecard_item)
-                elif role == "frontend" or role == ContributorRole.FRONTEND:
-                    frontend_candidates.append(scorecard_item)
-                elif role == "devops" or role == ContributorRole.DEVOPS:
-                    devops_candidates.append(scorecard_item)
-                elif role == "full_stack" or role == ContributorRole.FULL_STACK:
-                    full_stack_candidates.append(scorecard_item)
-
-                # Check if must interview (scorecard_item is a dict)
-                hiring_signals = scorecard_item.get("hiring_signals", {})
-                if isinstance(hiring_signals, dict) and hiring_signals.get("must_interview"):
-                    must_interview.append(scorecard_item)
-
-        return HiringIntelligence(
-            backend_candidates=backend_candidates[:20],  # Limit to top 20 per category
-            frontend_candidates=frontend_candidates[:20],
-            devops_candidates=devops_candidates[:20],
-            full_stack_candidates=full_stack_candidates[:20],
-            must_interview=must_interview[:10],  # Top 10 must-interview
-        )
-
-    def _analyze_technology_trends(self, submissions: list[Any]) -> TechnologyTrends:
-        """Identify popular stacks and emerging tech.
-
-        Args:
-            submissions: List of analyzed submissions
-
-        Returns:
-            TechnologyTrends with usage statistics
-        """
-        language_counter: Counter[str] = Counter()
-
-        for submission in submissions:
-            # Get scorecard for static analysis
-            scorecard = self.submission_service.get_submission_scorecard(submission.sub_id)
-            if not scorecard:
-                continue
-
-            # Extract from static analysis if available
-            static_analysis = scorecard.get("static_analysis")
-            if static_analysis:
-                language = static_analysis.get("language")
-                if language:
-                    language_counter[language] += 1
-
-            # Extract from repo metadata if available
-            repo_meta = scorecard.get("repo_meta")
-            if repo_meta and isinstance(repo_meta, dict):
-                primary_language = repo_meta.get("primary_language")
-                if primary_language:
-                    language_counter[primary_language] += 1
-
-        # Most used technologies
-        most_used = language_counter.most_common(10)
-
-        # Emerging technologies (used by 2-5 teams)
-        emerging = [tech for tech, count in language_counter.items() if 2 <= count <= 5]
-
-        # Popular stacks (for now, just language combinations)
-        popular_stacks: list[tuple[str, int]] = []
-
-        return TechnologyTrends(
-            most_used=most_used,
-            emerging=emerging,
-            popular_stacks=popular_stacks,
-        )
-
-    def _identify_common_issues(self, submissions: list[Any]) -> list[CommonIssue]:
-        """Find patterns across submissions.
-
-        Args:
-            submissions: List of analyzed submissions
+            hack_id: Hackathon ID
 
         Returns:
-            List of common issues with workshop recommendations
+            Rebuilt aggregate
         """
-        issue_counter: dict[str, list[str]] = defaultdict(list)
-
-        for submission in submissions:
-            # Get scorecard for static analysis
-            scorecard = self.submission_service.get_submission_scorecard(submission.sub_id)
-            if not scorecard:
-                continue
+        current = self.db.get_intelligence(hack_id)
+        expected_version = int(current["version"]) if current else None
 
-            # Count issues by category
-            static_analysis = scorecard.get("static_analysis")
-            if not static_analysis:
+        aggregate = IntelligenceAggregate()
+        for submission in self.db.list_submissions(hack_id):
+            if submission.get("overall_score") is None:
                 continue
-
-            findings = static_analysis.get("findings", [])
-            for finding in findings:
-                category = (
-                    finding.get("category", "unknown")
-                    if isinstance(finding, dict)
-                    else getattr(finding, "category", "unknown")
-                )
-                issue_counter[category].append(submission.team_name)
-
-        # Convert to CommonIssue objects
-        common_issues = []
-        total_submissions = len(submissions) if submissions else 1
-
-        for issue_type, teams in issue_counter.items():
-            if len(teams) >= 3:  # At least 3 teams affected
-                percentage_affected = (len(teams) / total_submissions) * 100
-
-                # Generate workshop recommendation
-                workshop_recommendation = self._generate_workshop_recommendation(issue_type)
-
-                common_issues.append(
-                    CommonIssue(
-                        issue_type=issue_type,
-                        percentage_affected=percentage_affected,
-                        workshop_recommendation=workshop_recommendation,
-                        example_teams=teams[:5],  # First 5 teams as examples
-                    )
-                )
-
-        # Sort by percentage affected
-        common_issues.sort(key=lambda x: x.percentage_affected, reverse=True)
-
-        return common_issues[:10]  # Top 10 common issues
-
-    def _generate_workshop_recommendation(self, issue_type: str) -> str:
-        """Generate workshop recommendation for issue type.
-
-        Args:
-            issue_type: Type of issue
-
-        Returns:
-            Workshop recommendation text
-        """
-        recommendations = {
-            "security": "Workshop: Secure Coding Practices - OWASP Top 10",
-            "testing": "Workshop: Test-Driven Development and Testing Strategies",
-            "style": "Workshop: Code Quality and Style Guidelines",
-            "complexity": "Workshop: Refactoring and Code Simplification",
-            "import": "Workshop: Dependency Management Best Practices",
-            "syntax": "Workshop: Language Fundamentals and Common Pitfalls",
-        }
-
-        return recommendations.get(issue_type, f"Workshop: Best Practices for {issue_type.title()}")
-
-    def _recommend_prizes(self, submissions: list[Any]) -> list[PrizeRecommendation]:
-        """Recommend prize winners with evidence.
-
-        Args:
-            submissions: List of analyzed submissions
-
-        Returns:
-            List of prize recommendations
-        """
-        if not submissions:
-            return []
-
-        recommendations = []
-
-        # Best Overall
-        best_overall = max(submissions, key=lambda x: x.overall_score or 0)
-        recommendations.append(
-            PrizeRecommendation(
-                prize_category="Best Overall",
-                recommended_team=best_overall.team_name,
-                sub_id=best_overall.sub_id,
-                justification=f"Highest overall score: {best_overall.overall_score:.1f}",
-                evidence=[f"Overall Score: {best_overall.overall_score:.1f}"],
+            sub_id = submission["sub_id"]
+            aggregate.fold(
+                sub_id=sub_id,
+                team_name=submission.get("team_name", ""),
+                overall_score=submission["overall_score"],
+                strengths=submission.get("strengths"),
+                weaknesses=submission.get("weaknesses"),
+                repo_meta=submission.get("repo_meta"),
+                team_analysis=self.db.get_team_analysis(sub_id),
+                strategy_analysis=self.db.get_strategy_analysis(sub_id),
             )
-        )
-
-        # Best Team Dynamics (if team analysis available)
-        teams_with_dynamics: list[tuple[SubmissionListItem, dict[str, Any]]] = []
-        for submission in submissions:
-            scorecard = self.submission_service.get_submission_scorecard(submission.sub_id)
-            if scorecard and scorecard.get("team_dynamics"):
-                team_dynamics = scorecard["team_dynamics"]
-                if "team_dynamics_grade" in team_dynamics:
-                    teams_with_dynamics.append((submission, team_dynamics))
-
-        if teams_with_dynamics:
-            best_team = max(
-                teams_with_dynamics,
-                key=lambda x: self._grade_to_score(x[1]["team_dynamics_grade"]),
-            )
-            recommendations.append(
-                PrizeRecommendation(
-                    prize_category="Best Team Dynamics",
-                    recommended_team=best_team[0].team_name,
-                    sub_id=best_team[0].sub_id,
-                    justification=f"Excellent collaboration and teamwork (Grade: {best_team[1]['team_dynamics_grade']})",
-                    evidence=[f"Team Dynamics Grade: {best_team[1]['team_dynamics_grade']}"],
+            stored = submission.get("intelligence_contribution")
+            if not aggregate.matches_contribution(sub_id, stored):
+                self.db.put_intelligence_contribution(
+                    hack_id, sub_id, aggregate.contributions[sub_id]
                 )
-            )
-
-        return recommendations
-
-    def _grade_to_score(self, grade: str) -> float:
-        """Convert letter grade to numeric score.
-
-        Args:
-            grade: Letter grade (A-F)
 
-        Returns:
-            Numeric score (0-100)
-        """
-        grade_map = {"A": 95, "B": 85, "C": 75, "D": 65, "F": 50}
-        return grade_map.get(grade, 0)
+        # A concurrent fold or rebuild wins the conflict; its state is at least as fresh
+        saved = self.db.put_intelligence(hack_id, aggregate.to_state(), expected_version)
+        logger.info(
+            "intelligence_rebuilt",
+            hack_id=hack_id,
+            analyzed_submissions=aggregate.analyzed_count,
+            saved=saved,
+        )
+        return aggregate
 
-    def _identify_standout_moments(self, submissions: list[Any]) -> list[str]:
-        """Identify standout moments across submissions.
+    def record_submission(
+        self,
+        hack_id: str,
+        sub_id: str,
+        team_name: str,
+        overall_score: float,
+        strengths: list[str] | None = None,
+        weaknesses: list[str] | None = None,
+        repo_meta: Any = None,
+        team_analysis: Any = None,
+        strategy_analysis: Any = None,
+    ) -> bool:
+        """Fold an analyzed submission into the materialized aggregate.
+
+        Read-fold-write under optimistic concurrency; after
+        INTELLIGENCE_FOLD_ATTEMPTS conflicts the item is marked stale and
+        rebuilt on the next dashboard read. A missing item is built from
+        all submissions (which already include this one). The submission's
+        previous contribution is retracted first and its new one stored on
+        its SUB item.
 
         Args:
-            submissions: List of analyzed submissions
+            hack_id: Hackathon ID
+            sub_id: Submission ID
+            team_name: Team name
+            overall_score: Overall score
+            strengths: Submission strengths
+            weaknesses: Submission weaknesses
+            repo_meta: Repository metadata
+            team_analysis: Team dynamics analysis (model or stored dict)
+            strategy_analysis: Strategy analysis (model or stored dict)
 
         Returns:
-            List of standout moment descriptions
+            True if the submission is reflected in the stored aggregate
         """
-        standout_moments: list[str] = []
-
-        if not submissions:
-            return standout_moments
-
-        # Most creative API use
-        # Most improved team
-        # Best learning journey
-
-        # For now, return placeholder moments
-        if len(submissions) >= 3:
-            standout_moments.append(
-                f"{len(submissions)} teams participated with diverse technical approaches"
+        previous = self.db.get_intelligence_contribution(hack_id, sub_id)
+        for _ in range(INTELLIGENCE_FOLD_ATTEMPTS):
+            item = self.db.get_intelligence(hack_id)
+            if item is None:
+                self.rebuild(hack_id)
+                return True
+            if _needs_rebuild(item):
+                return False  # rebuilt on next read
+
+            aggregate = IntelligenceAggregate.from_item(item)
+            aggregate.load_contribution(sub_id, previous)
+            aggregate.fold(
+                sub_id=sub_id,
+                team_name=team_name,
+                overall_score=overall_score,
+                strengths=strengths,
+                weaknesses=weaknesses,
+                repo_meta=repo_meta,
+                team_analysis=team_analysis,
+                strategy_analysis=strategy_analysis,
             )
+            if self.db.put_intelligence(hack_id, aggregate.to_state(), aggregate.version):
+                return self._store_contribution(hack_id, sub_id, aggregate.contributions[sub_id])
 
-        return standout_moments
+        logger.warning("intelligence_fold_contended", hack_id=hack_id, sub_id=sub_id)
+        self.db.mark_intelligence_stale(hack_id)
+        return False
 
-    def _generate_next_hackathon_recommendations(
-        self, common_issues: list[CommonIssue], technology_trends: TechnologyTrends
-    ) -> list[str]:
-        """Generate recommendations for next hackathon.
+    def remove_submission(self, hack_id: str, sub_id: str) -> bool:
+        """Retract a submission (e.g. disqualified on re-analysis) from the aggregate.
 
         Args:
-            common_issues: Common issues identified
-            technology_trends: Technology trends
+            hack_id: Hackathon ID
+            sub_id: Submission ID
 
         Returns:
-            List of recommendations
+            True if the stored aggregate no longer includes the submission
         """
-        recommendations = []
-
-        # Recommend workshops based on common issues
-        if common_issues:
-            top_issue = common_issues[0]
-            recommendations.append(f"Pre-hackathon workshop: {top_issue.workshop_recommendation}")
-
-        # Recommend technology focus
-        if technology_trends.most_used:
-            top_tech = technology_trends.most_used[0][0]
-            recommendations.append(f"Consider {top_tech}-focused track or prizes")
-
-        # Recommend emerging tech support
-        if technology_trends.emerging:
-            recommendations.append(
-                f"Provide resources for emerging technologies: {', '.join(technology_trends.emerging[:3])}"
-            )
-
-        return recommendations
-
-    def _generate_sponsor_follow_up_actions(
-        self, submissions: list[Any], technology_trends: TechnologyTrends
-    ) -> list[str]:
-        """Generate sponsor follow-up actions.
-
-        Args:
-            submissions: List of analyzed submissions
-            technology_trends: Technology trends
-
-        Returns:
-            List of follow-up actions
+        previous = self.db.get_intelligence_contribution(hack_id, sub_id)
+        if previous is None:
+            return True  # never folded in
+        for _ in range(INTELLIGENCE_FOLD_ATTEMPTS):
+            item = self.db.get_intelligence(hack_id)
+            if item is None or _needs_rebuild(item):
+                return True  # built from scratch on next read
+
+            aggregate = IntelligenceAggregate.from_item(item)
+            aggregate.load_contribution(sub_id, previous)
+            aggregate.retract(sub_id)
+            if self.db.put_intelligence(hack_id, aggregate.to_state(), aggregate.version):
+                return self._store_contribution(hack_id, sub_id, None)
+
+        self.db.mark_intelligence_stale(hack_id)
+        return False
+
+    def _store_contribution(self, hack_id: str, sub_id: str, contribution: dict | None) -> bool:
+        """Store a submission's contribution after the aggregate was written.
+
+        Without it the next re-fold could not retract the submission, so a
+        failed write marks the aggregate stale.
         """
-        actions = []
-
-        if submissions:
-            actions.append(
-                f"Share hiring intelligence report with {len(submissions)} candidate profiles"
-            )
-
-        if technology_trends.most_used:
-            top_tech = technology_trends.most_used[0][0]
-            actions.append(f"Highlight {top_tech} expertise in candidate pool")
-
-        return actions
+        if self.db.put_intelligence_contribution(hack_id, sub_id, contribution):
+            return True
+        self.db.mark_intelligence_stale(hack_id)
+        return False
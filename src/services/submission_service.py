@@ -1,17 +1,26 @@
 """Submission service — Submission management."""
 
+import csv
+import io
+import json
+import re
 from datetime import UTC, datetime
 from decimal import Decimal
 from typing import Any
 
+from pydantic import ValidationError
+
+from src.constants import SUBMISSION_UPLOAD_MAX_ROWS
 from src.models.common import SubmissionStatus
 from src.models.submission import (
     RepoMeta,
     SubmissionBatchCreate,
     SubmissionBatchCreateResponse,
+    SubmissionInput,
     SubmissionListItem,
     SubmissionListResponse,
     SubmissionResponse,
+    SubmissionRowError,
     WeightedDimensionScore,
 )
 from src.utils.dynamo import DynamoDBHelper
@@ -39,91 +48,295 @@ class SubmissionService:
     ) -> SubmissionBatchCreateResponse:
         """Create multiple submissions.
 
+        Rows whose repository was already submitted to this hackathon (or
+        appears earlier in the batch) are not created and are reported in
+        ``errors``.
+
         Args:
             hack_id: Hackathon ID
             data: Batch submission data
 
         Returns:
             Batch creation response
+        """
+        return self.ingest_submissions(hack_id, list(enumerate(data.submissions, start=1)))
+
+    def upload_submissions(
+        self, hack_id: str, content: str, fmt: str
+    ) -> SubmissionBatchCreateResponse:
+        """Create submissions from a CSV or JSONL upload.
+
+        Args:
+            hack_id: Hackathon ID
+            content: Uploaded text
+            fmt: "csv" or "jsonl"
+
+        Returns:
+            Batch creation response; unparseable or invalid rows are
+            reported in ``errors``
 
         Raises:
-            ValueError: If duplicate repo_url found for this hackathon
+            ValueError: If the upload is malformed as a whole (format, CSV
+                header, row limit)
         """
-        now = datetime.now(UTC)
-        created_items = []
+        rows, errors = self.parse_submission_rows(content, fmt)
+        return self.ingest_submissions(hack_id, rows, errors)
 
-        # Check for duplicates - get existing submissions for this hackathon
-        existing_submissions = self.list_submissions(hack_id)
-        existing_repo_urls = {sub.repo_url.lower() for sub in existing_submissions.submissions}
+    def ingest_submissions(
+        self,
+        hack_id: str,
+        rows: list[tuple[int, SubmissionInput]],
+        errors: list[SubmissionRowError] | None = None,
+    ) -> SubmissionBatchCreateResponse:
+        """Create submissions with set-based deduplication and batched writes.
 
-        for sub_input in data.submissions:
-            # Check if repo_url already exists for this hackathon
-            if sub_input.repo_url.lower() in existing_repo_urls:
-                raise ValueError(
-                    f"Duplicate submission: Repository '{sub_input.repo_url}' "
-                    f"has already been submitted to this hackathon"
+        Repository uniqueness is enforced by conditional ``REPO#`` claim
+        items rather than by listing existing submissions, so concurrent
+        uploads cannot both create the same repository. Claimed rows are
+        written in BatchWriteItem chunks and the hackathon's submission
+        count is updated with one atomic ADD.
+
+        Args:
+            hack_id: Hackathon ID
+            rows: (row number, input) pairs
+            errors: Row errors found before ingestion (e.g. while parsing)
+
+        Returns:
+            Batch creation response
+        """
+        now = datetime.now(UTC)
+        errors = list(errors or [])
+        records: dict[str, dict[str, Any]] = {}
+        row_numbers: dict[str, int] = {}
+
+        for row, sub_input in rows:
+            repo_key = self.normalize_repo_url(sub_input.repo_url)
+            if repo_key in records:
+                errors.append(
+                    SubmissionRowError(
+                        row=row,
+                        team_name=sub_input.team_name,
+                        repo_url=sub_input.repo_url,
+                        error=f"Duplicate submission: Repository '{sub_input.repo_url}' "
+                        f"already appears in row {row_numbers[repo_key]}",
+                    )
                 )
-            sub_id = generate_sub_id()
-
-            # Create submission record
-            record: dict[str, Any] = {
-                "PK": f"HACK#{hack_id}",
-                "SK": f"SUB#{sub_id}",
-                "entity_type": "SUBMISSION",
-                "sub_id": sub_id,
-                "hack_id": hack_id,
-                "team_name": sub_input.team_name,
-                "repo_url": sub_input.repo_url,
-                "status": SubmissionStatus.PENDING.value,
-                "overall_score": None,
-                "rank": None,
-                "recommendation": None,
-                "repo_meta": None,
-                "weighted_scores": None,
-                "strengths": [],
-                "weaknesses": [],
-                "agent_scores": {},
-                "total_cost_usd": None,
-                "total_tokens": None,
-                "analysis_duration_ms": None,
-                "analyzed_at": None,
-                "GSI1PK": f"SUB#{sub_id}",
-                "GSI1SK": f"HACK#{hack_id}",
-                "created_at": now.isoformat(),
-                "updated_at": now.isoformat(),
-            }
+                continue
+            row_numbers[repo_key] = row
+            records[repo_key] = self._new_submission_record(hack_id, sub_input, now)
 
-            success = self.db.put_submission(record)
-            if success:
+        claimed, duplicates = self.db.claim_repo_urls(
+            hack_id, {repo_key: record["sub_id"] for repo_key, record in records.items()}
+        )
+        failed = self.db.batch_put_items([records[repo_key] for repo_key in claimed])
+        failed_keys = {self.normalize_repo_url(record["repo_url"]) for record in failed}
+        if failed_keys:
+            self.db.release_repo_urls(hack_id, sorted(failed_keys))
+
+        created_keys = set(claimed) - failed_keys
+        duplicate_keys = set(duplicates)
+        created_items = []
+        for repo_key, record in records.items():
+            if repo_key in created_keys:
                 created_items.append(
                     SubmissionListItem(
-                        sub_id=sub_id,
-                        team_name=sub_input.team_name,
-                        repo_url=sub_input.repo_url,
+                        sub_id=record["sub_id"],
+                        team_name=record["team_name"],
+                        repo_url=record["repo_url"],
                         status=SubmissionStatus.PENDING,
-                        overall_score=None,
-                        rank=None,
-                        total_cost_usd=None,
                         created_at=now,
                     )
                 )
-                logger.info(
-                    "submission_created",
-                    sub_id=sub_id,
-                    hack_id=hack_id,
-                    team=sub_input.team_name,
+                continue
+            if repo_key in duplicate_keys:
+                error = (
+                    f"Duplicate submission: Repository '{record['repo_url']}' "
+                    f"has already been submitted to this hackathon"
+                )
+            else:
+                error = "Failed to store submission"
+            errors.append(
+                SubmissionRowError(
+                    row=row_numbers[repo_key],
+                    team_name=record["team_name"],
+                    repo_url=record["repo_url"],
+                    error=error,
                 )
+            )
+
+        submission_count = None
+        if created_items:
+            submission_count = self.db.add_submission_count(hack_id, len(created_items))
+        if submission_count is None:
+            hackathon = self.db.get_hackathon(hack_id)
+            submission_count = int(hackathon.get("submission_count", 0)) if hackathon else 0
 
-        # Get updated hackathon submission count
-        hackathon = self.db.get_hackathon(hack_id)
-        submission_count = hackathon.get("submission_count", 0) if hackathon else 0
+        logger.info(
+            "submissions_ingested",
+            hack_id=hack_id,
+            created=len(created_items),
+            duplicates=len(duplicate_keys),
+            rejected=len(errors),
+        )
 
         return SubmissionBatchCreateResponse(
             created=len(created_items),
             submissions=created_items,
-            hackathon_submission_count=submission_count + len(created_items),
+            hackathon_submission_count=submission_count,
+            rejected=len(errors),
+            errors=sorted(errors, key=lambda e: e.row),
         )
 
+    @staticmethod
+    def _new_submission_record(
+        hack_id: str, sub_input: SubmissionInput, now: datetime
+    ) -> dict[str, Any]:
+        """Build a pending submission record.
+
+        Args:
+            hack_id: Hackathon ID
+            sub_input: Submission input
+            now: Creation time
+
+        Returns:
+            Submission record
+        """
+        sub_id = generate_sub_id()
+        return {
+            "PK": f"HACK#{hack_id}",
+            "SK": f"SUB#{sub_id}",
+            "entity_type": "SUBMISSION",
+            "sub_id": sub_id,
+            "hack_id": hack_id,
+            "team_name": sub_input.team_name,
+            "repo_url": sub_input.repo_url,
+            "status": SubmissionStatus.PENDING.value,
+            "overall_score": None,
+            "rank": None,
+            "recommendation": None,
+            "repo_meta": None,
+            "weighted_scores": None,
+            "strengths": [],
+            "weaknesses": [],
+            "agent_scores": {},
+            "total_cost_usd": None,
+            "total_tokens": None,
+            "analysis_duration_ms": None,
+            "analyzed_at": None,
+            "GSI1PK": f"SUB#{sub_id}",
+            "GSI1SK": f"HACK#{hack_id}",
+            "created_at": now.isoformat(),
+            "updated_at": now.isoformat(),
+        }
+
+    @staticmethod
+    def normalize_repo_url(repo_url: str) -> str:
+        """Normalize a repository URL for duplicate detection.
+
+        ``https://GitHub.com/Owner/Repo.git/`` and ``github.com/owner/repo``
+        both become ``github.com/owner/repo``.
+
+        Args:
+            repo_url: Repository URL
+
+        Returns:
+            Normalized URL
+        """
+        url = repo_url.strip().lower()
+        url = re.sub(r"^[a-z][a-z0-9+.-]*://", "", url)
+        url = url.removeprefix("www.").rstrip("/")
+        return url.removesuffix(".git").rstrip("/")
+
+    @staticmethod
+    def parse_submission_rows(
+        content: str, fmt: str
+    ) -> tuple[list[tuple[int, SubmissionInput]], list[SubmissionRowError]]:
+        """Parse and validate a CSV or JSONL submission upload.
+
+        CSV needs a header with ``team_name`` and ``repo_url`` columns
+        (case-insensitive; other columns are ignored). JSONL has one object
+        per line with those keys. Rows are numbered from 1: data rows for
+        CSV, lines for JSONL.
+
+        Args:
+            content: Uploaded text
+            fmt: "csv" or "jsonl"
+
+        Returns:
+            Tuple of (valid (row, input) pairs, row errors)
+
+        Raises:
+            ValueError: If the format is unknown, the CSV header is missing
+                a column, or there are more than SUBMISSION_UPLOAD_MAX_ROWS rows
+        """
+        raw_rows: list[tuple[int, Any]] = []
+        if fmt == "csv":
+            reader = csv.DictReader(io.StringIO(content))
+            columns = {(name or "").strip().lower(): name for name in reader.fieldnames or []}
+            missing = [c for c in ("team_name", "repo_url") if c not in columns]
+            if missing:
+                raise ValueError(f"CSV header is missing column(s): {', '.join(missing)}")
+            for row, record in enumerate(reader, start=1):
+                raw_rows.append(
+                    (
+                        row,
+                        {
+                            key: (record.get(columns[key]) or "").strip()
+                            for key in ("team_name", "repo_url")
+                        },
+                    )
+                )
+        elif fmt == "jsonl":
+            for row, line in enumerate(content.splitlines(), start=1):
+                if line.strip():
+                    raw_rows.append((row, line))
+        else:
+            raise ValueError(f"Unsupported upload format: {fmt}")
+
+        if len(raw_rows) > SUBMISSION_UPLOAD_MAX_ROWS:
+            raise ValueError(
+                f"Upload has {len(raw_rows)} rows; the limit is {SUBMISSION_UPLOAD_MAX_ROWS}"
+            )
+
+        rows: list[tuple[int, SubmissionInput]] = []
+        errors: list[SubmissionRowError] = []
+        for row, raw in raw_rows:
+            if isinstance(raw, str):
+                try:
+                    raw = json.loads(raw)
+                except json.JSONDecodeError as e:
+                    errors.append(SubmissionRowError(row=row, error=f"Invalid JSON: {e.msg}"))
+                    continue
+                if not isinstance(raw, dict):
+                    errors.append(SubmissionRowError(row=row, error="Expected a JSON object"))
+                    continue
+            try:
+                rows.append(
+                    (
+                        row,
+                        SubmissionInput(
+                            team_name=raw.get("team_name"), repo_url=raw.get("repo_url")
+                        ),
+                    )
+                )
+            except ValidationError as e:
+                errors.append(
+                    SubmissionRowError(
+                        row=row,
+                        team_name=raw.get("team_name")
+                        if isinstance(raw.get("team_name"), str)
+                        else None,
+                        repo_url=raw.get("repo_url")
+                        if isinstance(raw.get("repo_url"), str)
+                        else None,
+                        error="; ".join(
+                            f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}"
+                            for err in e.errors()
+                        ),
+                    )
+                )
+        return rows, errors
+
     def get_submission(self, sub_id: str) -> SubmissionResponse | None:
         """Get submission by ID.
 
@@ -342,7 +555,7 @@ class SubmissionService:
             weighted_scores: Weighted dimension scores
             recommendation: Recommendation category
             confidence: Overall confidence score (not stored)
-            agent_scores: Agent raw scores
+            agent_scores: Per-agent results (compacted before storage)
             strengths: List of strengths
             weaknesses: List of weaknesses
             repo_meta: Repository metadata
@@ -379,13 +592,15 @@ class SubmissionService:
                 return convert_to_decimal(obj.model_dump(mode="json"))
             return obj
 
-        # Call the main update method (dimension_scores and confidence not stored)
+        # Call the main update method (dimension_scores and confidence not stored).
+        # Only compact per-agent summaries go on the submission item; the full
+        # agent responses (evidence, observations) live in the SCORE# items.
         return self.update_submission_results(
             hack_id=hack_id,
             sub_id=sub_id,
             overall_score=float(overall_score),
             weighted_scores=convert_to_decimal(weighted_scores),
-            agent_scores=convert_to_decimal(agent_scores),
+            agent_scores=convert_to_decimal(self.compact_agent_scores(agent_scores)),
             strengths=strengths,
             weaknesses=weaknesses,
             recommendation=recommendation,
@@ -395,6 +610,36 @@ class SubmissionService:
             analysis_duration_ms=analysis_duration_ms,
         )
 
+    @staticmethod
+    def compact_agent_scores(agent_scores: dict) -> dict[str, dict[str, float]]:
+        """Reduce per-agent results to the numeric summary kept on the submission.
+
+        Accepts either full agent responses (pydantic models or ``model_dump()``
+        dicts, as written by older analyzer versions), already-compact
+        summaries, or bare numeric scores.
+
+        Args:
+            agent_scores: Mapping of agent name to agent result
+
+        Returns:
+            Mapping of agent name to ``{"overall_score", "confidence"}``
+        """
+        compact: dict[str, dict[str, float]] = {}
+        for agent_name, value in agent_scores.items():
+            if hasattr(value, "model_dump"):
+                value = {"overall_score": value.overall_score, "confidence": value.confidence}
+
+            if isinstance(value, dict):
+                summary = {"overall_score": float(value.get("overall_score", 0) or 0)}
+                if value.get("confidence") is not None:
+                    summary["confidence"] = float(value["confidence"])
+            else:
+                summary = {"overall_score": float(value or 0)}
+
+            key = agent_name.value if hasattr(agent_name, "value") else str(agent_name)
+            compact[key] = summary
+        return compact
+
     def delete_submission(self, hack_id: str, sub_id: str) -> bool:
         """Delete submission (soft delete by status).
 
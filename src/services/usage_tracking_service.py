@@ -1,13 +1,14 @@
 """Usage tracking service for quota management and analytics."""
 
 import csv
+import threading
 from datetime import datetime, timedelta
 from io import StringIO
 
 from src.models.rate_limit import DailyUsageBreakdown, UsageRecord, UsageSummary
 from src.utils.dynamo import DynamoDBHelper
-from src.utils.id_gen import generate_id
 from src.utils.logging import get_logger
+from src.utils.usage_buffer import UsageDelta, UsageWriteBuffer, default_flush_interval
 
 logger = get_logger(__name__)
 
@@ -15,13 +16,15 @@ logger = get_logger(__name__)
 class UsageTrackingService:
     """Service for tracking API usage, quotas, and generating analytics."""
 
-    def __init__(self, db_helper: DynamoDBHelper) -> None:
+    def __init__(self, db_helper: DynamoDBHelper, buffer: UsageWriteBuffer | None = None) -> None:
         """Initialize usage tracking service.
 
         Args:
             db_helper: DynamoDB helper instance
+            buffer: Optional write-behind buffer for record_request
         """
         self.db = db_helper
+        self.buffer = buffer
 
     def record_request(
         self,
@@ -33,8 +36,10 @@ class UsageTrackingService:
     ) -> None:
         """Record an API request with metadata.
 
-        Updates the daily usage record for the API key, incrementing counters
-        and tracking endpoint usage breakdown.
+        With a write buffer attached the request is only counted in memory
+        and written with others for the same key on the next flush;
+        otherwise the daily usage record is updated immediately. Either way
+        the write is a single atomic ``ADD`` (no read-modify-write).
 
         Args:
             api_key: API key that made the request
@@ -44,48 +49,22 @@ class UsageTrackingService:
             cost_usd: Cost of the request in USD (for Bedrock calls)
         """
         try:
-            # Get current date in UTC
-            now = datetime.utcnow()
-            date_str = now.strftime("%Y-%m-%d")
-
-            # Get or create usage record for today
-            usage_record = self._get_or_create_usage_record(api_key, date_str)
-
-            # Track successful vs failed requests
-            if 200 <= status_code < 400:
-                usage_record.successful_requests += 1
-            else:
-                usage_record.failed_requests += 1
-
-            # Update request count (must equal successful + failed)
-            usage_record.request_count = (
-                usage_record.successful_requests + usage_record.failed_requests
-            )
-
-            # Update cost tracking
-            usage_record.total_cost_usd += cost_usd
-
-            # Track endpoint usage breakdown
-            if endpoint not in usage_record.endpoints_used:
-                usage_record.endpoints_used[endpoint] = 0
-            usage_record.endpoints_used[endpoint] += 1
-
-            # Update timestamp
-            usage_record.updated_at = now
+            date_str = datetime.utcnow().strftime("%Y-%m-%d")
 
-            # Set DynamoDB keys
-            usage_record.set_dynamodb_keys()
+            if self.buffer is not None:
+                self.buffer.add(api_key, date_str, endpoint, status_code, cost_usd)
+                return
 
-            # Save to DynamoDB
-            usage_dict = usage_record.model_dump()
-            serialized = self.db._serialize_item(usage_dict)
-            self.db.table.put_item(Item=serialized)
+            delta = UsageDelta()
+            delta.record(endpoint, status_code, cost_usd)
+            self.apply_usage_delta(api_key, date_str, delta)
 
             logger.info(
                 "request_recorded",
                 api_key_prefix=api_key[:8],
                 endpoint=endpoint,
                 status_code=status_code,
+                response_time_ms=response_time_ms,
                 cost_usd=cost_usd,
             )
 
@@ -98,6 +77,26 @@ class UsageTrackingService:
             )
             # Don't raise - usage tracking failures shouldn't break the API
 
+    def apply_usage_delta(self, api_key: str, date: str, delta: UsageDelta) -> bool:
+        """Atomically add accumulated counters to a daily usage record.
+
+        Args:
+            api_key: API key
+            date: Date in YYYY-MM-DD format
+            delta: Counters to add
+
+        Returns:
+            True if the counters were applied
+        """
+        return self.db.add_usage_counters(
+            api_key=api_key,
+            date=date,
+            successful=delta.successful,
+            failed=delta.failed,
+            cost_usd=delta.cost_usd,
+            endpoints=delta.endpoints,
+        )
+
     def check_daily_quota(self, api_key: str, daily_quota: int) -> tuple[bool, int, int]:
         """Check if API key has exceeded daily quota.
 
@@ -396,40 +395,6 @@ class UsageTrackingService:
             )
             return None
 
-    def _get_or_create_usage_record(self, api_key: str, date: str) -> UsageRecord:
-        """Get or create usage record for a specific date.
-
-        Args:
-            api_key: API key
-            date: Date in YYYY-MM-DD format
-
-        Returns:
-            UsageRecord (existing or newly created)
-        """
-        # Try to get existing record
-        existing = self._get_usage_record(api_key, date)
-        if existing:
-            return existing
-
-        # Create new record
-        now = datetime.utcnow()
-        usage_record = UsageRecord(
-            usage_id=generate_id(),
-            api_key=api_key,
-            date=date,
-            request_count=0,
-            successful_requests=0,
-            failed_requests=0,
-            total_cost_usd=0.0,
-            bedrock_cost_usd=0.0,
-            lambda_cost_usd=0.0,
-            endpoints_used={},
-            created_at=now,
-            updated_at=now,
-        )
-
-        return usage_record
-
     def get_quota_reset_time(self) -> datetime:
         """Get the next quota reset time (midnight UTC).
 
@@ -440,3 +405,30 @@ class UsageTrackingService:
         # Next midnight UTC
         tomorrow = now.date() + timedelta(days=1)
         return datetime.combine(tomorrow, datetime.min.time())
+
+
+_buffers: dict[str, UsageWriteBuffer] = {}
+_buffers_lock = threading.Lock()
+
+
+def get_usage_buffer(db_helper: DynamoDBHelper) -> UsageWriteBuffer:
+    """Get the process-wide usage write buffer for a table.
+
+    The buffer is created on first use, writes through
+    ``UsageTrackingService.apply_usage_delta``, and flushes itself at
+    shutdown.
+
+    Args:
+        db_helper: DynamoDB helper for the usage table
+
+    Returns:
+        Shared write buffer
+    """
+    with _buffers_lock:
+        buffer = _buffers.get(db_helper.table_name)
+        if buffer is None:
+            writer = UsageTrackingService(db_helper).apply_usage_delta
+            buffer = UsageWriteBuffer(writer, flush_interval_seconds=default_flush_interval())
+            buffer.install_shutdown_hooks()
+            _buffers[db_helper.table_name] = buffer
+        return buffer
@@ -1,37 +1,196 @@
-"""Bedrock Converse API wrapper with token tracking and retry logic."""
+"""Bedrock Converse API wrapper with token tracking and retry logic.
+
+Calls with a deadline or time-to-first-token limit go through the
+ConverseStream API. botocore blocks while it waits for the next stream event,
+so a background thread reads the stream and the caller waits on a queue with
+a timeout; when a limit passes, the stream is closed and the caller gets a
+``BedrockTimeoutError``. A missed first token is retried within the deadline;
+a missed deadline is not. The streamed text is fed to the JSON repairer as it
+arrives, so a response whose JSON object is already complete when the
+deadline passes is returned rather than discarded.
+"""
 
-import json
+import contextlib
+import math
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
-import boto3
 from botocore.exceptions import ClientError
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
-from src.constants import BEDROCK_RETRY_ATTEMPTS, MODEL_RATES
+from src.constants import (
+    BEDROCK_CHARS_PER_TOKEN,
+    BEDROCK_LATENCY_WINDOW,
+    BEDROCK_RETRY_ATTEMPTS,
+    BEDROCK_RETRY_BACKOFF_MULTIPLIER,
+    BEDROCK_RETRY_WAIT_SECONDS,
+    MODEL_RATES,
+)
+from src.utils.clients import get_aws_client
+from src.utils.json_repair import JSONRepairer, parse_json_object
 from src.utils.logging import get_logger
+from src.utils.tracing import span
 
 logger = get_logger(__name__)
 
+# Longest wait between retries (matches converse's tenacity policy)
+_MAX_RETRY_WAIT_SECONDS = 10
+
+_STREAM_END = object()
+_CANCELLED = object()
+
+
+class BedrockTimeoutError(Exception):
+    """A streamed Bedrock call missed its time-to-first-token limit or deadline."""
+
+    def __init__(self, model_id: str, limit: str, elapsed_ms: int, partial_content: str = ""):
+        """Initialize the error.
+
+        Args:
+            model_id: Bedrock model ID
+            limit: ``first_token`` or ``deadline``
+            elapsed_ms: Time since the call started
+            partial_content: Text received before the limit passed
+        """
+        super().__init__(f"Bedrock {limit} limit passed for {model_id} after {elapsed_ms} ms")
+        self.model_id = model_id
+        self.limit = limit
+        self.elapsed_ms = elapsed_ms
+        self.partial_content = partial_content
+
+
+class BedrockCancelledError(Exception):
+    """A streamed Bedrock call was abandoned through its cancel token."""
+
+    def __init__(self, model_id: str, elapsed_ms: int, usage: dict[str, int]):
+        """Initialize the error.
+
+        Args:
+            model_id: Bedrock model ID
+            elapsed_ms: Time since the attempt started
+            usage: Token usage estimated from the text sent and received
+        """
+        super().__init__(f"Bedrock call to {model_id} cancelled after {elapsed_ms} ms")
+        self.model_id = model_id
+        self.elapsed_ms = elapsed_ms
+        self.usage = usage
+
+
+class CancelToken:
+    """Lets another thread abandon a streamed call, e.g. the loser of a hedged pair."""
+
+    def __init__(self) -> None:
+        """Start not cancelled."""
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._callbacks: list[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether ``cancel`` was called."""
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """Abandon the call (idempotent)."""
+        with self._lock:
+            if self._cancelled:
+                return
+            self._cancelled = True
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def on_cancel(self, callback: Callable[[], None]) -> None:
+        """Run a callback on cancellation (at once if already cancelled)."""
+        with self._lock:
+            if not self._cancelled:
+                self._callbacks.append(callback)
+                return
+        callback()
+
+
+class _StreamReader:
+    """Reads a ConverseStream response on a background thread.
+
+    Events, then any exception, then ``_STREAM_END`` are put on ``events``.
+    """
+
+    def __init__(self, call: Callable[[], dict[str, Any]]) -> None:
+        """Start the call on a daemon thread.
+
+        Args:
+            call: Makes the ConverseStream request
+        """
+        self.events: queue.Queue[Any] = queue.Queue()
+        self._stream: Any = None
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+        threading.Thread(target=self._run, args=(call,), name="bedrock-stream", daemon=True).start()
+
+    def _run(self, call: Callable[[], dict[str, Any]]) -> None:
+        try:
+            stream = call()["stream"]
+            with self._lock:
+                self._stream = stream
+            if self._cancelled.is_set():
+                stream.close()
+                return
+            for event in stream:
+                if self._cancelled.is_set():
+                    break
+                self.events.put(event)
+        except Exception as e:  # re-raised by the caller
+            self.events.put(e)
+        finally:
+            self.events.put(_STREAM_END)
+
+    def cancel(self) -> None:
+        """Stop reading and close the stream."""
+        self._cancelled.set()
+        with self._lock:
+            stream = self._stream
+        if stream is not None:
+            with contextlib.suppress(Exception):  # already abandoned
+                stream.close()
+
+    def abort(self) -> None:
+        """Close the stream and wake the caller at once."""
+        self.cancel()
+        self.events.put(_CANCELLED)
+
+
+def _estimate_usage(request: dict[str, Any], content: str) -> dict[str, int]:
+    """Estimate Converse usage from text lengths, for streams cut off before the metadata."""
+    system_text = request["system"][0]["text"]
+    user_text = request["messages"][0]["content"][0]["text"]
+    input_tokens = (len(system_text) + len(user_text)) // BEDROCK_CHARS_PER_TOKEN
+    output_tokens = len(content) // BEDROCK_CHARS_PER_TOKEN
+    return {
+        "inputTokens": input_tokens,
+        "outputTokens": output_tokens,
+        "totalTokens": input_tokens + output_tokens,
+    }
+
 
 class BedrockClient:
     """Wrapper for Amazon Bedrock Converse API with token tracking."""
 
-    def __init__(self, region_name: str = "us-east-1"):
+    def __init__(self, region_name: str = "us-east-1", client: Any = None):
         """Initialize Bedrock client.
 
         Args:
             region_name: AWS region for Bedrock
+            client: Optional boto3 bedrock-runtime client (default: the
+                process-wide shared client for the region)
         """
-        self.client = boto3.client("bedrock-runtime", region_name=region_name)
+        self.client = client or get_aws_client("bedrock-runtime", region_name=region_name)
         self.region = region_name
 
-    @retry(
-        stop=stop_after_attempt(BEDROCK_RETRY_ATTEMPTS),
-        wait=wait_exponential(multiplier=2, min=2, max=10),
-        retry=retry_if_exception_type((ClientError,)),
-        reraise=True,
-    )
     def converse(
         self,
         model_id: str,
@@ -40,9 +199,15 @@ class BedrockClient:
         temperature: float = 0.3,
         max_tokens: int = 2048,
         top_p: float | None = None,
+        deadline_seconds: float | None = None,
+        first_token_timeout_seconds: float | None = None,
+        cancel: CancelToken | None = None,
     ) -> dict[str, Any]:
         """Call Bedrock Converse API with retry logic.
 
+        With a deadline, first-token limit or cancel token the call is
+        streamed (see ``converse_stream``) so they can be enforced.
+
         Args:
             model_id: Bedrock model ID
             system_prompt: System prompt text
@@ -50,6 +215,9 @@ class BedrockClient:
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
             top_p: Nucleus sampling parameter (optional, not compatible with Claude Sonnet 4)
+            deadline_seconds: Time limit for the whole call, retries included
+            first_token_timeout_seconds: Time limit for the first token of each attempt
+            cancel: Token another thread can use to abandon the call
 
         Returns:
             Response dict with:
@@ -60,11 +228,46 @@ class BedrockClient:
 
         Raises:
             ClientError: If Bedrock API call fails after retries
+            BedrockTimeoutError: If a streamed call misses its limits
+            BedrockCancelledError: If the call is cancelled
         """
-        start_time = datetime.utcnow()
+        if (
+            deadline_seconds is not None
+            or first_token_timeout_seconds is not None
+            or cancel is not None
+        ):
+            return self.converse_stream(
+                model_id=model_id,
+                system_prompt=system_prompt,
+                user_message=user_message,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                top_p=top_p,
+                deadline_seconds=deadline_seconds,
+                first_token_timeout_seconds=first_token_timeout_seconds,
+                cancel=cancel,
+            )
+        return self._converse(
+            model_id=model_id,
+            system_prompt=system_prompt,
+            user_message=user_message,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            top_p=top_p,
+        )
 
+    @staticmethod
+    def _request(
+        model_id: str,
+        system_prompt: str,
+        user_message: str,
+        temperature: float,
+        max_tokens: int,
+        top_p: float | None,
+    ) -> dict[str, Any]:
+        """Build the Converse/ConverseStream request arguments."""
         # Build inference config - exclude top_p for Claude Sonnet 4
-        inference_config = {
+        inference_config: dict[str, Any] = {
             "maxTokens": max_tokens,
             "temperature": temperature,
         }
@@ -73,17 +276,41 @@ class BedrockClient:
         if top_p is not None and "claude-sonnet-4" not in model_id:
             inference_config["topP"] = top_p
 
+        return {
+            "modelId": model_id,
+            "system": [{"text": system_prompt}],
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [{"text": user_message}],
+                }
+            ],
+            "inferenceConfig": inference_config,
+        }
+
+    @retry(
+        stop=stop_after_attempt(BEDROCK_RETRY_ATTEMPTS),
+        wait=wait_exponential(multiplier=2, min=2, max=_MAX_RETRY_WAIT_SECONDS),
+        retry=retry_if_exception_type((ClientError,)),
+        reraise=True,
+    )
+    def _converse(
+        self,
+        model_id: str,
+        system_prompt: str,
+        user_message: str,
+        temperature: float,
+        max_tokens: int,
+        top_p: float | None,
+    ) -> dict[str, Any]:
+        """Call the blocking Converse API (see ``converse``)."""
+        start_time = datetime.utcnow()
+
         try:
             response = self.client.converse(
-                modelId=model_id,
-                system=[{"text": system_prompt}],
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [{"text": user_message}],
-                    }
-                ],
-                inferenceConfig=inference_config,  # type: ignore[arg-type]
+                **self._request(
+                    model_id, system_prompt, user_message, temperature, max_tokens, top_p
+                )
             )
 
             latency_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
@@ -135,6 +362,214 @@ class BedrockClient:
             )
             raise
 
+    def converse_stream(
+        self,
+        model_id: str,
+        system_prompt: str,
+        user_message: str,
+        temperature: float = 0.3,
+        max_tokens: int = 2048,
+        top_p: float | None = None,
+        deadline_seconds: float | None = None,
+        first_token_timeout_seconds: float | None = None,
+        cancel: CancelToken | None = None,
+    ) -> dict[str, Any]:
+        """Call Bedrock ConverseStream API under a deadline and first-token limit.
+
+        Throttling and other client errors are retried with backoff, and a
+        missed first token is retried at once, as long as the deadline
+        leaves room. TTFT and output tokens/s are recorded per model.
+
+        Args:
+            model_id: Bedrock model ID
+            system_prompt: System prompt text
+            user_message: User message text
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            top_p: Nucleus sampling parameter (ignored for Claude Sonnet 4)
+            deadline_seconds: Time limit for the whole call, retries included
+            first_token_timeout_seconds: Time limit for the first token of each attempt
+            cancel: Token another thread can use to abandon the call
+
+        Returns:
+            Response dict as from ``converse``, plus ``ttft_ms`` and
+            ``tokens_per_second``
+
+        Raises:
+            ClientError: If Bedrock API call fails after retries
+            BedrockTimeoutError: If the deadline passes, or the first token
+                is late on the last attempt
+            BedrockCancelledError: If the call is cancelled
+        """
+        request = self._request(
+            model_id, system_prompt, user_message, temperature, max_tokens, top_p
+        )
+        deadline = time.monotonic() + deadline_seconds if deadline_seconds is not None else None
+
+        attempt = 1
+        while True:
+            try:
+                return self._stream_once(
+                    request, deadline, first_token_timeout_seconds, attempt, cancel
+                )
+            except (BedrockTimeoutError, ClientError) as e:
+                late_first_token = isinstance(e, BedrockTimeoutError) and e.limit == "first_token"
+                if isinstance(e, BedrockTimeoutError):
+                    _latency_metrics.record_timeout(model_id, e.limit)
+                if attempt >= BEDROCK_RETRY_ATTEMPTS or not (
+                    late_first_token or isinstance(e, ClientError)
+                ):
+                    raise
+                wait = (
+                    0.0
+                    if late_first_token
+                    else min(
+                        BEDROCK_RETRY_WAIT_SECONDS
+                        * BEDROCK_RETRY_BACKOFF_MULTIPLIER ** (attempt - 1),
+                        _MAX_RETRY_WAIT_SECONDS,
+                    )
+                )
+                if deadline is not None and time.monotonic() + wait >= deadline:
+                    raise
+                logger.warning(
+                    "bedrock_stream_retrying",
+                    model_id=model_id,
+                    attempt=attempt,
+                    error=str(e),
+                    wait_seconds=wait,
+                )
+                time.sleep(wait)
+                attempt += 1
+
+    def _stream_once(
+        self,
+        request: dict[str, Any],
+        deadline: float | None,
+        first_token_timeout_seconds: float | None,
+        attempt: int,
+        cancel: CancelToken | None,
+    ) -> dict[str, Any]:
+        """Make one ConverseStream attempt (see ``converse_stream``)."""
+        model_id = request["modelId"]
+        started = time.monotonic()
+        first_token_by = (
+            started + first_token_timeout_seconds
+            if first_token_timeout_seconds is not None
+            else None
+        )
+        reader = _StreamReader(lambda: self.client.converse_stream(**request))
+        if cancel is not None:
+            cancel.on_cancel(reader.abort)
+        repairer = JSONRepairer()
+        chunks: list[str] = []
+        ttft: float | None = None
+        usage: dict[str, Any] | None = None
+        stop_reason = "unknown"
+
+        with span("bedrock.converse_stream", model_id=model_id, attempt=attempt) as call:
+            try:
+                while True:
+                    limits = [(deadline, "deadline")] if deadline is not None else []
+                    if ttft is None and first_token_by is not None:
+                        limits.append((first_token_by, "first_token"))
+                    until, limit = min(limits) if limits else (None, "")
+                    try:
+                        event = reader.events.get(
+                            timeout=None if until is None else max(until - time.monotonic(), 0)
+                        )
+                    except queue.Empty:
+                        elapsed_ms = int((time.monotonic() - started) * 1000)
+                        call.set(timed_out=limit)
+                        if limit == "deadline" and repairer.complete:
+                            # Only text after the JSON object is missing
+                            stop_reason = "deadline"
+                            break
+                        logger.warning(
+                            "bedrock_stream_timeout",
+                            model_id=model_id,
+                            limit=limit,
+                            elapsed_ms=elapsed_ms,
+                            received_chars=sum(len(c) for c in chunks),
+                        )
+                        raise BedrockTimeoutError(
+                            model_id, limit, elapsed_ms, "".join(chunks)
+                        ) from None
+
+                    if event is _STREAM_END:
+                        break
+                    if event is _CANCELLED:
+                        call.set(cancelled=True)
+                        estimate = _estimate_usage(request, "".join(chunks))
+                        raise BedrockCancelledError(
+                            model_id,
+                            int((time.monotonic() - started) * 1000),
+                            {
+                                "input_tokens": estimate["inputTokens"],
+                                "output_tokens": estimate["outputTokens"],
+                                "total_tokens": estimate["totalTokens"],
+                            },
+                        )
+                    if isinstance(event, Exception):
+                        raise event
+                    if "contentBlockDelta" in event:
+                        text = event["contentBlockDelta"].get("delta", {}).get("text", "")
+                        if text:
+                            if ttft is None:
+                                ttft = time.monotonic() - started
+                            chunks.append(text)
+                            repairer.feed(text)
+                    elif "messageStop" in event:
+                        stop_reason = event["messageStop"].get("stopReason", "unknown")
+                    elif "metadata" in event:
+                        usage = event["metadata"].get("usage")
+            except ClientError as e:
+                error_code = e.response.get("Error", {}).get("Code", "Unknown")
+                logger.error(
+                    "bedrock_converse_failed",
+                    model_id=model_id,
+                    error_code=error_code,
+                    error=str(e),
+                )
+                raise
+            finally:
+                reader.cancel()
+
+            latency = time.monotonic() - started
+            content = "".join(chunks)
+            if usage is None:
+                usage = _estimate_usage(request, content)
+            output_tokens = usage.get("outputTokens", 0)
+            generating = latency - (ttft or 0.0)
+            tokens_per_second = round(output_tokens / generating, 1) if generating > 0 else 0.0
+            ttft_ms = int((ttft if ttft is not None else latency) * 1000)
+            latency_ms = int(latency * 1000)
+            call.set(ttft_ms=ttft_ms, tokens_per_second=tokens_per_second)
+
+        _latency_metrics.record(model_id, ttft_ms, latency_ms, tokens_per_second)
+        logger.info(
+            "bedrock_converse_success",
+            model_id=model_id,
+            input_tokens=usage.get("inputTokens", 0),
+            output_tokens=output_tokens,
+            latency_ms=latency_ms,
+            ttft_ms=ttft_ms,
+            tokens_per_second=tokens_per_second,
+            stop_reason=stop_reason,
+        )
+        return {
+            "content": content,
+            "usage": {
+                "input_tokens": usage.get("inputTokens", 0),
+                "output_tokens": output_tokens,
+                "total_tokens": usage.get("totalTokens", 0),
+            },
+            "stop_reason": stop_reason,
+            "latency_ms": latency_ms,
+            "model_id": model_id,
+            "ttft_ms": ttft_ms,
+            "tokens_per_second": tokens_per_second,
+        }
+
     def calculate_cost(
         self,
         model_id: str,
@@ -174,9 +609,14 @@ class BedrockClient:
         """Parse JSON from LLM response.
 
         Handles common issues:
-        - Markdown code blocks
-        - Leading/trailing whitespace
-        - Text before/after JSON
+        - Markdown code blocks and text before/after the JSON object
+        - Trailing commas, missing commas, raw newlines in strings,
+          invalid escapes and Python literals
+        - Output truncated at max_tokens (closed at the last complete member)
+
+        Well-formed JSON is parsed directly; the tolerant repair pass runs only
+        when that fails. Repairs are logged and reported to an enclosing
+        ``capture_repairs()`` block.
 
         Args:
             content: Raw LLM response text
@@ -184,36 +624,17 @@ class BedrockClient:
         Returns:
             Parsed JSON dict or None if parsing fails
         """
-        # Remove markdown code blocks
-        content = content.strip()
-        if content.startswith("```json"):
-            content = content[7:]
-        elif content.startswith("```"):
-            content = content[3:]
-        if content.endswith("```"):
-            content = content[:-3]
-
-        content = content.strip()
-
-        # Try to find JSON object boundaries
-        start = content.find("{")
-        end = content.rfind("}") + 1
-
-        if start == -1 or end == 0:
-            logger.error("json_parse_no_braces", content_preview=content[:200])
-            return None
-
-        json_str = content[start:end]
-
-        try:
-            return json.loads(json_str)  # type: ignore[no-any-return]
-        except json.JSONDecodeError as e:
+        parsed, repairs = parse_json_object(content)
+        if parsed is None:
             logger.error(
                 "json_parse_failed",
-                error=str(e),
-                content_preview=json_str[:200],
+                repairs=repairs,
+                content_preview=content.strip()[:200],
             )
             return None
+        if repairs:
+            logger.info("json_response_repaired", repairs=repairs)
+        return parsed
 
     def retry_with_correction(
         self,
@@ -224,6 +645,8 @@ class BedrockClient:
         parse_error: str,
         temperature: float = 0.1,
         max_tokens: int = 2048,
+        deadline_seconds: float | None = None,
+        first_token_timeout_seconds: float | None = None,
     ) -> dict[str, Any]:
         """Retry API call with correction prompt.
 
@@ -232,9 +655,11 @@ class BedrockClient:
             system_prompt: Original system prompt
             original_message: Original user message
             failed_response: Previous failed response
-            parse_error: Error message from parsing
+            parse_error: Why the response was rejected (parse or schema validation errors)
             temperature: Sampling temperature
             max_tokens: Maximum tokens
+            deadline_seconds: Time limit for the call (see ``converse``)
+            first_token_timeout_seconds: Time limit for the first token
 
         Returns:
             Response dict from converse()
@@ -244,7 +669,7 @@ class BedrockClient:
 Previous response snippet:
 {failed_response[:500]}
 
-Parse error: {parse_error}
+Error: {parse_error}
 
 Please respond with ONLY a valid JSON object matching your system prompt schema.
 No markdown code blocks, no text outside the JSON object.
@@ -261,4 +686,178 @@ Original request:
             user_message=correction_prompt,
             temperature=temperature,
             max_tokens=max_tokens,
+            deadline_seconds=deadline_seconds,
+            first_token_timeout_seconds=first_token_timeout_seconds,
         )
+
+
+class ResponseParseMetrics:
+    """Process-wide counts of how agent responses were parsed, per model.
+
+    Each response is counted once with its outcome:
+    - ``clean``: parsed and validated as returned
+    - ``repaired``: valid after the tolerant JSON repair
+    - ``corrected``: needed a correction round-trip to Bedrock
+    - ``failed``: still invalid after the correction
+    """
+
+    OUTCOMES = ("clean", "repaired", "corrected", "failed")
+
+    def __init__(self) -> None:
+        """Start with no responses."""
+        self._lock = threading.Lock()
+        self._outcomes: dict[str, dict[str, int]] = {}
+        self._repairs: dict[str, dict[str, int]] = {}
+
+    def record(self, model_id: str, outcome: str, repairs: list[str] | None = None) -> None:
+        """Count one parsed response.
+
+        Args:
+            model_id: Model that produced the response
+            outcome: One of OUTCOMES
+            repairs: Kinds of JSON repairs applied
+        """
+        with self._lock:
+            outcomes = self._outcomes.setdefault(model_id, dict.fromkeys(self.OUTCOMES, 0))
+            outcomes[outcome] += 1
+            kinds = self._repairs.setdefault(model_id, {})
+            for kind in repairs or []:
+                kinds[kind] = kinds.get(kind, 0) + 1
+
+    def get_metrics(self) -> dict[str, dict[str, Any]]:
+        """Return per-model counts with repair and correction-retry rates.
+
+        Returns:
+            Per model ID: outcome counts, ``responses``, ``repair_rate``,
+            ``retry_rate`` and ``repairs`` (count per repair kind)
+        """
+        with self._lock:
+            metrics: dict[str, dict[str, Any]] = {}
+            for model_id, outcomes in self._outcomes.items():
+                responses = sum(outcomes.values())
+                retried = outcomes["corrected"] + outcomes["failed"]
+                metrics[model_id] = {
+                    **outcomes,
+                    "responses": responses,
+                    "repair_rate": round(outcomes["repaired"] / responses, 4),
+                    "retry_rate": round(retried / responses, 4),
+                    "repairs": dict(self._repairs.get(model_id, {})),
+                }
+            return metrics
+
+
+_parse_metrics = ResponseParseMetrics()
+
+
+def get_response_parse_metrics() -> ResponseParseMetrics:
+    """Get the process-wide agent response parse metrics."""
+    return _parse_metrics
+
+
+def nearest_rank(values: list[float], percentile: float) -> float:
+    """Return the nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[max(math.ceil(percentile / 100 * len(ordered)), 1) - 1]
+
+
+class ModelLatencyMetrics:
+    """Process-wide latency and throughput of streamed calls, per model.
+
+    Keeps the last ``BEDROCK_LATENCY_WINDOW`` successful calls per model and
+    counts the calls that missed a limit.
+    """
+
+    FIELDS = ("ttft_ms", "latency_ms", "tokens_per_second")
+
+    def __init__(self, window: int = BEDROCK_LATENCY_WINDOW) -> None:
+        """Start with no calls.
+
+        Args:
+            window: Calls per model kept for the percentiles
+        """
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples: dict[str, dict[str, deque[float]]] = {}
+        self._timeouts: dict[str, dict[str, int]] = {}
+
+    def record(
+        self, model_id: str, ttft_ms: float, latency_ms: float, tokens_per_second: float
+    ) -> None:
+        """Record a completed call.
+
+        Args:
+            model_id: Bedrock model ID
+            ttft_ms: Time to first token
+            latency_ms: Time to the end of the stream
+            tokens_per_second: Output tokens per second after the first token
+        """
+        with self._lock:
+            samples = self._samples.setdefault(
+                model_id, {name: deque(maxlen=self.window) for name in self.FIELDS}
+            )
+            samples["ttft_ms"].append(ttft_ms)
+            samples["latency_ms"].append(latency_ms)
+            samples["tokens_per_second"].append(tokens_per_second)
+
+    def record_timeout(self, model_id: str, limit: str) -> None:
+        """Count a call that missed a limit.
+
+        Args:
+            model_id: Bedrock model ID
+            limit: ``first_token`` or ``deadline``
+        """
+        with self._lock:
+            counts = self._timeouts.setdefault(model_id, {"first_token": 0, "deadline": 0})
+            counts[limit] += 1
+
+    def count(self, model_id: str) -> int:
+        """Return how many of the model's recent calls are in the window."""
+        with self._lock:
+            return len(self._samples.get(model_id, {}).get("latency_ms", ()))
+
+    def percentile(self, model_id: str, field: str, percentile: float) -> float | None:
+        """Return a percentile of one field over the model's recent calls.
+
+        Args:
+            model_id: Bedrock model ID
+            field: One of FIELDS
+            percentile: Percentile (0-100)
+
+        Returns:
+            The value, or None before the model's first call
+        """
+        with self._lock:
+            values = list(self._samples.get(model_id, {}).get(field, ()))
+        return nearest_rank(values, percentile) if values else None
+
+    def get_metrics(self) -> dict[str, dict[str, Any]]:
+        """Return per-model call counts, percentiles and timeouts.
+
+        Returns:
+            Per model ID: ``calls`` (in the window), p50/p95 of TTFT and
+            latency, p50 of tokens/s, and ``timeouts`` by limit
+        """
+        with self._lock:
+            models = set(self._samples) | set(self._timeouts)
+            metrics: dict[str, dict[str, Any]] = {}
+            for model_id in sorted(models):
+                samples = {k: list(v) for k, v in self._samples.get(model_id, {}).items()}
+                entry: dict[str, Any] = {"calls": len(samples.get("latency_ms", []))}
+                if entry["calls"]:
+                    for name in ("ttft_ms", "latency_ms"):
+                        entry[f"{name}_p50"] = nearest_rank(samples[name], 50)
+                        entry[f"{name}_p95"] = nearest_rank(samples[name], 95)
+                    entry["tokens_per_second_p50"] = nearest_rank(samples["tokens_per_second"], 50)
+                entry["timeouts"] = dict(
+                    self._timeouts.get(model_id, {"first_token": 0, "deadline": 0})
+                )
+                metrics[model_id] = entry
+            return metrics
+
+
+_latency_metrics = ModelLatencyMetrics()
+
+
+def get_model_latency_metrics() -> ModelLatencyMetrics:
+    """Get the process-wide streamed call latency metrics."""
+    return _latency_metrics
@@ -0,0 +1,203 @@
+"""Process-wide registry of AWS and HTTP clients.
+
+Creating a boto3 client or resource loads service models and builds a new
+connection pool; creating an httpx client builds another pool. Doing that per
+request (or per submission) costs milliseconds of CPU and throws away warm
+TLS connections. Clients are therefore created once per process through this
+registry, with explicit pool sizing and TCP keep-alive, and shared by the API
+dependencies, middleware and analyzer.
+
+boto3 clients and httpx clients are thread-safe. Creation goes through the
+registry lock, since building clients from the default boto3 session is not.
+A forked child process (analyzer workers) starts with an empty registry
+rather than inheriting the parent's sockets.
+"""
+
+import os
+import threading
+from collections.abc import Callable, Hashable
+from typing import TYPE_CHECKING, Any
+
+import boto3
+from botocore.config import Config
+
+from src.constants import (
+    AWS_MAX_POOL_CONNECTIONS,
+    HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+)
+from src.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = get_logger(__name__)
+
+
+class ClientRegistry:
+    """Lazily created, process-wide shared clients keyed by configuration."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._lock = threading.RLock()  # factories may fetch other shared clients
+        self._clients: dict[Hashable, tuple[Any, Callable[[Any], None] | None]] = {}
+        self._pid = os.getpid()
+        self._stats = {"created": 0, "reused": 0}
+
+    def get(
+        self,
+        key: Hashable,
+        factory: Callable[[], Any],
+        closer: Callable[[Any], None] | None = None,
+    ) -> Any:
+        """Get the shared client for a key, creating it on first use.
+
+        Args:
+            key: Registry key (service and configuration)
+            factory: Builds the client
+            closer: Releases the client's connections (default: its ``close``)
+
+        Returns:
+            Shared client
+        """
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked: the parent's pools are not ours to reuse or close
+                self._clients.clear()
+                self._pid = os.getpid()
+
+            entry = self._clients.get(key)
+            if entry is not None:
+                self._stats["reused"] += 1
+                return entry[0]
+
+            client = factory()
+            self._clients[key] = (client, closer)
+            self._stats["created"] += 1
+            logger.debug("client_created", key=str(key))
+            return client
+
+    def close(self) -> None:
+        """Close every client and empty the registry."""
+        with self._lock:
+            entries = list(self._clients.values())
+            self._clients.clear()
+
+        for client, closer in entries:
+            try:
+                if closer is not None:
+                    closer(client)
+                elif hasattr(client, "close"):
+                    client.close()
+            except Exception as e:
+                logger.warning("client_close_failed", error=str(e))
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Created / reused counters and the number of live clients."""
+        with self._lock:
+            return {**self._stats, "clients": len(self._clients)}
+
+
+_registry = ClientRegistry()
+
+
+def get_client_registry() -> ClientRegistry:
+    """Get the process-wide client registry."""
+    return _registry
+
+
+def close_clients() -> None:
+    """Close all shared clients (application shutdown, test isolation)."""
+    _registry.close()
+
+
+# ============================================================
+# AWS
+# ============================================================
+
+
+def aws_config(max_pool_connections: int = AWS_MAX_POOL_CONNECTIONS) -> Config:
+    """Build the botocore config used for shared clients.
+
+    Args:
+        max_pool_connections: Connection pool size per client
+
+    Returns:
+        botocore Config with pool sizing and TCP keep-alive
+    """
+    return Config(max_pool_connections=max_pool_connections, tcp_keepalive=True)
+
+
+def _default_region() -> str:
+    return os.environ.get("AWS_REGION", "us-east-1")
+
+
+def get_aws_client(
+    service_name: str,
+    region_name: str | None = None,
+    endpoint_url: str | None = None,
+) -> Any:
+    """Get the shared low-level boto3 client for a service.
+
+    Args:
+        service_name: AWS service name (e.g. "bedrock-runtime", "lambda")
+        region_name: AWS region (defaults to AWS_REGION)
+        endpoint_url: Optional endpoint override (local services)
+
+    Returns:
+        Shared boto3 client
+    """
+    region_name = region_name or _default_region()
+    return _registry.get(
+        ("client", service_name, region_name, endpoint_url),
+        # The stubs only have overloads for literal service names
+        lambda: boto3.client(  # type: ignore[call-overload]
+            service_name,
+            region_name=region_name,
+            endpoint_url=endpoint_url,
+            config=aws_config(),
+        ),
+    )
+
+
+def get_dynamodb_resource(region_name: str | None = None, endpoint_url: str | None = None) -> Any:
+    """Get the shared DynamoDB service resource.
+
+    Args:
+        region_name: AWS region (defaults to AWS_REGION)
+        endpoint_url: Optional endpoint (DynamoDB Local); defaults to
+            DYNAMODB_ENDPOINT_URL
+
+    Returns:
+        Shared boto3 DynamoDB resource
+    """
+    region_name = region_name or _default_region()
+    endpoint_url = endpoint_url or os.environ.get("DYNAMODB_ENDPOINT_URL")
+    return _registry.get(
+        ("resource", "dynamodb", region_name, endpoint_url),
+        lambda: boto3.resource(
+            "dynamodb",
+            region_name=region_name,
+            endpoint_url=endpoint_url,
+            config=aws_config(),
+        ),
+        closer=lambda resource: resource.meta.client.close(),
+    )
+
+
+# ============================================================
+# HTTP
+# ============================================================
+
+
+def http_limits() -> "httpx.Limits":
+    """Connection limits for shared httpx clients."""
+    import httpx  # only the analyzer talks HTTP; keep it out of API cold starts
+
+    return httpx.Limits(
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    )
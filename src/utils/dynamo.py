@@ -1,12 +1,24 @@
 """DynamoDB helper with all 16 access patterns."""
 
+import base64
+import json
 from typing import Any
 
-import boto3
-from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.conditions import ConditionBase, Key
+from boto3.dynamodb.types import TypeDeserializer
 from botocore.exceptions import ClientError
 
+from src.constants import (
+    DYNAMODB_BATCH_GET_ATTEMPTS,
+    DYNAMODB_BATCH_GET_MAX_ITEMS,
+    DYNAMODB_BATCH_WRITE_MAX_ITEMS,
+    DYNAMODB_TRANSACT_MAX_ITEMS,
+    REPO_CLAIM_ATTEMPTS,
+)
+from src.utils.clients import get_client_registry, get_dynamodb_resource
 from src.utils.logging import get_logger
+from src.utils.tracing import span
+from src.utils.write_scheduler import estimate_write_units, get_write_scheduler
 
 logger = get_logger(__name__)
 
@@ -20,20 +32,47 @@ class DynamoDBHelper:
         Args:
             table_name: Name of the DynamoDB table
         """
-        import os
-
-        endpoint_url = os.environ.get("DYNAMODB_ENDPOINT_URL")
-        region = os.environ.get("AWS_REGION", "us-east-1")
-
-        if endpoint_url:
-            # Local DynamoDB
-            dynamodb = boto3.resource("dynamodb", endpoint_url=endpoint_url, region_name=region)
-        else:
-            # AWS DynamoDB
-            dynamodb = boto3.resource("dynamodb", region_name=region)
+        # Shared per process (DYNAMODB_ENDPOINT_URL selects DynamoDB Local)
+        dynamodb = get_dynamodb_resource()
 
         self.table = dynamodb.Table(table_name)
         self.table_name = table_name
+        self.write_scheduler = get_write_scheduler(table_name)
+
+    def _put_item(self, item: dict, **kwargs: Any) -> Any:
+        """Put an item through the capacity-aware write scheduler.
+
+        Throttled writes are paced and retried instead of failing; a
+        ClientError only surfaces once retries are exhausted or the error
+        is not a throttle.
+
+        Args:
+            item: Serialized item
+            **kwargs: Further put_item arguments (e.g. ConditionExpression)
+
+        Returns:
+            put_item response
+        """
+        size = estimate_item_size(item)
+        with span("dynamodb.put_item", entity=_entity_of(item), bytes=size):
+            return self.write_scheduler.execute(
+                self.table.put_item,
+                estimated_units=estimate_write_units(size),
+                Item=item,
+                **kwargs,
+            )
+
+    def _update_item(self, **kwargs: Any) -> Any:
+        """Run update_item through the capacity-aware write scheduler.
+
+        Args:
+            **kwargs: update_item arguments
+
+        Returns:
+            update_item response
+        """
+        with span("dynamodb.update_item", entity=_entity_of(kwargs.get("Key", {}))):
+            return self.write_scheduler.execute(self.table.update_item, **kwargs)
 
     # ============================================================
     # ORGANIZER ACCESS PATTERNS
@@ -50,7 +89,7 @@ class DynamoDBHelper:
         """
         try:
             response = self.table.get_item(Key={"PK": f"ORG#{org_id}", "SK": "PROFILE"})
-            return response.get("Item")
+            return _item(response)
         except ClientError as e:
             logger.error("get_organizer_failed", org_id=org_id, error=str(e))
             return None
@@ -86,7 +125,7 @@ class DynamoDBHelper:
         try:
             # Convert datetime objects to ISO strings for DynamoDB
             item = self._serialize_item(organizer)
-            self.table.put_item(Item=item)
+            self._put_item(item)
             logger.info("organizer_created", org_id=organizer.get("org_id"))
             return True
         except ClientError as e:
@@ -148,7 +187,7 @@ class DynamoDBHelper:
                     Key("PK").eq(f"ORG#{org_id}") & Key("SK").begins_with("HACK#")
                 )
             )
-            return response.get("Items", [])
+            return _items(response)
         except ClientError as e:
             logger.error("list_organizer_hackathons_failed", org_id=org_id, error=str(e))
             return []
@@ -164,7 +203,7 @@ class DynamoDBHelper:
         """
         try:
             response = self.table.get_item(Key={"PK": f"HACK#{hack_id}", "SK": "META"})
-            return response.get("Item")
+            return _item(response)
         except ClientError as e:
             logger.error("get_hackathon_failed", hack_id=hack_id, error=str(e))
             return None
@@ -202,7 +241,7 @@ class DynamoDBHelper:
         """
         try:
             item = self._serialize_item(hackathon)
-            self.table.put_item(Item=item)
+            self._put_item(item)
             logger.info("hackathon_created", hack_id=hackathon.get("hack_id"))
             return True
         except ClientError as e:
@@ -212,21 +251,97 @@ class DynamoDBHelper:
     def put_hackathon_detail(self, detail: dict) -> bool:
         """Create or update hackathon detail record.
 
+        META items also get the GSI3 keys of their current status, so a
+        status change moves the hackathon between status listings.
+
         Args:
             detail: Hackathon detail record dict
 
         Returns:
             True if successful
         """
+        if detail.get("SK") == "META" and detail.get("status"):
+            # Keep the status listing index (GSI3) in step with the status
+            detail = {
+                **detail,
+                "GSI3PK": f"HACK_STATUS#{detail['status']}",
+                "GSI3SK": f"{detail.get('created_at', '')}#{detail.get('hack_id', '')}",
+            }
         try:
             item = self._serialize_item(detail)
-            self.table.put_item(Item=item)
+            self._put_item(item)
             logger.info("hackathon_detail_created", hack_id=detail.get("hack_id"))
             return True
         except ClientError as e:
             logger.error("put_hackathon_detail_failed", error=str(e))
             return False
 
+    def list_hackathons_by_status_page(
+        self,
+        status: str,
+        limit: int = 50,
+        exclusive_start_key: dict | None = None,
+    ) -> tuple[list[dict], dict | None]:
+        """AP19: List one page of hackathons in a status, newest first.
+
+        Reads the sparse GSI3 index, which projects only the fields needed
+        for listings (name, description, dates, status, submission_count).
+
+        Args:
+            status: Hackathon status
+            limit: Maximum hackathons to return
+            exclusive_start_key: LastEvaluatedKey from the previous page
+
+        Returns:
+            Tuple of (projected hackathon records, LastEvaluatedKey or None
+            when exhausted)
+        """
+        query_kwargs: dict[str, Any] = {
+            "IndexName": "GSI3",
+            "KeyConditionExpression": Key("GSI3PK").eq(f"HACK_STATUS#{status}"),
+            "ScanIndexForward": False,
+            "Limit": limit,
+        }
+        if exclusive_start_key:
+            query_kwargs["ExclusiveStartKey"] = exclusive_start_key
+
+        try:
+            response = self.table.query(**query_kwargs)
+            return response.get("Items", []), response.get("LastEvaluatedKey")
+        except ClientError as e:
+            logger.error("list_hackathons_by_status_page_failed", status=status, error=str(e))
+            return [], None
+
+    def add_submission_count(self, hack_id: str, delta: int) -> int | None:
+        """Atomically add to a hackathon's submission count.
+
+        Args:
+            hack_id: Hackathon ID
+            delta: Submissions added (negative to subtract)
+
+        Returns:
+            Submission count after the update, or None if the hackathon
+            does not exist or the update failed
+        """
+        from datetime import UTC, datetime
+
+        try:
+            response = self._update_item(
+                Key={"PK": f"HACK#{hack_id}", "SK": "META"},
+                UpdateExpression="SET updated_at = :now ADD submission_count :delta",
+                ConditionExpression="attribute_exists(PK)",
+                ExpressionAttributeValues={
+                    ":delta": delta,
+                    ":now": datetime.now(UTC).isoformat(),
+                },
+                ReturnValues="UPDATED_NEW",
+            )
+            return int(response["Attributes"]["submission_count"])
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                logger.error("add_submission_count_failed", hack_id=hack_id, error=str(e))
+            return None
+
     # ============================================================
     # SUBMISSION ACCESS PATTERNS
     # ============================================================
@@ -246,7 +361,7 @@ class DynamoDBHelper:
                     Key("PK").eq(f"HACK#{hack_id}") & Key("SK").begins_with("SUB#")
                 )
             )
-            return response.get("Items", [])
+            return _items(response)
         except ClientError as e:
             logger.error("list_submissions_failed", hack_id=hack_id, error=str(e))
             return []
@@ -263,7 +378,7 @@ class DynamoDBHelper:
         """
         try:
             response = self.table.get_item(Key={"PK": f"HACK#{hack_id}", "SK": f"SUB#{sub_id}"})
-            return response.get("Item")
+            return _item(response)
         except ClientError as e:
             logger.error("get_submission_failed", sub_id=sub_id, error=str(e))
             return None
@@ -298,7 +413,7 @@ class DynamoDBHelper:
         """
         try:
             item = self._serialize_item(submission)
-            self.table.put_item(Item=item)
+            self._put_item(item)
             logger.info("submission_created", sub_id=submission.get("sub_id"))
             return True
         except ClientError as e:
@@ -348,7 +463,7 @@ class DynamoDBHelper:
                     update_expr += f", {key} = :{key}"
                     expr_attr_values[f":{key}"] = value
 
-            self.table.update_item(
+            self._update_item(
                 Key={"PK": f"HACK#{hack_id}", "SK": f"SUB#{sub_id}"},
                 UpdateExpression=update_expr,
                 ExpressionAttributeNames=expr_attr_names,
@@ -360,6 +475,113 @@ class DynamoDBHelper:
             logger.error("update_submission_status_failed", sub_id=sub_id, error=str(e))
             return False
 
+    # ============================================================
+    # REPOSITORY CLAIM ACCESS PATTERNS
+    # ============================================================
+
+    def claim_repo_urls(self, hack_id: str, claims: dict[str, str]) -> tuple[list[str], list[str]]:
+        """Claim repository URLs for submissions, at most once per hackathon.
+
+        Each claim is a ``REPO#<normalized url>`` item under the hackathon,
+        written with ``attribute_not_exists`` in TransactWriteItems chunks.
+        A cancelled chunk reports which conditions failed; those rows are
+        duplicates and the rest of the chunk is retried without them.
+
+        Args:
+            hack_id: Hackathon ID
+            claims: Normalized repository URL -> sub_id of the new submission
+
+        Returns:
+            Tuple of (claimed, duplicates) normalized URLs; URLs in neither
+            list could not be written
+        """
+        from datetime import UTC, datetime
+
+        now = datetime.now(UTC).isoformat()
+        client = self.table.meta.client
+        claimed: list[str] = []
+        duplicates: list[str] = []
+        urls = list(claims)
+
+        for start in range(0, len(urls), DYNAMODB_TRANSACT_MAX_ITEMS):
+            chunk = urls[start : start + DYNAMODB_TRANSACT_MAX_ITEMS]
+            for _ in range(REPO_CLAIM_ATTEMPTS):
+                if not chunk:
+                    break
+                try:
+                    self.write_scheduler.execute(
+                        client.transact_write_items,
+                        # Transactional writes cost two units per item
+                        estimated_units=2.0 * len(chunk),
+                        TransactItems=[
+                            {
+                                "Put": {
+                                    "TableName": self.table_name,
+                                    "Item": {
+                                        "PK": f"HACK#{hack_id}",
+                                        "SK": f"REPO#{url}",
+                                        "entity_type": "REPO_CLAIM",
+                                        "hack_id": hack_id,
+                                        "repo_url": url,
+                                        "sub_id": claims[url],
+                                        "created_at": now,
+                                    },
+                                    "ConditionExpression": "attribute_not_exists(PK)",
+                                }
+                            }
+                            for url in chunk
+                        ],
+                    )
+                    claimed.extend(chunk)
+                    chunk = []
+                except ClientError as e:
+                    if e.response.get("Error", {}).get("Code") != "TransactionCanceledException":
+                        logger.error("claim_repo_urls_failed", hack_id=hack_id, error=str(e))
+                        break
+                    reasons = e.response.get("CancellationReasons", [])
+                    taken = [
+                        url
+                        for url, reason in zip(chunk, reasons, strict=False)
+                        if reason.get("Code") == "ConditionalCheckFailed"
+                    ]
+                    duplicates.extend(taken)
+                    # No failed condition means a conflict with a concurrent
+                    # transaction: retry the chunk as is
+                    chunk = [url for url in chunk if url not in taken]
+            if chunk:
+                logger.error("claim_repo_urls_incomplete", hack_id=hack_id, remaining=len(chunk))
+
+        return claimed, duplicates
+
+    def release_repo_urls(self, hack_id: str, urls: list[str]) -> bool:
+        """Delete repository claims (e.g. when the submission write failed).
+
+        Args:
+            hack_id: Hackathon ID
+            urls: Normalized repository URLs
+
+        Returns:
+            True if every claim was deleted
+        """
+        released = True
+        for start in range(0, len(urls), DYNAMODB_BATCH_WRITE_MAX_ITEMS):
+            chunk = urls[start : start + DYNAMODB_BATCH_WRITE_MAX_ITEMS]
+            requests = [
+                {"DeleteRequest": {"Key": {"PK": f"HACK#{hack_id}", "SK": f"REPO#{url}"}}}
+                for url in chunk
+            ]
+            try:
+                unprocessed = self.write_scheduler.execute_batch_write(
+                    self.table.meta.client.batch_write_item,
+                    {self.table_name: requests},
+                    estimated_units=float(len(chunk)),
+                )
+                released = released and not unprocessed
+            except ClientError as e:
+                logger.error("release_repo_urls_failed", hack_id=hack_id, error=str(e))
+                released = False
+        return released
+
     # ============================================================
     # SCORE ACCESS PATTERNS
     # ============================================================
@@ -379,7 +601,7 @@ class DynamoDBHelper:
                     Key("PK").eq(f"SUB#{sub_id}") & Key("SK").begins_with("SCORE#")
                 )
             )
-            return response.get("Items", [])
+            return _items(response)
         except ClientError as e:
             logger.error("get_agent_scores_failed", sub_id=sub_id, error=str(e))
             return []
@@ -396,7 +618,7 @@ class DynamoDBHelper:
         """
         try:
             response = self.table.get_item(Key={"PK": f"SUB#{sub_id}", "SK": f"SCORE#{agent_name}"})
-            return response.get("Item")
+            return _item(response)
         except ClientError as e:
             logger.error("get_agent_score_failed", sub_id=sub_id, agent=agent_name, error=str(e))
             return None
@@ -412,7 +634,7 @@ class DynamoDBHelper:
         """
         try:
             item = self._serialize_item(score)
-            self.table.put_item(Item=item)
+            self._put_item(item)
             logger.info(
                 "agent_score_saved", sub_id=score.get("sub_id"), agent=score.get("agent_name")
             )
@@ -432,7 +654,7 @@ class DynamoDBHelper:
         """
         try:
             response = self.table.get_item(Key={"PK": f"SUB#{sub_id}", "SK": "SUMMARY"})
-            return response.get("Item")
+            return _item(response)
         except ClientError as e:
             logger.error("get_submission_summary_failed", sub_id=sub_id, error=str(e))
             return None
@@ -448,7 +670,7 @@ class DynamoDBHelper:
         """
         try:
             item = self._serialize_item(summary)
-            self.table.put_item(Item=item)
+            self._put_item(item)
             logger.info("submission_summary_saved", sub_id=summary.get("sub_id"))
             return True
         except ClientError as e:
@@ -474,7 +696,7 @@ class DynamoDBHelper:
                     Key("PK").eq(f"SUB#{sub_id}") & Key("SK").begins_with("COST#")
                 )
             )
-            return response.get("Items", [])
+            return _items(response)
         except ClientError as e:
             logger.error("get_submission_costs_failed", sub_id=sub_id, error=str(e))
             return []
@@ -490,7 +712,7 @@ class DynamoDBHelper:
         """
         try:
             item = self._serialize_item(cost)
-            self.table.put_item(Item=item)
+            self._put_item(item)
             logger.info(
                 "cost_record_saved", sub_id=cost.get("sub_id"), agent=cost.get("agent_name")
             )
@@ -510,7 +732,7 @@ class DynamoDBHelper:
         """
         try:
             response = self.table.get_item(Key={"PK": f"HACK#{hack_id}", "SK": "COST#SUMMARY"})
-            return response.get("Item")
+            return _item(response)
         except ClientError as e:
             logger.error("get_hackathon_cost_summary_failed", hack_id=hack_id, error=str(e))
             return None
@@ -526,13 +748,159 @@ class DynamoDBHelper:
         """
         try:
             item = self._serialize_item(cost_summary)
-            self.table.put_item(Item=item)
+            self._put_item(item)
             logger.info("hackathon_cost_summary_saved", hack_id=cost_summary.get("hack_id"))
             return True
         except ClientError as e:
             logger.error("put_hackathon_cost_summary_failed", error=str(e))
             return False
 
+    # ============================================================
+    # ORGANIZER INTELLIGENCE ACCESS PATTERNS
+    # ============================================================
+
+    def get_intelligence(self, hack_id: str) -> dict | None:
+        """Get the materialized organizer intelligence aggregate.
+
+        Args:
+            hack_id: Hackathon ID
+
+        Returns:
+            Intelligence item or None
+        """
+        try:
+            response = self.table.get_item(Key={"PK": f"HACK#{hack_id}", "SK": "INTELLIGENCE"})
+            return _item(response)
+        except ClientError as e:
+            logger.error("get_intelligence_failed", hack_id=hack_id, error=str(e))
+            return None
+
+    def put_intelligence(
+        self, hack_id: str, state: dict, expected_version: int | None = None
+    ) -> bool:
+        """Write the intelligence aggregate if nobody else wrote it first.
+
+        Optimistic concurrency: the write succeeds only while the stored
+        version still equals ``expected_version`` (or, when None, while no
+        item exists). The stored version is incremented and the stale flag
+        cleared.
+
+        Args:
+            hack_id: Hackathon ID
+            state: Aggregate state
+            expected_version: Version the state was read from; None if the item was missing
+
+        Returns:
+            True if written, False on a version conflict or error
+        """
+        from datetime import UTC, datetime
+
+        item = self._serialize_item(
+            {
+                **state,
+                "PK": f"HACK#{hack_id}",
+                "SK": "INTELLIGENCE",
+                "entity_type": "INTELLIGENCE",
+                "hack_id": hack_id,
+                "version": (expected_version or 0) + 1,
+                "stale": False,
+                "updated_at": datetime.now(UTC).isoformat(),
+            }
+        )
+        if expected_version is None:
+            condition: dict[str, Any] = {"ConditionExpression": "attribute_not_exists(PK)"}
+        else:
+            condition = {
+                "ConditionExpression": "version = :version",
+                "ExpressionAttributeValues": {":version": expected_version},
+            }
+
+        try:
+            self._put_item(item, **condition)
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                logger.error("put_intelligence_failed", hack_id=hack_id, error=str(e))
+            return False
+
+    def mark_intelligence_stale(self, hack_id: str) -> bool:
+        """Flag the intelligence aggregate for a rebuild on next read.
+
+        Args:
+            hack_id: Hackathon ID
+
+        Returns:
+            True if successful (or the item does not exist yet)
+        """
+        try:
+            self._update_item(
+                Key={"PK": f"HACK#{hack_id}", "SK": "INTELLIGENCE"},
+                UpdateExpression="SET stale = :true ADD version :one",
+                ConditionExpression="attribute_exists(PK)",
+                ExpressionAttributeValues={":true": True, ":one": 1},
+            )
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+                return True
+            logger.error("mark_intelligence_stale_failed", hack_id=hack_id, error=str(e))
+            return False
+
+    def get_intelligence_contribution(self, hack_id: str, sub_id: str) -> dict | None:
+        """Get what a submission contributed to the intelligence aggregate.
+
+        Args:
+            hack_id: Hackathon ID
+            sub_id: Submission ID
+
+        Returns:
+            Contribution or None (not folded in)
+        """
+        try:
+            response = self.table.get_item(
+                Key={"PK": f"HACK#{hack_id}", "SK": f"SUB#{sub_id}"},
+                ProjectionExpression="intelligence_contribution",
+            )
+            return (_item(response) or {}).get("intelligence_contribution")
+        except ClientError as e:
+            logger.error("get_intelligence_contribution_failed", sub_id=sub_id, error=str(e))
+            return None
+
+    def put_intelligence_contribution(
+        self, hack_id: str, sub_id: str, contribution: dict | None
+    ) -> bool:
+        """Store (or, with None, remove) a submission's intelligence contribution.
+
+        Kept on the submission item so the INTELLIGENCE item does not grow with
+        the number of submissions.
+
+        Args:
+            hack_id: Hackathon ID
+            sub_id: Submission ID
+            contribution: Contribution to store; None removes it
+
+        Returns:
+            True if successful
+        """
+        update: dict[str, Any] = (
+            {
+                "UpdateExpression": "SET intelligence_contribution = :contribution",
+                "ExpressionAttributeValues": {":contribution": self._serialize_item(contribution)},
+            }
+            if contribution is not None
+            else {"UpdateExpression": "REMOVE intelligence_contribution"}
+        )
+        try:
+            self._update_item(
+                Key={"PK": f"HACK#{hack_id}", "SK": f"SUB#{sub_id}"},
+                ConditionExpression="attribute_exists(PK)",
+                **update,
+            )
+            return True
+        except ClientError as e:
+            logger.error("put_intelligence_contribution_failed", sub_id=sub_id, error=str(e))
+            return False
+
     # ============================================================
     # ANALYSIS JOB ACCESS PATTERNS
     # ============================================================
@@ -552,25 +920,87 @@ class DynamoDBHelper:
                     Key("PK").eq(f"HACK#{hack_id}") & Key("SK").begins_with("JOB#")
                 )
             )
-            return response.get("Items", [])
+            return _items(response)
         except ClientError as e:
             logger.error("list_analysis_jobs_failed", hack_id=hack_id, error=str(e))
             return []
 
-    def list_jobs_by_status(self, status: str) -> list[dict]:
+    def get_latest_analysis_job(self, hack_id: str) -> dict | None:
+        """AP14a: Get the most recent analysis job for a hackathon.
+
+        Job IDs are ULIDs, so a descending query with Limit=1 reads a
+        single item no matter how many jobs the hackathon has.
+
+        Args:
+            hack_id: Hackathon ID
+
+        Returns:
+            Latest analysis job record or None
+        """
+        try:
+            response = self.table.query(
+                KeyConditionExpression=(
+                    Key("PK").eq(f"HACK#{hack_id}") & Key("SK").begins_with("JOB#")
+                ),
+                ScanIndexForward=False,
+                Limit=1,
+                ConsistentRead=True,
+            )
+            items = response.get("Items", [])
+            return items[0] if items else None
+        except ClientError as e:
+            logger.error("get_latest_analysis_job_failed", hack_id=hack_id, error=str(e))
+            return None
+
+    def list_analysis_jobs_page(
+        self,
+        hack_id: str,
+        limit: int = 20,
+        exclusive_start_key: dict | None = None,
+    ) -> tuple[list[dict], dict | None]:
+        """AP14b: List one page of analysis jobs for a hackathon, newest first.
+
+        Args:
+            hack_id: Hackathon ID
+            limit: Maximum jobs to return
+            exclusive_start_key: LastEvaluatedKey from the previous page
+
+        Returns:
+            Tuple of (job records, LastEvaluatedKey or None when exhausted)
+        """
+        query_kwargs: dict[str, Any] = {
+            "KeyConditionExpression": (
+                Key("PK").eq(f"HACK#{hack_id}") & Key("SK").begins_with("JOB#")
+            ),
+            "ScanIndexForward": False,
+            "Limit": limit,
+        }
+        if exclusive_start_key:
+            query_kwargs["ExclusiveStartKey"] = exclusive_start_key
+
+        try:
+            response = self.table.query(**query_kwargs)
+            return response.get("Items", []), response.get("LastEvaluatedKey")
+        except ClientError as e:
+            logger.error("list_analysis_jobs_page_failed", hack_id=hack_id, error=str(e))
+            return [], None
+
+    def list_jobs_by_status(self, status: str, created_before: str | None = None) -> list[dict]:
         """AP15: List jobs by status.
 
         Args:
             status: Job status
+            created_before: Only jobs created before this ISO timestamp
 
         Returns:
             List of job records
         """
+        condition: ConditionBase = Key("GSI2PK").eq(f"JOB_STATUS#{status}")
+        if created_before:
+            condition = condition & Key("GSI2SK").lt(created_before)
         try:
-            response = self.table.query(
-                IndexName="GSI2", KeyConditionExpression=Key("GSI2PK").eq(f"JOB_STATUS#{status}")
-            )
-            return response.get("Items", [])
+            response = self.table.query(IndexName="GSI2", KeyConditionExpression=condition)
+            return _items(response)
         except ClientError as e:
             logger.error("list_jobs_by_status_failed", status=status, error=str(e))
             return []
@@ -586,13 +1016,217 @@ class DynamoDBHelper:
         """
         try:
             item = self._serialize_item(job)
-            self.table.put_item(Item=item)
+            self._put_item(item)
             logger.info("analysis_job_created", job_id=job.get("job_id"))
             return True
         except ClientError as e:
             logger.error("put_analysis_job_failed", error=str(e))
             return False
 
+    def get_analysis_job(self, hack_id: str, job_id: str) -> dict | None:
+        """Get a single analysis job (strongly consistent).
+
+        Args:
+            hack_id: Hackathon ID
+            job_id: Job ID
+
+        Returns:
+            Analysis job record or None
+        """
+        try:
+            response = self.table.get_item(
+                Key={"PK": f"HACK#{hack_id}", "SK": f"JOB#{job_id}"},
+                ConsistentRead=True,
+            )
+            return _item(response)
+        except ClientError as e:
+            logger.error("get_analysis_job_failed", job_id=job_id, error=str(e))
+            return None
+
+    def update_analysis_job(self, hack_id: str, job_id: str, **fields: Any) -> bool:
+        """Set fields on an existing analysis job without rewriting the item.
+
+        Only the given fields are written, so concurrent progress counters
+        (see ``record_job_submission_outcome``) are never clobbered.
+
+        Args:
+            hack_id: Hackathon ID
+            job_id: Job ID
+            **fields: Attributes to set (None values are skipped)
+
+        Returns:
+            True if successful, False if the job does not exist or the write failed
+        """
+        values = self._serialize_item({k: v for k, v in fields.items() if v is not None})
+        if not values:
+            return True
+
+        names = {f"#{k}": k for k in values}
+        try:
+            self._update_item(
+                Key={"PK": f"HACK#{hack_id}", "SK": f"JOB#{job_id}"},
+                UpdateExpression="SET " + ", ".join(f"#{k} = :{k}" for k in values),
+                ConditionExpression="attribute_exists(PK)",
+                ExpressionAttributeNames=names,
+                ExpressionAttributeValues={f":{k}": v for k, v in values.items()},
+            )
+            return True
+        except ClientError as e:
+            logger.error("update_analysis_job_failed", job_id=job_id, error=str(e))
+            return False
+
+    def take_job_budget_reservation(self, hack_id: str, job_id: str) -> dict | None:
+        """Atomically remove and return a job's budget reservation.
+
+        The removal is conditional on the reservation being present, so
+        only the first caller (job completion, failure or expiry) settles it.
+
+        Args:
+            hack_id: Hackathon ID
+            job_id: Job ID
+
+        Returns:
+            The reservation record, or None if the job has none (or it was
+            already taken)
+        """
+        try:
+            response = self._update_item(
+                Key={"PK": f"HACK#{hack_id}", "SK": f"JOB#{job_id}"},
+                UpdateExpression="REMOVE budget_reservation",
+                ConditionExpression="attribute_exists(budget_reservation)",
+                ReturnValues="UPDATED_OLD",
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                logger.error("take_job_budget_reservation_failed", job_id=job_id, error=str(e))
+            return None
+        old = _item(response, "Attributes") or {}
+        reservation: dict | None = old.get("budget_reservation")
+        return reservation
+
+    def record_job_submission_outcome(
+        self,
+        hack_id: str,
+        job_id: str,
+        sub_id: str,
+        succeeded: bool,
+        cost_usd: Any = 0,
+    ) -> bool:
+        """Atomically checkpoint one processed submission on the job item.
+
+        Increments the completed/failed counter and total cost, and appends
+        the submission to ``processed_submission_ids``. The write is
+        conditional on the submission not already being recorded, so a
+        retried or duplicated invocation never double counts.
+
+        Args:
+            hack_id: Hackathon ID
+            job_id: Job ID
+            sub_id: Submission ID that finished processing
+            succeeded: True if analysis completed (or disqualified), False if failed
+            cost_usd: Cost incurred for the submission
+
+        Returns:
+            True if recorded, False if already recorded or the write failed
+        """
+        from datetime import UTC, datetime
+        from decimal import Decimal
+
+        try:
+            self._update_item(
+                Key={"PK": f"HACK#{hack_id}", "SK": f"JOB#{job_id}"},
+                UpdateExpression=(
+                    "ADD completed_submissions :completed, failed_submissions :failed, "
+                    "total_cost_usd :cost "
+                    "SET processed_submission_ids = "
+                    "list_append(if_not_exists(processed_submission_ids, :empty), :sub_list), "
+                    "updated_at = :now"
+                ),
+                ConditionExpression=(
+                    "attribute_exists(PK) AND NOT contains(processed_submission_ids, :sub_id)"
+                ),
+                ExpressionAttributeValues={
+                    ":completed": 1 if succeeded else 0,
+                    ":failed": 0 if succeeded else 1,
+                    ":cost": Decimal(str(cost_usd)),
+                    ":empty": [],
+                    ":sub_list": [sub_id],
+                    ":sub_id": sub_id,
+                    ":now": datetime.now(UTC).isoformat(),
+                },
+            )
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+                logger.info("job_submission_already_recorded", job_id=job_id, sub_id=sub_id)
+            else:
+                logger.error(
+                    "record_job_submission_outcome_failed",
+                    job_id=job_id,
+                    sub_id=sub_id,
+                    error=str(e),
+                )
+            return False
+
+    def record_job_shard_completed(
+        self, hack_id: str, job_id: str, shard_index: int
+    ) -> dict | None:
+        """Atomically add a shard to the job's completed_shards set.
+
+        Adding to a number set is idempotent, so a duplicated shard
+        invocation cannot inflate the count.
+
+        Args:
+            hack_id: Hackathon ID
+            job_id: Job ID
+            shard_index: Index of the finished shard
+
+        Returns:
+            Updated job record, or None if the write failed
+        """
+        try:
+            response = self._update_item(
+                Key={"PK": f"HACK#{hack_id}", "SK": f"JOB#{job_id}"},
+                UpdateExpression="ADD completed_shards :shard",
+                ConditionExpression="attribute_exists(PK)",
+                ExpressionAttributeValues={":shard": {shard_index}},
+                ReturnValues="ALL_NEW",
+            )
+            return _item(response, "Attributes")
+        except ClientError as e:
+            logger.error(
+                "record_job_shard_completed_failed",
+                job_id=job_id,
+                shard_index=shard_index,
+                error=str(e),
+            )
+            return None
+
+    def claim_job_finalization(self, hack_id: str, job_id: str) -> bool:
+        """Claim the right to finalize a job (first caller wins).
+
+        Args:
+            hack_id: Hackathon ID
+            job_id: Job ID
+
+        Returns:
+            True if this caller claimed finalization
+        """
+        from datetime import UTC, datetime
+
+        try:
+            self._update_item(
+                Key={"PK": f"HACK#{hack_id}", "SK": f"JOB#{job_id}"},
+                UpdateExpression="SET finalized_at = :now",
+                ConditionExpression="attribute_exists(PK) AND attribute_not_exists(finalized_at)",
+                ExpressionAttributeValues={":now": datetime.now(UTC).isoformat()},
+            )
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                logger.error("claim_job_finalization_failed", job_id=job_id, error=str(e))
+            return False
+
     # ============================================================
     # LEADERBOARD
     # ============================================================
@@ -636,6 +1270,44 @@ class DynamoDBHelper:
             logger.error("batch_write_failed", error=str(e))
             return False
 
+    def batch_put_items(self, items: list[dict]) -> list[dict]:
+        """Put items in BatchWriteItem chunks through the write scheduler.
+
+        Unlike ``batch_write``, writes are paced against the table's
+        capacity and the caller learns exactly which items were not
+        written.
+
+        Args:
+            items: Items to put (unique PK/SK pairs)
+
+        Returns:
+            Items that could not be written (empty on success)
+        """
+        failed: list[dict] = []
+        for start in range(0, len(items), DYNAMODB_BATCH_WRITE_MAX_ITEMS):
+            chunk = items[start : start + DYNAMODB_BATCH_WRITE_MAX_ITEMS]
+            serialized = [self._serialize_item(item) for item in chunk]
+            sizes = [estimate_item_size(item) for item in serialized]
+            try:
+                with span("dynamodb.batch_write_item", items=len(chunk), bytes=sum(sizes)):
+                    unprocessed = self.write_scheduler.execute_batch_write(
+                        self.table.meta.client.batch_write_item,
+                        {self.table_name: [{"PutRequest": {"Item": item}} for item in serialized]},
+                        estimated_units=sum(estimate_write_units(size) for size in sizes),
+                    )
+            except ClientError as e:
+                logger.error("batch_put_items_failed", count=len(chunk), error=str(e))
+                failed.extend(chunk)
+                continue
+            unwritten = {
+                (request["PutRequest"]["Item"]["PK"], request["PutRequest"]["Item"]["SK"])
+                for request in unprocessed.get(self.table_name, [])
+            }
+            failed.extend(item for item in chunk if (item["PK"], item["SK"]) in unwritten)
+
+        logger.info("batch_put_items_completed", count=len(items), failed=len(failed))
+        return failed
+
     # ============================================================
     # TEAM ANALYSIS ACCESS PATTERNS
     # ============================================================
@@ -651,7 +1323,7 @@ class DynamoDBHelper:
         """
         try:
             response = self.table.get_item(Key={"PK": f"SUB#{sub_id}", "SK": "TEAM_ANALYSIS"})
-            return response.get("Item")
+            return _item(response)
         except ClientError as e:
             logger.error("get_team_analysis_failed", sub_id=sub_id, error=str(e))
             return None
@@ -667,7 +1339,7 @@ class DynamoDBHelper:
         """
         try:
             item = self._serialize_item(team_analysis)
-            self.table.put_item(Item=item)
+            self._put_item(item)
             logger.info("team_analysis_saved", sub_id=team_analysis.get("sub_id"))
             return True
         except ClientError as e:
@@ -685,7 +1357,7 @@ class DynamoDBHelper:
         """
         try:
             response = self.table.get_item(Key={"PK": f"SUB#{sub_id}", "SK": "STRATEGY_ANALYSIS"})
-            return response.get("Item")
+            return _item(response)
         except ClientError as e:
             logger.error("get_strategy_analysis_failed", sub_id=sub_id, error=str(e))
             return None
@@ -701,7 +1373,7 @@ class DynamoDBHelper:
         """
         try:
             item = self._serialize_item(strategy_analysis)
-            self.table.put_item(Item=item)
+            self._put_item(item)
             logger.info("strategy_analysis_saved", sub_id=strategy_analysis.get("sub_id"))
             return True
         except ClientError as e:
@@ -719,7 +1391,7 @@ class DynamoDBHelper:
         """
         try:
             response = self.table.get_item(Key={"PK": f"SUB#{sub_id}", "SK": "ACTIONABLE_FEEDBACK"})
-            return response.get("Item")
+            return _item(response)
         except ClientError as e:
             logger.error("get_actionable_feedback_failed", sub_id=sub_id, error=str(e))
             return None
@@ -735,13 +1407,409 @@ class DynamoDBHelper:
         """
         try:
             item = self._serialize_item(actionable_feedback)
-            self.table.put_item(Item=item)
+            self._put_item(item)
             logger.info("actionable_feedback_saved", sub_id=actionable_feedback.get("sub_id"))
             return True
         except ClientError as e:
             logger.error("put_actionable_feedback_failed", error=str(e))
             return False
 
+    # ============================================================
+    # TRACE ACCESS PATTERNS
+    # ============================================================
+
+    def put_submission_trace(self, trace: dict) -> bool:
+        """Create or update the pipeline trace of a submission's latest analysis.
+
+        Args:
+            trace: Trace record dict with sub_id
+
+        Returns:
+            True if successful
+        """
+        try:
+            item = self._serialize_item(trace)
+            self._put_item(item)
+            logger.info("submission_trace_saved", sub_id=trace.get("sub_id"))
+            return True
+        except ClientError as e:
+            logger.error("put_submission_trace_failed", error=str(e))
+            return False
+
+    def get_submission_span_durations(self, sub_ids: list[str]) -> list[dict]:
+        """Get the per-span durations of several submissions' traces.
+
+        Reads with BatchGetItem and projects away the Chrome trace, which
+        is only needed when a single submission is inspected.
+
+        Args:
+            sub_ids: Submission IDs
+
+        Returns:
+            Records with sub_id and span_durations (submissions without a
+            trace are omitted)
+        """
+        client = self.table.meta.client
+        records: list[dict] = []
+        for start in range(0, len(sub_ids), DYNAMODB_BATCH_GET_MAX_ITEMS):
+            request: dict = {
+                self.table_name: {
+                    "Keys": [
+                        {"PK": f"SUB#{sub_id}", "SK": "TRACE"}
+                        for sub_id in sub_ids[start : start + DYNAMODB_BATCH_GET_MAX_ITEMS]
+                    ],
+                    "ProjectionExpression": "sub_id, span_durations",
+                }
+            }
+            try:
+                for _ in range(DYNAMODB_BATCH_GET_ATTEMPTS):
+                    response = client.batch_get_item(RequestItems=request)
+                    records.extend(response.get("Responses", {}).get(self.table_name, []))
+                    request = response.get("UnprocessedKeys") or {}
+                    if not request:
+                        break
+                else:
+                    logger.warning(
+                        "get_submission_span_durations_incomplete",
+                        unprocessed=len(request[self.table_name]["Keys"]),
+                    )
+            except ClientError as e:
+                logger.error("get_submission_span_durations_failed", error=str(e))
+        return records
+
+    # ============================================================
+    # USAGE TRACKING
+    # ============================================================
+
+    def add_usage_counters(
+        self,
+        api_key: str,
+        date: str,
+        successful: int = 0,
+        failed: int = 0,
+        cost_usd: Any = 0,
+        endpoints: dict[str, int] | None = None,
+        usage_id: str | None = None,
+    ) -> bool:
+        """Atomically add request counters to a daily usage record.
+
+        Counters are incremented with ``ADD``, so concurrent writers never
+        lose increments and no read is needed. Per-endpoint counts live in
+        the ``endpoints_used`` map; DynamoDB cannot create a map and add to
+        one of its keys in the same expression, so the first write of the
+        day seeds the whole map under an ``attribute_not_exists`` condition
+        and every later write adds to existing keys.
+
+        Args:
+            api_key: API key
+            date: Date in YYYY-MM-DD format
+            successful: Successful requests to add
+            failed: Failed requests to add
+            cost_usd: Cost to add
+            endpoints: Request counts to add per endpoint
+            usage_id: ID assigned if this write creates the record
+
+        Returns:
+            True if the counters were applied
+        """
+        from datetime import UTC, datetime
+        from decimal import Decimal
+
+        from src.utils.id_gen import generate_id
+
+        endpoints = endpoints or {}
+        names = {"#date": "date"}
+        values: dict[str, Any] = {
+            ":requests": successful + failed,
+            ":successful": successful,
+            ":failed": failed,
+            ":cost": Decimal(str(cost_usd)),
+            ":zero": Decimal("0"),
+            ":api_key": api_key,
+            ":date": date,
+            ":usage_id": usage_id or generate_id(),
+            ":now": datetime.now(UTC).isoformat(),
+            ":entity_type": "USAGE_RECORD",
+            ":gsi1pk": f"APIKEY#{api_key}",
+            ":gsi1sk": f"DATE#{date}",
+        }
+        set_clause = (
+            "SET usage_id = if_not_exists(usage_id, :usage_id), api_key = :api_key, "
+            "#date = :date, created_at = if_not_exists(created_at, :now), updated_at = :now, "
+            "bedrock_cost_usd = if_not_exists(bedrock_cost_usd, :zero), "
+            "lambda_cost_usd = if_not_exists(lambda_cost_usd, :zero), "
+            "entity_type = :entity_type, GSI1PK = :gsi1pk, GSI1SK = :gsi1sk"
+        )
+        add_clause = (
+            "ADD request_count :requests, successful_requests :successful, "
+            "failed_requests :failed, total_cost_usd :cost"
+        )
+        key = {"PK": f"USAGE#{api_key}#{date}", "SK": "SUMMARY"}
+
+        if not endpoints:
+            try:
+                self._update_item(
+                    Key=key,
+                    UpdateExpression=f"{set_clause} {add_clause}",
+                    ExpressionAttributeNames=names,
+                    ExpressionAttributeValues=values,
+                )
+                return True
+            except ClientError as e:
+                logger.error("add_usage_counters_failed", api_key_prefix=api_key[:8], error=str(e))
+                return False
+
+        endpoint_names = {f"#ep{i}": endpoint for i, endpoint in enumerate(endpoints)}
+        endpoint_values = {f":ep{i}": count for i, count in enumerate(endpoints.values())}
+        endpoint_adds = ", ".join(f"endpoints_used.#ep{i} :ep{i}" for i in range(len(endpoints)))
+
+        # Existing map: add to its keys. Missing map: seed it. Either condition
+        # can lose a race with a concurrent first write, so alternate.
+        for _ in range(3):
+            try:
+                self._update_item(
+                    Key=key,
+                    UpdateExpression=f"{set_clause} {add_clause}, {endpoint_adds}",
+                    ConditionExpression="attribute_exists(endpoints_used)",
+                    ExpressionAttributeNames={**names, **endpoint_names},
+                    ExpressionAttributeValues={**values, **endpoint_values},
+                )
+                return True
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                    logger.error(
+                        "add_usage_counters_failed", api_key_prefix=api_key[:8], error=str(e)
+                    )
+                    return False
+
+            try:
+                self._update_item(
+                    Key=key,
+                    UpdateExpression=f"{set_clause}, endpoints_used = :endpoints {add_clause}",
+                    ConditionExpression="attribute_not_exists(endpoints_used)",
+                    ExpressionAttributeNames=names,
+                    ExpressionAttributeValues={**values, ":endpoints": dict(endpoints)},
+                )
+                return True
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                    logger.error(
+                        "add_usage_counters_failed", api_key_prefix=api_key[:8], error=str(e)
+                    )
+                    return False
+
+        logger.error("add_usage_counters_contended", api_key_prefix=api_key[:8], date=date)
+        return False
+
+    # ============================================================
+    # BUDGET TRACKING
+    # ============================================================
+
+    def reserve_budget(
+        self, entity_type: str, entity_id: str, amount: Any, limit: Any
+    ) -> tuple[bool, dict]:
+        """Atomically reserve spend against a budget if it fits under the limit.
+
+        One conditional update: ``current_spend_usd + amount <= limit``. The
+        tracking item is created on first use, and the limit is refreshed
+        on every reservation.
+
+        Args:
+            entity_type: Budget level (api_key, hackathon)
+            entity_id: Entity identifier
+            amount: Spend to reserve in USD
+            limit: Budget limit in USD
+
+        Returns:
+            Tuple of (reserved, attributes): the item after the update when
+            reserved, the item as it was when denied (empty if unknown)
+        """
+        from datetime import UTC, datetime
+        from decimal import Decimal
+
+        amount = Decimal(str(amount))
+        limit = Decimal(str(limit))
+        if amount > limit:
+            return False, {}
+
+        now = datetime.now(UTC).isoformat()
+        try:
+            response = self._update_item(
+                Key={"PK": f"BUDGET#{entity_type}#{entity_id}", "SK": "TRACKING"},
+                UpdateExpression=(
+                    "SET budget_limit_usd = :limit, entity_type = :entity_type, "
+                    "entity_id = :entity_id, entity_type_field = :kind, GSI1PK = :gsi1pk, "
+                    "created_at = if_not_exists(created_at, :now), updated_at = :now "
+                    "ADD current_spend_usd :amount, reserved_usd :amount"
+                ),
+                ConditionExpression=(
+                    "attribute_not_exists(current_spend_usd) OR current_spend_usd <= :max_before"
+                ),
+                ExpressionAttributeValues={
+                    ":limit": limit,
+                    ":amount": amount,
+                    ":max_before": limit - amount,
+                    ":entity_type": entity_type,
+                    ":entity_id": entity_id,
+                    ":kind": "BUDGET_TRACKING",
+                    ":gsi1pk": f"ENTITY#{entity_type}",
+                    ":now": now,
+                },
+                ReturnValues="ALL_NEW",
+                ReturnValuesOnConditionCheckFailure="ALL_OLD",
+            )
+            return True, response.get("Attributes", {})
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+                # Error responses are not deserialized by the resource layer
+                deserializer = TypeDeserializer()
+                old: Any = e.response.get("Item") or {}
+                return False, {k: deserializer.deserialize(v) for k, v in old.items()}
+            raise
+
+    def adjust_budget_spend(
+        self,
+        entity_type: str,
+        entity_id: str,
+        spend_delta: Any,
+        reserved_delta: Any = 0,
+    ) -> bool:
+        """Atomically add to a budget's spend (negative releases spend).
+
+        Used to release a reservation whose request failed and to reconcile
+        a reservation with the actual cost. Unconditional: actual spend is
+        recorded even if it overshoots the limit.
+
+        Args:
+            entity_type: Budget level (api_key, hackathon)
+            entity_id: Entity identifier
+            spend_delta: Amount to add to current_spend_usd
+            reserved_delta: Amount to add to reserved_usd
+
+        Returns:
+            True if the update succeeded
+        """
+        from datetime import UTC, datetime
+        from decimal import Decimal
+
+        try:
+            self._update_item(
+                Key={"PK": f"BUDGET#{entity_type}#{entity_id}", "SK": "TRACKING"},
+                UpdateExpression=(
+                    "ADD current_spend_usd :spend, reserved_usd :reserved SET updated_at = :now"
+                ),
+                ConditionExpression="attribute_exists(PK)",
+                ExpressionAttributeValues={
+                    ":spend": Decimal(str(spend_delta)),
+                    ":reserved": Decimal(str(reserved_delta)),
+                    ":now": datetime.now(UTC).isoformat(),
+                },
+            )
+            return True
+        except ClientError as e:
+            logger.error(
+                "adjust_budget_spend_failed",
+                entity_type=entity_type,
+                entity_id=entity_id,
+                error=str(e),
+            )
+            return False
+
+    def reserve_hedge_spend(self, hack_id: str, amount: Any, cap: Any) -> bool:
+        """Atomically reserve hedge spend on a hackathon's budget if it fits the cap.
+
+        One conditional update: ``hedge_spend_usd + amount <= cap``. Only a
+        hackathon whose budget tracking item exists (created by its first
+        budget reservation) can reserve.
+
+        Args:
+            hack_id: Hackathon ID
+            amount: Estimated cost of the hedge request in USD
+            cap: Hedge spend cap in USD
+
+        Returns:
+            True if the spend was reserved
+        """
+        from datetime import UTC, datetime
+        from decimal import Decimal
+
+        amount = Decimal(str(amount))
+        cap = Decimal(str(cap))
+        if amount > cap:
+            return False
+        try:
+            self._update_item(
+                Key={"PK": f"BUDGET#hackathon#{hack_id}", "SK": "TRACKING"},
+                UpdateExpression="ADD hedge_spend_usd :amount SET updated_at = :now",
+                ConditionExpression=(
+                    "attribute_exists(PK) AND "
+                    "(attribute_not_exists(hedge_spend_usd) OR hedge_spend_usd <= :max_before)"
+                ),
+                ExpressionAttributeValues={
+                    ":amount": amount,
+                    ":max_before": cap - amount,
+                    ":now": datetime.now(UTC).isoformat(),
+                },
+            )
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                logger.error("reserve_hedge_spend_failed", hack_id=hack_id, error=str(e))
+            return False
+
+    def adjust_hedge_spend(self, hack_id: str, delta: Any) -> bool:
+        """Atomically add to a hackathon's hedge spend (negative returns spend).
+
+        Args:
+            hack_id: Hackathon ID
+            delta: Amount to add to hedge_spend_usd
+
+        Returns:
+            True if the update succeeded
+        """
+        from datetime import UTC, datetime
+        from decimal import Decimal
+
+        try:
+            self._update_item(
+                Key={"PK": f"BUDGET#hackathon#{hack_id}", "SK": "TRACKING"},
+                UpdateExpression="ADD hedge_spend_usd :delta SET updated_at = :now",
+                ConditionExpression="attribute_exists(PK)",
+                ExpressionAttributeValues={
+                    ":delta": Decimal(str(round(float(delta), 6))),
+                    ":now": datetime.now(UTC).isoformat(),
+                },
+            )
+            return True
+        except ClientError as e:
+            logger.error("adjust_hedge_spend_failed", hack_id=hack_id, error=str(e))
+            return False
+
+    def mark_budget_alert_sent(self, entity_type: str, entity_id: str, threshold: int) -> bool:
+        """Set a budget alert flag once (first caller wins).
+
+        Args:
+            entity_type: Budget level (api_key, hackathon)
+            entity_id: Entity identifier
+            threshold: Alert threshold percentage (50, 80, 90, 100)
+
+        Returns:
+            True if this caller set the flag
+        """
+        alert_field = f"alert_{threshold}_sent"
+        try:
+            self._update_item(
+                Key={"PK": f"BUDGET#{entity_type}#{entity_id}", "SK": "TRACKING"},
+                UpdateExpression=f"SET {alert_field} = :true",
+                ConditionExpression=f"attribute_exists(PK) AND NOT {alert_field} = :true",
+                ExpressionAttributeValues={":true": True},
+            )
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                logger.error("mark_budget_alert_sent_failed", threshold=threshold, error=str(e))
+            return False
+
     # ============================================================
     # API KEY ACCESS PATTERNS
     # ============================================================
@@ -796,7 +1864,7 @@ class DynamoDBHelper:
         """
         try:
             response = self.table.get_item(Key={"PK": f"APIKEY#{api_key_id}", "SK": "METADATA"})
-            return response.get("Item")
+            return _item(response)
         except ClientError as e:
             logger.error("get_api_key_failed", api_key_id=api_key_id, error=str(e))
             return None
@@ -812,7 +1880,7 @@ class DynamoDBHelper:
         """
         try:
             item = self._serialize_item(api_key)
-            self.table.put_item(Item=item)
+            self._put_item(item)
             logger.info("api_key_created", api_key_id=api_key.get("api_key_id"))
             return True
         except ClientError as e:
@@ -834,7 +1902,7 @@ class DynamoDBHelper:
                 KeyConditionExpression=Key("GSI1PK").eq(f"ORG#{organizer_id}")
                 & Key("GSI1SK").begins_with("APIKEY#"),
             )
-            return response.get("Items", [])
+            return _items(response)
         except ClientError as e:
             logger.error(
                 "list_api_keys_by_organizer_failed", organizer_id=organizer_id, error=str(e)
@@ -864,7 +1932,7 @@ class DynamoDBHelper:
             from decimal import Decimal
 
             update_parts = []
-            expr_attr_values = {":updated_at": datetime.utcnow().isoformat()}
+            expr_attr_values: dict[str, Any] = {":updated_at": datetime.utcnow().isoformat()}
 
             if total_requests is not None:
                 update_parts.append("total_requests = :total_requests")
@@ -888,7 +1956,7 @@ class DynamoDBHelper:
 
             update_expr = f"SET {', '.join(update_parts)}, updated_at = :updated_at"
 
-            self.table.update_item(
+            self._update_item(
                 Key={"PK": f"APIKEY#{api_key_id}", "SK": "METADATA"},
                 UpdateExpression=update_expr,
                 ExpressionAttributeValues=expr_attr_values,
@@ -898,3 +1966,120 @@ class DynamoDBHelper:
         except ClientError as e:
             logger.error("update_api_key_usage_failed", api_key_id=api_key_id, error=str(e))
             return False
+
+
+def get_dynamodb_helper(table_name: str) -> DynamoDBHelper:
+    """Get the process-wide DynamoDB helper for a table.
+
+    Args:
+        table_name: DynamoDB table name
+
+    Returns:
+        Shared helper (backed by the shared DynamoDB resource)
+    """
+    helper: DynamoDBHelper = get_client_registry().get(
+        ("dynamodb_helper", table_name), lambda: DynamoDBHelper(table_name)
+    )
+    return helper
+
+
+def encode_cursor(last_evaluated_key: dict | None) -> str | None:
+    """Encode a DynamoDB LastEvaluatedKey as an opaque pagination cursor.
+
+    Args:
+        last_evaluated_key: Key returned by a query page (string attributes only)
+
+    Returns:
+        URL-safe cursor string, or None when there are no more pages
+    """
+    if not last_evaluated_key:
+        return None
+    raw = json.dumps(last_evaluated_key, sort_keys=True, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str | None) -> dict | None:
+    """Decode a pagination cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string (None for the first page)
+
+    Returns:
+        ExclusiveStartKey dict or None
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+    if not isinstance(key, dict) or not all(isinstance(v, str) for v in key.values()):
+        raise ValueError("Invalid pagination cursor")
+    return key
+
+
+def estimate_item_size(item: dict) -> int:
+    """Estimate the DynamoDB storage size of an item in bytes.
+
+    Follows the published DynamoDB sizing rules closely enough to compare
+    read costs (1 RCU = 4 KB strongly consistent) before and after schema
+    changes. Attribute names count towards the size, numbers take roughly
+    one byte per two significant digits plus one, and maps/lists carry a
+    3-byte overhead plus 1 byte per element.
+
+    Args:
+        item: DynamoDB item (as returned by boto3 resource calls)
+
+    Returns:
+        Approximate item size in bytes
+    """
+    return sum(len(str(name).encode("utf-8")) + _attribute_size(v) for name, v in item.items())
+
+
+def _item(response: dict[str, Any], key: str = "Item") -> dict | None:
+    """Return the item of a get_item (or ``ReturnValues``) response."""
+    item: dict | None = response.get(key)
+    return item
+
+
+def _items(response: dict[str, Any]) -> list[dict]:
+    """Return the items of a query or scan response."""
+    items: list[dict] = response.get("Items", [])
+    return items
+
+
+def _entity_of(item: dict) -> str:
+    """Return the entity an item or key belongs to, for trace attributes.
+
+    Uses ``entity_type`` when present, otherwise the sort key up to its
+    first ``#`` (``SCORE#bug_hunter`` -> ``SCORE``), which keeps IDs out of
+    the trace.
+    """
+    entity = item.get("entity_type") or str(item.get("SK", "")).split("#", 1)[0]
+    return str(entity)
+
+
+def _attribute_size(value: Any) -> int:
+    """Approximate the size in bytes of a single DynamoDB attribute value."""
+    from decimal import Decimal
+
+    if value is None or isinstance(value, bool):
+        return 1
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    if isinstance(value, int | float | Decimal):
+        digits = len(str(value).lstrip("-").replace(".", "").lstrip("0")) or 1
+        return (digits + 1) // 2 + 1
+    if isinstance(value, bytes | bytearray):
+        return len(value)
+    if isinstance(value, dict):
+        return 3 + sum(
+            len(str(k).encode("utf-8")) + _attribute_size(v) + 1 for k, v in value.items()
+        )
+    if isinstance(value, list | set | tuple):
+        return 3 + sum(_attribute_size(v) + 1 for v in value)
+    return len(str(value).encode("utf-8"))
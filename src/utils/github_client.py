@@ -3,6 +3,7 @@
 import httpx
 
 from src.models.analysis import WorkflowRun
+from src.utils.clients import get_client_registry, http_limits
 from src.utils.config import settings
 from src.utils.logging import get_logger
 
@@ -33,6 +34,7 @@ class GitHubClient:
             base_url=self.BASE_URL,
             headers=headers,
             timeout=30.0,
+            limits=http_limits(),
         )
 
     def fetch_workflow_runs(self, owner: str, repo: str, max_runs: int = 50) -> list[WorkflowRun]:
@@ -137,3 +139,22 @@ class GitHubClient:
     def close(self) -> None:
         """Close the HTTP client."""
         self.client.close()
+
+
+def get_github_client(token: str | None = None) -> GitHubClient:
+    """Get the process-wide GitHub client for a token.
+
+    The shared client keeps its connection pool warm across submissions; it
+    is closed by ``close_clients`` at shutdown, not by callers.
+
+    Args:
+        token: GitHub personal access token (defaults to settings.github_token)
+
+    Returns:
+        Shared GitHub client
+    """
+    token = token or settings.github_token
+    client: GitHubClient = get_client_registry().get(
+        ("github", token), lambda: GitHubClient(token=token)
+    )
+    return client
@@ -0,0 +1,476 @@
+"""Hedged requests for tail-latency control on agent calls.
+
+A submission waits for the slowest of its agents, so an agent call in its
+model's latency tail holds up the whole submission. When a call outlasts the
+model's recent p95 (``HEDGE_LATENCY_PERCENTILE``), a second request is sent,
+on the agent's ``hedge_model_id`` (the same model or a cheaper fallback).
+The first valid result wins and the other request is cancelled. Until a model
+has ``HEDGE_MIN_SAMPLES`` recent calls its p95 is not known and nothing is
+hedged.
+
+Hedging buys latency with spend, so the process-wide ``HedgeController``
+caps it. A hedge is refused when its estimated cost (the prompt plus
+``max_tokens`` of output at the hedge model's rates) exceeds
+``HEDGE_MAX_REQUEST_COST_USD``, or when it would take extra spend past the
+cap. Extra spend is what the losing requests of hedged calls cost, up to the
+point they were cancelled; it is billed like any other agent call, on a cost
+record of its own. Inside a ``hedge_budget_scope`` the cap is
+``HEDGE_MAX_BUDGET_SHARE`` of the hackathon's budget limit, and the extra
+spend is reserved on the hackathon's budget item, so every process shares
+it. Without a hackathon budget the cap is ``HEDGE_MAX_SPEND_RATIO`` of the
+process's agent spend (what the results cost) plus
+``HEDGE_SPEND_ALLOWANCE_USD``.
+The controller's report compares each agent's call latency with its
+model's latency, next to the extra spend. The model latency leaves out
+primary requests cancelled by a winning hedge, which are the slowest ones, so
+the reported reduction understates the real one.
+"""
+
+import contextvars
+import math
+import queue
+import threading
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from src.constants import (
+    BEDROCK_CHARS_PER_TOKEN,
+    BEDROCK_LATENCY_WINDOW,
+    HEDGE_LATENCY_PERCENTILE,
+    HEDGE_MAX_BUDGET_SHARE,
+    HEDGE_MAX_REQUEST_COST_USD,
+    HEDGE_MAX_SPEND_RATIO,
+    HEDGE_MIN_SAMPLES,
+    HEDGE_SPEND_ALLOWANCE_USD,
+    MODEL_RATES,
+)
+from src.utils.bedrock import (
+    CancelToken,
+    ModelLatencyMetrics,
+    get_model_latency_metrics,
+    nearest_rank,
+)
+from src.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from src.utils.dynamo import DynamoDBHelper
+
+logger = get_logger(__name__)
+
+PRIMARY = "primary"
+HEDGE = "hedge"
+
+
+@dataclass
+class HedgeBudget:
+    """Hedge spend cap of a hackathon, tracked on its budget item.
+
+    Attributes:
+        hack_id: Hackathon ID
+        cap_usd: Most the hackathon's hedged calls may spend on losing requests
+        db: DynamoDB helper holding the budget item
+    """
+
+    hack_id: str
+    cap_usd: float
+    db: "DynamoDBHelper"
+
+    @classmethod
+    def for_hackathon(
+        cls, hack_id: str, budget_limit_usd: float | None, db: "DynamoDBHelper"
+    ) -> "HedgeBudget | None":
+        """Build the hedge budget of a hackathon.
+
+        Args:
+            hack_id: Hackathon ID
+            budget_limit_usd: Hackathon budget limit
+            db: DynamoDB helper
+
+        Returns:
+            Hedge budget, or None when the hackathon has no budget limit
+        """
+        if not budget_limit_usd or budget_limit_usd <= 0:
+            return None
+        return cls(hack_id, float(budget_limit_usd) * HEDGE_MAX_BUDGET_SHARE, db)
+
+    def reserve(self, amount_usd: float) -> bool:
+        """Reserve the estimated cost of a hedge request, if it fits the cap."""
+        return self.db.reserve_hedge_spend(self.hack_id, round(amount_usd, 6), self.cap_usd)
+
+    def settle(self, delta_usd: float) -> None:
+        """Replace a reservation with what the losing request cost."""
+        self.db.adjust_hedge_spend(self.hack_id, delta_usd)
+
+
+_current_budget: contextvars.ContextVar[HedgeBudget | None] = contextvars.ContextVar(
+    "hedge_budget", default=None
+)
+
+
+@contextmanager
+def hedge_budget_scope(budget: HedgeBudget | None) -> Iterator[None]:
+    """Cap the hedges of agent calls made in this context by a hackathon budget.
+
+    Args:
+        budget: Hedge budget (None keeps the process-wide cap)
+    """
+    token = _current_budget.set(budget)
+    try:
+        yield
+    finally:
+        _current_budget.reset(token)
+
+
+@dataclass
+class HedgeResult:
+    """Outcome of a hedged call.
+
+    Attributes:
+        value: Result of the winning request
+        winner: ``primary`` or ``hedge``
+        hedged: Whether a hedge request was sent
+    """
+
+    value: Any
+    winner: str
+    hedged: bool
+
+
+def run_hedged(
+    primary: Callable[[CancelToken], Any],
+    start_hedge: Callable[[], Callable[[CancelToken], Any] | None],
+    delay_seconds: float,
+    is_valid: Callable[[Any], bool],
+    on_loser: Callable[[str, Any, Exception | None], None] | None = None,
+) -> HedgeResult:
+    """Run a request, hedging it if it is still running after a delay.
+
+    Each request runs on its own thread in a copy of the caller's context,
+    so trace spans still nest under the caller's. The first valid result
+    wins and the other request is cancelled through its token. If neither
+    is valid, the primary's result (or error) is returned, then the hedge's
+    result.
+
+    Args:
+        primary: Makes the primary request
+        start_hedge: Returns the hedge request, or None if it is refused
+        delay_seconds: How long the primary may run before hedging
+        is_valid: Whether a result can be used
+        on_loser: Called with the losing request's name, result and error
+            once it ends, which may be after this function has returned
+
+    Returns:
+        The winning result
+
+    Raises:
+        Exception: The primary's error, when neither request produced a result
+    """
+    results: queue.Queue[tuple[str, Any, Exception | None]] = queue.Queue()
+    tokens = {PRIMARY: CancelToken(), HEDGE: CancelToken()}
+    lock = threading.Lock()
+    winner: list[str] = []
+
+    def run(name: str, request: Callable[[CancelToken], Any]) -> None:
+        try:
+            outcome: tuple[str, Any, Exception | None] = (name, request(tokens[name]), None)
+        except Exception as e:  # handed to the caller
+            outcome = (name, None, e)
+        with lock:
+            if not winner:
+                results.put(outcome)
+                return
+        if on_loser is not None:
+            on_loser(*outcome)
+
+    def start(name: str, request: Callable[[CancelToken], Any]) -> None:
+        context = contextvars.copy_context()
+        threading.Thread(
+            target=context.run, args=(run, name, request), name=f"agent-{name}", daemon=True
+        ).start()
+
+    def decide(name: str, finished: dict[str, tuple[Any, Exception | None]]) -> None:
+        """Settle the race; a loser that ends later reports itself."""
+        with lock:
+            winner.append(name)
+            while not results.empty():
+                other, value, error = results.get_nowait()
+                finished[other] = (value, error)
+        if on_loser is not None:
+            for other, (value, error) in finished.items():
+                if other != name:
+                    on_loser(other, value, error)
+
+    start(PRIMARY, primary)
+    try:
+        _, value, error = results.get(timeout=delay_seconds)
+    except queue.Empty:
+        pass
+    else:
+        if error is not None:
+            raise error
+        return HedgeResult(value=value, winner=PRIMARY, hedged=False)
+
+    hedge = start_hedge()
+    if hedge is None:
+        _, value, error = results.get()
+        if error is not None:
+            raise error
+        return HedgeResult(value=value, winner=PRIMARY, hedged=False)
+
+    start(HEDGE, hedge)
+    finished: dict[str, tuple[Any, Exception | None]] = {}
+    while len(finished) < 2:
+        name, value, error = results.get()
+        if error is None and is_valid(value):
+            tokens[HEDGE if name == PRIMARY else PRIMARY].cancel()
+            decide(name, finished)
+            return HedgeResult(value=value, winner=name, hedged=True)
+        finished[name] = (value, error)
+
+    for name in (PRIMARY, HEDGE):
+        value, error = finished.pop(name)
+        if error is None:
+            decide(name, finished)
+            return HedgeResult(value=value, winner=name, hedged=True)
+        finished[name] = (value, error)
+    decide(PRIMARY, finished)
+    raise finished[PRIMARY][1]  # type: ignore[misc]
+
+
+def estimate_request_cost(model_id: str, prompt_chars: int, max_tokens: int) -> float:
+    """Estimate the cost of a request that uses all of its output tokens.
+
+    Args:
+        model_id: Bedrock model ID
+        prompt_chars: Characters of system prompt and user message
+        max_tokens: Output token limit
+
+    Returns:
+        Estimated cost in USD (infinite for a model without rates)
+    """
+    rates = MODEL_RATES.get(model_id)
+    if rates is None:
+        return math.inf
+    return prompt_chars / BEDROCK_CHARS_PER_TOKEN * rates["input"] + max_tokens * rates["output"]
+
+
+class _AgentHedgeStats:
+    """Hedging counters of one agent."""
+
+    def __init__(self, model_id: str, window: int) -> None:
+        self.model_id = model_id
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.refused = 0
+        self.spend_usd = 0.0
+        self.extra_spend_usd = 0.0
+        self.latency_ms: deque[float] = deque(maxlen=window)
+
+
+class HedgeController:
+    """Decides when agent calls are hedged and caps what hedging spends.
+
+    Thread-safe; one instance per process (``get_hedge_controller``).
+    """
+
+    def __init__(
+        self,
+        latency: ModelLatencyMetrics | None = None,
+        percentile: float = HEDGE_LATENCY_PERCENTILE,
+        min_samples: int = HEDGE_MIN_SAMPLES,
+        max_request_cost_usd: float = HEDGE_MAX_REQUEST_COST_USD,
+        max_spend_ratio: float = HEDGE_MAX_SPEND_RATIO,
+        spend_allowance_usd: float = HEDGE_SPEND_ALLOWANCE_USD,
+        window: int = BEDROCK_LATENCY_WINDOW,
+    ) -> None:
+        """Initialize the controller.
+
+        Args:
+            latency: Per-model latency of streamed calls (default: process-wide)
+            percentile: Model latency percentile after which a call is hedged
+            min_samples: Recent calls a model needs before it is hedged
+            max_request_cost_usd: Largest estimated cost of one hedge request
+            max_spend_ratio: Extra spend cap as a share of agent spend
+            spend_allowance_usd: Extra spend allowed on top of the ratio
+            window: Agent calls kept for the latency percentiles
+        """
+        self.latency = latency or get_model_latency_metrics()
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.max_request_cost_usd = max_request_cost_usd
+        self.max_spend_ratio = max_spend_ratio
+        self.spend_allowance_usd = spend_allowance_usd
+        self.window = window
+        self._lock = threading.Lock()
+        self._agents: dict[str, _AgentHedgeStats] = {}
+        self._in_flight_usd = 0.0
+
+    def _stats(self, agent_name: str, model_id: str) -> _AgentHedgeStats:
+        stats = self._agents.get(agent_name)
+        if stats is None:
+            stats = self._agents[agent_name] = _AgentHedgeStats(model_id, self.window)
+        return stats
+
+    def delay_seconds(self, model_id: str) -> float | None:
+        """Return how long a call to a model runs before it is hedged.
+
+        Args:
+            model_id: Primary model ID
+
+        Returns:
+            Seconds, or None while the model has too few recent calls
+        """
+        if self.latency.count(model_id) < self.min_samples:
+            return None
+        latency_ms = self.latency.percentile(model_id, "latency_ms", self.percentile)
+        return latency_ms / 1000 if latency_ms is not None else None
+
+    def allow(self, agent_name: str, model_id: str, estimated_cost_usd: float) -> bool:
+        """Reserve spend for a hedge request, if the caps allow it.
+
+        Inside a ``hedge_budget_scope`` the spend is reserved on the
+        hackathon's budget, otherwise against the process-wide cap.
+
+        Args:
+            agent_name: Agent being hedged
+            model_id: Agent's primary model ID
+            estimated_cost_usd: Estimated cost of the hedge request
+
+        Returns:
+            True if the hedge may be sent (call ``release`` when it ends, and
+            ``record_extra_spend`` once the losing request is known)
+        """
+        budget = _current_budget.get()
+        with self._lock:
+            stats = self._stats(agent_name, model_id)
+            extra_spend = sum(s.extra_spend_usd for s in self._agents.values())
+            if budget is not None:
+                cap = budget.cap_usd
+                allowed = estimated_cost_usd <= self.max_request_cost_usd
+            else:
+                spend = sum(s.spend_usd for s in self._agents.values())
+                cap = self.max_spend_ratio * spend + self.spend_allowance_usd
+                projected = extra_spend + self._in_flight_usd + estimated_cost_usd
+                allowed = estimated_cost_usd <= self.max_request_cost_usd and projected <= cap
+                if allowed:
+                    self._in_flight_usd += estimated_cost_usd
+        if allowed and budget is not None:
+            allowed = budget.reserve(estimated_cost_usd)
+        with self._lock:
+            if allowed:
+                stats.hedged += 1
+            else:
+                stats.refused += 1
+        if not allowed:
+            logger.info(
+                "hedge_refused",
+                agent=agent_name,
+                estimated_cost_usd=round(estimated_cost_usd, 6),
+                extra_spend_usd=round(extra_spend, 6),
+                cap_usd=round(cap, 6),
+                hack_id=budget.hack_id if budget is not None else None,
+            )
+        return allowed
+
+    def release(self, estimated_cost_usd: float) -> None:
+        """Drop the reservation of a hedge request that has ended.
+
+        Args:
+            estimated_cost_usd: Amount reserved by ``allow``
+        """
+        if _current_budget.get() is not None:
+            return  # settled on the hackathon's budget by record_extra_spend
+        with self._lock:
+            self._in_flight_usd = max(0.0, self._in_flight_usd - estimated_cost_usd)
+
+    def record_extra_spend(
+        self, agent_name: str, cost_usd: float, reserved_usd: float = 0.0
+    ) -> None:
+        """Record the cost of the request that lost a hedged call.
+
+        Args:
+            agent_name: Agent that was hedged
+            cost_usd: Cost of the losing request (estimated if it was cancelled)
+            reserved_usd: Amount ``allow`` reserved for the hedge request
+        """
+        with self._lock:
+            self._agents[agent_name].extra_spend_usd += cost_usd
+        budget = _current_budget.get()
+        if budget is not None:
+            budget.settle(cost_usd - reserved_usd)
+
+    def record_call(
+        self,
+        agent_name: str,
+        model_id: str,
+        latency_ms: float,
+        cost_usd: float,
+        hedge_won: bool = False,
+    ) -> None:
+        """Record a finished agent call.
+
+        Args:
+            agent_name: Agent name
+            model_id: Agent's primary model ID
+            latency_ms: Time until the agent had its result
+            cost_usd: Cost of the result billed to the agent
+            hedge_won: Whether the hedge request produced the result
+        """
+        with self._lock:
+            stats = self._stats(agent_name, model_id)
+            stats.calls += 1
+            stats.hedge_wins += int(hedge_won)
+            stats.spend_usd += float(cost_usd)
+            stats.latency_ms.append(latency_ms)
+
+    def report(self) -> dict[str, dict[str, Any]]:
+        """Return per-agent tail latency next to the extra spend on hedging.
+
+        Returns:
+            Per agent: call and hedge counts, p95/p99 of the agent's call
+            latency and of its model's latency (``model_p95_ms``), and
+            spend with ``extra_spend_ratio`` (extra spend over agent spend)
+        """
+        with self._lock:
+            agents = {name: (stats, list(stats.latency_ms)) for name, stats in self._agents.items()}
+        report: dict[str, dict[str, Any]] = {}
+        for name, (stats, latencies) in sorted(agents.items()):
+            entry: dict[str, Any] = {
+                "model_id": stats.model_id,
+                "calls": stats.calls,
+                "hedged": stats.hedged,
+                "hedge_wins": stats.hedge_wins,
+                "refused": stats.refused,
+                "spend_usd": round(stats.spend_usd, 6),
+                "extra_spend_usd": round(stats.extra_spend_usd, 6),
+                "extra_spend_ratio": (
+                    round(stats.extra_spend_usd / stats.spend_usd, 4) if stats.spend_usd else 0.0
+                ),
+            }
+            for q in (95, 99):
+                if latencies:
+                    entry[f"p{q}_ms"] = nearest_rank(latencies, q)
+                entry[f"model_p{q}_ms"] = self.latency.percentile(stats.model_id, "latency_ms", q)
+            report[name] = entry
+        return report
+
+
+_controller: HedgeController | None = None
+_controller_lock = threading.Lock()
+
+
+def get_hedge_controller() -> HedgeController:
+    """Get the process-wide hedge controller.
+
+    Returns:
+        Shared hedge controller
+    """
+    global _controller
+    with _controller_lock:
+        if _controller is None:
+            _controller = HedgeController()
+        return _controller
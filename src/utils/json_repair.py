@@ -0,0 +1,299 @@
+"""Tolerant parsing of the JSON object in an LLM response.
+
+Agents are prompted for a single JSON object, and most responses parse with
+``json.loads`` as is. The rest usually have one of a few defects:
+- a trailing comma before ``}`` or ``]``
+- raw newlines or tabs inside strings
+- invalid escapes such as ``\\'``
+- Python literals (``True``, ``None``)
+- a missing comma between members
+- output cut off at ``max_tokens`` in the middle of an array or string
+
+``JSONRepairer`` fixes these in one pass over the text. It is incremental
+(``feed`` chunks as they arrive, ``finish`` at the end), so it also works on
+streamed output. Truncated output is closed at the last complete member of
+the innermost open container, and a truncated string value is kept.
+
+``parse_json_object`` tries ``json.loads`` first and repairs only when that
+fails, so well-formed responses cost no more than before. The repairs it
+applied are reported to the caller and, inside ``capture_repairs()``, also to
+the enclosing block. That lets code receiving only the parsed dict (through
+``BedrockClient.parse_json_response``) still see them.
+"""
+
+import json
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+_VALID_ESCAPES = frozenset('"\\/bfnrtu')
+_CONTROL_ESCAPES = {"\n": "\\n", "\r": "\\r", "\t": "\\t", "\b": "\\b", "\f": "\\f"}
+_LITERALS = {
+    "true": "true",
+    "false": "false",
+    "null": "null",
+    "True": "true",
+    "False": "false",
+    "None": "null",
+}
+_NUMBER = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?")
+_HEX = frozenset("0123456789abcdefABCDEF")
+
+# Container states: what the next significant character should be
+_KEY, _COLON, _VALUE, _AFTER = range(4)
+
+
+@dataclass
+class _Frame:
+    """An open object or array."""
+
+    closer: str
+    state: int
+    # Output length after the opening bracket or the last complete member
+    safe_len: int
+
+
+class JSONRepairer:
+    """Single-pass repairer for the first JSON object in a text.
+
+    Text before the first ``{`` and after the object closes is ignored.
+    Whitespace outside strings is dropped. ``repairs`` lists the kinds of
+    defects fixed, in the order first seen.
+    """
+
+    def __init__(self) -> None:
+        """Start before the object."""
+        self.repairs: list[str] = []
+        self.complete = False
+        self._out: list[str] = []
+        self._stack: list[_Frame] = []
+        self._token: list[str] = []
+        self._in_string = False
+        self._string_is_key = False
+        self._escape = False
+
+    def feed(self, chunk: str) -> None:
+        """Consume the next chunk of text.
+
+        Args:
+            chunk: Text, possibly ending mid-token
+        """
+        for ch in chunk:
+            if self.complete:
+                return
+            if self._in_string:
+                self._string_char(ch)
+                continue
+            if not self._stack:
+                if ch == "{":
+                    self._open("}")
+                continue
+            if self._token and not (ch.isalnum() or ch in "+-."):
+                self._end_token()
+
+            if ch in " \t\r\n":
+                continue
+            if ch == '"':
+                self._before_item()
+                frame = self._stack[-1]
+                self._string_is_key = frame.closer == "}" and frame.state == _KEY
+                self._in_string = True
+                self._out.append('"')
+            elif ch in "{[":
+                self._before_item()
+                self._open("}" if ch == "{" else "]")
+            elif ch in "}]":
+                if ch != self._stack[-1].closer:
+                    self._repair("mismatched_bracket")
+                self._close()
+            elif ch == ":":
+                frame = self._stack[-1]
+                if frame.state == _COLON:
+                    frame.state = _VALUE
+                    self._out.append(":")
+                else:
+                    self._repair("stray_character")
+            elif ch == ",":
+                frame = self._stack[-1]
+                if frame.state == _AFTER:
+                    frame.state = _KEY if frame.closer == "}" else _VALUE
+                    self._out.append(",")
+                else:
+                    self._repair("stray_character")
+            else:
+                if not self._token:
+                    self._before_item()
+                self._token.append(ch)
+
+    def finish(self) -> str:
+        """Close whatever is still open and return the repaired JSON text.
+
+        Returns:
+            Repaired text ("" if no object was found)
+        """
+        if self.complete or not self._stack:
+            return "".join(self._out)
+
+        self._repair("truncated")
+        if self._in_string:
+            self._in_string = False
+            self._escape = False
+            self._drop_partial_unicode_escape()
+            if self._string_is_key:
+                del self._out[self._stack[-1].safe_len :]
+            else:
+                self._out.append('"')
+                self._value_done()
+        elif self._token:
+            token = "".join(self._token)
+            if token in _LITERALS or _NUMBER.fullmatch(token):
+                self._end_token()
+            else:
+                self._token.clear()
+
+        while self._stack:
+            self._close()
+        return "".join(self._out)
+
+    def _repair(self, kind: str) -> None:
+        if kind not in self.repairs:
+            self.repairs.append(kind)
+
+    def _open(self, closer: str) -> None:
+        self._out.append("{" if closer == "}" else "[")
+        state = _KEY if closer == "}" else _VALUE
+        self._stack.append(_Frame(closer=closer, state=state, safe_len=len(self._out)))
+
+    def _close(self) -> None:
+        frame = self._stack[-1]
+        if frame.state == _COLON or (frame.state == _VALUE and frame.closer == "}"):
+            # A key without a value
+            del self._out[frame.safe_len :]
+            self._repair("missing_value")
+        elif frame.state != _AFTER and self._out[-1] == ",":
+            self._out.pop()
+            self._repair("trailing_comma")
+        self._out.append(frame.closer)
+        self._stack.pop()
+        if self._stack:
+            self._value_done()
+        else:
+            self.complete = True
+
+    def _before_item(self) -> None:
+        """Insert the comma a model left out between two members."""
+        frame = self._stack[-1]
+        if frame.state == _AFTER:
+            self._repair("missing_comma")
+            self._out.append(",")
+            frame.state = _KEY if frame.closer == "}" else _VALUE
+
+    def _value_done(self) -> None:
+        frame = self._stack[-1]
+        frame.state = _AFTER
+        frame.safe_len = len(self._out)
+
+    def _end_token(self) -> None:
+        token = "".join(self._token)
+        self._token.clear()
+        literal = _LITERALS.get(token)
+        if literal is not None and literal != token:
+            self._repair("python_literal")
+            token = literal
+        self._out.append(token)
+        self._value_done()
+
+    def _string_char(self, ch: str) -> None:
+        if self._escape:
+            self._escape = False
+            if ch in _VALID_ESCAPES:
+                self._out.append("\\" + ch)
+                return
+            self._repair("invalid_escape")
+            if ch == "'":
+                self._out.append("'")
+                return
+            # Keep the backslash as a literal character
+            self._out.append("\\\\")
+        if ch == "\\":
+            self._escape = True
+        elif ch == '"':
+            self._in_string = False
+            self._out.append('"')
+            if self._string_is_key:
+                self._stack[-1].state = _COLON
+            else:
+                self._value_done()
+        elif ch < " ":
+            self._repair("control_character")
+            self._out.append(_CONTROL_ESCAPES.get(ch, f"\\u{ord(ch):04x}"))
+        else:
+            self._out.append(ch)
+
+    def _drop_partial_unicode_escape(self) -> None:
+        """Remove a ``\\uXXXX`` escape cut off before its fourth hex digit."""
+        for back in range(1, 5):
+            if len(self._out) < back:
+                return
+            piece = self._out[-back]
+            if piece == "\\u":
+                del self._out[-back:]
+                return
+            if piece not in _HEX:
+                return
+
+
+_current_repairs: ContextVar[list[str] | None] = ContextVar("current_repairs", default=None)
+
+
+@contextmanager
+def capture_repairs() -> Iterator[list[str]]:
+    """Collect the repairs of every ``parse_json_object`` call in the block.
+
+    Yields:
+        List the repair kinds are appended to
+    """
+    repairs: list[str] = []
+    token = _current_repairs.set(repairs)
+    try:
+        yield repairs
+    finally:
+        _current_repairs.reset(token)
+
+
+def parse_json_object(text: str) -> tuple[dict[str, Any] | None, list[str]]:
+    """Parse the first JSON object in a text, repairing it if needed.
+
+    Args:
+        text: LLM response text (may include prose or markdown fences)
+
+    Returns:
+        Tuple of (parsed object or None, kinds of repairs applied)
+    """
+    start = text.find("{")
+    if start == -1:
+        return None, []
+
+    end = text.rfind("}")
+    if end > start:
+        try:
+            value = json.loads(text[start : end + 1])
+            if isinstance(value, dict):
+                return value, []
+        except json.JSONDecodeError:
+            pass
+
+    repairer = JSONRepairer()
+    repairer.feed(text[start:])
+    repaired = repairer.finish()
+    captured = _current_repairs.get()
+    if captured is not None:
+        captured.extend(r for r in repairer.repairs if r not in captured)
+    try:
+        value = json.loads(repaired)
+    except json.JSONDecodeError:
+        return None, repairer.repairs
+    return (value if isinstance(value, dict) else None), repairer.repairs
@@ -0,0 +1,372 @@
+"""Memory accounting and admission control for submission analysis.
+
+While a submission is analyzed the analyzer holds its cloned source files,
+CI workflow data, agent responses and intelligence models. One submission at
+a time fits easily in the function's memory, but several in flight in one
+process (fan-out shards sharing a host, the pipeline benchmark, garbage
+retained by a warm Lambda container) can run it out of memory.
+
+A ``MemoryLedger`` records the process RSS, plus tracemalloc's traced memory
+when tracemalloc is running, at a submission's stage boundaries. Like the
+tracer, the active ledger lives in a context variable, so ``checkpoint()``
+can be called from any stage and does nothing outside a submission. RSS is
+process-wide: with several submissions in flight a ledger shows the process
+around that submission, not the submission alone.
+
+The process-wide ``AdmissionController`` decides whether another submission
+may start. RSS rarely shrinks once memory is freed (the allocator keeps the
+pages for reuse), so the projection is anchored on a baseline: the RSS after
+``gc.collect()`` the first time the process is idle. The projected RSS is the
+baseline plus the estimated footprint of every in-flight submission and of
+the new one, or the current RSS if that is higher. A warm process that has
+freed its last submission is therefore not charged for pages it will reuse.
+The footprint estimate starts at ``ANALYZER_SUBMISSION_MEMORY_MB`` and
+follows each finished submission's peak RSS above the baseline (smoothed,
+never below the starting value).
+"""
+
+import gc
+import os
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from src.constants import (
+    ANALYZER_ADMISSION_WAIT_SECONDS,
+    ANALYZER_MEMORY_CEILING_FRACTION,
+    ANALYZER_MEMORY_CEILING_MB,
+    ANALYZER_SUBMISSION_MEMORY_MB,
+)
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+MIB = 1024 * 1024
+
+# Weight of the latest observation in the footprint estimate
+_ESTIMATE_SMOOTHING = 0.3
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_rss_mb() -> float:
+    """Return the resident set size of this process in MiB.
+
+    Reads ``/proc/self/statm`` (Linux); elsewhere the peak RSS is the best
+    available figure.
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * _PAGE_SIZE / MIB
+    except (OSError, ValueError, IndexError):
+        return peak_rss_mb()
+
+
+def peak_rss_mb() -> float:
+    """Return the peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / MIB if sys.platform == "darwin" else peak / 1024
+
+
+def start_tracemalloc_from_env() -> None:
+    """Start tracemalloc when ``ANALYZER_TRACEMALLOC`` is set (it slows allocation)."""
+    if os.environ.get("ANALYZER_TRACEMALLOC") and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        logger.info("tracemalloc_started")
+
+
+@dataclass
+class MemorySnapshot:
+    """Memory use at one stage boundary.
+
+    Attributes:
+        stage: Stage that just finished (or ``start``)
+        rss_mb: Process RSS (MiB)
+        traced_mb: Memory allocated by Python (MiB), when tracemalloc runs
+        traced_peak_mb: Peak of traced_mb since tracemalloc started
+    """
+
+    stage: str
+    rss_mb: float
+    traced_mb: float | None = None
+    traced_peak_mb: float | None = None
+
+
+class MemoryLedger:
+    """Memory snapshots taken at the stage boundaries of one submission."""
+
+    def __init__(self, sub_id: str) -> None:
+        """Create an empty ledger.
+
+        Args:
+            sub_id: Submission ID
+        """
+        self.sub_id = sub_id
+        self.snapshots: list[MemorySnapshot] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def activate(self) -> Iterator["MemoryLedger"]:
+        """Make this the current ledger for the enclosed block."""
+        token = _current_ledger.set(self)
+        try:
+            yield self
+        finally:
+            _current_ledger.reset(token)
+
+    def checkpoint(self, stage: str) -> MemorySnapshot:
+        """Record the memory use after a stage.
+
+        Args:
+            stage: Stage name
+
+        Returns:
+            The snapshot
+        """
+        snapshot = MemorySnapshot(stage=stage, rss_mb=round(current_rss_mb(), 1))
+        if tracemalloc.is_tracing():
+            traced, traced_peak = tracemalloc.get_traced_memory()
+            snapshot.traced_mb = round(traced / MIB, 1)
+            snapshot.traced_peak_mb = round(traced_peak / MIB, 1)
+        with self._lock:
+            self.snapshots.append(snapshot)
+        return snapshot
+
+    @property
+    def peak_mb(self) -> float:
+        """Highest RSS recorded (MiB)."""
+        return max((s.rss_mb for s in self.snapshots), default=0.0)
+
+    @property
+    def growth_mb(self) -> float:
+        """RSS growth from the first snapshot to the highest (MiB)."""
+        if not self.snapshots:
+            return 0.0
+        return max(0.0, self.peak_mb - self.snapshots[0].rss_mb)
+
+    def to_record(self) -> dict[str, Any]:
+        """Return the ledger as a JSON/DynamoDB-friendly dict."""
+        return {
+            "peak_rss_mb": self.peak_mb,
+            "growth_mb": round(self.growth_mb, 1),
+            "stages": [
+                {k: v for k, v in asdict(s).items() if v is not None} for s in self.snapshots
+            ],
+        }
+
+
+_current_ledger: ContextVar[MemoryLedger | None] = ContextVar("current_ledger", default=None)
+
+
+def checkpoint(stage: str) -> MemorySnapshot | None:
+    """Record a stage boundary on the active ledger, if any.
+
+    Args:
+        stage: Stage that just finished
+
+    Returns:
+        The snapshot, or None outside a submission
+    """
+    ledger = _current_ledger.get()
+    return ledger.checkpoint(stage) if ledger is not None else None
+
+
+class AdmissionController:
+    """Admits submissions while the projected RSS stays under a ceiling.
+
+    Thread-safe. A refused submission waits for in-flight ones to finish; if
+    nothing else is in flight, garbage is collected once before refusing.
+
+    Attributes:
+        baseline_mb: RSS after garbage collection while idle (None until the
+            first submission is admitted)
+    """
+
+    def __init__(
+        self,
+        ceiling_mb: float = ANALYZER_MEMORY_CEILING_MB,
+        estimate_mb: float = ANALYZER_SUBMISSION_MEMORY_MB,
+        wait_seconds: float = ANALYZER_ADMISSION_WAIT_SECONDS,
+        rss: Callable[[], float] = current_rss_mb,
+        collect: Callable[[], Any] = gc.collect,
+    ) -> None:
+        """Initialize the controller.
+
+        Args:
+            ceiling_mb: Highest projected RSS to admit at (0 disables admission control)
+            estimate_mb: Initial, and minimum, footprint estimate per submission
+            wait_seconds: How long a submission waits for memory to free up
+            rss: Current RSS probe in MiB (injectable for tests)
+            collect: Garbage collector (injectable for tests)
+        """
+        self.ceiling_mb = ceiling_mb
+        self.min_estimate_mb = estimate_mb
+        self.estimate_mb = estimate_mb
+        self.wait_seconds = wait_seconds
+        self._rss = rss
+        self._collect = collect
+        self.baseline_mb: float | None = None
+        self._in_flight: dict[str, float] = {}
+        self._condition = threading.Condition()
+        self.stats = {"admitted": 0, "waited": 0, "refused": 0, "overridden": 0}
+
+    @property
+    def in_flight(self) -> int:
+        """Number of admitted submissions not yet released."""
+        with self._condition:
+            return len(self._in_flight)
+
+    def projected_mb(self) -> float:
+        """RSS projected with the in-flight reservations and one more submission."""
+        with self._condition:
+            return self._projected_mb()
+
+    def _projected_mb(self) -> float:
+        rss = self._rss()
+        reserved = sum(self._in_flight.values()) + self.estimate_mb
+        if self.baseline_mb is None:
+            return rss + reserved
+        return max(rss, self.baseline_mb + reserved)
+
+    def _measure_baseline(self) -> None:
+        """Collect garbage and take the idle RSS as the baseline (lowest seen)."""
+        self._collect()
+        rss = self._rss()
+        if self.baseline_mb is None or rss < self.baseline_mb:
+            self.baseline_mb = rss
+
+    def admit(self, sub_id: str, required: bool = False) -> bool:
+        """Reserve memory for a submission about to start.
+
+        Admitting a submission that is already in flight is a no-op.
+
+        Args:
+            sub_id: Submission ID
+            required: Admit even if memory does not free up in time (the
+                caller cannot defer the submission)
+
+        Returns:
+            True if admitted; False means defer the submission
+        """
+        deadline = time.monotonic() + self.wait_seconds
+        collected = False
+        waited = False
+        with self._condition:
+            if sub_id in self._in_flight:
+                return True
+            if self.ceiling_mb > 0 and self.baseline_mb is None and not self._in_flight:
+                self._measure_baseline()
+                collected = True
+            while self.ceiling_mb > 0:
+                projected = self._projected_mb()
+                if projected <= self.ceiling_mb:
+                    break
+                if not self._in_flight and not collected:
+                    self._collect()
+                    collected = True
+                    continue
+                remaining = deadline - time.monotonic()
+                if not self._in_flight or remaining <= 0:
+                    if not required:
+                        self.stats["refused"] += 1
+                        logger.warning(
+                            "memory_admission_refused",
+                            sub_id=sub_id,
+                            projected_mb=round(projected),
+                            ceiling_mb=self.ceiling_mb,
+                            in_flight=len(self._in_flight),
+                        )
+                        return False
+                    self.stats["overridden"] += 1
+                    logger.warning(
+                        "memory_admission_overridden",
+                        sub_id=sub_id,
+                        projected_mb=round(projected),
+                        ceiling_mb=self.ceiling_mb,
+                    )
+                    break
+                if not waited:
+                    waited = True
+                    self.stats["waited"] += 1
+                self._condition.wait(remaining)
+
+            self._in_flight[sub_id] = self.estimate_mb
+            self.stats["admitted"] += 1
+            return True
+
+    def release(self, sub_id: str) -> None:
+        """Return a submission's reservation and wake waiting submissions.
+
+        Args:
+            sub_id: Submission ID (unknown IDs are ignored)
+        """
+        with self._condition:
+            if self._in_flight.pop(sub_id, None) is not None:
+                self._condition.notify_all()
+
+    def observe(self, peak_rss_mb: float) -> None:
+        """Fold a finished submission's footprint into the estimate.
+
+        The footprint is the submission's peak RSS above the baseline, so
+        memory a warm process reuses is not counted again. Ignored until a
+        baseline has been measured.
+
+        Args:
+            peak_rss_mb: Highest RSS during the submission (``MemoryLedger.peak_mb``)
+        """
+        with self._condition:
+            if self.baseline_mb is None:
+                return
+            footprint = max(0.0, peak_rss_mb - self.baseline_mb)
+            smoothed = (
+                1 - _ESTIMATE_SMOOTHING
+            ) * self.estimate_mb + _ESTIMATE_SMOOTHING * footprint
+            self.estimate_mb = max(self.min_estimate_mb, smoothed)
+
+
+_controller: AdmissionController | None = None
+_controller_lock = threading.Lock()
+
+
+def get_admission_controller() -> AdmissionController:
+    """Get the process-wide admission controller.
+
+    Returns:
+        Shared admission controller (ceiling from ``memory_ceiling_mb``)
+    """
+    global _controller
+    with _controller_lock:
+        if _controller is None:
+            _controller = AdmissionController(ceiling_mb=memory_ceiling_mb())
+        return _controller
+
+
+def memory_ceiling_mb() -> float:
+    """Return the admission ceiling in MiB.
+
+    ``ANALYZER_MEMORY_CEILING_MB`` wins when set (0 disables admission
+    control). In Lambda the ceiling is ANALYZER_MEMORY_CEILING_FRACTION of
+    the function's memory (``AWS_LAMBDA_FUNCTION_MEMORY_SIZE``); elsewhere it
+    is ANALYZER_MEMORY_CEILING_MB.
+    """
+    for name, scale in (
+        ("ANALYZER_MEMORY_CEILING_MB", 1.0),
+        ("AWS_LAMBDA_FUNCTION_MEMORY_SIZE", ANALYZER_MEMORY_CEILING_FRACTION),
+    ):
+        configured = os.environ.get(name)
+        if not configured:
+            continue
+        try:
+            return float(configured) * scale
+        except ValueError:
+            logger.warning("invalid_memory_setting", name=name, value=configured)
+    return float(ANALYZER_MEMORY_CEILING_MB)
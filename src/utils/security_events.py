@@ -0,0 +1,285 @@
+"""Off-request-path security event pipeline.
+
+Abuse bursts are exactly when per-request DynamoDB work hurts most, so the
+security middleware never touches DynamoDB while a response is pending:
+
+- ``SecurityEventSink`` samples repeated events per (key, type, endpoint,
+  status) and queues the rest in a bounded in-memory queue, written in
+  ``BatchWriteItem`` chunks, paced by the table's write scheduler, by a flush
+  that runs after the response is sent.
+- ``SlidingWindowCounter`` tracks per-key request rates in memory and
+  reports only upward threshold crossings, which become anomaly events.
+
+Counts are per process (per Lambda execution environment); global request
+rates are still enforced by the rate limiter.
+"""
+
+import atexit
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from src.constants import (
+    SECURITY_ANOMALY_WINDOW_SECONDS,
+    SECURITY_EVENT_BATCH_SIZE,
+    SECURITY_EVENT_DEDUP_WINDOW_SECONDS,
+    SECURITY_EVENT_FLUSH_INTERVAL_SECONDS,
+    SECURITY_EVENT_QUEUE_SIZE,
+    SECURITY_EVENT_SAMPLE_FIRST,
+    SECURITY_EVENT_SAMPLE_RATE,
+    SECURITY_TRACKED_KEYS_MAX,
+)
+from src.models.rate_limit import SecurityEvent, Severity
+from src.utils.dynamo import DynamoDBHelper
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class SlidingWindowCounter:
+    """Per-key request counts over a sliding window, in one-second buckets."""
+
+    def __init__(
+        self,
+        threshold: int,
+        window_seconds: int = SECURITY_ANOMALY_WINDOW_SECONDS,
+        max_keys: int = SECURITY_TRACKED_KEYS_MAX,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize counter.
+
+        Args:
+            threshold: Count above which a key is anomalous
+            window_seconds: Window length in seconds
+            max_keys: Keys tracked before the least recently seen is evicted
+            clock: Wall-clock source (injectable for tests)
+        """
+        self.threshold = threshold
+        self.window_seconds = window_seconds
+        self.max_keys = max_keys
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (deque of [second, count] buckets, running total)
+        self._windows: OrderedDict[str, tuple[deque[list[int]], list[int]]] = OrderedDict()
+        self._above: set[str] = set()
+
+    def hit(self, key: str) -> int | None:
+        """Count one request for key.
+
+        Returns:
+            The window count if this request crossed the threshold (the key
+            was at or below it before), otherwise None. A key re-arms once
+            its count falls back to the threshold.
+        """
+        now = int(self._clock())
+        with self._lock:
+            if key in self._windows:
+                buckets, total = self._windows[key]
+                self._windows.move_to_end(key)
+            else:
+                buckets, total = deque(), [0]
+                self._windows[key] = (buckets, total)
+                if len(self._windows) > self.max_keys:
+                    evicted, _ = self._windows.popitem(last=False)
+                    self._above.discard(evicted)
+
+            while buckets and buckets[0][0] <= now - self.window_seconds:
+                total[0] -= buckets.popleft()[1]
+            if buckets and buckets[-1][0] == now:
+                buckets[-1][1] += 1
+            else:
+                buckets.append([now, 1])
+            total[0] += 1
+
+            count = total[0]
+            if count <= self.threshold:
+                self._above.discard(key)
+                return None
+            if key in self._above:
+                return None
+            self._above.add(key)
+            return count
+
+
+@dataclass
+class _SampleState:
+    window_start: float
+    seen: int = 0
+    suppressed: int = 0
+
+
+class SecurityEventSink:
+    """Sampled, bounded, batched writer for security events."""
+
+    def __init__(
+        self,
+        db_helper: DynamoDBHelper,
+        max_queue_size: int = SECURITY_EVENT_QUEUE_SIZE,
+        batch_size: int = SECURITY_EVENT_BATCH_SIZE,
+        flush_interval_seconds: float = SECURITY_EVENT_FLUSH_INTERVAL_SECONDS,
+        dedup_window_seconds: float = SECURITY_EVENT_DEDUP_WINDOW_SECONDS,
+        sample_first: int = SECURITY_EVENT_SAMPLE_FIRST,
+        sample_rate: int = SECURITY_EVENT_SAMPLE_RATE,
+        max_tracked_keys: int = SECURITY_TRACKED_KEYS_MAX,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize sink.
+
+        Args:
+            db_helper: DynamoDB helper used for batch writes
+            max_queue_size: Queued events before new ones are dropped
+            batch_size: Events per batch write
+            flush_interval_seconds: Seconds between flushes (0 = every response)
+            dedup_window_seconds: Window for sampling repeated events
+            sample_first: Repeats kept in full per window
+            sample_rate: Keep one in this many repeats after that
+            max_tracked_keys: Sampling keys tracked before the oldest is evicted
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.db_helper = db_helper
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.dedup_window_seconds = dedup_window_seconds
+        self.sample_first = sample_first
+        self.sample_rate = max(1, sample_rate)
+        self.max_tracked_keys = max_tracked_keys
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._queue: list[SecurityEvent] = []
+        self._samples: OrderedDict[tuple, _SampleState] = OrderedDict()
+        self._last_flush = clock()
+        self.stats = {"submitted": 0, "sampled_out": 0, "dropped": 0, "written": 0, "failed": 0}
+
+    @property
+    def queue_depth(self) -> int:
+        """Events waiting to be written."""
+        with self._lock:
+            return len(self._queue)
+
+    def submit(self, event: SecurityEvent) -> bool:
+        """Offer an event; never blocks or does I/O.
+
+        Critical events bypass sampling. Repeats beyond the sampling budget
+        are counted and folded into the next kept event's
+        ``metadata["suppressed_count"]``.
+
+        Args:
+            event: Security event
+
+        Returns:
+            True if the event was queued
+        """
+        with self._lock:
+            self.stats["submitted"] += 1
+            if event.severity != Severity.CRITICAL and not self._sample(event):
+                self.stats["sampled_out"] += 1
+                return False
+            if len(self._queue) >= self.max_queue_size:
+                self.stats["dropped"] += 1
+                return False
+            self._queue.append(event)
+            return True
+
+    def _sample(self, event: SecurityEvent) -> bool:
+        """Decide whether to keep a repeated event (caller holds the lock)."""
+        key = (event.api_key_prefix, event.event_type, event.endpoint, event.status_code)
+        now = self._clock()
+        state = self._samples.get(key)
+        if state is None or now - state.window_start >= self.dedup_window_seconds:
+            state = _SampleState(window_start=now)
+            self._samples[key] = state
+            if len(self._samples) > self.max_tracked_keys:
+                self._samples.popitem(last=False)
+        self._samples.move_to_end(key)
+
+        state.seen += 1
+        keep = (
+            state.seen <= self.sample_first
+            or (state.seen - self.sample_first) % self.sample_rate == 0
+        )
+        if not keep:
+            state.suppressed += 1
+            return False
+        if state.suppressed:
+            event.metadata["suppressed_count"] = state.suppressed
+            state.suppressed = 0
+        return True
+
+    def flush_due(self) -> bool:
+        """Whether queued events should be written now."""
+        with self._lock:
+            if not self._queue:
+                return False
+            return (
+                len(self._queue) >= self.batch_size
+                or self._clock() - self._last_flush >= self.flush_interval_seconds
+            )
+
+    def flush(self) -> int:
+        """Write all queued events in batch-size chunks.
+
+        Returns:
+            Number of events written
+        """
+        with self._flush_lock:
+            with self._lock:
+                events, self._queue = self._queue, []
+                self._last_flush = self._clock()
+            written = 0
+            for start in range(0, len(events), self.batch_size):
+                chunk = events[start : start + self.batch_size]
+                failed = self.db_helper.batch_put_items([event.model_dump() for event in chunk])
+                written += len(chunk) - len(failed)
+                if failed:
+                    with self._lock:
+                        self.stats["failed"] += len(failed)
+            with self._lock:
+                self.stats["written"] += written
+            if events:
+                logger.info("security_events_flushed", written=written, queued=len(events))
+            return written
+
+    def maybe_flush(self) -> int:
+        """Flush if due.
+
+        Returns:
+            Number of events written
+        """
+        return self.flush() if self.flush_due() else 0
+
+
+def default_flush_interval() -> float:
+    """Security event flush interval for this environment (0 inside Lambda)."""
+    configured = os.environ.get("SECURITY_EVENT_FLUSH_INTERVAL_SECONDS")
+    if configured:
+        return float(configured)
+    if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+        return 0.0
+    return SECURITY_EVENT_FLUSH_INTERVAL_SECONDS
+
+
+_sinks: dict[str, SecurityEventSink] = {}
+_sinks_lock = threading.Lock()
+
+
+def get_security_event_sink(db_helper: DynamoDBHelper) -> SecurityEventSink:
+    """Get the process-wide security event sink for a table.
+
+    Args:
+        db_helper: DynamoDB helper for the events table
+
+    Returns:
+        Shared sink (flushed at interpreter exit)
+    """
+    with _sinks_lock:
+        sink = _sinks.get(db_helper.table_name)
+        if sink is None:
+            sink = SecurityEventSink(db_helper, flush_interval_seconds=default_flush_interval())
+            atexit.register(sink.flush)
+            _sinks[db_helper.table_name] = sink
+        return sink
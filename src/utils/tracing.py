@@ -0,0 +1,270 @@
+"""Span-based tracing of the analysis pipeline.
+
+``PerformanceMonitor`` and ``CostTracker`` record one flat duration per
+component, which hides nesting and concurrency: once agents and the
+intelligence stages run in parallel, per-component totals no longer explain
+where a submission's wall time went. A ``Tracer`` records spans instead,
+with a parent, start and end offsets, the thread they ran on and free-form
+attributes (bytes written, tokens, file counts).
+
+The active tracer and span live in context variables, so instrumented code
+calls the module-level ``span()`` without a tracer being passed around, and
+it costs nothing when no tracer is active (tests, scripts, the API). Work
+handed to a thread pool keeps its parent only if it runs in a copy of the
+caller's context (``contextvars.copy_context().run``); ``asyncio.to_thread``
+does this, ``loop.run_in_executor`` does not.
+
+A finished trace exports to the Chrome trace event format, which
+chrome://tracing and https://ui.perfetto.dev open directly, and reduces to
+per-span-name durations that ``summarize_durations`` turns into percentiles.
+"""
+
+import itertools
+import math
+import threading
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.constants import TRACE_SUMMARY_PERCENTILES
+
+
+@dataclass
+class Span:
+    """One timed operation within a trace.
+
+    Attributes:
+        name: Span name (dotted, e.g. ``dynamodb.put_item``)
+        span_id: Identifier unique within the trace
+        parent_id: Enclosing span, or None for a root span
+        start_ns: Start offset from the trace origin (nanoseconds)
+        end_ns: End offset, or None while the span is open
+        thread_id: Identifier of the thread the span ran on
+        thread_name: Name of that thread
+        attributes: Free-form attributes (sizes, counts, error type)
+    """
+
+    name: str
+    span_id: int
+    parent_id: int | None
+    start_ns: int
+    end_ns: int | None = None
+    thread_id: int = 0
+    thread_name: str = ""
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    def set(self, **attributes: Any) -> None:
+        """Add or overwrite attributes."""
+        self.attributes.update(attributes)
+
+    @property
+    def duration_ms(self) -> float:
+        """Span duration in milliseconds (0 while open)."""
+        if self.end_ns is None:
+            return 0.0
+        return (self.end_ns - self.start_ns) / 1_000_000
+
+
+class _NoopSpan(Span):
+    """Span handed out when tracing is off; attributes are discarded."""
+
+    def set(self, **attributes: Any) -> None:
+        """Ignore the attributes."""
+
+
+_NOOP_SPAN = _NoopSpan(name="", span_id=0, parent_id=None, start_ns=0)
+
+_current_tracer: ContextVar["Tracer | None"] = ContextVar("current_tracer", default=None)
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+class Tracer:
+    """Collects the spans of one trace (one submission's analysis).
+
+    Spans may be opened from several threads at once; finished spans are
+    appended under a lock.
+    """
+
+    def __init__(self, trace_id: str) -> None:
+        """Start the trace clock.
+
+        Args:
+            trace_id: Trace identifier (the submission ID)
+        """
+        self.trace_id = trace_id
+        self.spans: list[Span] = []
+        self._origin_ns = time.perf_counter_ns()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def activate(self) -> Iterator["Tracer"]:
+        """Make this the current tracer for the enclosed block."""
+        token = _current_tracer.set(self)
+        try:
+            yield self
+        finally:
+            _current_tracer.reset(token)
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """Record the enclosed block as a child of the current span.
+
+        An exception escaping the block is recorded as the ``error``
+        attribute and re-raised.
+
+        Args:
+            name: Span name
+            **attributes: Initial attributes
+
+        Yields:
+            The open span, for attributes known only at the end
+        """
+        parent = _current_span.get()
+        thread = threading.current_thread()
+        current = Span(
+            name=name,
+            span_id=next(self._ids),
+            parent_id=parent.span_id if parent is not None and parent is not _NOOP_SPAN else None,
+            start_ns=time.perf_counter_ns() - self._origin_ns,
+            thread_id=thread.ident or 0,
+            thread_name=thread.name,
+            attributes=attributes,
+        )
+        token = _current_span.set(current)
+        try:
+            yield current
+        except BaseException as e:
+            current.attributes["error"] = type(e).__name__
+            raise
+        finally:
+            current.end_ns = time.perf_counter_ns() - self._origin_ns
+            _current_span.reset(token)
+            with self._lock:
+                self.spans.append(current)
+
+    def durations_ms(self) -> dict[str, list[float]]:
+        """Return the durations of the finished spans, grouped by span name."""
+        durations: dict[str, list[float]] = {}
+        for finished in self.spans:
+            durations.setdefault(finished.name, []).append(round(finished.duration_ms, 3))
+        return durations
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Export the finished spans in the Chrome trace event format.
+
+        Each span becomes a complete ("X") event on its thread's track, with
+        its attributes and span/parent IDs as event args. Thread names are
+        emitted as metadata events so the tracks are labelled.
+
+        Returns:
+            JSON-serializable trace (``{"traceEvents": [...], ...}``)
+        """
+        spans = sorted(self.spans, key=lambda s: s.start_ns)
+        threads = {s.thread_id: s.thread_name for s in spans}
+        events: list[dict[str, Any]] = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": thread_id,
+                "args": {"name": thread_name},
+            }
+            for thread_id, thread_name in threads.items()
+        ]
+        for s in spans:
+            events.append(
+                {
+                    "name": s.name,
+                    "cat": s.name.split(".", 1)[0].split(":", 1)[0],
+                    "ph": "X",
+                    "ts": s.start_ns / 1000,
+                    "dur": ((s.end_ns or s.start_ns) - s.start_ns) / 1000,
+                    "pid": 1,
+                    "tid": s.thread_id,
+                    "args": {
+                        **{k: _json_value(v) for k, v in s.attributes.items()},
+                        "span_id": s.span_id,
+                        "parent_id": s.parent_id,
+                    },
+                }
+            )
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"trace_id": self.trace_id},
+        }
+
+
+def current_tracer() -> Tracer | None:
+    """Return the active tracer, or None when tracing is off."""
+    return _current_tracer.get()
+
+
+def current_span() -> Span:
+    """Return the innermost open span (a no-op span when tracing is off)."""
+    return _current_span.get() or _NOOP_SPAN
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    """Record the enclosed block as a span of the active tracer, if any.
+
+    Args:
+        name: Span name
+        **attributes: Initial attributes
+
+    Yields:
+        The open span (a no-op span when tracing is off)
+    """
+    tracer = _current_tracer.get()
+    if tracer is None:
+        yield _NOOP_SPAN
+        return
+    with tracer.span(name, **attributes) as current:
+        yield current
+
+
+def summarize_durations(
+    durations: Iterable[Mapping[str, Iterable[float]]],
+    percentiles: Iterable[int] = TRACE_SUMMARY_PERCENTILES,
+) -> dict[str, dict[str, float]]:
+    """Merge per-trace span durations and compute percentiles per span name.
+
+    Percentiles use the nearest-rank method, so every reported value is an
+    observed duration.
+
+    Args:
+        durations: Span durations (ms) by span name, one mapping per trace
+        percentiles: Percentiles to report
+
+    Returns:
+        Per span name: ``count``, ``p<N>`` for each percentile and ``max``
+    """
+    merged: dict[str, list[float]] = {}
+    for trace in durations:
+        for name, values in trace.items():
+            merged.setdefault(name, []).extend(float(v) for v in values)
+
+    summary: dict[str, dict[str, float]] = {}
+    for name, values in sorted(merged.items()):
+        if not values:
+            continue
+        values.sort()
+        stats: dict[str, float] = {"count": len(values)}
+        for p in percentiles:
+            rank = max(1, math.ceil(p / 100 * len(values)))
+            stats[f"p{p}"] = round(values[rank - 1], 3)
+        stats["max"] = round(values[-1], 3)
+        summary[name] = stats
+    return summary
+
+
+def _json_value(value: Any) -> Any:
+    """Return an attribute value that json.dumps accepts."""
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    return str(value)
@@ -0,0 +1,216 @@
+"""Write-behind buffer for per-API-key usage counters.
+
+Recording usage with a read-modify-write per request costs two round trips
+and loses increments under concurrency. Instead, requests are accumulated
+in memory as ``UsageDelta``s keyed by (API key, day), and each flush writes
+one atomic ``ADD`` update per key, however many requests it covers.
+
+Flushes happen when the interval has elapsed (checked after each
+response), when too many keys are pending, and at shutdown (``atexit`` and
+SIGTERM, which Lambda sends before recycling an environment). In Lambda the
+process freezes between invocations, so the default interval there is 0:
+flush after every response.
+"""
+
+import atexit
+import os
+import signal
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any
+
+from src.constants import USAGE_BUFFER_MAX_KEYS, USAGE_FLUSH_INTERVAL_SECONDS
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class UsageDelta:
+    """Counters accumulated for one (API key, day) since the last flush."""
+
+    successful: int = 0
+    failed: int = 0
+    cost_usd: Decimal = field(default_factory=Decimal)
+    endpoints: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def requests(self) -> int:
+        return self.successful + self.failed
+
+    def record(self, endpoint: str, status_code: int, cost_usd: float = 0.0) -> None:
+        """Add one request."""
+        if 200 <= status_code < 400:
+            self.successful += 1
+        else:
+            self.failed += 1
+        self.cost_usd += Decimal(str(cost_usd))
+        self.endpoints[endpoint] = self.endpoints.get(endpoint, 0) + 1
+
+    def merge(self, other: "UsageDelta") -> None:
+        """Fold another delta into this one."""
+        self.successful += other.successful
+        self.failed += other.failed
+        self.cost_usd += other.cost_usd
+        for endpoint, count in other.endpoints.items():
+            self.endpoints[endpoint] = self.endpoints.get(endpoint, 0) + count
+
+
+UsageWriter = Callable[[str, str, UsageDelta], bool]
+
+
+class UsageWriteBuffer:
+    """Thread-safe in-process buffer coalescing usage counters per key."""
+
+    def __init__(
+        self,
+        writer: UsageWriter,
+        flush_interval_seconds: float = USAGE_FLUSH_INTERVAL_SECONDS,
+        max_pending_keys: int = USAGE_BUFFER_MAX_KEYS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize buffer.
+
+        Args:
+            writer: Applies one delta atomically; called as
+                ``writer(api_key, date, delta)`` and returns True on success
+            flush_interval_seconds: Seconds between flushes (0 = every response)
+            max_pending_keys: Pending keys that force a flush
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.writer = writer
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_pending_keys = max_pending_keys
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: dict[tuple[str, str], UsageDelta] = {}
+        self._last_flush = clock()
+        self.stats = {"recorded": 0, "flushes": 0, "writes": 0, "write_failures": 0}
+
+    @property
+    def pending_keys(self) -> int:
+        """Number of (API key, day) records waiting to be written."""
+        with self._lock:
+            return len(self._pending)
+
+    def add(
+        self,
+        api_key: str,
+        date: str,
+        endpoint: str,
+        status_code: int,
+        cost_usd: float = 0.0,
+    ) -> None:
+        """Buffer one request.
+
+        Args:
+            api_key: API key that made the request
+            date: Date in YYYY-MM-DD format (UTC)
+            endpoint: API endpoint path
+            status_code: HTTP status code
+            cost_usd: Cost of the request in USD
+        """
+        with self._lock:
+            delta = self._pending.setdefault((api_key, date), UsageDelta())
+            delta.record(endpoint, status_code, cost_usd)
+            self.stats["recorded"] += 1
+
+    def flush_due(self) -> bool:
+        """Whether the interval has elapsed or too many keys are pending."""
+        with self._lock:
+            if not self._pending:
+                return False
+            return (
+                len(self._pending) >= self.max_pending_keys
+                or self._clock() - self._last_flush >= self.flush_interval_seconds
+            )
+
+    def flush(self) -> int:
+        """Write every pending delta (one update per key).
+
+        Deltas whose write fails are merged back and retried on the next
+        flush.
+
+        Returns:
+            Number of records written
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._last_flush = self._clock()
+            if not pending:
+                return 0
+
+            written = 0
+            failed: dict[tuple[str, str], UsageDelta] = {}
+            for (api_key, date), delta in pending.items():
+                try:
+                    ok = self.writer(api_key, date, delta)
+                except Exception as e:
+                    logger.error(
+                        "usage_flush_write_failed", api_key_prefix=api_key[:8], error=str(e)
+                    )
+                    ok = False
+                if ok:
+                    written += 1
+                else:
+                    failed[(api_key, date)] = delta
+
+            with self._lock:
+                for key, delta in failed.items():
+                    self._pending.setdefault(key, UsageDelta()).merge(delta)
+                self.stats["flushes"] += 1
+                self.stats["writes"] += written
+                self.stats["write_failures"] += len(failed)
+
+            logger.info(
+                "usage_buffer_flushed",
+                records=written,
+                requests=sum(d.requests for d in pending.values()),
+                failed=len(failed),
+            )
+            return written
+
+    def maybe_flush(self) -> int:
+        """Flush if due.
+
+        Returns:
+            Number of records written
+        """
+        return self.flush() if self.flush_due() else 0
+
+    def install_shutdown_hooks(self) -> None:
+        """Flush at interpreter exit and on SIGTERM (main thread only)."""
+        atexit.register(self.flush)
+        if threading.current_thread() is not threading.main_thread():
+            return
+        previous = signal.getsignal(signal.SIGTERM)
+
+        def _on_sigterm(signum: int, frame: Any) -> None:
+            self.flush()
+            if callable(previous):
+                previous(signum, frame)
+            elif previous == signal.SIG_DFL:
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                os.kill(os.getpid(), signal.SIGTERM)
+
+        signal.signal(signal.SIGTERM, _on_sigterm)
+
+
+def default_flush_interval() -> float:
+    """Flush interval for this environment.
+
+    ``USAGE_FLUSH_INTERVAL_SECONDS`` wins if set; otherwise 0 inside Lambda
+    (the environment may be frozen or recycled right after the response)
+    and ``USAGE_FLUSH_INTERVAL_SECONDS`` from constants elsewhere.
+    """
+    configured = os.environ.get("USAGE_FLUSH_INTERVAL_SECONDS")
+    if configured:
+        return float(configured)
+    if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+        return 0.0
+    return USAGE_FLUSH_INTERVAL_SECONDS
@@ -0,0 +1,290 @@
+"""Pluggable work queues for analysis work items.
+
+The analyzer worker pulls one submission per message. Two backends share an
+SQS-shaped interface (send / receive with a visibility timeout / delete /
+change visibility):
+
+- ``SQSWorkQueue`` for deployed workers,
+- ``SQLiteWorkQueue`` for local runs without AWS (a file path shares the
+  queue across processes, ``:memory:`` keeps it in-process).
+
+A received message stays invisible to other consumers until its visibility
+timeout expires; consumers extend it while working (heartbeats) and delete
+it when done. Undeleted messages are redelivered, so handlers must be
+idempotent.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from src.utils.clients import get_aws_client
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+SQLITE_URL_PREFIX = "sqlite:///"
+
+
+@dataclass
+class WorkItem:
+    """A received message."""
+
+    message_id: str
+    receipt_handle: str
+    body: dict[str, Any]
+    receive_count: int = 1
+
+
+class WorkQueue(ABC):
+    """SQS-compatible work queue interface."""
+
+    @abstractmethod
+    def send(self, body: dict[str, Any]) -> str:
+        """Enqueue a message.
+
+        Args:
+            body: JSON-serializable message body
+
+        Returns:
+            Message ID
+        """
+
+    @abstractmethod
+    def receive(
+        self,
+        max_messages: int = 1,
+        visibility_timeout: int = 300,
+        wait_seconds: float = 0,
+    ) -> list[WorkItem]:
+        """Receive up to max_messages, hiding them for visibility_timeout seconds.
+
+        Args:
+            max_messages: Maximum number of messages to return
+            visibility_timeout: Seconds before an undeleted message is redelivered
+            wait_seconds: Long-poll duration when the queue is empty
+
+        Returns:
+            Received work items (possibly empty)
+        """
+
+    @abstractmethod
+    def delete(self, receipt_handle: str) -> None:
+        """Delete a processed message.
+
+        Args:
+            receipt_handle: Receipt handle from the latest receive
+        """
+
+    @abstractmethod
+    def change_visibility(self, receipt_handle: str, visibility_timeout: int) -> None:
+        """Extend (heartbeat) or release (0) a received message.
+
+        Args:
+            receipt_handle: Receipt handle from the latest receive
+            visibility_timeout: New timeout in seconds, from now
+        """
+
+
+class SQSWorkQueue(WorkQueue):
+    """Amazon SQS backend."""
+
+    # SQS caps a single ReceiveMessage call at 10 messages / 20 s long poll
+    MAX_BATCH = 10
+    MAX_WAIT_SECONDS = 20
+
+    def __init__(self, queue_url: str, client: Any = None):
+        """Initialize SQS queue.
+
+        Args:
+            queue_url: SQS queue URL
+            client: Optional boto3 SQS client
+        """
+        self.queue_url = queue_url
+        self.client = client or get_aws_client("sqs")
+
+    def send(self, body: dict[str, Any]) -> str:
+        response = self.client.send_message(QueueUrl=self.queue_url, MessageBody=json.dumps(body))
+        return str(response["MessageId"])
+
+    def receive(
+        self,
+        max_messages: int = 1,
+        visibility_timeout: int = 300,
+        wait_seconds: float = 0,
+    ) -> list[WorkItem]:
+        response = self.client.receive_message(
+            QueueUrl=self.queue_url,
+            MaxNumberOfMessages=max(1, min(max_messages, self.MAX_BATCH)),
+            VisibilityTimeout=int(visibility_timeout),
+            WaitTimeSeconds=int(min(wait_seconds, self.MAX_WAIT_SECONDS)),
+            AttributeNames=["ApproximateReceiveCount"],
+        )
+        return [
+            WorkItem(
+                message_id=message["MessageId"],
+                receipt_handle=message["ReceiptHandle"],
+                body=json.loads(message["Body"]),
+                receive_count=int(message.get("Attributes", {}).get("ApproximateReceiveCount", 1)),
+            )
+            for message in response.get("Messages", [])
+        ]
+
+    def delete(self, receipt_handle: str) -> None:
+        self.client.delete_message(QueueUrl=self.queue_url, ReceiptHandle=receipt_handle)
+
+    def change_visibility(self, receipt_handle: str, visibility_timeout: int) -> None:
+        self.client.change_message_visibility(
+            QueueUrl=self.queue_url,
+            ReceiptHandle=receipt_handle,
+            VisibilityTimeout=int(visibility_timeout),
+        )
+
+
+class SQLiteWorkQueue(WorkQueue):
+    """SQLite backend for local runs (no AWS required).
+
+    Messages received ``max_receive_count`` times without being deleted are
+    no longer delivered, like an SQS redrive policy; they stay in the table
+    for inspection.
+    """
+
+    POLL_INTERVAL_SECONDS = 0.1
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        max_receive_count: int = 5,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize SQLite queue.
+
+        Args:
+            path: Database file path (``:memory:`` for an in-process queue)
+            max_receive_count: Deliveries before a message is dead-lettered
+            clock: Wall-clock source (injectable for tests)
+        """
+        self.path = path
+        self.max_receive_count = max_receive_count
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS messages (
+                message_id TEXT PRIMARY KEY,
+                body TEXT NOT NULL,
+                visible_at REAL NOT NULL,
+                receive_count INTEGER NOT NULL DEFAULT 0,
+                receipt_handle TEXT,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_visible ON messages (visible_at)")
+
+    def send(self, body: dict[str, Any]) -> str:
+        message_id = uuid.uuid4().hex
+        now = self._clock()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO messages (message_id, body, visible_at, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (message_id, json.dumps(body), now, now),
+            )
+        return message_id
+
+    def receive(
+        self,
+        max_messages: int = 1,
+        visibility_timeout: int = 300,
+        wait_seconds: float = 0,
+    ) -> list[WorkItem]:
+        deadline = time.monotonic() + wait_seconds
+        while True:
+            items = self._receive_once(max_messages, visibility_timeout)
+            if items or time.monotonic() >= deadline:
+                return items
+            time.sleep(self.POLL_INTERVAL_SECONDS)
+
+    def _receive_once(self, max_messages: int, visibility_timeout: int) -> list[WorkItem]:
+        now = self._clock()
+        items = []
+        with self._lock:
+            # BEGIN IMMEDIATE serializes receivers across processes
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute(
+                    "SELECT message_id, body, receive_count FROM messages "
+                    "WHERE visible_at <= ? AND receive_count < ? "
+                    "ORDER BY created_at LIMIT ?",
+                    (now, self.max_receive_count, max_messages),
+                ).fetchall()
+                for message_id, body, receive_count in rows:
+                    receipt_handle = uuid.uuid4().hex
+                    self._conn.execute(
+                        "UPDATE messages SET visible_at = ?, receive_count = ?, "
+                        "receipt_handle = ? WHERE message_id = ?",
+                        (now + visibility_timeout, receive_count + 1, receipt_handle, message_id),
+                    )
+                    items.append(
+                        WorkItem(
+                            message_id=message_id,
+                            receipt_handle=receipt_handle,
+                            body=json.loads(body),
+                            receive_count=receive_count + 1,
+                        )
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return items
+
+    def delete(self, receipt_handle: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM messages WHERE receipt_handle = ?", (receipt_handle,))
+
+    def change_visibility(self, receipt_handle: str, visibility_timeout: int) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE messages SET visible_at = ? WHERE receipt_handle = ?",
+                (self._clock() + visibility_timeout, receipt_handle),
+            )
+
+    def count(self) -> int:
+        """Count messages still deliverable (visible or in flight)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM messages WHERE receive_count < ?",
+                (self.max_receive_count,),
+            ).fetchone()
+        return int(row[0])
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def get_work_queue(url: str) -> WorkQueue:
+    """Build a work queue from a URL.
+
+    Args:
+        url: ``sqlite:///path/to/queue.db`` (or ``sqlite:///:memory:``) for a
+            local queue, otherwise an SQS queue URL
+
+    Returns:
+        Work queue instance
+    """
+    if url.startswith(SQLITE_URL_PREFIX):
+        return SQLiteWorkQueue(url[len(SQLITE_URL_PREFIX) :] or ":memory:")
+    return SQSWorkQueue(url)
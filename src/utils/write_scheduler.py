@@ -0,0 +1,355 @@
+"""Capacity-aware write scheduling for the provisioned DynamoDB table.
+
+The single table is provisioned at a handful of WCUs. The analyzer writes
+many items per submission (scores, costs, intelligence records), so parallel
+analysis easily exceeds that and DynamoDB starts throttling. Instead of
+letting ``put_*`` calls fail and be logged away, writes go through a
+``DynamoDBWriteScheduler`` which:
+
+- paces writes with a token bucket refilled at this process's share of the
+  table's write capacity,
+- meters actual usage via ``ReturnConsumedCapacity`` and corrects the bucket,
+- retries throttled writes with exponential backoff and full jitter,
+- exposes queue-depth / throttle metrics for logging and alarms.
+"""
+
+import math
+import os
+import random
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from botocore.exceptions import ClientError
+
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# DynamoDB error codes that mean "slow down", not "this write is invalid"
+THROTTLE_ERROR_CODES = frozenset(
+    {
+        "ProvisionedThroughputExceededException",
+        "ThrottlingException",
+        "RequestLimitExceeded",
+    }
+)
+
+# DynamoDB bills 1 WCU per 1 KB written (rounded up)
+WCU_BYTES = 1024
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at a fixed rate."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held (burst size)
+            clock: Monotonic clock (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float) -> float:
+        """Block until ``tokens`` are available, then take them.
+
+        Requests larger than the bucket capacity are allowed once the bucket
+        is full, leaving it in debt so later writers wait for the refill.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                needed = min(tokens, self.capacity)
+                if self.tokens >= needed:
+                    self.tokens -= tokens
+                    return waited
+                delay = (needed - self.tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+    def adjust(self, tokens: float) -> None:
+        """Credit (positive) or debit (negative) tokens without blocking.
+
+        Args:
+            tokens: Token delta, e.g. estimated minus actually consumed units
+        """
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.capacity, self.tokens + tokens)
+
+
+class DynamoDBWriteScheduler:
+    """Paces and retries DynamoDB writes against the table's write capacity."""
+
+    def __init__(
+        self,
+        write_capacity_units: float | None,
+        burst_seconds: float = 2.0,
+        max_retries: int = 8,
+        base_delay_seconds: float = 0.05,
+        max_delay_seconds: float = 5.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize write scheduler.
+
+        Args:
+            write_capacity_units: Provisioned WCUs (None or 0 = on-demand, no pacing)
+            burst_seconds: Seconds of capacity the bucket may accumulate
+            max_retries: Retries for a throttled write before giving up
+            base_delay_seconds: Base backoff delay
+            max_delay_seconds: Backoff ceiling
+            sleep: Sleep function (injectable for tests)
+        """
+        self.write_capacity_units = write_capacity_units or None
+        self.bucket = (
+            TokenBucket(
+                rate=self.write_capacity_units,
+                capacity=self.write_capacity_units * burst_seconds,
+                sleep=sleep,
+            )
+            if self.write_capacity_units
+            else None
+        )
+        self.max_retries = max_retries
+        self.base_delay_seconds = base_delay_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._metrics: dict[str, float] = {
+            "writes": 0,
+            "throttled": 0,
+            "retries": 0,
+            "failed": 0,
+            "consumed_wcu": 0.0,
+            "wait_seconds": 0.0,
+            "queue_depth": 0,
+            "max_queue_depth": 0,
+        }
+
+    def _incr(self, key: str, value: float = 1) -> None:
+        with self._lock:
+            self._metrics[key] += value
+            if key == "queue_depth":
+                self._metrics["max_queue_depth"] = max(
+                    self._metrics["max_queue_depth"], self._metrics["queue_depth"]
+                )
+
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff delay for a retry attempt."""
+        ceiling = min(self.max_delay_seconds, self.base_delay_seconds * (2**attempt))
+        return random.uniform(0, ceiling)  # nosec B311 - jitter, not crypto
+
+    def execute(
+        self,
+        operation: Callable[..., Any],
+        estimated_units: float = 1.0,
+        **kwargs: Any,
+    ) -> Any:
+        """Run a write operation with pacing, metering and throttle retries.
+
+        Args:
+            operation: boto3 table method (``put_item``, ``update_item``, ...)
+            estimated_units: Expected WCUs, charged before the write
+            **kwargs: Arguments for the operation
+
+        Returns:
+            The operation's response
+
+        Raises:
+            ClientError: Non-throttling errors, or throttling after max_retries
+        """
+        kwargs.setdefault("ReturnConsumedCapacity", "TOTAL")
+
+        for attempt in range(self.max_retries + 1):
+            if self.bucket is not None:
+                self._incr("queue_depth")
+                try:
+                    self._incr("wait_seconds", self.bucket.acquire(estimated_units))
+                finally:
+                    self._incr("queue_depth", -1)
+
+            try:
+                response = operation(**kwargs)
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") not in THROTTLE_ERROR_CODES:
+                    self._incr("failed")
+                    raise
+                self._incr("throttled")
+                if attempt == self.max_retries:
+                    self._incr("failed")
+                    logger.error(
+                        "dynamodb_write_throttled_giving_up",
+                        attempts=attempt + 1,
+                        **self.get_metrics(),
+                    )
+                    raise
+                delay = self._backoff(attempt)
+                self._incr("retries")
+                logger.warning(
+                    "dynamodb_write_throttled",
+                    attempt=attempt + 1,
+                    retry_in_ms=round(delay * 1000, 1),
+                )
+                self._sleep(delay)
+                continue
+
+            consumed = consumed_units(response, estimated_units)
+            if self.bucket is not None and consumed != estimated_units:
+                self.bucket.adjust(estimated_units - consumed)
+            self._incr("writes")
+            self._incr("consumed_wcu", consumed)
+            return response
+
+        raise RuntimeError("unreachable")  # pragma: no cover
+
+    def execute_batch_write(
+        self,
+        operation: Callable[..., Any],
+        request_items: dict[str, list[dict]],
+        estimated_units: float,
+        max_attempts: int = 5,
+    ) -> dict[str, list[dict]]:
+        """Run a BatchWriteItem call and resubmit its unprocessed items.
+
+        DynamoDB reports items it skipped under load as ``UnprocessedItems``
+        rather than raising; those are retried with the same backoff as
+        throttled writes.
+
+        Args:
+            operation: boto3 client ``batch_write_item``
+            request_items: RequestItems for the call (at most 25 requests)
+            estimated_units: Expected WCUs for the whole batch
+            max_attempts: Calls before giving up on the remaining items
+
+        Returns:
+            Requests still unprocessed after max_attempts (empty on success)
+
+        Raises:
+            ClientError: Non-throttling errors, or throttling after max_retries
+        """
+        pending = request_items
+        total = sum(len(requests) for requests in request_items.values()) or 1
+        for attempt in range(max_attempts):
+            count = sum(len(requests) for requests in pending.values())
+            response = self.execute(
+                operation,
+                estimated_units=estimated_units * count / total,
+                RequestItems=pending,
+            )
+            pending = response.get("UnprocessedItems") or {}
+            if not pending:
+                return {}
+            if attempt < max_attempts - 1:
+                self._incr("retries")
+                self._sleep(self._backoff(attempt))
+
+        logger.warning(
+            "dynamodb_batch_write_incomplete",
+            unprocessed=sum(len(requests) for requests in pending.values()),
+        )
+        return pending
+
+    def get_metrics(self) -> dict[str, float]:
+        """Get a snapshot of scheduler metrics.
+
+        Returns:
+            Dict with writes, throttled, retries, failed, consumed_wcu,
+            wait_seconds, queue_depth and max_queue_depth
+        """
+        with self._lock:
+            return {k: round(v, 3) if isinstance(v, float) else v for k, v in self._metrics.items()}
+
+
+def consumed_units(response: Any, default: float) -> float:
+    """Read the write units a response reports via ReturnConsumedCapacity.
+
+    Single-item writes report one ``ConsumedCapacity`` dict; batch and
+    transactional writes report a list (one entry per table).
+
+    Args:
+        response: Operation response
+        default: Units to assume when the response reports none
+
+    Returns:
+        Consumed write capacity units
+    """
+    if not isinstance(response, dict):
+        return default
+    capacity = response.get("ConsumedCapacity")
+    if isinstance(capacity, list):
+        units = [c["CapacityUnits"] for c in capacity if "CapacityUnits" in c]
+        return float(sum(units)) if units else default
+    if isinstance(capacity, dict) and "CapacityUnits" in capacity:
+        return float(capacity["CapacityUnits"])
+    return default
+
+
+def estimate_write_units(item_size_bytes: int) -> float:
+    """Estimate WCUs for writing an item of the given size.
+
+    Args:
+        item_size_bytes: Approximate item size
+
+    Returns:
+        Write capacity units (at least 1)
+    """
+    return float(max(1, math.ceil(item_size_bytes / WCU_BYTES)))
+
+
+_schedulers: dict[str, DynamoDBWriteScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_write_scheduler(table_name: str) -> DynamoDBWriteScheduler:
+    """Get the process-wide write scheduler for a table.
+
+    All ``DynamoDBHelper`` instances for the same table share one scheduler.
+    The bucket only sees this process's writes, so each process is paced at
+    ``DYNAMODB_WRITE_CAPACITY_UNITS`` divided by
+    ``DYNAMODB_WRITE_CONCURRENCY``, the number of analyzer invocations
+    expected to write at once (default 1). More concurrent writers than that
+    can still exceed the table's capacity; their throttled writes are then
+    retried with backoff. An unset or 0 capacity disables pacing.
+
+    Args:
+        table_name: DynamoDB table name
+
+    Returns:
+        Shared write scheduler
+    """
+    with _schedulers_lock:
+        scheduler = _schedulers.get(table_name)
+        if scheduler is None:
+            wcu = float(os.environ.get("DYNAMODB_WRITE_CAPACITY_UNITS", "0") or 0)
+            writers = max(1, int(os.environ.get("DYNAMODB_WRITE_CONCURRENCY", "1") or 1))
+            scheduler = DynamoDBWriteScheduler(write_capacity_units=wcu / writers)
+            _schedulers[table_name] = scheduler
+        return scheduler
@@ -4,6 +4,7 @@ Simplified version - backend is source of truth, no caching complexity.
 """
 
 import logging
+import time
 
 import requests
 import streamlit as st
@@ -84,6 +85,12 @@ def api_call(endpoint: str, method: str = "GET", json_data: dict | None = None)
         return None
 
 
+# Poll the status endpoint while a job is active (one short request per poll,
+# ~10 minutes) before falling back to the manual refresh button
+STATUS_POLL_SECONDS = 5
+MAX_STATUS_POLLS = 120
+
+
 # Fetch hackathons
 with st.spinner("🔄 Loading hackathons..."):
     hackathons_response = api_call("/hackathons")
@@ -253,31 +260,58 @@ if "analysis_confirmation" not in st.session_state:
 # Check for active job (backend is source of truth)
 job_status = api_call(f"/hackathons/{selected_hack_id}/analyze/status")
 
+if st.session_state.pop("analysis_just_completed", False):
+    st.success("✅ Analysis completed!")
+    st.balloons()
+
 if job_status and job_status.get("status") in ["queued", "running"]:
     # Show progress
     st.info(f"📊 Analysis job in progress: {job_status.get('job_id')}")
 
-    progress_data = job_status.get("progress", {})
-    progress_percent = progress_data.get("percent_complete", 0)
+    progress_bar = st.progress(0.0)
+    progress_caption = st.empty()
 
-    st.progress(progress_percent / 100.0)
-    st.caption(f"Progress: {progress_percent:.1f}%")
-
-    # Show metrics
     col1, col2, col3 = st.columns(3)
-
-    with col1:
-        st.metric("Completed", progress_data.get("completed", 0))
-
-    with col2:
-        st.metric("Failed", progress_data.get("failed", 0))
-
-    with col3:
-        st.metric("Total", progress_data.get("total_submissions", 0))
-
-    if job_status.get("status") == "completed":
-        st.success("✅ Analysis completed!")
-        st.balloons()
+    completed_metric = col1.empty()
+    failed_metric = col2.empty()
+    total_metric = col3.empty()
+    current_caption = st.empty()
+
+    def render_progress(status: dict) -> None:
+        """Redraw the progress widgets from a status response."""
+        progress_data = status.get("progress") or {}
+        progress_percent = float(progress_data.get("percent_complete") or 0)
+
+        progress_bar.progress(min(progress_percent, 100.0) / 100.0)
+        progress_caption.caption(f"Progress: {progress_percent:.1f}%")
+        completed_metric.metric("Completed", progress_data.get("completed", 0))
+        failed_metric.metric("Failed", progress_data.get("failed", 0))
+        total_metric.metric("Total", progress_data.get("total_submissions", 0))
+
+        details = []
+        team_name = (status.get("current_submission") or {}).get("team_name")
+        if team_name:
+            details.append(f"Analyzing: **{team_name}**")
+        cost_usd = (status.get("cost_so_far") or {}).get("total_usd")
+        if cost_usd is not None:
+            details.append(f"Cost so far: ${cost_usd:.2f}")
+        current_caption.markdown(" · ".join(details))
+
+    render_progress(job_status)
+
+    # Update the widgets in place instead of re-fetching everything on each rerun
+    for _ in range(MAX_STATUS_POLLS):
+        time.sleep(STATUS_POLL_SECONDS)
+        latest = api_call(f"/hackathons/{selected_hack_id}/analyze/status")
+        if not latest:
+            break
+        if latest.get("job_id") != job_status.get("job_id"):
+            st.rerun()
+        if latest.get("status") not in ["queued", "running"]:
+            # Reload submissions and scores once the job is done
+            st.session_state["analysis_just_completed"] = latest.get("status") == "completed"
+            st.rerun()
+        render_progress(latest)
 
 else:
     # Check if we're in confirmation state
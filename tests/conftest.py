@@ -642,6 +642,21 @@ def build_complete_ai_detection_dict(overall_score: float = 8.0, confidence: flo
     }
 
 
+# ============================================================
+# SHARED CLIENTS
+# ============================================================
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_clients():
+    """Give each test fresh process-wide clients, created under its own AWS mocks."""
+    from src.utils.clients import close_clients
+
+    close_clients()
+    yield
+    close_clients()
+
+
 # ============================================================
 # DYNAMODB HELPER FIXTURE
 # ============================================================
@@ -666,6 +681,8 @@ def dynamodb_helper():
                 {"AttributeName": "GSI1SK", "AttributeType": "S"},
                 {"AttributeName": "GSI2PK", "AttributeType": "S"},
                 {"AttributeName": "GSI2SK", "AttributeType": "S"},
+                {"AttributeName": "GSI3PK", "AttributeType": "S"},
+                {"AttributeName": "GSI3SK", "AttributeType": "S"},
             ],
             GlobalSecondaryIndexes=[
                 {
@@ -692,6 +709,29 @@ def dynamodb_helper():
                         "WriteCapacityUnits": 5,
                     },
                 },
+                {
+                    "IndexName": "GSI3",
+                    "KeySchema": [
+                        {"AttributeName": "GSI3PK", "KeyType": "HASH"},
+                        {"AttributeName": "GSI3SK", "KeyType": "RANGE"},
+                    ],
+                    "Projection": {
+                        "ProjectionType": "INCLUDE",
+                        "NonKeyAttributes": [
+                            "hack_id",
+                            "name",
+                            "description",
+                            "status",
+                            "start_date",
+                            "end_date",
+                            "submission_count",
+                        ],
+                    },
+                    "ProvisionedThroughput": {
+                        "ReadCapacityUnits": 5,
+                        "WriteCapacityUnits": 5,
+                    },
+                },
             ],
             BillingMode="PROVISIONED",
             ProvisionedThroughput={
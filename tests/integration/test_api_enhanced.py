@@ -15,6 +15,7 @@ from src.api.main import app
 from src.models.common import SubmissionStatus
 from src.models.dashboard import (
     CommonIssue,
+    HiringCandidate,
     HiringIntelligence,
     OrganizerDashboard,
     PrizeRecommendation,
@@ -708,34 +709,13 @@ def test_intelligence_dashboard_aggregates_individual_scorecards(
     # Add hiring intelligence to dashboard
     sample_organizer_dashboard.hiring_intelligence = HiringIntelligence(
         backend_candidates=[
-            IndividualScorecard(
+            HiringCandidate(
+                sub_id="sub_123",
+                team_name="Team Alpha",
                 contributor_name="Alice",
-                contributor_email="alice@example.com",
                 role=ContributorRole.BACKEND,
-                expertise_areas=[ExpertiseArea.DATABASE],
-                commit_count=50,
-                lines_added=1000,
-                lines_deleted=200,
-                files_touched=["src/api.py"],
-                notable_contributions=["Auth system"],
-                strengths=["Strong backend"],
-                weaknesses=["Limited frontend"],
-                growth_areas=["Learn React"],
-                work_style=WorkStyle(
-                    commit_frequency="frequent",
-                    avg_commit_size=50,
-                    active_hours=[9, 10, 11],
-                    late_night_commits=0,
-                    weekend_commits=0,
-                ),
-                hiring_signals=HiringSignals(
-                    recommended_role="Backend Engineer",
-                    seniority_level="mid",
-                    salary_range_usd="$80k-$100k",
-                    must_interview=True,
-                    sponsor_interest=["TechCorp"],
-                    rationale="Strong backend skills",
-                ),
+                seniority_level="mid",
+                must_interview=True,
             )
         ],
         frontend_candidates=[],
@@ -0,0 +1,209 @@
+"""Fan-out analysis: local multi-worker harness over moto DynamoDB.
+
+Drives AnalysisService.trigger_analysis with sharding enabled, captures the
+async analyzer invocations, and runs them through lambda_handler.handler on
+a thread pool. analyze_single_submission is replaced by a fixed-latency stub
+that counts how many analyses overlap, so concurrency is asserted directly
+rather than through wall-clock time.
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.models.common import JobStatus
+from src.services.analysis_service import AnalysisService
+
+SUBMISSION_LATENCY_SECONDS = 0.2
+
+
+class FakeLambdaClient:
+    """Collects async invocations instead of calling AWS."""
+
+    def __init__(self, failing_shards: dict[int, int] | None = None):
+        self.payloads: list[dict] = []
+        self.attempts: dict[int, int] = {}
+        # Shard index -> number of invocations to reject (for shard failures)
+        self.failing_shards = failing_shards or {}
+
+    def invoke(self, FunctionName: str, InvocationType: str, Payload: str) -> dict:  # noqa: N803
+        payload = json.loads(Payload)
+        shard = payload.get("shard_index", 0)
+        self.attempts[shard] = self.attempts.get(shard, 0) + 1
+        if self.attempts[shard] <= self.failing_shards.get(shard, 0):
+            raise RuntimeError("Rate exceeded")
+        self.payloads.append(payload)
+        return {"StatusCode": 202}
+
+
+class ConcurrencyProbe:
+    """Tracks how many stubbed analyses run at the same time."""
+
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def analyze(self, submission, hackathon, db) -> dict:
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            return _stub_analysis(submission, hackathon, db)
+        finally:
+            with self._lock:
+                self.running -= 1
+
+
+def _stub_analysis(submission, hackathon, db) -> dict:
+    time.sleep(SUBMISSION_LATENCY_SECONDS)
+    return {
+        "success": True,
+        "overall_score": 75.0,
+        "dimension_scores": {},
+        "weighted_scores": {},
+        "recommendation": "solid_submission",
+        "confidence": 0.9,
+        "agent_scores": {},
+        "strengths": [],
+        "weaknesses": [],
+        "repo_meta": {},
+        "cost": 0.01,
+        "tokens": 100,
+        "duration_ms": 50,
+        "cost_records": [],
+    }
+
+
+def _seed_hackathon(db, hack_id: str) -> None:
+    db.table.put_item(
+        Item={"PK": f"HACK#{hack_id}", "SK": "META", "hack_id": hack_id, "name": "Harness"}
+    )
+
+
+def run_job(db, monkeypatch, submission_count: int, shard_size: int, workers: int):
+    """Trigger a job and run every analyzer invocation on a worker pool.
+
+    Returns:
+        Tuple of (job record, peak concurrent analyses, cost summary call count)
+    """
+    from src.analysis import lambda_handler
+
+    monkeypatch.setenv("ANALYZER_LAMBDA_FUNCTION_NAME", "analyzer-harness")
+    monkeypatch.setenv("ANALYZER_SHARD_SIZE", str(shard_size))
+    hack_id = f"H{shard_size}x{workers}"
+    _seed_hackathon(db, hack_id)
+
+    fake_lambda = FakeLambdaClient()
+    service = AnalysisService(db)
+    service._lambda_client = fake_lambda
+    sub_ids = [f"S{i:03d}" for i in range(submission_count)]
+    job = service.trigger_analysis(hack_id, sub_ids)
+
+    summary_calls = MagicMock()
+    probe = ConcurrencyProbe()
+    with (
+        patch.object(lambda_handler.HackathonService, "get_hackathon", return_value=MagicMock()),
+        patch.object(
+            lambda_handler.SubmissionService,
+            "get_submission",
+            side_effect=lambda sub_id: MagicMock(sub_id=sub_id, team_name=f"Team {sub_id}"),
+        ),
+        patch.object(lambda_handler.SubmissionService, "update_submission_status"),
+        patch.object(lambda_handler.SubmissionService, "update_submission_with_scores"),
+        patch.object(lambda_handler.CostService, "update_hackathon_cost_summary", summary_calls),
+        patch.object(lambda_handler, "analyze_single_submission", side_effect=probe.analyze),
+        ThreadPoolExecutor(max_workers=workers) as pool,
+    ):
+        results = list(
+            pool.map(lambda p: lambda_handler.handler(p, {}), list(fake_lambda.payloads))
+        )
+
+    assert all(r["statusCode"] == 200 for r in results)
+    return db.get_analysis_job(hack_id, job.job_id), probe.peak, summary_calls.call_count
+
+
+def test_split_into_shards():
+    """Submission IDs are split into consecutive shards."""
+    ids = [str(i) for i in range(7)]
+
+    assert AnalysisService._split_into_shards(ids, 3) == [["0", "1", "2"], ["3", "4", "5"], ["6"]]
+    assert AnalysisService._split_into_shards(ids, 0) == [ids]
+    assert AnalysisService._split_into_shards(ids, 10) == [ids]
+
+
+@pytest.mark.performance
+def test_fanout_finalizes_once_and_scales_with_workers(dynamodb_helper, monkeypatch):
+    """Sharded jobs complete exactly once and their shards run concurrently."""
+    serial_job, serial_peak, serial_summaries = run_job(
+        dynamodb_helper, monkeypatch, submission_count=16, shard_size=4, workers=1
+    )
+    parallel_job, parallel_peak, parallel_summaries = run_job(
+        dynamodb_helper, monkeypatch, submission_count=16, shard_size=4, workers=4
+    )
+
+    for job, summaries in ((serial_job, serial_summaries), (parallel_job, parallel_summaries)):
+        assert job["status"] == "completed"
+        assert job["shard_count"] == 4
+        assert job["completed_shards"] == {0, 1, 2, 3}
+        assert job["completed_submissions"] == 16
+        assert job["total_cost_usd"] == Decimal("0.16")
+        assert summaries == 1
+
+    # Every shard analyzes at the same time when there is a worker for each
+    assert (serial_peak, parallel_peak) == (1, 4)
+
+
+def test_unsharded_job_uses_single_invocation(dynamodb_helper, monkeypatch):
+    """With sharding disabled the job runs in one invocation as before."""
+    job, _, summaries = run_job(
+        dynamodb_helper, monkeypatch, submission_count=3, shard_size=0, workers=1
+    )
+
+    assert job["status"] == "completed"
+    assert job["shard_count"] == 1
+    assert "completed_shards" not in job
+    assert job["completed_submissions"] == 3
+    assert summaries == 1
+
+
+def test_shard_that_cannot_start_fails_the_job(dynamodb_helper, monkeypatch):
+    """A shard invoke is retried; if it keeps failing the job fails instead of hanging."""
+    from src.analysis import lambda_handler
+
+    monkeypatch.setenv("ANALYZER_LAMBDA_FUNCTION_NAME", "analyzer-harness")
+    monkeypatch.setenv("ANALYZER_SHARD_SIZE", "2")
+    monkeypatch.setattr("src.services.analysis_service.time.sleep", lambda _: None)
+    _seed_hackathon(dynamodb_helper, "HFAIL")
+    service = AnalysisService(dynamodb_helper)
+    sub_ids = [f"S{i}" for i in range(6)]
+
+    # Shard 1 is throttled once, then accepted
+    service._lambda_client = FakeLambdaClient(failing_shards={1: 1})
+    job = service.trigger_analysis("HFAIL", sub_ids)
+    assert [p["shard_index"] for p in service._lambda_client.payloads] == [0, 1, 2]
+    service.update_job_status("HFAIL", job.job_id, JobStatus.COMPLETED)
+
+    # Shard 2 never starts
+    service._lambda_client = FakeLambdaClient(failing_shards={2: 99})
+    with pytest.raises(RuntimeError, match="shard 3 of 3"):
+        service.trigger_analysis("HFAIL", sub_ids)
+
+    assert service._lambda_client.attempts[2] == 3
+    job = dynamodb_helper.get_latest_analysis_job("HFAIL")
+    assert job["status"] == JobStatus.FAILED.value
+    assert dynamodb_helper.get_hackathon("HFAIL")["analysis_status"] == "not_started"
+
+    # Shards that did start see the failed job and stop
+    with (
+        patch.object(lambda_handler.HackathonService, "get_hackathon", return_value=MagicMock()),
+        patch.object(lambda_handler, "analyze_single_submission") as analyze,
+    ):
+        result = lambda_handler.handler(service._lambda_client.payloads[0], {})
+    assert json.loads(result["body"])["status"] == "failed"
+    analyze.assert_not_called()
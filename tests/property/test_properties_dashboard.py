@@ -16,19 +16,14 @@ from hypothesis import strategies as st
 
 from src.models.dashboard import (
     CommonIssue,
+    HiringCandidate,
     HiringIntelligence,
     OrganizerDashboard,
     PrizeRecommendation,
     TechnologyTrends,
     TopPerformer,
 )
-from src.models.team_dynamics import (
-    ContributorRole,
-    ExpertiseArea,
-    HiringSignals,
-    IndividualScorecard,
-    WorkStyle,
-)
+from src.models.team_dynamics import ContributorRole
 
 # ============================================================
 # HYPOTHESIS STRATEGIES (Test Data Generators)
@@ -52,53 +47,18 @@ def top_performer_strategy(draw: Any) -> TopPerformer:
 
 
 @st.composite
-def individual_scorecard_strategy(draw: Any) -> IndividualScorecard:
-    """Generate random individual scorecard."""
+def hiring_candidate_strategy(draw: Any) -> HiringCandidate:
+    """Generate random hiring candidate summary."""
     first_names = ["Alice", "Bob", "Charlie", "Diana", "Eve"]
     last_names = ["Smith", "Johnson", "Williams", "Brown", "Jones"]
 
-    first = draw(st.sampled_from(first_names))
-    last = draw(st.sampled_from(last_names))
-    name = f"{first} {last}"
-
-    return IndividualScorecard(
-        contributor_name=name,
-        contributor_email=f"{first.lower()}.{last.lower()}@example.com",
+    return HiringCandidate(
+        sub_id=f"SUB#{draw(st.integers(min_value=1000, max_value=9999))}",
+        team_name=draw(st.sampled_from(["Team Alpha", "Team Beta", "Team Gamma"])),
+        contributor_name=f"{draw(st.sampled_from(first_names))} {draw(st.sampled_from(last_names))}",
         role=draw(st.sampled_from(list(ContributorRole))),
-        expertise_areas=draw(
-            st.lists(st.sampled_from(list(ExpertiseArea)), min_size=1, max_size=3, unique=True)
-        ),
-        commit_count=draw(st.integers(min_value=1, max_value=200)),
-        lines_added=draw(st.integers(min_value=10, max_value=10000)),
-        lines_deleted=draw(st.integers(min_value=0, max_value=5000)),
-        files_touched=[f"file_{i}.py" for i in range(draw(st.integers(min_value=1, max_value=20)))],
-        notable_contributions=draw(st.lists(st.text(min_size=10, max_size=100), max_size=5)),
-        strengths=draw(st.lists(st.text(min_size=5, max_size=50), min_size=1, max_size=5)),
-        weaknesses=draw(st.lists(st.text(min_size=5, max_size=50), max_size=3)),
-        growth_areas=draw(st.lists(st.text(min_size=5, max_size=50), max_size=3)),
-        work_style=WorkStyle(
-            commit_frequency=draw(st.sampled_from(["frequent", "moderate", "infrequent"])),
-            avg_commit_size=draw(st.integers(min_value=10, max_value=500)),
-            active_hours=draw(
-                st.lists(
-                    st.integers(min_value=0, max_value=23), min_size=1, max_size=12, unique=True
-                )
-            ),
-            late_night_commits=draw(st.integers(min_value=0, max_value=20)),
-            weekend_commits=draw(st.integers(min_value=0, max_value=50)),
-        ),
-        hiring_signals=HiringSignals(
-            recommended_role=draw(st.text(min_size=5, max_size=30)),
-            seniority_level=draw(st.sampled_from(["junior", "mid", "senior"])),
-            salary_range_usd=draw(
-                st.sampled_from(["$60k-$80k", "$80k-$100k", "$100k-$130k", "$130k-$160k"])
-            ),
-            must_interview=draw(st.booleans()),
-            sponsor_interest=draw(
-                st.lists(st.sampled_from(["AWS", "Google", "Microsoft"]), max_size=2)
-            ),
-            rationale=draw(st.text(min_size=10, max_size=100)),
-        ),
+        seniority_level=draw(st.sampled_from(["junior", "mid", "senior"])),
+        must_interview=draw(st.booleans()),
     )
 
 
@@ -112,13 +72,11 @@ def hiring_intelligence_strategy(draw: Any) -> HiringIntelligence:
     must_interview_count = draw(st.integers(min_value=0, max_value=5))
 
     return HiringIntelligence(
-        backend_candidates=[draw(individual_scorecard_strategy()) for _ in range(backend_count)],
-        frontend_candidates=[draw(individual_scorecard_strategy()) for _ in range(frontend_count)],
-        devops_candidates=[draw(individual_scorecard_strategy()) for _ in range(devops_count)],
-        full_stack_candidates=[
-            draw(individual_scorecard_strategy()) for _ in range(fullstack_count)
-        ],
-        must_interview=[draw(individual_scorecard_strategy()) for _ in range(must_interview_count)],
+        backend_candidates=[draw(hiring_candidate_strategy()) for _ in range(backend_count)],
+        frontend_candidates=[draw(hiring_candidate_strategy()) for _ in range(frontend_count)],
+        devops_candidates=[draw(hiring_candidate_strategy()) for _ in range(devops_count)],
+        full_stack_candidates=[draw(hiring_candidate_strategy()) for _ in range(fullstack_count)],
+        must_interview=[draw(hiring_candidate_strategy()) for _ in range(must_interview_count)],
     )
 
 
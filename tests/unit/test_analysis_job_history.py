@@ -0,0 +1,78 @@
+"""Unit tests for latest-job lookup and paginated analysis job history."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.services.analysis_service import AnalysisService
+from src.utils.dynamo import decode_cursor, encode_cursor
+
+
+def _put_jobs(db, count: int) -> list[str]:
+    job_ids = [f"01J{i:023d}" for i in range(count)]
+    for job_id in job_ids:
+        db.put_analysis_job(
+            {
+                "PK": "HACK#H1",
+                "SK": f"JOB#{job_id}",
+                "job_id": job_id,
+                "hack_id": "H1",
+                "status": "completed",
+                "total_submissions": 1,
+                "created_at": "2026-01-01T00:00:00+00:00",
+            }
+        )
+    return job_ids
+
+
+def test_latest_job_reads_a_single_item(dynamodb_helper):
+    """The latest job comes from a descending Limit=1 query."""
+    job_ids = _put_jobs(dynamodb_helper, 5)
+    service = AnalysisService(dynamodb_helper)
+
+    with patch.object(dynamodb_helper.table, "query", wraps=dynamodb_helper.table.query) as query:
+        latest = service.get_latest_job_record("H1")
+
+    assert latest["job_id"] == job_ids[-1]
+    kwargs = query.call_args.kwargs
+    assert kwargs["Limit"] == 1
+    assert kwargs["ScanIndexForward"] is False
+
+
+def test_job_history_pages_newest_first(dynamodb_helper):
+    """Following next_cursor walks every job exactly once, newest first."""
+    job_ids = _put_jobs(dynamodb_helper, 5)
+    service = AnalysisService(dynamodb_helper)
+
+    seen: list[str] = []
+    cursor = None
+    for _ in range(5):
+        page = service.list_analysis_jobs_page("H1", limit=2, cursor=cursor)
+        seen.extend(job.job_id for job in page.jobs)
+        if not page.has_more:
+            break
+        cursor = page.next_cursor
+
+    assert seen == list(reversed(job_ids))
+
+
+def test_job_history_empty_hackathon(dynamodb_helper):
+    """A hackathon without jobs returns an empty last page."""
+    page = AnalysisService(dynamodb_helper).list_analysis_jobs_page("NONE")
+
+    assert page.jobs == []
+    assert page.has_more is False
+    assert page.next_cursor is None
+
+
+def test_cursor_round_trip_and_validation():
+    """Cursors are opaque round-trips of the last evaluated key."""
+    key = {"PK": "HACK#H1", "SK": "JOB#01J"}
+
+    assert decode_cursor(encode_cursor(key)) == key
+    assert encode_cursor(None) is None
+    assert decode_cursor(None) is None
+    with pytest.raises(ValueError):
+        decode_cursor("not a cursor!")
+    with pytest.raises(ValueError):
+        decode_cursor(encode_cursor({"PK": 1}))  # type: ignore[dict-item]
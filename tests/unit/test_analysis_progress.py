@@ -0,0 +1,74 @@
+"""Unit tests for live analysis job progress."""
+
+from src.services.analysis_service import AnalysisService
+
+
+def _put_job(db, job_id: str = "01J0000000000000000000000A", **fields) -> None:
+    db.put_analysis_job(
+        {
+            "PK": "HACK#H1",
+            "SK": f"JOB#{job_id}",
+            "job_id": job_id,
+            "hack_id": "H1",
+            "status": "running",
+            "total_submissions": 4,
+            "completed_submissions": 0,
+            "failed_submissions": 0,
+            "total_cost_usd": 0,
+            "created_at": "2026-01-01T00:00:00+00:00",
+            "updated_at": "2026-01-01T00:00:00+00:00",
+            **fields,
+        }
+    )
+
+
+def test_progress_snapshot_reports_counts_cost_and_current_submission():
+    """Snapshots are JSON-safe and hide the current submission once finished."""
+    record = {
+        "job_id": "J1",
+        "status": "running",
+        "total_submissions": 4,
+        "completed_submissions": 1,
+        "failed_submissions": 1,
+        "total_cost_usd": 0.05,
+        "current_sub_id": "S3",
+        "current_team_name": "Gamma",
+    }
+
+    snapshot = AnalysisService.progress_snapshot(record)
+
+    assert snapshot["remaining"] == 2
+    assert snapshot["percent_complete"] == 25.0
+    assert snapshot["cost_usd"] == 0.05
+    assert snapshot["current_team_name"] == "Gamma"
+    assert (
+        AnalysisService.progress_snapshot({**record, "status": "completed"})["current_sub_id"]
+        is None
+    )
+
+
+def test_latest_job_record_is_newest_job(dynamodb_helper):
+    """The most recently created job (highest ULID) is returned."""
+    _put_job(dynamodb_helper, "01J0000000000000000000000A")
+    _put_job(dynamodb_helper, "01J0000000000000000000000C")
+    _put_job(dynamodb_helper, "01J0000000000000000000000B")
+
+    latest = AnalysisService(dynamodb_helper).get_latest_job_record("H1")
+
+    assert latest["job_id"] == "01J0000000000000000000000C"
+    assert AnalysisService(dynamodb_helper).get_latest_job_record("NONE") is None
+
+
+def test_per_submission_progress_is_visible_on_the_job(dynamodb_helper):
+    """Current submission and counters update while the job runs."""
+    _put_job(dynamodb_helper)
+    service = AnalysisService(dynamodb_helper)
+
+    service.mark_current_submission("H1", "01J0000000000000000000000A", "S1", "Alpha")
+    service.record_submission_outcome("H1", "01J0000000000000000000000A", "S1", True, 0.02)
+
+    snapshot = service.progress_snapshot(service.get_latest_job_record("H1"))
+    assert snapshot["current_sub_id"] == "S1"
+    assert snapshot["current_team_name"] == "Alpha"
+    assert snapshot["completed"] == 1
+    assert snapshot["cost_usd"] == 0.02
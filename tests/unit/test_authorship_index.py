@@ -0,0 +1,163 @@
+"""Unit tests for the per-file authorship index and the analyzers that use it."""
+
+from datetime import UTC, datetime
+
+import git
+
+from src.analysis.authorship_index import AuthorshipIndex
+from src.analysis.git_analyzer import extract_commits
+from src.analysis.strategy_detector import StrategyDetector
+from src.analysis.team_analyzer import TeamAnalyzer
+from src.models.analysis import CommitInfo, RepoData, SourceFile
+from src.models.submission import RepoMeta
+
+BASE_TIME = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _index(*commits: tuple[str, int, list[str]]) -> AuthorshipIndex:
+    """Build an index from (author, seconds, paths), given newest first."""
+    index = AuthorshipIndex()
+    for row, (author, seconds, paths) in enumerate(commits):
+        index.add_commit(f"{row:040x}", author, BASE_TIME.timestamp() + seconds, paths)
+    return index
+
+
+def _repo(authorship: AuthorshipIndex, paths: list[str]) -> RepoData:
+    commits = [
+        CommitInfo(
+            hash=authorship.commit_hashes[row],
+            short_hash=authorship.commit_hashes[row][:8],
+            message="Update",
+            author=authorship.authors[authorship.commit_authors[row]],
+            timestamp=datetime.fromtimestamp(authorship.commit_times[row], tz=UTC),
+            files_changed=len(authorship.commit_files(row)),
+            insertions=10,
+            deletions=0,
+        )
+        for row in range(len(authorship))
+    ]
+    return RepoData(
+        repo_url="https://github.com/test/repo",
+        repo_owner="test",
+        repo_name="repo",
+        meta=RepoMeta(),
+        source_files=[SourceFile(path=p, content="x", lines=1, language="Python") for p in paths],
+        commit_history=commits,
+        authorship=authorship,
+    )
+
+
+def test_queries_follow_chronological_order():
+    """Views are chronological even though rows are newest first; ties favour older rows."""
+    index = _index(
+        ("bob", 200, ["src/cart.py", "README.md"]),
+        ("alice", 100, ["src/cart.py", "tests/test_cart.py"]),
+        ("carol", 100, ["src/cart.py"]),
+    )
+
+    assert index.paths == ["src/cart.py", "README.md", "tests/test_cart.py"]
+    assert len(index.touched) == 5
+    assert index.commit_files(1) == ["src/cart.py", "tests/test_cart.py"]
+    assert index.first_commit("src/cart.py") == 2
+    assert index.first_commit("README.md") == 0
+    assert index.first_commit("missing.py") is None
+    assert index.authors_of("src/cart.py") == ["carol", "alice", "bob"]
+    assert index.files_by_author("alice") == ["src/cart.py", "tests/test_cart.py"]
+    assert index.files_by_author("nobody") == []
+    assert index.sole_author_files() == [["README.md"], ["tests/test_cart.py"], []]
+
+    index.add_commit("f" * 40, "dave", BASE_TIME.timestamp(), ["README.md"])
+    assert index.first_commit("README.md") == 3
+
+
+def test_key_authors_is_greedy_bus_factor():
+    """The key authors are those whose departure orphans half of the files."""
+    index = _index(
+        ("alice", 0, ["a.py", "b.py", "c.py", "shared.py"]),
+        ("bob", 1, ["d.py", "shared.py"]),
+        ("carol", 2, ["e.py"]),
+    )
+    assert index.key_authors() == ["alice"]
+    assert index.key_authors(share=0.8) == ["alice", "bob"]
+    assert AuthorshipIndex().key_authors() == []
+
+
+def test_extract_commits_fills_index_in_same_pass(tmp_path):
+    """Extraction records touched files per commit; a rename touches both paths."""
+    repo = git.Repo.init(tmp_path, initial_branch="main")
+    with repo.config_writer() as config:
+        config.set_value("user", "email", "dev@example.com")
+
+    def commit(author: str, message: str) -> None:
+        repo.git.add(A=True)
+        repo.index.commit(message, author=git.Actor(author, f"{author}@example.com"))
+
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "cart.py").write_text("def total():\n    return 0\n")
+    commit("alice", "Add cart")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_cart.py").write_text("def test_total():\n    pass\n")
+    commit("bob", "Test cart")
+    repo.git.mv("src/cart.py", "src/basket.py")
+    commit("bob", "Rename cart")
+
+    authorship = AuthorshipIndex()
+    commits = extract_commits(repo, authorship=authorship)
+
+    assert [c.hash for c in commits] == authorship.commit_hashes
+    assert authorship.files_by_author("bob") == [
+        "tests/test_cart.py",
+        "src/basket.py",
+        "src/cart.py",
+    ]
+    assert authorship.authors_of("src/cart.py") == ["alice", "bob"]
+    assert authorship.first_commit("src/cart.py") == 2
+    assert authorship.first_commit("src/basket.py") == 0
+
+
+def test_team_analyzer_uses_real_files_and_ownership():
+    """Scorecards list each contributor's own files and silos come from file ownership."""
+    backend = [f"api/{name}.py" for name in ("users", "orders", "carts", "auth", "db")]
+    authorship = _index(
+        ("bob", 300, ["web/App.tsx", "web/style.css"]),
+        ("alice", 200, backend),
+        ("bob", 100, ["api/users.py"]),
+    )
+    repo = _repo(authorship, [*backend, "web/App.tsx", "web/style.css"])
+
+    result = TeamAnalyzer().analyze(repo)
+
+    cards = {card.contributor_name: card for card in result.individual_scorecards}
+    assert cards["bob"].files_touched == ["api/users.py", "web/App.tsx", "web/style.css"]
+    assert cards["alice"].files_touched == backend
+    assert cards["alice"].role == "backend"
+
+    silos = [p for p in result.collaboration_patterns if p.pattern_type == "knowledge_silo"]
+    assert [p.contributors for p in silos] == [["alice"]]
+    assert "only author of 4 of the 5 files" in silos[0].evidence
+    assert "bus factor 1" in silos[0].evidence
+
+
+def test_tdd_detection_compares_first_commits_of_test_and_code():
+    """A test counts as TDD when it was committed no later than the code it tests."""
+    files = [
+        SourceFile(path=path, content="x", lines=1, language="Python")
+        for path in ("src/cart.py", "tests/test_cart.py", "src/auth.ts", "src/auth.test.ts")
+    ]
+    tests = [f for f in files if "test" in f.path]
+    code = [f for f in files if "test" not in f.path]
+    authorship = _index(
+        ("bob", 300, ["src/auth.test.ts"]),
+        ("bob", 200, ["src/auth.ts"]),
+        ("alice", 100, ["src/cart.py", "tests/test_cart.py"]),
+    )
+    repo = _repo(authorship, [f.path for f in files])
+    detector = StrategyDetector()
+
+    assert detector._detect_tdd_patterns(repo.commit_history, tests, code, authorship) == 0.5
+    _, metrics = detector._analyze_test_strategy(files, None, repo.commit_history, None, authorship)
+    assert metrics["tdd_percentage"] == 0.5
+
+    # Without per-file history, the commit-message heuristic is used
+    _, metrics = detector._analyze_test_strategy(files, None, repo.commit_history)
+    assert metrics["tdd_percentage"] == 0.0
@@ -0,0 +1,208 @@
+"""Unit tests for streamed Bedrock calls with deadlines and first-token limits."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.agents.bug_hunter import BugHunterAgent
+from src.utils.bedrock import BedrockClient, BedrockTimeoutError, ModelLatencyMetrics
+from tests.conftest import build_bedrock_response, build_bug_hunter_json
+
+MODEL_ID = "amazon.nova-lite-v1:0"
+
+
+def delta(text: str) -> dict:
+    return {"contentBlockDelta": {"delta": {"text": text}, "contentBlockIndex": 0}}
+
+
+END_EVENTS = [
+    {"messageStop": {"stopReason": "end_turn"}},
+    {"metadata": {"usage": {"inputTokens": 100, "outputTokens": 20, "totalTokens": 120}}},
+]
+
+
+class FakeStream:
+    """Event stream that sleeps before the events listed with a delay."""
+
+    def __init__(self, events: list, release: threading.Event):
+        self.events = events
+        self.release = release
+        self.closed = False
+
+    def __iter__(self):
+        for event in self.events:
+            if isinstance(event, float):
+                # Wait until the delay passes or the test releases the stream
+                self.release.wait(event)
+                continue
+            if isinstance(event, Exception):
+                raise event
+            yield event
+
+    def close(self):
+        self.closed = True
+        self.release.set()
+
+
+class FakeRuntime:
+    """bedrock-runtime stand-in that serves one scripted stream per call."""
+
+    def __init__(self, *scripts: list):
+        self.scripts = list(scripts)
+        self.streams: list[FakeStream] = []
+        self.requests: list[dict] = []
+
+    def converse_stream(self, **kwargs):
+        self.requests.append(kwargs)
+        stream = FakeStream(self.scripts.pop(0), threading.Event())
+        self.streams.append(stream)
+        return {"stream": stream}
+
+    def converse(self, **kwargs):
+        return {
+            "output": {"message": {"content": [{"text": '{"blocking": true}'}]}},
+            "usage": {"inputTokens": 1, "outputTokens": 1, "totalTokens": 2},
+            "stopReason": "end_turn",
+        }
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    fresh = ModelLatencyMetrics()
+    monkeypatch.setattr("src.utils.bedrock._latency_metrics", fresh)
+    return fresh
+
+
+def stream(client: BedrockClient, **limits):
+    return client.converse(
+        model_id=MODEL_ID,
+        system_prompt="You are a judge.",
+        user_message="Score this repository.",
+        **limits,
+    )
+
+
+def test_stream_collects_text_usage_and_speed(metrics):
+    """Deltas are joined, usage comes from the metadata event and TTFT is recorded."""
+    runtime = FakeRuntime([0.02, delta('{"score": '), delta("8}"), *END_EVENTS])
+    client = BedrockClient(client=runtime)
+
+    result = stream(client, deadline_seconds=5, first_token_timeout_seconds=5)
+
+    assert result["content"] == '{"score": 8}'
+    assert result["usage"] == {"input_tokens": 100, "output_tokens": 20, "total_tokens": 120}
+    assert result["stop_reason"] == "end_turn"
+    assert result["ttft_ms"] >= 20
+    assert result["latency_ms"] >= result["ttft_ms"]
+    assert runtime.requests[0]["inferenceConfig"] == {"maxTokens": 2048, "temperature": 0.3}
+    model = metrics.get_metrics()[MODEL_ID]
+    assert model["calls"] == 1
+    assert model["ttft_ms_p95"] == result["ttft_ms"]
+    assert model["timeouts"] == {"first_token": 0, "deadline": 0}
+
+
+def test_converse_without_limits_stays_blocking(metrics):
+    """Only calls with a limit are streamed."""
+    client = BedrockClient(client=FakeRuntime())
+
+    assert stream(client)["content"] == '{"blocking": true}'
+    assert metrics.get_metrics() == {}
+
+
+def test_late_first_token_is_retried(metrics):
+    """A stalled attempt is closed and retried at once."""
+    runtime = FakeRuntime([5.0, delta("{}"), *END_EVENTS], [delta("{}"), *END_EVENTS])
+    client = BedrockClient(client=runtime)
+
+    started = time.monotonic()
+    result = stream(client, deadline_seconds=5, first_token_timeout_seconds=0.05)
+
+    assert result["content"] == "{}"
+    assert time.monotonic() - started < 2
+    assert runtime.streams[0].closed
+    assert metrics.get_metrics()[MODEL_ID]["timeouts"]["first_token"] == 1
+
+
+def test_deadline_cuts_off_slow_generation(metrics):
+    """A missed deadline is not retried and carries the text received so far."""
+    runtime = FakeRuntime([delta('{"summary": "slow'), 5.0, delta('"}'), *END_EVENTS])
+    client = BedrockClient(client=runtime)
+
+    with pytest.raises(BedrockTimeoutError) as exc_info:
+        stream(client, deadline_seconds=0.1, first_token_timeout_seconds=5)
+
+    assert exc_info.value.limit == "deadline"
+    assert exc_info.value.partial_content == '{"summary": "slow'
+    assert len(runtime.streams) == 1 and runtime.streams[0].closed
+    assert metrics.get_metrics()[MODEL_ID]["timeouts"]["deadline"] == 1
+
+
+def test_complete_json_survives_deadline_with_estimated_usage(metrics):
+    """Once the JSON object has closed, a deadline only loses trailing text."""
+    runtime = FakeRuntime([delta('{"score": 8}'), delta(" Hope this helps"), 5.0, *END_EVENTS])
+    client = BedrockClient(client=runtime)
+
+    result = stream(client, deadline_seconds=0.1)
+
+    assert result["stop_reason"] == "deadline"
+    assert result["content"] == '{"score": 8} Hope this helps'
+    assert result["usage"]["output_tokens"] == len(result["content"]) // 4
+    assert result["usage"]["input_tokens"] > 0
+
+
+def test_throttled_stream_is_retried_with_backoff(metrics):
+    """Client errors raised by the stream are retried like blocking calls."""
+    throttled = ClientError(
+        {"Error": {"Code": "ThrottlingException", "Message": "slow down"}}, "ConverseStream"
+    )
+    runtime = FakeRuntime([throttled], [delta("{}"), *END_EVENTS])
+    client = BedrockClient(client=runtime)
+
+    with patch("src.utils.bedrock.time.sleep") as sleep:
+        result = stream(client, deadline_seconds=30)
+
+    assert result["content"] == "{}"
+    sleep.assert_called_once_with(2)
+
+    runtime = FakeRuntime([throttled])
+    with pytest.raises(ClientError):
+        # No time left for the backoff
+        stream(BedrockClient(client=runtime), deadline_seconds=1)
+
+
+def test_latency_percentiles_use_recent_calls():
+    """Percentiles are nearest-rank over the window of recent calls."""
+    latency = ModelLatencyMetrics(window=4)
+    for ms in (100, 200, 300, 400, 500):
+        latency.record(MODEL_ID, ttft_ms=ms / 10, latency_ms=ms, tokens_per_second=50.0)
+
+    assert latency.percentile(MODEL_ID, "latency_ms", 95) == 500
+    assert latency.percentile(MODEL_ID, "latency_ms", 50) == 300
+    assert latency.percentile("other-model", "latency_ms", 95) is None
+    assert latency.get_metrics()[MODEL_ID]["calls"] == 4
+
+
+def test_agent_limits_bound_the_correction_call(mock_bedrock_client, sample_repo_data):
+    """The agent's deadline covers the correction call too."""
+    mock_bedrock_client.converse.return_value = build_bedrock_response(content="not json")
+    mock_bedrock_client.retry_with_correction.return_value = build_bedrock_response(
+        content=build_bug_hunter_json()
+    )
+    mock_bedrock_client.parse_json_response.side_effect = BedrockClient(
+        client=FakeRuntime()
+    ).parse_json_response
+
+    agent = BugHunterAgent(mock_bedrock_client)
+    agent.analyze(repo_data=sample_repo_data, hackathon_name="Test", team_name="Test")
+
+    first = mock_bedrock_client.converse.call_args.kwargs
+    assert (first["deadline_seconds"], first["first_token_timeout_seconds"]) == (120, 20)
+    correction = mock_bedrock_client.retry_with_correction.call_args.kwargs
+    assert 0 < correction["deadline_seconds"] <= 120
+
+    agent.timeout_seconds = 0
+    with pytest.raises(BedrockTimeoutError, match="deadline"):
+        agent.analyze(repo_data=sample_repo_data, hackathon_name="Test", team_name="Test")
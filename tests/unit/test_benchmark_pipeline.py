@@ -0,0 +1,76 @@
+"""Unit tests for the offline end-to-end pipeline benchmark."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from src.utils.github_client import GitHubClient
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "benchmark_pipeline.py"
+
+
+@pytest.fixture(scope="module")
+def benchmark():
+    spec = importlib.util.spec_from_file_location("benchmark_pipeline", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_compare_to_baseline_flags_only_real_regressions(benchmark):
+    """A stage regresses only when its p95 is both relatively and absolutely slower."""
+    baseline = {
+        "stages": {
+            "git.clone": {"p95": 100.0},
+            "source_index": {"p95": 0.2},
+            "agent:bug_hunter": {"p95": 300.0},
+        },
+        "throughput_per_min": 60.0,
+        "peak_rss_mb": 200.0,
+    }
+    report = {
+        "stages": {"git.clone": {"p95": 160.0}, "source_index": {"p95": 2.0}},
+        "throughput_per_min": 50.0,
+        "peak_rss_mb": 320.0,
+    }
+
+    regressions = benchmark.compare_to_baseline(report, baseline)
+
+    assert regressions == [
+        "git.clone: p95 160.0 ms (baseline 100.0 ms)",
+        "peak RSS: 320.0 MiB (baseline 200.0 MiB)",
+    ]
+    report["throughput_per_min"] = 25.0
+    assert benchmark.compare_to_baseline(report, baseline)[1] == (
+        "throughput: 25.0/min (baseline 60.0/min)"
+    )
+
+
+def test_benchmark_runs_handler_end_to_end(benchmark, tmp_path, monkeypatch):
+    """A small job completes through the fakes, with every pipeline layer traced."""
+    monkeypatch.delenv("DYNAMODB_ENDPOINT_URL", raising=False)
+    config = benchmark.BenchmarkConfig(
+        submissions=2,
+        workers=2,
+        shard_size=1,
+        commits=5,
+        files=3,
+        bedrock_latency_ms=0,
+        github_latency_ms=0,
+    )
+
+    report = benchmark.run_benchmark(config, tmp_path)
+
+    assert (report["status"], report["completed"], report["failed"]) == ("completed", 2, 0)
+    assert report["invocations"] == 2
+    assert report["bedrock_calls"] == 8
+    assert report["github_requests"] == 6
+    assert report["throughput_per_min"] > 0
+    assert report["peak_rss_mb"] > 0
+    assert report["stages"]["submission"]["count"] == 2
+    assert {"agent:bug_hunter", "git.clone", "github.workflow_runs", "dynamodb.put_item"} <= set(
+        report["stages"]
+    )
+    assert set(report["stages"]["git.clone"]) == {"count", "p50", "p95", "max"}
+    assert GitHubClient.BASE_URL == "https://api.github.com"
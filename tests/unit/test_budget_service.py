@@ -0,0 +1,310 @@
+"""Unit tests for budget reservation, reconciliation and BudgetMiddleware."""
+
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.api.middleware.budget import BudgetMiddleware
+from src.services.budget_service import BudgetReservation, BudgetService
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _budget(db, entity_type: str, entity_id: str) -> dict:
+    return db.table.get_item(Key={"PK": f"BUDGET#{entity_type}#{entity_id}", "SK": "TRACKING"})[
+        "Item"
+    ]
+
+
+def _seed_hackathon(db, hack_id="H1", limit=1.0, submission_count=4) -> None:
+    db.table.put_item(
+        Item={
+            "PK": f"HACK#{hack_id}",
+            "SK": "META",
+            "hack_id": hack_id,
+            "budget_limit_usd": Decimal(str(limit)),
+            "submission_count": submission_count,
+        }
+    )
+
+
+# ============================================================
+# RESERVATION
+# ============================================================
+
+
+def test_reserve_up_to_the_limit_then_deny(dynamodb_helper):
+    """Reservations succeed while current + estimate <= limit."""
+    service = BudgetService(dynamodb_helper)
+
+    assert service.reserve("K1", 1.0, None, 0.6).allowed
+    assert service.reserve("K1", 1.0, None, 0.4).allowed
+    denied = service.reserve("K1", 1.0, None, 0.01)
+
+    assert not denied.allowed
+    assert denied.level == "api_key"
+    assert denied.current == 1.0
+    item = _budget(dynamodb_helper, "api_key", "K1")
+    assert item["current_spend_usd"] == Decimal("1.0")
+    assert item["reserved_usd"] == Decimal("1.0")
+
+
+def test_hackathon_denial_releases_api_key_reservation(dynamodb_helper):
+    """A denied later level leaves no spend reserved at earlier levels."""
+    _seed_hackathon(dynamodb_helper, limit=0.5)
+    service = BudgetService(dynamodb_helper)
+
+    decision = service.reserve("K1", 10.0, "H1", 0.8)
+
+    assert not decision.allowed
+    assert decision.level == "hackathon"
+    assert _budget(dynamodb_helper, "api_key", "K1")["current_spend_usd"] == 0
+
+
+def test_levels_without_limit_are_not_enforced(dynamodb_helper):
+    """No positive limit means no reservation write for that level."""
+    service = BudgetService(dynamodb_helper)
+    decision = service.reserve("K1", 0, None, 5.0)
+
+    assert decision.allowed
+    assert decision.reservation.levels == []
+
+
+def test_release_and_reconcile(dynamodb_helper):
+    """Release returns the estimate; reconcile swaps it for the actual cost."""
+    _seed_hackathon(dynamodb_helper, limit=5.0)
+    service = BudgetService(dynamodb_helper)
+
+    failed = service.reserve("K1", 5.0, "H1", 1.0).reservation
+    service.release(failed)
+    assert _budget(dynamodb_helper, "api_key", "K1")["current_spend_usd"] == 0
+
+    job = service.reserve("K1", 5.0, "H1", 1.0).reservation
+    restored = BudgetReservation.from_record(job.to_record())
+    service.reconcile(restored, Decimal("0.35"))
+
+    for level, entity_id in (("api_key", "K1"), ("hackathon", "H1")):
+        item = _budget(dynamodb_helper, level, entity_id)
+        assert item["current_spend_usd"] == Decimal("0.35")
+        assert item["reserved_usd"] == 0
+
+
+def test_hackathon_limits_are_cached(dynamodb_helper):
+    """The hackathon record is read once per cache TTL."""
+    _seed_hackathon(dynamodb_helper, limit=2.0, submission_count=10)
+    clock = FakeClock()
+    service = BudgetService(dynamodb_helper, cache_ttl_seconds=60, clock=clock)
+    dynamodb_helper.get_hackathon = MagicMock(wraps=dynamodb_helper.get_hackathon)
+
+    assert service.get_hackathon_budget("H1") == (2.0, 10)
+    assert service.estimate_analysis_cost("H1") == pytest.approx(0.53)
+    assert dynamodb_helper.get_hackathon.call_count == 1
+
+    clock.now += 60
+    service.get_hackathon_budget("H1")
+    assert dynamodb_helper.get_hackathon.call_count == 2
+
+
+def test_alerts_are_marked_once(dynamodb_helper):
+    """Each threshold is flagged once on the tracking item."""
+    service = BudgetService(dynamodb_helper)
+    service.reserve("K1", 1.0, None, 0.55)
+    service.reserve("K1", 1.0, None, 0.01)
+    service.reserve("K1", 1.0, None, 0.3)
+
+    item = _budget(dynamodb_helper, "api_key", "K1")
+    assert item["alert_50_sent"] is True
+    assert item["alert_80_sent"] is True
+    assert "alert_90_sent" not in item
+
+
+# ============================================================
+# MIDDLEWARE
+# ============================================================
+
+
+class _InjectAPIKey(BaseHTTPMiddleware):
+    """Stands in for RateLimitMiddleware, which sets the API key on request.state."""
+
+    async def dispatch(self, request: Request, call_next):
+        request.state.api_key = "vj_live_secret"
+        request.state.api_key_data = MagicMock(api_key_id="K1", budget_limit_usd=0.3)
+        return await call_next(request)
+
+
+def _client(dynamodb_helper, status_code=202) -> TestClient:
+    app = FastAPI()
+
+    @app.post("/api/v1/hackathons/{hack_id}/analyze")
+    def analyze(hack_id: str, request: Request):
+        reservation = request.state.budget_reservation
+        return JSONResponse({"levels": len(reservation.levels)}, status_code=status_code)
+
+    app.add_middleware(BudgetMiddleware, db_helper=dynamodb_helper, max_cost_per_submission=1.0)
+    app.add_middleware(_InjectAPIKey)
+    return TestClient(app)
+
+
+def test_middleware_reserves_and_returns_402_when_exhausted(dynamodb_helper):
+    """Two analyze calls fit the API key budget; the third gets 402."""
+    _seed_hackathon(dynamodb_helper, limit=10.0, submission_count=2)  # ~$0.106 per job
+    client = _client(dynamodb_helper)
+
+    responses = [client.post("/api/v1/hackathons/H1/analyze") for _ in range(3)]
+
+    assert [r.status_code for r in responses] == [202, 202, 402]
+    assert responses[0].json() == {"levels": 2}
+    assert responses[2].json()["level"] == "api_key"
+
+
+def test_middleware_releases_reservation_when_request_fails(dynamodb_helper):
+    """A failed analyze request does not consume budget."""
+    _seed_hackathon(dynamodb_helper, limit=10.0, submission_count=2)
+    client = _client(dynamodb_helper, status_code=500)
+
+    client.post("/api/v1/hackathons/H1/analyze")
+
+    assert _budget(dynamodb_helper, "api_key", "K1")["current_spend_usd"] == 0
+    assert _budget(dynamodb_helper, "hackathon", "H1")["current_spend_usd"] == 0
+
+
+def test_finalize_job_reconciles_budget(dynamodb_helper):
+    """Completing a job replaces the reserved estimate with the actual cost."""
+    from src.analysis.lambda_handler import finalize_job
+    from src.services.analysis_service import AnalysisService
+
+    reservation = BudgetService(dynamodb_helper).reserve("K1", 5.0, None, 0.5).reservation
+    dynamodb_helper.put_analysis_job(
+        {
+            "PK": "HACK#H1",
+            "SK": "JOB#J1",
+            "job_id": "J1",
+            "hack_id": "H1",
+            "status": "running",
+            "total_cost_usd": Decimal("0.12"),
+            "budget_reservation": reservation.to_record(),
+        }
+    )
+
+    finalize_job(AnalysisService(dynamodb_helper), MagicMock(), "H1", "J1")
+
+    item = _budget(dynamodb_helper, "api_key", "K1")
+    assert item["current_spend_usd"] == Decimal("0.12")
+    assert item["reserved_usd"] == 0
+
+
+def _put_job(db, job_id="J1", status="running", created_at="2026-01-01T00:00:00+00:00", **fields):
+    db.put_analysis_job(
+        {
+            "PK": "HACK#H1",
+            "SK": f"JOB#{job_id}",
+            "job_id": job_id,
+            "hack_id": "H1",
+            "status": status,
+            "total_cost_usd": Decimal("0.12"),
+            "GSI2PK": f"JOB_STATUS#{status}",
+            "GSI2SK": created_at,
+            "created_at": created_at,
+            **fields,
+        }
+    )
+
+
+def test_failed_job_settles_budget_once(dynamodb_helper):
+    """A failed job keeps only the cost it incurred, however often it is finished."""
+    from src.models.common import JobStatus
+    from src.services.analysis_service import AnalysisService
+
+    reservation = BudgetService(dynamodb_helper).reserve("K1", 5.0, None, 0.5).reservation
+    _put_job(dynamodb_helper, budget_reservation=reservation.to_record())
+    service = AnalysisService(dynamodb_helper)
+
+    service.update_job_status("H1", "J1", JobStatus.FAILED, error_message="boom")
+    service.update_job_status("H1", "J1", JobStatus.COMPLETED)
+
+    item = _budget(dynamodb_helper, "api_key", "K1")
+    assert item["current_spend_usd"] == Decimal("0.12")
+    assert item["reserved_usd"] == 0
+    assert "budget_reservation" not in service.get_job_record("H1", "J1")
+
+
+def test_stale_jobs_expire_and_release_their_reservation(dynamodb_helper):
+    """Jobs that never finished are failed by the sweep; recent jobs are left alone."""
+    from datetime import UTC, datetime
+
+    from src.services.analysis_service import AnalysisService
+
+    reservation = BudgetService(dynamodb_helper).reserve("K1", 5.0, None, 0.5).reservation
+    _put_job(dynamodb_helper, "J1", budget_reservation=reservation.to_record())
+    _put_job(dynamodb_helper, "J2", status="queued", created_at=datetime.now(UTC).isoformat())
+    service = AnalysisService(dynamodb_helper)
+
+    assert service.expire_stale_jobs(max_age_seconds=3600) == 1
+    assert service.expire_stale_jobs(max_age_seconds=3600) == 0
+
+    assert service.get_job_record("H1", "J1")["status"] == "failed"
+    assert service.get_job_record("H1", "J2")["status"] == "queued"
+    assert _budget(dynamodb_helper, "api_key", "K1")["reserved_usd"] == 0
+
+
+def test_migration_rekeys_budgets_by_api_key_id(dynamodb_helper):
+    """Spend recorded under the secret is merged into the API key ID item."""
+    import importlib.util
+    from pathlib import Path
+
+    dynamodb_helper.table.put_item(
+        Item={
+            "PK": "APIKEY#K1",
+            "SK": "METADATA",
+            "entity_type": "API_KEY",
+            "api_key_id": "K1",
+            "api_key": "vj_live_secret",
+        }
+    )
+    dynamodb_helper.table.put_item(
+        Item={
+            "PK": "BUDGET#api_key#vj_live_secret",
+            "SK": "TRACKING",
+            "entity_id": "vj_live_secret",
+            "budget_limit_usd": Decimal("5"),
+            "current_spend_usd": Decimal("2.5"),
+            "alert_50_sent": True,
+        }
+    )
+    dynamodb_helper.table.put_item(
+        Item={"PK": "BUDGET#api_key#vj_live_gone", "SK": "TRACKING", "current_spend_usd": 1}
+    )
+    BudgetService(dynamodb_helper).reserve("K1", 5.0, None, 0.5)
+
+    path = Path(__file__).resolve().parents[2] / "scripts" / "migrate_budget_api_key_ids.py"
+    spec = importlib.util.spec_from_file_location("migrate_budget_api_key_ids", path)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    assert migration.migrate(dynamodb_helper, dry_run=False) == {
+        "migrated": 1,
+        "current": 1,
+        "orphaned": 1,
+    }
+    assert migration.migrate(dynamodb_helper, dry_run=False)["migrated"] == 0
+
+    item = _budget(dynamodb_helper, "api_key", "K1")
+    assert item["current_spend_usd"] == Decimal("3.0")
+    assert item["reserved_usd"] == Decimal("0.5")
+    assert item["alert_50_sent"] is True
+    assert "Item" not in dynamodb_helper.table.get_item(
+        Key={"PK": "BUDGET#api_key#vj_live_secret", "SK": "TRACKING"}
+    )
@@ -0,0 +1,137 @@
+"""Unit tests for the process-wide client registry and its consumers."""
+
+import statistics
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.analysis.actions_analyzer import ActionsAnalyzer
+from src.api.dependencies import DynamoDBHelperDep, get_dynamodb_helper
+from src.utils.bedrock import BedrockClient
+from src.utils.clients import (
+    ClientRegistry,
+    close_clients,
+    get_aws_client,
+    get_client_registry,
+    get_dynamodb_resource,
+)
+from src.utils.github_client import get_github_client
+
+# ============================================================
+# REGISTRY
+# ============================================================
+
+
+def test_registry_creates_once_per_key():
+    """The factory runs once per key; later gets reuse the client."""
+    registry = ClientRegistry()
+    factory = MagicMock(side_effect=lambda: object())
+
+    first = registry.get("a", factory)
+    assert registry.get("a", factory) is first
+    assert registry.get("b", factory) is not first
+    assert factory.call_count == 2
+    assert registry.stats == {"created": 2, "reused": 1, "clients": 2}
+
+
+def test_registry_close_releases_clients():
+    """close() calls each client's closer (or close) and empties the registry."""
+    registry = ClientRegistry()
+    plain = MagicMock()
+    custom = MagicMock()
+    closer = MagicMock()
+    registry.get("plain", lambda: plain)
+    registry.get("custom", lambda: custom, closer=closer)
+
+    registry.close()
+
+    plain.close.assert_called_once()
+    closer.assert_called_once_with(custom)
+    custom.close.assert_not_called()
+    assert registry.stats["clients"] == 0
+
+
+def test_registry_starts_empty_after_fork():
+    """A child process does not reuse (or close) the parent's clients."""
+    registry = ClientRegistry()
+    parent_client = MagicMock()
+    registry.get("a", lambda: parent_client)
+
+    with patch("src.utils.clients.os.getpid", return_value=-1):
+        child_client = registry.get("a", MagicMock)
+
+    assert child_client is not parent_client
+    parent_client.close.assert_not_called()
+
+
+# ============================================================
+# SHARED CLIENTS
+# ============================================================
+
+
+def test_aws_clients_are_shared_with_pool_config():
+    """boto3 clients are created once per service/region with the pool config."""
+    client = get_aws_client("s3", region_name="us-east-1")
+
+    assert get_aws_client("s3", region_name="us-east-1") is client
+    assert get_aws_client("s3", region_name="eu-west-1") is not client
+    assert client.meta.config.max_pool_connections == 50
+    assert client.meta.config.tcp_keepalive is True
+
+
+def test_dynamodb_helpers_share_one_resource(dynamodb_helper):
+    """Every helper is backed by the shared resource; the dependency returns one helper."""
+    assert dynamodb_helper.table.meta.client is get_dynamodb_resource().meta.client
+    assert get_dynamodb_helper() is get_dynamodb_helper()
+
+
+def test_bedrock_and_github_clients_are_shared():
+    """Agents and the Actions analyzer draw from the registry."""
+    assert BedrockClient().client is BedrockClient().client
+    assert BedrockClient().client is get_aws_client("bedrock-runtime", "us-east-1")
+
+    analyzers = [ActionsAnalyzer("ghp_token"), ActionsAnalyzer("ghp_token")]
+    for analyzer in analyzers:
+        analyzer.close()
+    assert analyzers[0].client is analyzers[1].client is get_github_client("ghp_token")
+    assert not analyzers[0].client.client.is_closed
+
+    close_clients()
+    assert analyzers[0].client.client.is_closed
+
+
+# ============================================================
+# BENCHMARK
+# ============================================================
+
+
+@pytest.mark.performance
+def test_benchmark_cold_vs_warm_request(dynamodb_helper):
+    """Warm requests skip client creation and are faster than cold ones."""
+    app = FastAPI()
+
+    @app.get("/hackathons/{hack_id}")
+    def get_hackathon(hack_id: str, db: DynamoDBHelperDep):
+        return {"found": db.get_hackathon(hack_id) is not None}
+
+    client = TestClient(app)
+    client.get("/hackathons/H0")  # import and route warm-up
+
+    def timed_request() -> float:
+        start = time.perf_counter()
+        assert client.get("/hackathons/H1").status_code == 200
+        return (time.perf_counter() - start) * 1000
+
+    cold = []
+    for _ in range(10):
+        close_clients()
+        cold.append(timed_request())
+    warm = [timed_request() for _ in range(10)]
+
+    cold_ms, warm_ms = statistics.median(cold), statistics.median(warm)
+    print(f"\ncold request p50: {cold_ms:.2f} ms, warm request p50: {warm_ms:.2f} ms")
+    assert warm_ms < cold_ms
+    assert get_client_registry().stats["reused"] > 0
@@ -0,0 +1,94 @@
+"""Unit tests for the columnar commit table used by TeamAnalyzer."""
+
+import importlib.util
+import random
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from src.analysis.commit_table import CommitTable
+from src.analysis.team_analyzer import TeamAnalyzer
+from src.models.analysis import CommitInfo
+
+BASE_TIME = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _commit(author: str, seconds: float, insertions: int = 10, deletions: int = 1) -> CommitInfo:
+    return CommitInfo(
+        hash="a" * 40,
+        short_hash="aaaaaaa",
+        message="Add feature",
+        author=author,
+        timestamp=BASE_TIME + timedelta(seconds=seconds),
+        files_changed=1,
+        insertions=insertions,
+        deletions=deletions,
+    )
+
+
+def test_group_by_reductions_follow_first_appearance():
+    """Author codes follow first appearance; counts, sums and rows are per code."""
+    table = CommitTable(
+        [
+            _commit("bob", 0, insertions=5, deletions=2),
+            _commit("alice", 10, insertions=7),
+            _commit("bob", 20, insertions=1, deletions=4),
+        ]
+    )
+
+    assert table.authors == ["bob", "alice"]
+    assert list(table.author_codes) == [0, 1, 0]
+    assert table.count_by_author() == [2, 1]
+    assert table.sum_by_author(table.insertions) == [6, 7]
+    assert table.sum_by_author(table.deletions) == [6, 1]
+    assert table.rows_by_author() == [[0, 2], [1]]
+    assert table.timestamps[1] == BASE_TIME.timestamp() + 10
+
+
+def test_overlap_sweep_matches_pairwise_comparison():
+    """The sort-merge sweep finds exactly the authors a pairwise check would."""
+    rng = random.Random(5)
+    for _ in range(300):
+        authors = [f"a{i}" for i in range(rng.randint(1, 5))]
+        commits = [
+            _commit(
+                rng.choice(authors), rng.choice([rng.randint(0, 50_000), 3600 * rng.randint(0, 8)])
+            )
+            for _ in range(rng.randint(0, 40))
+        ]
+        table = CommitTable(commits)
+
+        expected = {
+            table.authors.index(c.author)
+            for c in commits
+            for o in commits
+            if c.author != o.author and abs((c.timestamp - o.timestamp).total_seconds()) < 3600
+        }
+        assert table.authors_near_other_authors(3600) == expected
+
+
+def test_knowledge_silo_window_is_exclusive():
+    """Commits exactly one hour apart do not overlap; a silo needs 5+ commits."""
+    loner = [_commit("loner", 3600 * (i + 1)) for i in range(5)]
+    history = [_commit("team", 0), *loner, _commit("team", 3600 * 6 + 7200)]
+
+    silos = TeamAnalyzer()._detect_knowledge_silos(history)
+
+    assert [p.contributors for p in silos] == [["loner"]]
+    assert "5 commits" in silos[0].evidence
+
+    history.append(_commit("team", 3600 * 3 + 1800))
+    assert TeamAnalyzer()._detect_knowledge_silos(history) == []
+
+
+def test_benchmark_history_agrees_with_pairwise_reference():
+    """The scaling benchmark's worst-case history yields the same silo as the old check."""
+    path = Path(__file__).resolve().parents[2] / "scripts" / "benchmark_commit_table.py"
+    spec = importlib.util.spec_from_file_location("benchmark_commit_table", path)
+    benchmark = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(benchmark)
+
+    history = benchmark.synthetic_history(300)
+    silos = TeamAnalyzer()._detect_knowledge_silos(history)
+
+    assert {p.contributors[0] for p in silos} == benchmark.pairwise_isolated_authors(history)
+    assert {p.contributors[0] for p in silos} == {"solo"}
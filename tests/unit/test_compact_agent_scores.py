@@ -0,0 +1,90 @@
+"""Unit tests for compact agent_scores on submission items."""
+
+import importlib.util
+from decimal import Decimal
+from pathlib import Path
+
+from src.services.submission_service import SubmissionService
+from src.utils.dynamo import estimate_item_size
+
+
+def _load_migration_module():
+    """Load the migration script as a module (scripts/ is not a package)."""
+    path = Path(__file__).resolve().parents[2] / "scripts" / "migrate_compact_agent_scores.py"
+    spec = importlib.util.spec_from_file_location("migrate_compact_agent_scores", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _bloated_submission(hack_id: str, sub_id: str, full_response: dict) -> dict:
+    return {
+        "PK": f"HACK#{hack_id}",
+        "SK": f"SUB#{sub_id}",
+        "entity_type": "SUBMISSION",
+        "sub_id": sub_id,
+        "hack_id": hack_id,
+        "team_name": "Team",
+        "repo_url": "https://github.com/a/b",
+        "status": "completed",
+        "overall_score": Decimal("81.5"),
+        "agent_scores": {"bug_hunter": full_response},
+        "created_at": "2026-01-01T00:00:00+00:00",
+        "updated_at": "2026-01-01T00:00:00+00:00",
+    }
+
+
+def test_compact_agent_scores_from_pydantic_models(sample_bug_hunter_response):
+    """Full agent responses are reduced to score and confidence."""
+    compact = SubmissionService.compact_agent_scores({"bug_hunter": sample_bug_hunter_response})
+
+    assert compact == {
+        "bug_hunter": {
+            "overall_score": sample_bug_hunter_response.overall_score,
+            "confidence": sample_bug_hunter_response.confidence,
+        }
+    }
+
+
+def test_compact_agent_scores_from_legacy_dump(sample_bug_hunter_response):
+    """Legacy model_dump() dicts with evidence are compacted."""
+    legacy = {"bug_hunter": sample_bug_hunter_response.model_dump()}
+
+    compact = SubmissionService.compact_agent_scores(legacy)
+
+    assert set(compact["bug_hunter"]) == {"overall_score", "confidence"}
+
+
+def test_compact_agent_scores_accepts_numeric_scores():
+    """Bare numeric scores are wrapped without a confidence."""
+    compact = SubmissionService.compact_agent_scores({"innovation": Decimal("7.5")})
+
+    assert compact == {"innovation": {"overall_score": 7.5}}
+
+
+def test_estimate_item_size_counts_names_and_values():
+    """Item size includes attribute names and UTF-8 string lengths."""
+    assert estimate_item_size({"ab": "xyz"}) == 5
+    assert estimate_item_size({"n": Decimal("12345")}) == 1 + 4
+    assert estimate_item_size({"m": {"k": True}}) == 1 + 3 + 1 + 1 + 1
+
+
+def test_migration_compacts_items_and_reports_bytes(dynamodb_helper, sample_bug_hunter_response):
+    """Migration rewrites bloated submission items and shrinks bytes read."""
+    migration = _load_migration_module()
+    full = dynamodb_helper._serialize_item(sample_bug_hunter_response.model_dump(mode="json"))
+    dynamodb_helper.table.put_item(Item=_bloated_submission("H1", "S1", full))
+
+    dry = migration.migrate(dynamodb_helper, dry_run=True)
+    assert dry["migrated"] == 1
+    assert dry["bytes_after"]["H1"] < dry["bytes_before"]["H1"]
+    assert "evidence" in dynamodb_helper.get_submission("H1", "S1")["agent_scores"]["bug_hunter"]
+
+    report = migration.migrate(dynamodb_helper, dry_run=False)
+    item = dynamodb_helper.get_submission("H1", "S1")
+    assert set(item["agent_scores"]["bug_hunter"]) == {"overall_score", "confidence"}
+    assert estimate_item_size(item) == report["bytes_after"]["H1"]
+
+    rerun = migration.migrate(dynamodb_helper, dry_run=False)
+    assert rerun["migrated"] == 0
+    assert rerun["skipped"] == 1
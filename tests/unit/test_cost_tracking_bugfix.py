@@ -280,6 +280,7 @@ def test_lambda_handler_cost_recording_exception_handling():
         mock_cost_record.input_tokens = 1000
         mock_cost_record.output_tokens = 500
         mock_cost_record.total_tokens = 1500
+        mock_cost_record.hedge = False
 
         mock_analyze.return_value = {
             "success": True,
@@ -419,6 +419,7 @@ def test_property_batch_processing_independence_preserved():
             mock_cost_record.input_tokens = 1000
             mock_cost_record.output_tokens = 500
             mock_cost_record.total_tokens = 1500
+            mock_cost_record.hedge = False
 
             return {
                 "success": True,
@@ -376,9 +376,9 @@ def test_generate_hiring_intelligence_seniority_sorting(
 
     result = dashboard_aggregator._generate_hiring_intelligence(scorecards)
 
-    assert result.backend_candidates[0].hiring_signals.seniority_level == "senior"
-    assert result.backend_candidates[1].hiring_signals.seniority_level == "mid"
-    assert result.backend_candidates[2].hiring_signals.seniority_level == "junior"
+    assert result.backend_candidates[0].seniority_level == "senior"
+    assert result.backend_candidates[1].seniority_level == "mid"
+    assert result.backend_candidates[2].seniority_level == "junior"
 
 
 # ============================================================
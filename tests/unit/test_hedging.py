@@ -0,0 +1,292 @@
+"""Unit tests for hedged agent calls, model fallback and hedge spend caps."""
+
+import asyncio
+import threading
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.agents.bug_hunter import BugHunterAgent
+from src.analysis.orchestrator import AnalysisOrchestrator
+from src.models.common import AgentName
+from src.services.cost_service import CostService
+from src.utils.bedrock import BedrockClient, ModelLatencyMetrics
+from src.utils.hedging import (
+    HedgeBudget,
+    HedgeController,
+    estimate_request_cost,
+    hedge_budget_scope,
+    run_hedged,
+)
+from tests.conftest import build_bug_hunter_json
+
+PRIMARY_MODEL = "amazon.nova-lite-v1:0"
+FALLBACK_MODEL = "amazon.nova-micro-v1:0"
+
+
+def request(result=None, error=None, wait: threading.Event | None = None, seconds=5.0):
+    """Build a hedged request that optionally blocks until cancelled or released."""
+    calls = []
+
+    def call(cancel):
+        calls.append(cancel)
+        if wait is not None:
+            cancel.on_cancel(wait.set)
+            wait.wait(seconds)
+        if error is not None:
+            raise error
+        return result
+
+    call.calls = calls
+    return call
+
+
+def test_fast_primary_is_not_hedged():
+    """A primary that answers within the delay never starts a hedge."""
+    hedge = request("hedge")
+
+    result = run_hedged(request("primary"), lambda: hedge, 1.0, bool)
+
+    assert (result.value, result.winner, result.hedged) == ("primary", "primary", False)
+    assert hedge.calls == []
+
+
+def test_slow_primary_loses_to_hedge_and_is_cancelled():
+    """The first valid result wins and the other request is cancelled."""
+    primary = request("primary", wait=threading.Event())
+
+    result = run_hedged(primary, lambda: request("hedge"), 0.01, bool)
+
+    assert (result.value, result.winner, result.hedged) == ("hedge", "hedge", True)
+    assert primary.calls[0].cancelled
+
+
+def test_invalid_hedge_waits_for_primary():
+    """An invalid hedge result does not win; a valid primary still does."""
+    release = threading.Event()
+    primary = request("primary", wait=release, seconds=0.2)
+
+    result = run_hedged(primary, lambda: request(""), 0.01, bool)
+
+    assert (result.value, result.winner) == ("primary", "primary")
+
+
+def test_refused_hedge_and_double_failure():
+    """A refused hedge waits for the primary; if both fail, the primary's error is raised."""
+    slow = request("primary", wait=threading.Event(), seconds=0.05)
+    assert run_hedged(slow, lambda: None, 0.01, bool).hedged is False
+
+    with pytest.raises(RuntimeError, match="primary"):
+        run_hedged(
+            request(error=RuntimeError("primary"), wait=threading.Event(), seconds=0.05),
+            lambda: request(error=RuntimeError("hedge")),
+            0.01,
+            bool,
+        )
+
+
+def test_loser_is_reported_when_it_ends():
+    """The losing request is reported once it ends, even after the call returned."""
+    losers = []
+    ended = threading.Event()
+
+    def on_loser(name, value, error):
+        losers.append((name, value, error))
+        ended.set()
+
+    primary = request("primary", wait=threading.Event())
+    result = run_hedged(primary, lambda: request("hedge"), 0.01, bool, on_loser)
+
+    assert result.winner == "hedge"
+    assert ended.wait(1)
+    assert losers == [("primary", "primary", None)]
+
+    losers.clear()
+    result = run_hedged(
+        request("", wait=threading.Event(), seconds=0.05), lambda: request(""), 0.01, bool, on_loser
+    )
+    assert result.winner == "primary"
+    assert [name for name, _, _ in losers] == ["hedge"]
+
+
+def test_delay_needs_enough_model_samples():
+    """Calls are hedged at the model's p95 once enough calls were observed."""
+    latency = ModelLatencyMetrics()
+    controller = HedgeController(latency=latency, min_samples=20)
+    for ms in range(100, 2100, 100):
+        assert controller.delay_seconds(PRIMARY_MODEL) is None
+        latency.record(PRIMARY_MODEL, ttft_ms=10, latency_ms=ms, tokens_per_second=50)
+
+    assert controller.delay_seconds(PRIMARY_MODEL) == 1.9
+
+
+def test_hedge_spend_is_capped():
+    """Hedges are refused over the per-request cap or the spend ratio."""
+    controller = HedgeController(
+        latency=ModelLatencyMetrics(),
+        max_request_cost_usd=0.05,
+        max_spend_ratio=0.1,
+        spend_allowance_usd=0.02,
+    )
+    assert not controller.allow("innovation", "sonnet", estimated_cost_usd=0.06)
+    assert controller.allow("innovation", "sonnet", estimated_cost_usd=0.015)
+    # The in-flight reservation counts against the allowance
+    assert not controller.allow("innovation", "sonnet", estimated_cost_usd=0.01)
+    controller.release(estimated_cost_usd=0.015)
+    controller.record_extra_spend("innovation", cost_usd=0.004)
+    assert controller.allow("innovation", "sonnet", estimated_cost_usd=0.01)
+    controller.release(estimated_cost_usd=0.01)
+    controller.record_extra_spend("innovation", cost_usd=0.01)
+
+    for _ in range(10):
+        controller.record_call("innovation", "sonnet", latency_ms=1000, cost_usd=0.02)
+    # Cap is now 0.1 * 0.2 + 0.02 = 0.04 with 0.014 spent
+    assert controller.allow("innovation", "sonnet", estimated_cost_usd=0.02)
+
+    report = controller.report()["innovation"]
+    assert (report["hedged"], report["refused"]) == (3, 2)
+    assert report["extra_spend_usd"] == 0.014
+    assert report["extra_spend_ratio"] == 0.07
+    assert report["p95_ms"] == 1000
+    assert estimate_request_cost("unknown-model", 4000, 1000) == float("inf")
+
+
+def test_hedge_spend_is_capped_by_hackathon_budget(dynamodb_helper):
+    """Inside a hackathon's scope, every process reserves hedge spend on its budget."""
+    dynamodb_helper.table.put_item(
+        Item={"PK": "BUDGET#hackathon#H1", "SK": "TRACKING", "current_spend_usd": Decimal("0")}
+    )
+    budget = HedgeBudget.for_hackathon("H1", 1.0, dynamodb_helper)
+    assert budget is not None and budget.cap_usd == pytest.approx(0.05)
+    assert HedgeBudget.for_hackathon("H1", None, dynamodb_helper) is None
+    # Two processes (cold starts) share the cap
+    first, second = (HedgeController(latency=ModelLatencyMetrics()) for _ in range(2))
+
+    with hedge_budget_scope(budget):
+        assert first.allow("innovation", "sonnet", estimated_cost_usd=0.03)
+        assert second.allow("innovation", "sonnet", estimated_cost_usd=0.02)
+        assert not second.allow("innovation", "sonnet", estimated_cost_usd=0.01)
+        # The losing request cost less than the hedge's estimate
+        first.record_extra_spend("innovation", cost_usd=0.01, reserved_usd=0.03)
+        assert second.allow("innovation", "sonnet", estimated_cost_usd=0.02)
+    # Outside the scope the process-wide cap applies
+    assert first.allow("innovation", "sonnet", estimated_cost_usd=0.05)
+
+    item = dynamodb_helper.table.get_item(Key={"PK": "BUDGET#hackathon#H1", "SK": "TRACKING"})
+    assert item["Item"]["hedge_spend_usd"] == Decimal("0.05")
+    assert item["Item"]["current_spend_usd"] == Decimal("0")
+
+
+class FakeStream(list):
+    def __init__(self, events, release=None):
+        super().__init__(events)
+        self.release = release
+
+    def __iter__(self):
+        if self.release is not None:
+            self.release.wait(5)
+        return super().__iter__()
+
+    def close(self):
+        if self.release is not None:
+            self.release.set()
+
+
+class StallingPrimaryRuntime:
+    """The primary model stalls until its stream is closed; the fallback answers."""
+
+    def __init__(self):
+        self.models = []
+        self.primary_closed = threading.Event()
+
+    def converse_stream(self, **kwargs):
+        self.models.append(kwargs["modelId"])
+        events = [
+            {"contentBlockDelta": {"delta": {"text": build_bug_hunter_json()}}},
+            {"messageStop": {"stopReason": "end_turn"}},
+            {
+                "metadata": {
+                    "usage": {"inputTokens": 4000, "outputTokens": 600, "totalTokens": 4600}
+                }
+            },
+        ]
+        if kwargs["modelId"] == PRIMARY_MODEL:
+            return {"stream": FakeStream(events, release=self.primary_closed)}
+        return {"stream": FakeStream(events)}
+
+
+def test_agent_falls_back_to_hedge_model(monkeypatch, sample_repo_data):
+    """A stalled primary is hedged on the fallback model; its partial cost is extra spend."""
+    latency = ModelLatencyMetrics()
+    for _ in range(20):
+        latency.record(PRIMARY_MODEL, ttft_ms=5, latency_ms=50, tokens_per_second=100)
+    controller = HedgeController(latency=latency, min_samples=20)
+    monkeypatch.setattr("src.agents.base.get_hedge_controller", lambda: controller)
+    runtime = StallingPrimaryRuntime()
+
+    agent = BugHunterAgent(BedrockClient(client=runtime))
+    agent.hedge_model_id = FALLBACK_MODEL
+    response, usage = agent.analyze(
+        repo_data=sample_repo_data, hackathon_name="Test", team_name="Test"
+    )
+
+    assert response.overall_score == 8.5
+    assert runtime.models == [PRIMARY_MODEL, FALLBACK_MODEL]
+    assert runtime.primary_closed.wait(1)
+    assert usage["model_id"] == FALLBACK_MODEL
+    assert usage["total_cost_usd"] == pytest.approx(4000 * 0.000000035 + 600 * 0.00000014)
+    report = controller.report()["bug_hunter"]
+    assert (report["calls"], report["hedged"], report["hedge_wins"]) == (1, 1, 1)
+    assert report["spend_usd"] == round(usage["total_cost_usd"], 6)
+    # The primary was cancelled before any output: only its prompt is charged
+    assert 0 < report["extra_spend_usd"] < report["spend_usd"]
+    assert usage["hedge_usage"]["model_id"] == PRIMARY_MODEL
+    assert usage["hedge_usage"]["input_tokens"] > 0
+    assert usage["hedge_usage"]["output_tokens"] == 0
+
+
+def test_losing_request_is_billed_on_a_hedge_cost_record(dynamodb_helper, sample_repo_data):
+    """The loser's usage gets its own cost record, which counts toward the total."""
+    orchestrator = AnalysisOrchestrator(bedrock_client=MagicMock())
+    agent = MagicMock(model_id=FALLBACK_MODEL)
+    agent.analyze.return_value = (
+        MagicMock(),
+        {
+            "model_id": FALLBACK_MODEL,
+            "input_tokens": 4000,
+            "output_tokens": 600,
+            "latency_ms": 900,
+            "hedge_usage": {"model_id": PRIMARY_MODEL, "input_tokens": 4000, "output_tokens": 0},
+        },
+    )
+    orchestrator.agents[AgentName.BUG_HUNTER] = agent
+
+    asyncio.run(
+        orchestrator._run_agent_async(
+            AgentName.BUG_HUNTER, sample_repo_data, "Test", "Team", "H1", "S1", "full_vibe"
+        )
+    )
+
+    records = orchestrator.cost_tracker.get_records()
+    assert [(r.model_id, r.hedge) for r in records] == [
+        (FALLBACK_MODEL, False),
+        (PRIMARY_MODEL, True),
+    ]
+    assert orchestrator.cost_tracker.get_total_cost() == pytest.approx(
+        sum(r.total_cost_usd for r in records)
+    )
+    assert set(orchestrator.cost_tracker.get_cost_by_agent()) == {"bug_hunter", "bug_hunter:hedge"}
+
+    service = CostService(dynamodb_helper)
+    for record in records:
+        service.record_agent_cost(
+            sub_id="S1",
+            agent_name=record.agent_name,
+            model_id=record.model_id,
+            input_tokens=record.input_tokens,
+            output_tokens=record.output_tokens,
+            hedge=record.hedge,
+        )
+    stored = {r["agent_name"] for r in dynamodb_helper.get_submission_costs("S1")}
+    assert stored == {"bug_hunter", "bug_hunter:hedge"}
@@ -0,0 +1,58 @@
+"""Unit tests for the API cold-start import profile and startup budget."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from src.constants import API_IMPORT_BUDGET_MS
+
+TRACE = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     httpx._models
+import time:       400 |        500 |   httpx
+import time:      2000 |       2000 |   boto3
+import time:      1500 |       4000 | src.api.main
+"""
+
+
+def _load_profiler():
+    """Load the profiler script as a module (scripts/ is not a package)."""
+    path = Path(__file__).resolve().parents[2] / "scripts" / "profile_imports.py"
+    spec = importlib.util.spec_from_file_location("profile_imports", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_digest_summarizes_trace():
+    """Totals, package self time and eagerly imported lazy modules are reported."""
+    profiler = _load_profiler()
+    records = profiler.parse_importtime(TRACE)
+    report = profiler.digest(records, "src.api.main", lazy_modules=("httpx",))
+
+    assert report["total_ms"] == 4.0
+    assert report["module_count"] == 4
+    assert report["slowest_self"][0] == {"module": "boto3", "self_ms": 2.0}
+    assert {"package": "httpx", "self_ms": 0.5} in report["packages"]
+    assert report["project_modules"][0]["module"] == "src.api.main"
+    assert report["eager_lazy_modules"] == ["httpx", "httpx._models"]
+
+
+def test_api_startup_keeps_lazy_modules_unloaded():
+    """Importing the API does not load analyzer-only or rarely used modules."""
+    profiler = _load_profiler()
+    report = profiler.digest(profiler.profile("src.api.main", runs=1), "src.api.main")
+
+    assert report["total_ms"] > 0
+    assert report["eager_lazy_modules"] == []
+
+
+@pytest.mark.performance
+def test_api_startup_within_import_budget():
+    """Cold-start import time stays within the startup budget (regression benchmark)."""
+    profiler = _load_profiler()
+    report = profiler.digest(profiler.profile("src.api.main", runs=3), "src.api.main")
+
+    print(f"\nsrc.api.main import: {report['total_ms']:.1f} ms (budget {API_IMPORT_BUDGET_MS} ms)")
+    assert report["total_ms"] <= API_IMPORT_BUDGET_MS
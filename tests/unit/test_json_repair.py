@@ -0,0 +1,181 @@
+"""Unit tests for tolerant JSON parsing of agent responses."""
+
+import json
+
+import pytest
+
+from src.agents.bug_hunter import BugHunterAgent
+from src.models.scores import BugHunterResponse
+from src.utils.bedrock import BedrockClient, ResponseParseMetrics
+from src.utils.json_repair import JSONRepairer, capture_repairs, parse_json_object
+from tests.conftest import build_bedrock_response, build_bug_hunter_json
+
+
+@pytest.mark.parametrize(
+    ("text", "expected", "repairs"),
+    [
+        ('Here you go:\n```json\n{"a": 1}\n```', {"a": 1}, []),
+        ('{"a": [1, 2,], "b": 3,}', {"a": [1, 2], "b": 3}, ["trailing_comma"]),
+        ('{"a": "line one\nline two"}', {"a": "line one\nline two"}, ["control_character"]),
+        ('{"a": "it\\\'s", "b": "C:\\d"}', {"a": "it's", "b": "C:\\d"}, ["invalid_escape"]),
+        ('{"a": True, "b": None}', {"a": True, "b": None}, ["python_literal"]),
+        ('{"a": 1\n "b": [1 2]}', {"a": 1, "b": [1, 2]}, ["missing_comma"]),
+        ('{"a": [1, 2}}', {"a": [1, 2]}, ["mismatched_bracket"]),
+    ],
+)
+def test_parse_json_object_repairs_common_defects(text, expected, repairs):
+    """Malformed responses are repaired; well-formed ones take the json.loads path."""
+    assert parse_json_object(text) == (expected, repairs)
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        (
+            '{"score": 8, "evidence": [{"finding": "a"}, {"finding": "b',
+            {
+                "score": 8,
+                "evidence": [{"finding": "a"}, {"finding": "b"}],
+            },
+        ),
+        (
+            '{"score": 8, "evidence": [{"finding": "a"}, {"fin',
+            {
+                "score": 8,
+                "evidence": [{"finding": "a"}, {}],
+            },
+        ),
+        ('{"score": 8, "summary":', {"score": 8}),
+        ('{"score": 8, "ratio": 0.', {"score": 8}),
+        ('{"summary": "caf\\u00', {"summary": "caf"}),
+    ],
+)
+def test_truncated_output_closes_at_last_complete_member(text, expected):
+    """Output cut off at max_tokens keeps everything that was complete."""
+    parsed, repairs = parse_json_object(text)
+
+    assert parsed == expected
+    assert "truncated" in repairs
+
+
+def test_repairer_is_incremental():
+    """Feeding a response in arbitrary chunks gives the same result as all at once."""
+    text = 'Sure! {"a": [1, 2,], "b": "x\ny", "c": {"d": None}} trailing prose {"e": 1}'
+    expected = JSONRepairer()
+    expected.feed(text)
+
+    for size in (1, 3, 7):
+        repairer = JSONRepairer()
+        for i in range(0, len(text), size):
+            repairer.feed(text[i : i + size])
+        assert repairer.complete
+        assert repairer.finish() == expected.finish()
+        assert repairer.repairs == expected.repairs
+
+    assert json.loads(expected.finish()) == {"a": [1, 2], "b": "x\ny", "c": {"d": None}}
+
+
+def test_capture_repairs_collects_nested_parses():
+    """Repairs reach the enclosing capture block even through the Bedrock client."""
+    client = BedrockClient()
+    with capture_repairs() as repairs:
+        assert client.parse_json_response('{"a": 1,}') == {"a": 1}
+        assert client.parse_json_response('{"b": True}') == {"b": True}
+        assert client.parse_json_response("no json here") is None
+
+    assert repairs == ["trailing_comma", "python_literal"]
+    assert parse_json_object('{"a": 1,}')[0] == {"a": 1}
+    assert repairs == ["trailing_comma", "python_literal"]
+
+
+def test_response_parse_metrics_rates():
+    """Rates are per model; corrected and failed responses both count as retries."""
+    metrics = ResponseParseMetrics()
+    for outcome in ("clean", "clean", "repaired", "corrected"):
+        metrics.record("model-a", outcome, ["trailing_comma"] if outcome == "repaired" else [])
+    metrics.record("model-b", "failed", ["truncated"])
+
+    result = metrics.get_metrics()
+
+    assert result["model-a"]["responses"] == 4
+    assert result["model-a"]["repair_rate"] == 0.25
+    assert result["model-a"]["retry_rate"] == 0.25
+    assert result["model-a"]["repairs"] == {"trailing_comma": 1}
+    assert result["model-b"] == {
+        "clean": 0,
+        "repaired": 0,
+        "corrected": 0,
+        "failed": 1,
+        "responses": 1,
+        "repair_rate": 0.0,
+        "retry_rate": 1.0,
+        "repairs": {"truncated": 1},
+    }
+
+
+@pytest.fixture
+def parse_metrics(monkeypatch):
+    metrics = ResponseParseMetrics()
+    monkeypatch.setattr("src.agents.base.get_response_parse_metrics", lambda: metrics)
+    return metrics
+
+
+def test_agent_uses_repaired_response_without_retry(
+    mock_bedrock_client, sample_repo_data, parse_metrics
+):
+    """A response the repairer recovers costs no correction round-trip."""
+    truncated = build_bug_hunter_json().rstrip().rstrip("}").rstrip() + ",\n"
+    mock_bedrock_client.converse.return_value = build_bedrock_response(content=truncated)
+    mock_bedrock_client.parse_json_response.side_effect = BedrockClient().parse_json_response
+
+    agent = BugHunterAgent(mock_bedrock_client)
+    response, usage = agent.analyze(
+        repo_data=sample_repo_data, hackathon_name="Test", team_name="Test"
+    )
+
+    assert isinstance(response, BugHunterResponse)
+    assert usage["input_tokens"] == 1000
+    mock_bedrock_client.retry_with_correction.assert_not_called()
+    metrics = parse_metrics.get_metrics()[agent.model_id]
+    assert (metrics["repaired"], metrics["retry_rate"]) == (1, 0.0)
+    assert "truncated" in metrics["repairs"]
+
+
+def test_agent_retries_schema_violations_with_validation_errors(
+    mock_bedrock_client, sample_repo_data, parse_metrics
+):
+    """Valid JSON that fails the response model is corrected, and both calls are billed."""
+    invalid = json.loads(build_bug_hunter_json())
+    invalid["overall_score"] = 42
+    mock_bedrock_client.converse.return_value = build_bedrock_response(content=json.dumps(invalid))
+    mock_bedrock_client.retry_with_correction.return_value = build_bedrock_response(
+        content=build_bug_hunter_json(), input_tokens=1200, output_tokens=400
+    )
+    mock_bedrock_client.parse_json_response.side_effect = BedrockClient().parse_json_response
+
+    agent = BugHunterAgent(mock_bedrock_client)
+    response, usage = agent.analyze(
+        repo_data=sample_repo_data, hackathon_name="Test", team_name="Test"
+    )
+
+    assert response.overall_score == 8.5
+    parse_error = mock_bedrock_client.retry_with_correction.call_args.kwargs["parse_error"]
+    assert parse_error.startswith("Schema validation failed: overall_score:")
+    assert (usage["input_tokens"], usage["output_tokens"]) == (2200, 900)
+    assert usage["latency_ms"] == 2400
+    assert mock_bedrock_client.calculate_cost.call_args.kwargs["input_tokens"] == 2200
+    assert parse_metrics.get_metrics()[agent.model_id]["corrected"] == 1
+
+
+def test_agent_records_failure_after_retry(mock_bedrock_client, sample_repo_data, parse_metrics):
+    """A response still invalid after the correction raises and counts as failed."""
+    invalid = build_bedrock_response(content='{"overall_score": 42}')
+    mock_bedrock_client.converse.return_value = invalid
+    mock_bedrock_client.retry_with_correction.return_value = invalid
+    mock_bedrock_client.parse_json_response.side_effect = BedrockClient().parse_json_response
+
+    agent = BugHunterAgent(mock_bedrock_client)
+    with pytest.raises(ValueError, match="Schema validation failed"):
+        agent.analyze(repo_data=sample_repo_data, hackathon_name="Test", team_name="Test")
+
+    assert parse_metrics.get_metrics()[agent.model_id]["failed"] == 1
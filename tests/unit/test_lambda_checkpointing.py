@@ -0,0 +1,224 @@
+"""Unit tests for checkpointed, resumable analyzer jobs."""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.models.common import JobStatus
+
+TEMPLATE = Path(__file__).parents[2] / "template.yaml"
+
+
+class FakeLambdaContext:
+    """Minimal Lambda context with a fixed remaining time."""
+
+    function_name = "vibejudge-analyzer-test"
+
+    def __init__(self, remaining_ms: int):
+        self._remaining_ms = remaining_ms
+
+    def get_remaining_time_in_millis(self) -> int:
+        return self._remaining_ms
+
+
+def _success_result() -> dict:
+    return {
+        "success": True,
+        "overall_score": 80.0,
+        "dimension_scores": {},
+        "weighted_scores": {},
+        "recommendation": "solid_submission",
+        "confidence": 0.9,
+        "agent_scores": {},
+        "strengths": [],
+        "weaknesses": [],
+        "repo_meta": {},
+        "cost": 0.05,
+        "tokens": 1000,
+        "duration_ms": 1000,
+        "cost_records": [],
+    }
+
+
+def _run_handler(event: dict, context, job_record: dict):
+    from src.analysis.lambda_handler import handler
+
+    with (
+        patch("src.analysis.lambda_handler.DynamoDBHelper"),
+        patch("src.analysis.lambda_handler.HackathonService") as hack_cls,
+        patch("src.analysis.lambda_handler.SubmissionService") as sub_cls,
+        patch("src.analysis.lambda_handler.AnalysisService") as analysis_cls,
+        patch("src.analysis.lambda_handler.CostService"),
+        patch("src.analysis.lambda_handler.analyze_single_submission") as analyze,
+    ):
+        hack_cls.return_value.get_hackathon.return_value = MagicMock()
+        sub_cls.return_value.get_submission.side_effect = lambda sub_id: MagicMock(sub_id=sub_id)
+        analysis = analysis_cls.return_value
+        analysis.get_job_record.return_value = job_record
+        analysis.invoke_analyzer.return_value = True
+        analyze.return_value = _success_result()
+
+        result = handler(event, context)
+        return result, analysis, analyze
+
+
+def test_handler_skips_already_checkpointed_submissions():
+    """Submissions recorded on the job item are not analyzed again."""
+    event = {"job_id": "J1", "hack_id": "H1", "submission_ids": ["S1", "S2", "S3"]}
+
+    result, analysis, analyze = _run_handler(event, {}, {"processed_submission_ids": ["S1", "S2"]})
+
+    assert result["statusCode"] == 200
+    assert analyze.call_count == 1
+    assert analyze.call_args[1]["submission"].sub_id == "S3"
+    analysis.record_submission_outcome.assert_called_once()
+    assert analysis.record_submission_outcome.call_args[1]["sub_id"] == "S3"
+
+
+def test_handler_checkpoints_each_submission():
+    """Every processed submission is checkpointed with its outcome and cost."""
+    event = {"job_id": "J1", "hack_id": "H1", "submission_ids": ["S1", "S2"]}
+
+    _, analysis, _ = _run_handler(event, {}, {})
+
+    calls = analysis.record_submission_outcome.call_args_list
+    assert [c[1]["sub_id"] for c in calls] == ["S1", "S2"]
+    assert all(c[1]["succeeded"] for c in calls)
+    completed = [
+        c for c in analysis.update_job_status.call_args_list if c[1]["status"] == "completed"
+    ]
+    assert len(completed) == 1
+
+
+def test_handler_reinvokes_itself_when_time_runs_low():
+    """Low remaining time hands the rest of the job to a new invocation."""
+    event = {"job_id": "J1", "hack_id": "H1", "submission_ids": ["S1", "S2", "S3"]}
+    context = FakeLambdaContext(30_000)
+
+    result, analysis, analyze = _run_handler(event, context, {})
+
+    assert result["statusCode"] == 202
+    assert json.loads(result["body"])["remaining"] == 2
+    assert analyze.call_count == 1
+    payload = analysis.invoke_analyzer.call_args[0][0]
+    assert payload["submission_ids"] == ["S2", "S3"]
+    assert payload["continuation"] == 1
+    assert analysis.invoke_analyzer.call_args[1]["function_name"] == context.function_name
+    statuses = [c[1]["status"] for c in analysis.update_job_status.call_args_list]
+    assert JobStatus.COMPLETED not in statuses
+
+
+def test_continuation_does_not_reset_running_status():
+    """Continuations keep the original started_at."""
+    event = {
+        "job_id": "J1",
+        "hack_id": "H1",
+        "submission_ids": ["S2"],
+        "continuation": 1,
+    }
+
+    _, analysis, _ = _run_handler(event, {}, {"processed_submission_ids": ["S1"]})
+
+    started = [c for c in analysis.update_job_status.call_args_list if "started_at" in c[1]]
+    assert started == []
+
+
+def test_handler_keeps_going_if_continuation_cannot_be_invoked():
+    """Without a way to re-invoke, the handler processes everything itself."""
+    from src.analysis.lambda_handler import handler
+
+    event = {"job_id": "J1", "hack_id": "H1", "submission_ids": ["S1", "S2"]}
+    with (
+        patch("src.analysis.lambda_handler.DynamoDBHelper"),
+        patch("src.analysis.lambda_handler.HackathonService"),
+        patch("src.analysis.lambda_handler.SubmissionService"),
+        patch("src.analysis.lambda_handler.AnalysisService") as analysis_cls,
+        patch("src.analysis.lambda_handler.CostService"),
+        patch("src.analysis.lambda_handler.analyze_single_submission") as analyze,
+    ):
+        analysis_cls.return_value.get_job_record.return_value = {}
+        analysis_cls.return_value.invoke_analyzer.return_value = False
+        analyze.return_value = _success_result()
+
+        result = handler(event, FakeLambdaContext(10_000))
+
+    assert result["statusCode"] == 200
+    assert analyze.call_count == 2
+
+
+def test_record_job_submission_outcome_is_idempotent(dynamodb_helper):
+    """Recording the same submission twice does not double count."""
+    dynamodb_helper.put_analysis_job(
+        {
+            "PK": "HACK#H1",
+            "SK": "JOB#J1",
+            "job_id": "J1",
+            "hack_id": "H1",
+            "completed_submissions": 0,
+            "failed_submissions": 0,
+            "total_cost_usd": 0.0,
+        }
+    )
+
+    assert dynamodb_helper.record_job_submission_outcome("H1", "J1", "S1", True, 0.05)
+    assert not dynamodb_helper.record_job_submission_outcome("H1", "J1", "S1", True, 0.05)
+    assert dynamodb_helper.record_job_submission_outcome("H1", "J1", "S2", False)
+
+    job = dynamodb_helper.get_analysis_job("H1", "J1")
+    assert job["completed_submissions"] == 1
+    assert job["failed_submissions"] == 1
+    assert float(job["total_cost_usd"]) == 0.05
+    assert job["processed_submission_ids"] == ["S1", "S2"]
+
+
+def test_update_analysis_job_preserves_counters(dynamodb_helper):
+    """Status updates only set the given fields."""
+    from src.services.analysis_service import AnalysisService
+
+    dynamodb_helper.put_analysis_job(
+        {"PK": "HACK#H1", "SK": "JOB#J1", "job_id": "J1", "hack_id": "H1", "status": "running"}
+    )
+    dynamodb_helper.record_job_submission_outcome("H1", "J1", "S1", True, 0.1)
+
+    assert AnalysisService(dynamodb_helper).update_job_status("H1", "J1", JobStatus.COMPLETED)
+
+    job = dynamodb_helper.get_analysis_job("H1", "J1")
+    assert job["status"] == "completed"
+    assert job["GSI2PK"] == "JOB_STATUS#completed"
+    assert job["completed_submissions"] == 1
+    assert not AnalysisService(dynamodb_helper).update_job_status("H1", "MISSING", JobStatus.FAILED)
+
+
+def test_analyzer_role_may_invoke_itself():
+    """The deployed analyzer can hand a job off to a fresh invocation of itself."""
+    yaml = pytest.importorskip("yaml")
+
+    class TemplateLoader(yaml.SafeLoader):
+        pass
+
+    # Keep CloudFormation intrinsics (!Ref, !Sub, ...) as {"Fn": value}
+    TemplateLoader.add_multi_constructor(
+        "!",
+        lambda loader, tag, node: {
+            tag: loader.construct_scalar(node)
+            if isinstance(node, yaml.ScalarNode)
+            else loader.construct_sequence(node)
+        },
+    )
+    template = yaml.load(TEMPLATE.read_text(), Loader=TemplateLoader)  # nosec B506
+    analyzer = template["Resources"]["AnalyzerFunction"]["Properties"]
+    function_arn = (
+        "arn:${AWS::Partition}:lambda:${AWS::Region}:${AWS::AccountId}:function:"
+        + analyzer["FunctionName"]["Sub"]
+    )
+
+    statements = [
+        statement for policy in analyzer["Policies"] for statement in policy.get("Statement", [])
+    ]
+    assert any(
+        "lambda:InvokeFunction" in statement["Action"]
+        and statement["Resource"] == {"Sub": function_arn}
+        for statement in statements
+    )
@@ -0,0 +1,248 @@
+"""Unit tests for memory accounting, eager release and admission control."""
+
+import json
+import threading
+import weakref
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from src.analysis.lambda_handler import analyze_single_submission, handler
+from src.models.common import AgentName
+from src.utils.memory import AdmissionController, MemoryLedger, checkpoint, memory_ceiling_mb
+
+
+class FakeRss:
+    """Settable RSS probe."""
+
+    def __init__(self, mb: float):
+        self.mb = mb
+
+    def __call__(self) -> float:
+        return self.mb
+
+
+def test_ledger_records_stage_boundaries_only_when_active():
+    """checkpoint() records on the active ledger and is a no-op otherwise."""
+    assert checkpoint("outside") is None
+
+    ledger = MemoryLedger("S1")
+    with ledger.activate():
+        checkpoint("start")
+        checkpoint("git_clone_and_extract")
+
+    assert [s.stage for s in ledger.snapshots] == ["start", "git_clone_and_extract"]
+    assert all(s.rss_mb > 0 for s in ledger.snapshots)
+    record = json.loads(json.dumps(ledger.to_record()))
+    assert record["peak_rss_mb"] == ledger.peak_mb
+    assert record["growth_mb"] >= 0
+    assert record["stages"][0] == {"stage": "start", "rss_mb": ledger.snapshots[0].rss_mb}
+
+
+def test_admission_counts_in_flight_reservations():
+    """The projection adds every in-flight reservation plus the new one to the baseline."""
+    rss = FakeRss(500)
+    collect = MagicMock()
+    controller = AdmissionController(
+        ceiling_mb=1000, estimate_mb=200, wait_seconds=0, rss=rss, collect=collect
+    )
+
+    assert controller.admit("S1")
+    assert controller.admit("S2")
+    assert controller.admit("S2")  # already in flight
+    assert controller.projected_mb() == 1100
+    assert not controller.admit("S3")
+    assert controller.admit("S3", required=True)
+    assert controller.stats == {"admitted": 3, "waited": 0, "refused": 1, "overridden": 1}
+
+    for sub_id in ("S1", "S2", "S3"):
+        controller.release(sub_id)
+    # The baseline was measured after garbage collection on the first admit
+    assert controller.baseline_mb == 500
+    collect.assert_called_once()
+
+    # A warm process reuses the pages it freed: RSS alone must fit
+    rss.mb = 900
+    assert controller.admit("S4")
+    controller.release("S4")
+    rss.mb = 1100
+    assert not controller.admit("S5")
+    # With nothing in flight, garbage is collected once more before refusing
+    assert collect.call_count == 2
+
+    # The footprint is the peak above the baseline, smoothed
+    controller.observe(900)
+    assert controller.estimate_mb == 260
+    controller.observe(500)
+    assert controller.estimate_mb == 200
+    assert AdmissionController(ceiling_mb=0, rss=FakeRss(10**6)).admit("S6")
+
+
+def test_memory_ceiling_follows_lambda_memory_size(monkeypatch):
+    """The ceiling is a share of the function memory unless set explicitly."""
+    monkeypatch.delenv("ANALYZER_MEMORY_CEILING_MB", raising=False)
+    monkeypatch.delenv("AWS_LAMBDA_FUNCTION_MEMORY_SIZE", raising=False)
+    assert memory_ceiling_mb() == 1536
+
+    monkeypatch.setenv("AWS_LAMBDA_FUNCTION_MEMORY_SIZE", "3008")
+    assert memory_ceiling_mb() == 2256
+
+    monkeypatch.setenv("ANALYZER_MEMORY_CEILING_MB", "0")
+    assert memory_ceiling_mb() == 0
+
+
+def test_admission_waits_for_in_flight_submission():
+    """A submission that does not fit is admitted once an in-flight one releases."""
+    controller = AdmissionController(
+        ceiling_mb=1000, estimate_mb=300, wait_seconds=5, rss=FakeRss(500)
+    )
+    assert controller.admit("S1")
+    admitted = []
+    waiter = threading.Thread(target=lambda: admitted.append(controller.admit("S2")))
+    waiter.start()
+    while not controller.stats["waited"]:
+        threading.Event().wait(0.01)
+
+    controller.release("S1")
+    waiter.join(5)
+
+    assert admitted == [True]
+    assert controller.in_flight == 1
+
+
+def _run_handler_over_ceiling(event: dict) -> tuple[dict, MagicMock, AdmissionController]:
+    """Run the handler with a first submission that leaves RSS over the ceiling."""
+    rss = FakeRss(100)
+    controller = AdmissionController(ceiling_mb=1000, estimate_mb=200, wait_seconds=0, rss=rss)
+
+    def analyze(**kwargs):
+        rss.mb = 1100  # retained by the first submission
+        return {"success": True, "disqualified": True, "disqualification_reason": "no CI"}
+
+    with (
+        patch("src.analysis.lambda_handler.get_dynamodb_helper"),
+        patch("src.analysis.lambda_handler.HackathonService"),
+        patch("src.analysis.lambda_handler.SubmissionService"),
+        patch("src.analysis.lambda_handler.AnalysisService") as analysis_cls,
+        patch("src.analysis.lambda_handler.CostService"),
+        patch("src.analysis.lambda_handler.analyze_single_submission", side_effect=analyze),
+        patch("src.analysis.lambda_handler.get_admission_controller", return_value=controller),
+    ):
+        analysis = analysis_cls.return_value
+        analysis.get_job_record.return_value = {}
+        analysis.invoke_analyzer.return_value = True
+
+        result = handler(event, {})
+
+    return result, analysis, controller
+
+
+def test_handler_defers_submissions_that_do_not_fit():
+    """When memory runs short the rest of the job goes to a continuation."""
+    event = {"job_id": "J1", "hack_id": "H1", "submission_ids": ["S1", "S2", "S3"]}
+
+    result, analysis, controller = _run_handler_over_ceiling(event)
+
+    assert result["statusCode"] == 202
+    payload = analysis.invoke_analyzer.call_args[0][0]
+    assert payload["submission_ids"] == ["S2", "S3"]
+    assert payload["memory_continuations"] == 1
+    assert [c[1]["sub_id"] for c in analysis.record_submission_outcome.call_args_list] == ["S1"]
+    assert controller.in_flight == 0
+    assert controller.stats["refused"] == 1
+
+
+def test_handler_stops_deferring_after_max_memory_continuations():
+    """A job that has been handed off for memory enough times runs the rest in place."""
+    event = {
+        "job_id": "J1",
+        "hack_id": "H1",
+        "submission_ids": ["S1", "S2", "S3"],
+        "memory_continuations": 5,
+    }
+
+    result, analysis, controller = _run_handler_over_ceiling(event)
+
+    assert result["statusCode"] == 200
+    analysis.invoke_analyzer.assert_not_called()
+    assert len(analysis.record_submission_outcome.call_args_list) == 3
+    assert controller.stats["overridden"] == 2
+
+
+class _Scores:
+    def model_dump(self) -> dict:
+        return {"correctness": 8.0}
+
+
+class _RepoData:
+    def __init__(self):
+        self.meta = MagicMock(model_dump=lambda: {"commit_count": 3})
+
+
+class _AgentResponse:
+    overall_score = 8.0
+    confidence = 0.9
+    summary = "Solid"
+    scores = _Scores()
+    evidence: list = []
+
+    def model_dump(self) -> dict:
+        return {"overall_score": self.overall_score}
+
+
+def test_repository_is_released_before_results_are_stored():
+    """Extracted files are freed once the agents finish, before any SCORE item is written."""
+    repo_refs: list[weakref.ref] = []
+
+    def clone_and_extract(**kwargs):
+        repo_data = _RepoData()
+        repo_refs.append(weakref.ref(repo_data))
+        return repo_data
+
+    class FakeOrchestrator:
+        async def analyze_submission(self, **kwargs):
+            return {
+                "agent_responses": {AgentName.BUG_HUNTER: _AgentResponse()},
+                "overall_score": 80.0,
+                "weighted_scores": {},
+                "recommendation": "solid_submission",
+                "confidence": 0.9,
+                "strengths": [],
+                "weaknesses": [],
+                "total_cost_usd": 0.01,
+                "total_tokens": 100,
+                "analysis_duration_ms": 10,
+                "cost_records": [],
+            }
+
+    repo_alive_at_store = []
+    db = MagicMock()
+    db.put_agent_score.side_effect = lambda _item: repo_alive_at_store.append(
+        repo_refs[0]() is not None
+    )
+    actions = {"disqualified": False, "workflow_runs": [], "workflow_definitions": []}
+    submission = SimpleNamespace(
+        sub_id="S1", hack_id="H1", repo_url="https://github.com/o/r", team_name="Team"
+    )
+    hackathon = MagicMock(agents_enabled=[AgentName.BUG_HUNTER], budget_limit_usd=None)
+    ledger = MemoryLedger("S1")
+
+    with (
+        patch("src.analysis.lambda_handler.ActionsAnalyzer") as actions_cls,
+        patch("src.analysis.lambda_handler.clone_and_extract", side_effect=clone_and_extract),
+        patch("src.analysis.lambda_handler.AnalysisOrchestrator", FakeOrchestrator),
+        ledger.activate(),
+    ):
+        actions_cls.return_value.analyze.return_value = actions
+        result = analyze_single_submission(submission, hackathon, db)
+
+    assert result["success"]
+    assert result["repo_meta"] == {"commit_count": 3}
+    assert result["agent_scores"] == {"bug_hunter": {"overall_score": 8.0, "confidence": 0.9}}
+    assert repo_alive_at_store == [False]
+    assert [s.stage for s in ledger.snapshots] == [
+        "actions_analyzer",
+        "git_clone_and_extract",
+        "orchestrator_analysis",
+        "repo_released",
+        "agent_scores_stored",
+    ]
@@ -1,5 +1,6 @@
 """Unit tests for analysis orchestrator."""
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -539,6 +540,72 @@ class TestCostTracking:
         assert result["analysis_duration_ms"] >= 0
 
 
+# ============================================================
+# STAGE SCHEDULING TESTS
+# ============================================================
+
+
+class TestStageScheduling:
+    """Tests for running the deterministic stages alongside the agents."""
+
+    @pytest.mark.asyncio
+    async def test_cpu_stages_overlap_agents(
+        self,
+        mock_bedrock_client,
+        sample_repo_data,
+        sample_rubric,
+    ):
+        """Team analysis runs while the agent calls Bedrock; feedback waits for strategy."""
+        agent_started = threading.Event()
+        team_started = threading.Event()
+        rendezvous = []
+
+        # The agent and team analysis each wait for the other to start, which
+        # only succeeds if they run at the same time
+        def converse(*args, **kwargs):
+            agent_started.set()
+            rendezvous.append(team_started.wait(timeout=5))
+            return build_bedrock_response(build_bug_hunter_json())
+
+        mock_bedrock_client.converse.side_effect = converse
+        mock_bedrock_client.parse_json_response.side_effect = [
+            build_complete_bug_hunter_dict(overall_score=8.0, confidence=0.9),
+        ]
+
+        orchestrator = AnalysisOrchestrator(bedrock_client=mock_bedrock_client)
+        team_analyze = orchestrator.team_analyzer.analyze
+
+        def team_analysis_waiting_for_agent(*args, **kwargs):
+            team_started.set()
+            rendezvous.append(agent_started.wait(timeout=5))
+            return team_analyze(*args, **kwargs)
+
+        with patch.object(
+            orchestrator.team_analyzer, "analyze", side_effect=team_analysis_waiting_for_agent
+        ):
+            result = await orchestrator.analyze_submission(
+                repo_data=sample_repo_data,
+                hackathon_name="Test Hackathon",
+                team_name="Test Team",
+                hack_id="HACK#123",
+                sub_id="SUB#456",
+                rubric=sample_rubric,
+                agents_enabled=[AgentName.BUG_HUNTER],
+            )
+
+        assert rendezvous == [True, True]
+        assert result["team_analysis"] is not None
+
+        timings = {timing.stage: timing for timing in result["stage_timings"]}
+        agent = timings["agent:bug_hunter"]
+        feedback = timings["brand_voice_transformer"]
+        assert timings["team_analyzer"].start_ms < agent.end_ms
+        assert timings["source_index"].end_ms <= timings["strategy_detector"].start_ms
+        assert feedback.start_ms >= timings["strategy_detector"].end_ms
+        assert feedback.start_ms >= agent.end_ms
+        assert "actions_analyzer" not in timings
+
+
 # ============================================================
 # STRENGTHS AND WEAKNESSES AGGREGATION TESTS
 # ============================================================
@@ -0,0 +1,292 @@
+"""Unit tests for the incrementally maintained organizer intelligence aggregate."""
+
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from src.analysis.dashboard_aggregator import DashboardAggregator
+from src.analysis.intelligence_aggregate import IntelligenceAggregate
+from src.models.submission import SubmissionResponse
+from src.models.team_dynamics import (
+    ContributorRole,
+    HiringSignals,
+    IndividualScorecard,
+    WorkStyle,
+)
+from src.services.organizer_intelligence_service import OrganizerIntelligenceService
+from src.utils.dynamo import estimate_item_size
+
+
+def _submission(i: int, score: float, weaknesses: list[str] | None = None) -> dict:
+    return {
+        "sub_id": f"S{i}",
+        "team_name": f"Team {i}",
+        "overall_score": score,
+        "strengths": [f"Strength {i}"],
+        "weaknesses": weaknesses or [],
+        "repo_meta": {
+            "primary_language": "Python" if i % 2 else "TypeScript",
+            "languages": {"Python": 70, "TypeScript": 30},
+            "has_ci": i % 3 == 0,
+            "has_dockerfile": False,
+            "workflow_run_count": 10,
+            "workflow_success_rate": 0.95,
+        },
+    }
+
+
+def _scorecard(
+    name: str, role: str, must_interview: bool, files_touched: list[str] | None = None
+) -> dict:
+    return IndividualScorecard(
+        contributor_name=name,
+        contributor_email=f"{name}@example.com",
+        role=ContributorRole(role),
+        expertise_areas=[],
+        commit_count=10,
+        lines_added=100,
+        lines_deleted=10,
+        files_touched=files_touched or [],
+        notable_contributions=[],
+        strengths=[],
+        weaknesses=[],
+        growth_areas=[],
+        work_style=WorkStyle(
+            commit_frequency="frequent",
+            avg_commit_size=10,
+            active_hours=[10],
+            late_night_commits=0,
+            weekend_commits=0,
+        ),
+        hiring_signals=HiringSignals(
+            recommended_role="Engineer",
+            seniority_level="mid",
+            salary_range_usd="$80k-$100k",
+            must_interview=must_interview,
+            sponsor_interest=[],
+            rationale="",
+        ),
+    ).model_dump(mode="json")
+
+
+def _team_analysis(grade: str, role: str = "backend", must_interview: bool = False) -> dict:
+    return {
+        "team_dynamics_grade": grade,
+        "collaboration_patterns": [{"pattern_type": "pair_programming"}],
+        "red_flags": [],
+        "individual_scorecards": [_scorecard(f"Dev {grade}", role, must_interview)],
+    }
+
+
+def _seed(db, hack_id: str, submission: dict, team: dict | None = None) -> None:
+    db.table.put_item(
+        Item=db._serialize_item(
+            {"PK": f"HACK#{hack_id}", "SK": f"SUB#{submission['sub_id']}", **submission}
+        )
+    )
+    if team:
+        db.put_team_analysis({"PK": f"SUB#{submission['sub_id']}", "SK": "TEAM_ANALYSIS", **team})
+
+
+def _service(db, submission_count: int = 0) -> OrganizerIntelligenceService:
+    hackathons = MagicMock()
+    hackathons.get_hackathon.return_value = SimpleNamespace(
+        name="Test Hackathon", submission_count=submission_count
+    )
+    return OrganizerIntelligenceService(db, hackathons, MagicMock())
+
+
+# ============================================================
+# AGGREGATE
+# ============================================================
+
+
+def test_refold_replaces_previous_contribution():
+    """Re-analyzing a submission does not double count it."""
+    aggregate = IntelligenceAggregate()
+    aggregate.fold(**_submission(1, 70.0, ["No tests"]), team_analysis=_team_analysis("B"))
+    aggregate.fold(**_submission(1, 90.0, ["Missing README"]), team_analysis=_team_analysis("A"))
+
+    dashboard = aggregate.render("H1", "Hack", 1)
+    assert aggregate.analyzed_count == 1
+    assert [p.overall_score for p in dashboard.top_performers] == [90.0]
+    assert dashboard.technology_trends.most_used == [("Python", 1)]
+    assert [i.issue_type for i in dashboard.common_issues] == ["poor_documentation"]
+    assert aggregate.state["role_counts"] == {"backend": 1}
+
+    assert aggregate.retract("S1")
+    assert aggregate.to_state() == IntelligenceAggregate().to_state()
+
+
+def test_incremental_folds_match_batch_aggregation():
+    """Folding one submission at a time (any order) equals the batch dashboard."""
+    submissions = [
+        _submission(i, 50.0 + i, ["Low test coverage"] if i % 2 else []) for i in range(12)
+    ]
+
+    incremental = IntelligenceAggregate()
+    for submission in reversed(submissions):
+        incremental.fold(**submission)
+
+    batch = DashboardAggregator().generate_dashboard(
+        "H1",
+        "Hack",
+        [
+            SubmissionResponse(
+                hack_id="H1", repo_url="https://github.com/o/r", status="completed", **s
+            )
+            for s in submissions
+        ],
+        {},
+        {},
+    )
+    dashboard = incremental.render("H1", "Hack", len(submissions))
+
+    assert dashboard.top_performers == batch.top_performers
+    assert dashboard.technology_trends == batch.technology_trends
+    assert (
+        dashboard.common_issues[0].percentage_affected == batch.common_issues[0].percentage_affected
+    )
+    assert [p.prize_category for p in dashboard.prize_recommendations] == [
+        p.prize_category for p in batch.prize_recommendations
+    ]
+
+
+# ============================================================
+# MATERIALIZED ITEM
+# ============================================================
+
+
+def test_dashboard_is_built_once_then_read_from_item(dynamodb_helper):
+    """The first read builds the INTELLIGENCE item; later reads are one GetItem."""
+    for i in range(3):
+        _seed(dynamodb_helper, "H1", _submission(i, 60.0 + i), _team_analysis("B"))
+    service = _service(dynamodb_helper, submission_count=4)
+
+    first = service.generate_dashboard("H1")
+    dynamodb_helper.list_submissions = MagicMock(wraps=dynamodb_helper.list_submissions)
+    second = service.generate_dashboard("H1")
+
+    assert second == first
+    assert first.total_submissions == 4
+    assert first.top_performers[0].sub_id == "S2"
+    dynamodb_helper.list_submissions.assert_not_called()
+    assert dynamodb_helper.get_intelligence("H1")["version"] == 1
+
+
+def test_record_submission_folds_into_item(dynamodb_helper):
+    """An analyzed submission updates the stored aggregate without a rebuild."""
+    _seed(dynamodb_helper, "H1", _submission(1, 60.0))
+    service = _service(dynamodb_helper)
+    service.generate_dashboard("H1")
+    _seed(dynamodb_helper, "H1", _submission(2, 95.0))
+    dynamodb_helper.list_submissions = MagicMock(wraps=dynamodb_helper.list_submissions)
+
+    assert service.record_submission(
+        "H1", **_submission(2, 95.0), team_analysis=_team_analysis("A", must_interview=True)
+    )
+    assert dynamodb_helper.get_intelligence_contribution("H1", "S2")["roles"] == ["backend"]
+    dashboard = service.generate_dashboard("H1")
+
+    dynamodb_helper.list_submissions.assert_not_called()
+    assert [p.sub_id for p in dashboard.top_performers] == ["S2", "S1"]
+    assert dashboard.prize_recommendations[1].prize_category == "Best Team Dynamics"
+    assert len(dashboard.hiring_intelligence.must_interview) == 1
+    assert dynamodb_helper.get_intelligence("H1")["version"] == 2
+
+    assert service.remove_submission("H1", "S2")
+    assert [p.sub_id for p in service.generate_dashboard("H1").top_performers] == ["S1"]
+    assert dynamodb_helper.get_intelligence_contribution("H1", "S2") is None
+
+
+def test_item_stays_small_for_a_large_hackathon(dynamodb_helper):
+    """Candidates are stored as summaries and contributions on the SUB items."""
+    files = [f"src/module_{i}/handler_{i}.py" for i in range(500)]
+    roles = ("backend", "frontend", "full_stack")
+
+    def team(i: int) -> dict:
+        return {
+            "team_dynamics_grade": "B",
+            "collaboration_patterns": [],
+            "red_flags": [],
+            "individual_scorecards": [
+                _scorecard(f"Dev {i}-{role}", role, must_interview=i % 7 == 0, files_touched=files)
+                for role in roles
+            ],
+        }
+
+    aggregate = IntelligenceAggregate()
+    for i in range(1, 200):
+        aggregate.fold(**_submission(i, 50.0 + i % 40), team_analysis=team(i))
+    assert dynamodb_helper.put_intelligence("H1", aggregate.to_state())
+    _seed(dynamodb_helper, "H1", _submission(7, 57.0))
+    assert dynamodb_helper.put_intelligence_contribution("H1", "S7", aggregate.contributions["S7"])
+    _seed(dynamodb_helper, "H1", _submission(0, 50.0))
+
+    service = _service(dynamodb_helper, submission_count=200)
+    assert service.record_submission("H1", **_submission(0, 50.0), team_analysis=team(0))
+    # Re-analysis replaces the submission's contribution
+    assert service.record_submission("H1", **_submission(7, 99.0), team_analysis=team(7))
+
+    item = dynamodb_helper.get_intelligence("H1")
+    assert item["stale"] is False
+    assert estimate_item_size(item) < 20_000
+    assert item["role_counts"] == {"backend": 200, "frontend": 200, "full_stack": 200}
+    assert item["analyzed_count"] == 200
+    dashboard = service.generate_dashboard("H1")
+    assert dashboard.top_performers[0].sub_id == "S7"
+    assert dashboard.hiring_intelligence.backend_candidates[0].contributor_name.startswith("Dev")
+
+
+def test_item_without_contribution_count_is_rebuilt(dynamodb_helper):
+    """An item that still holds contributions is rebuilt, moving them to the SUB items."""
+    _seed(dynamodb_helper, "H1", _submission(1, 60.0), _team_analysis("B"))
+    legacy = {**IntelligenceAggregate().to_state(), "contributions": {}}
+    del legacy["analyzed_count"]
+    dynamodb_helper.put_intelligence("H1", legacy)
+
+    dashboard = _service(dynamodb_helper).generate_dashboard("H1")
+
+    assert [p.sub_id for p in dashboard.top_performers] == ["S1"]
+    assert dynamodb_helper.get_intelligence("H1")["analyzed_count"] == 1
+    assert dynamodb_helper.get_intelligence_contribution("H1", "S1")["roles"] == ["backend"]
+
+
+def test_version_conflict_is_rejected(dynamodb_helper):
+    """Writes based on an outdated version fail instead of overwriting."""
+    assert dynamodb_helper.put_intelligence("H1", IntelligenceAggregate().to_state())
+    assert not dynamodb_helper.put_intelligence("H1", IntelligenceAggregate().to_state())
+    assert dynamodb_helper.put_intelligence("H1", IntelligenceAggregate().to_state(), 1)
+    assert not dynamodb_helper.put_intelligence("H1", IntelligenceAggregate().to_state(), 1)
+
+
+def test_contended_fold_marks_item_stale_and_read_rebuilds(dynamodb_helper):
+    """After repeated conflicts the item is rebuilt on the next read."""
+    _seed(dynamodb_helper, "H1", _submission(1, 60.0))
+    service = _service(dynamodb_helper)
+    service.generate_dashboard("H1")
+    _seed(dynamodb_helper, "H1", _submission(2, 80.0))
+
+    put = dynamodb_helper.put_intelligence
+    dynamodb_helper.put_intelligence = MagicMock(return_value=False)
+    assert not service.record_submission("H1", **_submission(2, 80.0))
+    dynamodb_helper.put_intelligence = put
+
+    assert dynamodb_helper.get_intelligence("H1")["stale"] is True
+    dashboard = service.generate_dashboard("H1")
+    assert [p.sub_id for p in dashboard.top_performers] == ["S2", "S1"]
+    assert dynamodb_helper.get_intelligence("H1")["stale"] is False
+
+
+def test_item_state_round_trips_through_dynamodb(dynamodb_helper):
+    """Stored Decimals load back as the same aggregate."""
+    aggregate = IntelligenceAggregate()
+    aggregate.fold(**_submission(1, 72.5, ["SQL injection"]), team_analysis=_team_analysis("A"))
+    dynamodb_helper.put_intelligence("H1", aggregate.to_state())
+
+    loaded = IntelligenceAggregate.from_item(dynamodb_helper.get_intelligence("H1"))
+
+    assert loaded.to_state() == aggregate.to_state()
+    assert isinstance(loaded.state["top_performers"][0]["overall_score"], float)
+    assert loaded.version == 1
+    assert isinstance(dynamodb_helper.get_intelligence("H1")["version"], Decimal)
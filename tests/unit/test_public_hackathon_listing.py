@@ -0,0 +1,130 @@
+"""Unit tests for the GSI-backed, cached public hackathon listing."""
+
+import importlib.util
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.models.common import AgentName
+from src.models.hackathon import HackathonCreate, RubricConfig, RubricDimension
+from src.services.hackathon_service import HackathonService, clear_public_listing_cache
+
+
+@pytest.fixture(autouse=True)
+def _empty_listing_cache():
+    clear_public_listing_cache()
+    yield
+    clear_public_listing_cache()
+
+
+def _create(service: HackathonService, name: str, activate: bool = True) -> str:
+    hackathon = service.create_hackathon(
+        "O1",
+        HackathonCreate(
+            name=name,
+            description=f"{name} description",
+            rubric=RubricConfig(
+                dimensions=[
+                    RubricDimension(
+                        name="Quality",
+                        description="Code quality",
+                        weight=1.0,
+                        agent=AgentName.BUG_HUNTER,
+                    )
+                ]
+            ),
+            agents_enabled=[AgentName.BUG_HUNTER],
+        ),
+    )
+    if activate:
+        service.activate_hackathon(hackathon.hack_id, "O1")
+    return hackathon.hack_id
+
+
+def test_listing_follows_status_changes(dynamodb_helper):
+    """Only CONFIGURED hackathons are listed; activation and archiving move them."""
+    service = HackathonService(dynamodb_helper)
+    draft = _create(service, "Draft", activate=False)
+    live = _create(service, "Live")
+
+    assert [h.hack_id for h in service.list_public_hackathons().hackathons] == [live]
+
+    service.activate_hackathon(draft, "O1")
+    service.delete_hackathon(live, "O1")
+    listed = service.list_public_hackathons().hackathons
+
+    assert [h.hack_id for h in listed] == [draft]
+    assert listed[0].name == "Draft"
+    assert listed[0].description == "Draft description"
+
+
+def test_listing_pages_with_cursor_without_scan_or_item_reads(dynamodb_helper, monkeypatch):
+    """Pages come from one index query each; no scan, no per-hackathon GetItem."""
+    service = HackathonService(dynamodb_helper)
+    created = [_create(service, f"Hack {i}") for i in range(5)]
+    dynamodb_helper.add_submission_count(created[0], 3)
+    monkeypatch.setattr(dynamodb_helper.table, "scan", MagicMock(side_effect=AssertionError))
+    monkeypatch.setattr(dynamodb_helper, "get_hackathon", MagicMock(side_effect=AssertionError))
+
+    seen = []
+    cursor = None
+    pages = 0
+    while True:
+        page = service.list_public_hackathons(limit=2, cursor=cursor)
+        seen.extend(page.hackathons)
+        pages += 1
+        if not page.has_more:
+            break
+        cursor = page.next_cursor
+
+    assert pages == 3
+    assert [h.hack_id for h in seen] == list(reversed(created))
+    assert seen[-1].submission_count == 3
+
+
+def test_listing_pages_are_cached_briefly(dynamodb_helper, monkeypatch):
+    """Repeated reads within the TTL are served from memory; changes clear the cache."""
+    service = HackathonService(dynamodb_helper)
+    _create(service, "Live")
+    query = MagicMock(wraps=dynamodb_helper.list_hackathons_by_status_page)
+    monkeypatch.setattr(dynamodb_helper, "list_hackathons_by_status_page", query)
+
+    first = service.list_public_hackathons()
+    assert service.list_public_hackathons() is first
+    assert query.call_count == 1
+
+    service.list_public_hackathons(max_age_seconds=0)
+    assert query.call_count == 2
+
+    _create(service, "Second")
+    assert len(service.list_public_hackathons().hackathons) == 2
+
+
+def test_listing_rejects_invalid_cursor(dynamodb_helper):
+    """A malformed cursor is a ValueError (400 at the route)."""
+    with pytest.raises(ValueError):
+        HackathonService(dynamodb_helper).list_public_hackathons(cursor="not-a-cursor")
+
+
+def test_backfill_indexes_legacy_hackathons(dynamodb_helper):
+    """Hackathons written before GSI3 existed are keyed by the backfill script."""
+    dynamodb_helper.table.put_item(
+        Item={
+            "PK": "HACK#H1",
+            "SK": "META",
+            "hack_id": "H1",
+            "name": "Legacy",
+            "status": "configured",
+            "created_at": "2026-01-01T00:00:00+00:00",
+        }
+    )
+    path = Path(__file__).resolve().parents[2] / "scripts" / "backfill_status_index.py"
+    spec = importlib.util.spec_from_file_location("backfill_status_index", path)
+    backfill = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(backfill)
+
+    assert backfill.backfill(dynamodb_helper, dry_run=False) == {"updated": 1, "current": 0}
+    assert backfill.backfill(dynamodb_helper, dry_run=False) == {"updated": 0, "current": 1}
+    listed = HackathonService(dynamodb_helper).list_public_hackathons().hackathons
+    assert [h.name for h in listed] == ["Legacy"]
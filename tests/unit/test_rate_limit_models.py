@@ -411,7 +411,7 @@ class TestSecurityEvent:
 
     def test_event_type_validation(self) -> None:
         """Test that event_type must be one of valid types."""
-        valid_types = ["auth_failure", "rate_limit", "budget_exceeded", "anomaly"]
+        valid_types = ["auth_failure", "rate_limit", "budget_exceeded", "server_error", "anomaly"]
         timestamp = datetime.utcnow()
         ttl = int((timestamp + timedelta(days=30)).timestamp())
 
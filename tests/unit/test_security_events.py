@@ -0,0 +1,243 @@
+"""Unit tests for the security event sink, anomaly window and security middleware."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from src.api.middleware.security import SecurityLoggerMiddleware
+from src.models.rate_limit import SecurityEvent, Severity
+from src.utils.security_events import SecurityEventSink, SlidingWindowCounter
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _event(
+    status_code: int = 401,
+    endpoint: str = "/api/v1/hackathons",
+    severity: Severity = Severity.MEDIUM,
+    prefix: str = "vj_live_",
+) -> SecurityEvent:
+    timestamp = datetime.utcnow()
+    event = SecurityEvent(
+        event_id=f"E{timestamp.timestamp()}",
+        event_type="auth_failure",
+        api_key_prefix=prefix,
+        endpoint=endpoint,
+        status_code=status_code,
+        severity=severity,
+        timestamp=timestamp,
+        ttl=SecurityEvent.calculate_ttl(timestamp),
+    )
+    event.set_dynamodb_keys()
+    return event
+
+
+def _security_events(db) -> list[dict]:
+    return [i for i in db.table.scan()["Items"] if i["PK"].startswith("SECURITY#")]
+
+
+# ============================================================
+# SLIDING WINDOW
+# ============================================================
+
+
+def test_window_reports_only_the_threshold_crossing():
+    """A key over the threshold is reported once, not on every request."""
+    clock = FakeClock()
+    counter = SlidingWindowCounter(threshold=3, window_seconds=60, clock=clock)
+
+    results = [counter.hit("k") for _ in range(6)]
+
+    assert results == [None, None, None, 4, None, None]
+
+
+def test_window_expires_old_requests_and_rearms():
+    """Requests leave the window after it elapses; the key can cross again."""
+    clock = FakeClock()
+    counter = SlidingWindowCounter(threshold=2, window_seconds=10, clock=clock)
+    for _ in range(3):
+        counter.hit("k")
+
+    clock.now += 10
+    assert counter.hit("k") is None
+    assert counter.hit("k") is None
+    assert counter.hit("k") == 3
+
+
+def test_window_evicts_least_recently_seen_keys():
+    """Tracked keys are bounded."""
+    counter = SlidingWindowCounter(threshold=1, max_keys=2, clock=FakeClock())
+    counter.hit("a")
+    counter.hit("b")
+    counter.hit("c")
+
+    assert counter.hit("a") is None  # "a" was evicted and starts from zero
+
+
+# ============================================================
+# EVENT SINK
+# ============================================================
+
+
+def test_repeated_events_are_sampled_with_suppressed_counts(dynamodb_helper):
+    """The first repeats are kept, then one in sample_rate with a suppressed count."""
+    sink = SecurityEventSink(dynamodb_helper, sample_first=2, sample_rate=5, clock=FakeClock())
+    kept = [e for e in (_event() for _ in range(12)) if sink.submit(e)]
+
+    assert len(kept) == 4  # events 1, 2, 7, 12
+    assert "suppressed_count" not in kept[1].metadata
+    assert kept[2].metadata["suppressed_count"] == 4
+    assert sink.stats["sampled_out"] == 8
+
+
+def test_sampling_is_per_key_and_window(dynamodb_helper):
+    """Different endpoints sample independently; a new window starts fresh."""
+    clock = FakeClock()
+    sink = SecurityEventSink(
+        dynamodb_helper, sample_first=1, sample_rate=100, dedup_window_seconds=60, clock=clock
+    )
+
+    assert sink.submit(_event(endpoint="/a"))
+    assert sink.submit(_event(endpoint="/b"))
+    assert not sink.submit(_event(endpoint="/a"))
+    clock.now += 60
+    assert sink.submit(_event(endpoint="/a"))
+
+
+def test_critical_events_bypass_sampling(dynamodb_helper):
+    """Critical events are always queued."""
+    sink = SecurityEventSink(dynamodb_helper, sample_first=0, sample_rate=1000)
+
+    assert sink.submit(_event(severity=Severity.CRITICAL))
+    assert sink.submit(_event(severity=Severity.CRITICAL))
+
+
+def test_queue_is_bounded(dynamodb_helper):
+    """Events beyond the queue size are dropped, not buffered without limit."""
+    sink = SecurityEventSink(dynamodb_helper, max_queue_size=3, sample_first=100)
+    results = [sink.submit(_event()) for _ in range(5)]
+
+    assert results == [True, True, True, False, False]
+    assert sink.stats["dropped"] == 2
+
+
+def test_flush_writes_batches(dynamodb_helper):
+    """Queued events are written in batch-size chunks."""
+    sink = SecurityEventSink(dynamodb_helper, batch_size=25, sample_first=100)
+    for i in range(30):
+        sink.submit(_event(endpoint=f"/e{i}"))
+
+    assert sink.flush_due()
+    assert sink.flush() == 30
+    assert sink.queue_depth == 0
+    assert len(_security_events(dynamodb_helper)) == 30
+
+
+def test_flush_counts_unprocessed_items_as_failed():
+    """Items the scheduled batch write returns unwritten are counted as failed."""
+    db = MagicMock()
+    db.batch_put_items.side_effect = lambda items: items[:2]
+    sink = SecurityEventSink(db, batch_size=25, sample_first=100)
+    for i in range(5):
+        sink.submit(_event(endpoint=f"/e{i}"))
+
+    assert sink.flush() == 3
+    assert sink.stats["written"] == 3
+    assert sink.stats["failed"] == 2
+    db.batch_write.assert_not_called()
+
+
+def test_flush_due_after_interval(dynamodb_helper):
+    """A partial batch is flushed once the interval elapses."""
+    clock = FakeClock()
+    sink = SecurityEventSink(dynamodb_helper, flush_interval_seconds=5, clock=clock)
+    sink.submit(_event())
+
+    assert not sink.flush_due()
+    clock.now += 5
+    assert sink.flush_due()
+
+
+# ============================================================
+# MIDDLEWARE
+# ============================================================
+
+
+def _client(dynamodb_helper, sink, threshold=100) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/ok")
+    def ok():
+        return {"ok": True}
+
+    @app.get("/denied")
+    def denied():
+        return JSONResponse({"error": "Invalid API key"}, status_code=401)
+
+    app.add_middleware(
+        SecurityLoggerMiddleware,
+        db_helper=dynamodb_helper,
+        anomaly_threshold=threshold,
+        event_sink=sink,
+    )
+    return TestClient(app)
+
+
+def test_middleware_persists_events_after_response(dynamodb_helper):
+    """Auth failures are written by the post-response flush, with full event fields."""
+    sink = SecurityEventSink(dynamodb_helper, flush_interval_seconds=0)
+    client = _client(dynamodb_helper, sink)
+
+    assert client.get("/denied", headers={"X-API-Key": "vj_live_secret"}).status_code == 401
+    assert client.get("/denied").status_code == 401
+
+    events = _security_events(dynamodb_helper)
+    assert sorted(e["api_key_prefix"] for e in events) == ["--------", "vj_live_"]
+    assert {e["endpoint"] for e in events} == {"/denied"}
+    assert {e["status_code"] for e in events} == {401}
+    assert sink.queue_depth == 0
+
+
+def test_middleware_logs_anomaly_once_per_crossing(dynamodb_helper):
+    """A burst above the threshold produces a single anomaly event, without reads."""
+    sink = SecurityEventSink(dynamodb_helper, flush_interval_seconds=0)
+    client = _client(dynamodb_helper, sink, threshold=5)
+
+    for _ in range(12):
+        assert client.get("/ok", headers={"X-API-Key": "vj_live_burst"}).status_code == 200
+
+    events = _security_events(dynamodb_helper)
+    assert [e["event_type"] for e in events] == ["anomaly"]
+    assert events[0]["severity"] == "critical"
+    assert events[0]["metadata"]["request_count"] == 6
+
+
+def test_critical_anomaly_logs_alarm_marker(dynamodb_helper):
+    """A threshold crossing emits the CRITICAL_SECURITY_EVENT marker with its metadata."""
+    sink = SecurityEventSink(dynamodb_helper, flush_interval_seconds=0)
+    middleware = SecurityLoggerMiddleware(
+        FastAPI(), db_helper=dynamodb_helper, anomaly_threshold=2, event_sink=sink
+    )
+
+    with patch("src.api.middleware.security.logger") as logger:
+        for _ in range(3):
+            asyncio.run(middleware._detect_and_log_anomalies("vj_live_burst", "vj_live_", "/ok"))
+
+    logger.error.assert_not_called()
+    logger.critical.assert_called_once()
+    args, kwargs = logger.critical.call_args
+    assert args == ("CRITICAL_SECURITY_EVENT",)
+    assert kwargs["event_type"] == "anomaly"
+    assert kwargs["metadata"]["request_count"] == 3
@@ -0,0 +1,138 @@
+"""Unit tests for the shared source index and keyword matcher."""
+
+import importlib.util
+import random
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from src.analysis.source_index import KeywordMatcher, SourceIndex
+from src.analysis.strategy_detector import StrategyDetector
+from src.analysis.team_analyzer import TeamAnalyzer
+from src.models.analysis import RepoData, SourceFile
+from src.models.submission import RepoMeta
+
+
+def _file(path: str, content: str = "") -> SourceFile:
+    return SourceFile(path=path, content=content, lines=content.count("\n") + 1, language="Python")
+
+
+# ============================================================
+# KEYWORD MATCHER
+# ============================================================
+
+
+def test_matcher_agrees_with_per_rule_substring_checks():
+    """Every rule hit, including overlapping and shared keywords, is reported."""
+    rules = {
+        "security": ["auth", "oauth", "jwt"],
+        "api": ["api", "rest", "route"],
+        "testing": ["test", "pytest", "spec"],
+        "infra": ["ci", "cd", "Docker"],
+    }
+    matcher = KeywordMatcher(rules)
+    rng = random.Random(3)
+    alphabet = "abcdeijkoprstuw /."
+
+    for _ in range(500):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        expected = {
+            rule for rule, keywords in rules.items() if any(k.lower() in text for k in keywords)
+        }
+        assert matcher.match(text) == expected
+        for rule in rules:
+            assert matcher.matches(text, rule) == (rule in expected)
+
+    assert matcher.match("src/oauth/pytest_routes.py") == {"security", "api", "testing"}
+
+
+def test_index_lowers_once_and_caches_rule_answers():
+    """Repeated questions about a file do not rescan or re-lower it."""
+    matcher = KeywordMatcher({"todo": ["todo"], "cache": ["redis"]})
+    matcher.matches = MagicMock(wraps=matcher.matches)
+    source = _file("SRC/App.PY", "# TODO: add Redis")
+    index = SourceIndex([source], "## Problem")
+
+    for _ in range(3):
+        assert index.content_matches(source, matcher, "todo")
+        assert index.path_hits(source.path, matcher) == frozenset()
+
+    assert matcher.matches.call_count == 1
+    assert index.content_lower(source) == "# todo: add redis"
+    assert index.path_lower(source.path) == "src/app.py"
+    assert index.readme_lower == "## problem"
+
+    unindexed = _file("notes.md", "Nothing to do")
+    assert not index.content_matches(unindexed, matcher, "todo")
+
+
+# ============================================================
+# ANALYZERS
+# ============================================================
+
+
+def _repo() -> RepoData:
+    return RepoData(
+        repo_url="https://github.com/test/repo",
+        repo_owner="test",
+        repo_name="repo",
+        meta=RepoMeta(),
+        readme_content="## API\nGET /api/items returns items",
+        source_files=[
+            _file("tests/test_auth.py", "def test_login(): pass"),
+            _file("src/services/cache.py", "import redis\n# TODO remove"),
+            _file("docs/architecture.png"),
+            _file("openapi.yaml", "openapi: 3.0.0"),
+            _file("src/App.tsx", "export const App = () => null"),
+        ],
+    )
+
+
+def test_strategy_detector_uses_shared_index():
+    """Detectors answer from the shared index; results match a fresh index."""
+    repo = _repo()
+    detector = StrategyDetector()
+    index = SourceIndex.from_repo_data(repo)
+
+    assert detector._detect_context_awareness(repo, index) == {
+        "has_problem_statement": False,
+        "has_architecture_diagram": True,
+        "has_api_docs": True,
+    }
+    assert detector._has_scalability_concerns(repo.source_files, index)
+    assert detector._has_fast_implementation_patterns(repo.source_files, index)
+    assert detector._detect_critical_path_focus(repo.source_files, index)
+    assert detector._detect_new_technology(repo.source_files, [], index) == "react"
+
+    shared = detector.analyze(repo, source_index=index)
+    fresh = detector.analyze(repo)
+    assert shared.model_dump(exclude={"duration_ms"}) == fresh.model_dump(exclude={"duration_ms"})
+
+
+def test_team_analyzer_scans_each_path_once_across_contributors():
+    """Role and expertise path rules are evaluated once per path, not per contributor."""
+    repo = _repo()
+    index = SourceIndex.from_repo_data(repo)
+    index.path_lower = MagicMock(wraps=index.path_lower)
+    analyzer = TeamAnalyzer()
+    files = [f.path for f in repo.source_files]
+
+    for _ in range(4):
+        role = analyzer._detect_role([], files, index)
+        expertise = analyzer._detect_expertise([], files, index)
+
+    assert index.path_lower.call_count == len(files)
+    assert role == analyzer._detect_role([], files)
+    assert sorted(expertise) == sorted(analyzer._detect_expertise([], files))
+
+
+def test_benchmark_script_runs_on_small_repo():
+    """The micro-benchmark builds its synthetic repo and both scan paths agree."""
+    path = Path(__file__).resolve().parents[2] / "scripts" / "benchmark_source_index.py"
+    spec = importlib.util.spec_from_file_location("benchmark_source_index", path)
+    benchmark = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(benchmark)
+
+    repo = benchmark.synthetic_repo(files=5, lines=20)
+
+    assert len(repo.source_files) == 5
+    assert benchmark.per_method_scans(repo) == benchmark.indexed_scans(repo)
@@ -0,0 +1,273 @@
+"""Unit tests for bulk submission ingestion (claims, batched writes, uploads)."""
+
+import importlib.util
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.dependencies import (
+    get_current_organizer,
+    get_hackathon_service,
+    get_submission_service,
+)
+from src.api.routes.submissions import router
+from src.models.submission import SubmissionBatchCreate, SubmissionInput
+from src.services.submission_service import SubmissionService
+from src.utils.write_scheduler import DynamoDBWriteScheduler, consumed_units
+
+
+def _seed_hackathon(db, hack_id: str = "H1", submission_count: int = 0) -> None:
+    db.table.put_item(
+        Item={
+            "PK": f"HACK#{hack_id}",
+            "SK": "META",
+            "hack_id": hack_id,
+            "org_id": "O1",
+            "submission_count": submission_count,
+        }
+    )
+
+
+def _batch(*repos: str) -> SubmissionBatchCreate:
+    return SubmissionBatchCreate(
+        submissions=[
+            SubmissionInput(team_name=f"Team {i}", repo_url=f"https://github.com/{repo}")
+            for i, repo in enumerate(repos)
+        ]
+    )
+
+
+# ============================================================
+# PARSING
+# ============================================================
+
+
+def test_normalize_repo_url_ignores_case_scheme_and_suffixes():
+    """Spellings of the same repository normalize to one key."""
+    normalize = SubmissionService.normalize_repo_url
+
+    assert normalize("https://GitHub.com/Owner/Repo") == "github.com/owner/repo"
+    assert normalize("https://www.github.com/owner/repo.git/") == "github.com/owner/repo"
+    assert normalize(" github.com/owner/repo/ ") == "github.com/owner/repo"
+
+
+def test_parse_csv_reports_invalid_rows():
+    """Header columns are matched case-insensitively; bad rows become row errors."""
+    content = (
+        "Team_Name,Repo_URL,contact\n"
+        "Nova,https://github.com/nova/app,a@b.c\n"
+        "Bad,https://gitlab.com/x/y,\n"
+        ",https://github.com/x/z,\n"
+    )
+
+    rows, errors = SubmissionService.parse_submission_rows(content, "csv")
+
+    assert [(row, s.team_name) for row, s in rows] == [(1, "Nova")]
+    assert [e.row for e in errors] == [2, 3]
+    assert "repo_url" in errors[0].error
+    assert errors[0].repo_url == "https://gitlab.com/x/y"
+
+
+def test_parse_jsonl_numbers_rows_by_line():
+    """JSONL rows are numbered by line; blank lines are skipped."""
+    content = (
+        '{"team_name": "Nova", "repo_url": "https://github.com/nova/app"}\n'
+        "\n"
+        "{not json\n"
+        '["a list"]\n'
+    )
+
+    rows, errors = SubmissionService.parse_submission_rows(content, "jsonl")
+
+    assert [row for row, _ in rows] == [1]
+    assert [(e.row, e.error.split(":")[0]) for e in errors] == [
+        (3, "Invalid JSON"),
+        (4, "Expected a JSON object"),
+    ]
+
+
+def test_parse_rejects_missing_columns_and_oversized_uploads(monkeypatch):
+    """Whole-upload problems raise ValueError instead of row errors."""
+    with pytest.raises(ValueError, match="repo_url"):
+        SubmissionService.parse_submission_rows("team_name\nNova\n", "csv")
+
+    monkeypatch.setattr("src.services.submission_service.SUBMISSION_UPLOAD_MAX_ROWS", 2)
+    with pytest.raises(ValueError, match="limit is 2"):
+        SubmissionService.parse_submission_rows("team_name,repo_url\na,b\nc,d\ne,f\n", "csv")
+
+
+# ============================================================
+# INGESTION
+# ============================================================
+
+
+def test_ingestion_dedups_with_claims_and_counts_atomically(dynamodb_helper):
+    """Duplicates within and across uploads are rejected per row without listing submissions."""
+    _seed_hackathon(dynamodb_helper, submission_count=2)
+    service = SubmissionService(dynamodb_helper)
+    dynamodb_helper.list_submissions = MagicMock(side_effect=AssertionError("no listing"))
+    dynamodb_helper.put_submission = MagicMock(side_effect=AssertionError("no single puts"))
+
+    first = service.create_submissions(hack_id="H1", data=_batch("a/one", "a/two", "A/One.git"))
+    second = service.create_submissions(hack_id="H1", data=_batch("a/three", "a/two/"))
+
+    assert first.created == 2
+    assert [(e.row, e.error) for e in first.errors] == [
+        (
+            3,
+            "Duplicate submission: Repository 'https://github.com/A/One.git' "
+            "already appears in row 1",
+        )
+    ]
+    assert second.created == 1
+    assert second.errors[0].row == 2
+    assert "already been submitted" in second.errors[0].error
+    assert second.hackathon_submission_count == 5
+    assert dynamodb_helper.get_hackathon("H1")["submission_count"] == 5
+
+    claim = dynamodb_helper.table.get_item(Key={"PK": "HACK#H1", "SK": "REPO#github.com/a/one"})
+    assert claim["Item"]["sub_id"] == first.submissions[0].sub_id
+
+
+def test_large_upload_is_written_in_chunks(dynamodb_helper, monkeypatch):
+    """Claims and submissions for hundreds of rows are chunked to DynamoDB limits."""
+    _seed_hackathon(dynamodb_helper)
+    service = SubmissionService(dynamodb_helper)
+    content = "team_name,repo_url\n" + "".join(
+        f"Team {i},https://github.com/org/repo{i}\n" for i in range(230)
+    )
+    client = dynamodb_helper.table.meta.client
+    transact = MagicMock(wraps=client.transact_write_items)
+    batch = MagicMock(wraps=client.batch_write_item)
+    monkeypatch.setattr(client, "transact_write_items", transact)
+    monkeypatch.setattr(client, "batch_write_item", batch)
+
+    result = service.upload_submissions("H1", content, "csv")
+
+    assert result.created == 230
+    assert result.hackathon_submission_count == 230
+    assert len(dynamodb_helper.list_submissions("H1")) == 230
+    assert transact.call_count == 3
+    assert batch.call_count == 10
+
+
+def test_failed_submission_write_releases_claim(dynamodb_helper):
+    """Rows whose submission write fails are reported and their claim removed."""
+    _seed_hackathon(dynamodb_helper)
+    service = SubmissionService(dynamodb_helper)
+    put = dynamodb_helper.batch_put_items
+    dynamodb_helper.batch_put_items = lambda items: [i for i in items if "two" in i["repo_url"]]
+
+    result = service.create_submissions("H1", _batch("a/one", "a/two"))
+
+    assert result.created == 1
+    assert [(e.row, e.error) for e in result.errors] == [(2, "Failed to store submission")]
+    assert dynamodb_helper.get_hackathon("H1")["submission_count"] == 1
+
+    dynamodb_helper.batch_put_items = put
+    assert service.create_submissions("H1", _batch("a/two")).created == 1
+
+
+def test_batch_write_retries_unprocessed_items():
+    """Unprocessed items are resubmitted; leftovers are returned."""
+    item = {"PutRequest": {"Item": {"PK": "x"}}}
+    operation = MagicMock(
+        side_effect=[
+            {"UnprocessedItems": {"T": [item]}, "ConsumedCapacity": [{"CapacityUnits": 1.0}]},
+            {"UnprocessedItems": {}, "ConsumedCapacity": [{"CapacityUnits": 1.0}]},
+        ]
+    )
+    scheduler = DynamoDBWriteScheduler(write_capacity_units=None, sleep=lambda _s: None)
+
+    unprocessed = scheduler.execute_batch_write(operation, {"T": [item, item]}, 2.0)
+
+    assert unprocessed == {}
+    assert operation.call_args.kwargs["RequestItems"] == {"T": [item]}
+    assert scheduler.get_metrics()["consumed_wcu"] == 2.0
+    assert consumed_units({"ConsumedCapacity": []}, 4.0) == 4.0
+
+
+# ============================================================
+# UPLOAD ENDPOINT
+# ============================================================
+
+
+def _client(dynamodb_helper) -> TestClient:
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1")
+    hackathons = MagicMock()
+    hackathons.get_hackathon.return_value = SimpleNamespace(org_id="O1")
+    app.dependency_overrides[get_submission_service] = lambda: SubmissionService(dynamodb_helper)
+    app.dependency_overrides[get_hackathon_service] = lambda: hackathons
+    app.dependency_overrides[get_current_organizer] = lambda: {"org_id": "O1"}
+    return TestClient(app)
+
+
+def test_upload_endpoint_accepts_csv_and_jsonl(dynamodb_helper):
+    """The content type selects the parser; an all-duplicate upload is a 409."""
+    _seed_hackathon(dynamodb_helper)
+    client = _client(dynamodb_helper)
+    url = "/api/v1/hackathons/H1/submissions/upload"
+
+    csv_response = client.post(
+        url,
+        content="team_name,repo_url\nNova,https://github.com/nova/app\n",
+        headers={"Content-Type": "text/csv"},
+    )
+    jsonl_response = client.post(
+        url + "?format=jsonl",
+        content='{"team_name": "Nova", "repo_url": "https://github.com/Nova/app/"}\n',
+    )
+    unsupported = client.post(url, content="x", headers={"Content-Type": "text/plain"})
+
+    assert csv_response.status_code == 201
+    assert csv_response.json()["created"] == 1
+    assert jsonl_response.status_code == 409
+    assert jsonl_response.json()["detail"]["errors"][0]["row"] == 1
+    assert unsupported.status_code == 415
+
+
+# ============================================================
+# BACKFILL SCRIPT
+# ============================================================
+
+
+def _load_backfill():
+    path = Path(__file__).resolve().parents[2] / "scripts" / "backfill_repo_claims.py"
+    spec = importlib.util.spec_from_file_location("backfill_repo_claims", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_backfill_claims_legacy_submissions(dynamodb_helper):
+    """Submissions created before claims existed get one claim per repository."""
+    for sub_id, repo, created in [
+        ("S1", "https://github.com/a/one", "2026-01-01"),
+        ("S2", "https://github.com/A/one/", "2026-01-02"),
+        ("S3", "https://github.com/a/two", "2026-01-03"),
+    ]:
+        dynamodb_helper.put_submission(
+            {
+                "PK": "HACK#H1",
+                "SK": f"SUB#{sub_id}",
+                "entity_type": "SUBMISSION",
+                "hack_id": "H1",
+                "sub_id": sub_id,
+                "repo_url": repo,
+                "created_at": created,
+            }
+        )
+    backfill = _load_backfill()
+
+    report = backfill.backfill(dynamodb_helper, dry_run=False)
+
+    assert report["claimed"] == 2
+    assert report["repeated"] == {"H1": ["github.com/a/one"]}
+    claim = dynamodb_helper.table.get_item(Key={"PK": "HACK#H1", "SK": "REPO#github.com/a/one"})
+    assert claim["Item"]["sub_id"] == "S1"
+    assert backfill.backfill(dynamodb_helper, dry_run=False)["existing"] == 2
@@ -0,0 +1,123 @@
+"""Unit tests for the analysis pipeline tracer and its trace export."""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.analysis.lambda_handler import finalize_job, store_submission_trace
+from src.analysis.orchestrator import StageTimeline
+from src.services.analysis_service import AnalysisService
+from src.utils.tracing import Tracer, current_span, span, summarize_durations
+
+
+def test_spans_nest_across_executor_threads():
+    """Stages keep their parent span on worker threads; plain submits lose it."""
+    tracer = Tracer("S1")
+    timeline = StageTimeline()
+
+    def stage() -> str:
+        with span("dynamodb.put_item", bytes=512):
+            current_span().set(entity="SCORE")
+        return threading.current_thread().name
+
+    with (
+        tracer.activate(),
+        span("orchestrator_analysis") as root,
+        ThreadPoolExecutor(1, thread_name_prefix="worker") as pool,
+    ):
+        worker = pool.submit(timeline.timed("team_analysis", stage)).result()
+        pool.submit(stage).result()
+
+    spans = {(s.name, s.parent_id): s for s in tracer.spans}
+    team = spans[("team_analysis", root.span_id)]
+    write = spans[("dynamodb.put_item", team.span_id)]
+    assert write.thread_name == worker != root.thread_name
+    assert write.attributes == {"bytes": 512, "entity": "SCORE"}
+    assert root.start_ns <= team.start_ns <= write.start_ns <= write.end_ns <= root.end_ns
+    # Without the context copy no tracer is active on the worker thread
+    assert len(tracer.spans) == 3
+    assert timeline.get("team_analysis") is not None
+
+
+def test_span_is_noop_without_tracer_and_records_errors():
+    """Outside a trace spans cost nothing; inside, escaping exceptions are recorded."""
+    with span("git.clone") as untraced:
+        untraced.set(bytes=1)
+    assert untraced.attributes == {}
+
+    tracer = Tracer("S1")
+    with tracer.activate(), pytest.raises(ValueError), span("git.clone"):
+        raise ValueError("clone failed")
+
+    assert tracer.spans[0].attributes == {"error": "ValueError"}
+    assert tracer.spans[0].parent_id is None
+
+
+def test_chrome_trace_export():
+    """Spans become complete events on labelled thread tracks, in microseconds."""
+    tracer = Tracer("S1")
+    with tracer.activate(), span("submission"), span("agent:bug_hunter", input_tokens=10):
+        pass
+
+    trace = json.loads(json.dumps(tracer.to_chrome_trace()))
+
+    assert trace["otherData"] == {"trace_id": "S1"}
+    metadata = [e for e in trace["traceEvents"] if e["ph"] == "M"]
+    events = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    assert metadata == [
+        {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": 1,
+            "tid": threading.get_ident(),
+            "args": {"name": threading.current_thread().name},
+        }
+    ]
+    assert [(e["name"], e["cat"]) for e in events] == [
+        ("submission", "submission"),
+        ("agent:bug_hunter", "agent"),
+    ]
+    assert events[1]["args"] == {"input_tokens": 10, "span_id": 2, "parent_id": 1}
+    assert events[0]["ts"] <= events[1]["ts"]
+    assert events[1]["ts"] + events[1]["dur"] <= events[0]["ts"] + events[0]["dur"]
+
+
+def test_summarize_durations_uses_nearest_rank():
+    """Percentiles are observed durations, merged across traces."""
+    summary = summarize_durations(
+        [{"git.clone": [1.0, 2.0, 3.0, 4.0, 5.0]}, {"git.clone": [10, 9, 8, 7, 6], "other": []}]
+    )
+
+    assert summary == {"git.clone": {"count": 10, "p50": 5.0, "p90": 9.0, "p99": 10.0, "max": 10.0}}
+    assert summarize_durations([]) == {}
+
+
+def test_job_summary_from_stored_traces(dynamodb_helper, tmp_path, monkeypatch):
+    """Submission traces are stored with their writes traced, then summarized on the job."""
+    monkeypatch.setenv("TRACE_EXPORT_DIR", str(tmp_path))
+    dynamodb_helper.put_analysis_job(
+        {"PK": "HACK#H1", "SK": "JOB#J1", "job_id": "J1", "hack_id": "H1", "status": "running"}
+    )
+    for sub_id in ("S1", "S2"):
+        tracer = Tracer(sub_id)
+        with tracer.activate(), span("submission"):
+            dynamodb_helper.put_team_analysis({"PK": f"SUB#{sub_id}", "SK": "TEAM_ANALYSIS"})
+        store_submission_trace(dynamodb_helper, tracer, "H1", sub_id, "J1")
+        dynamodb_helper.record_job_submission_outcome("H1", "J1", sub_id, True, 0)
+
+    item = dynamodb_helper.table.get_item(Key={"PK": "SUB#S1", "SK": "TRACE"})["Item"]
+    assert item["span_count"] == 2
+    exported = json.loads((tmp_path / "S1.trace.json").read_text())
+    assert exported == json.loads(item["chrome_trace"])
+    write = next(e for e in exported["traceEvents"] if e["name"] == "dynamodb.put_item")
+    assert write["args"]["entity"] == "TEAM_ANALYSIS"
+    assert write["args"]["bytes"] > 0
+
+    finalize_job(AnalysisService(dynamodb_helper), MagicMock(), "H1", "J1")
+
+    job = dynamodb_helper.get_analysis_job("H1", "J1")
+    assert set(job["trace_summary"]) == {"submission", "dynamodb.put_item"}
+    assert job["trace_summary"]["submission"]["count"] == 2
@@ -0,0 +1,116 @@
+"""Unit tests for the write-behind usage buffer."""
+
+from decimal import Decimal
+
+from src.utils.usage_buffer import UsageDelta, UsageWriteBuffer, default_flush_interval
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RecordingWriter:
+    """Collects written deltas; can be told to fail."""
+
+    def __init__(self):
+        self.writes: list[tuple[str, str, UsageDelta]] = []
+        self.fail = False
+
+    def __call__(self, api_key: str, date: str, delta: UsageDelta) -> bool:
+        if self.fail:
+            return False
+        self.writes.append((api_key, date, delta))
+        return True
+
+
+def test_delta_records_and_merges():
+    """Deltas count outcomes, cost and endpoints, and fold together."""
+    delta = UsageDelta()
+    delta.record("/a", 200, 0.01)
+    delta.record("/a", 503)
+    other = UsageDelta()
+    other.record("/b", 302, 0.02)
+
+    delta.merge(other)
+
+    assert (delta.successful, delta.failed, delta.requests) == (2, 1, 3)
+    assert delta.cost_usd == Decimal("0.03")
+    assert delta.endpoints == {"/a": 2, "/b": 1}
+
+
+def test_flush_writes_one_update_per_key():
+    """Requests for the same key and day coalesce into a single write."""
+    writer = RecordingWriter()
+    buffer = UsageWriteBuffer(writer)
+    for _ in range(50):
+        buffer.add("key-a", "2026-01-01", "/x", 200)
+    buffer.add("key-b", "2026-01-01", "/x", 200)
+    buffer.add("key-a", "2026-01-02", "/x", 200)
+
+    assert buffer.flush() == 3
+    by_key = {(k, d): delta for k, d, delta in writer.writes}
+    assert by_key[("key-a", "2026-01-01")].requests == 50
+    assert buffer.pending_keys == 0
+    assert buffer.flush() == 0
+
+
+def test_flush_due_after_interval_or_key_limit():
+    """A flush is due once the interval elapses or too many keys are pending."""
+    clock = FakeClock()
+    buffer = UsageWriteBuffer(
+        RecordingWriter(), flush_interval_seconds=5, max_pending_keys=3, clock=clock
+    )
+    assert not buffer.flush_due()
+
+    buffer.add("k1", "2026-01-01", "/x", 200)
+    assert not buffer.flush_due()
+    clock.now += 5
+    assert buffer.flush_due()
+    assert buffer.maybe_flush() == 1
+
+    for i in range(3):
+        buffer.add(f"k{i}", "2026-01-01", "/x", 200)
+    assert buffer.flush_due()
+
+
+def test_zero_interval_flushes_after_every_request():
+    """Interval 0 (Lambda) makes every buffered request due immediately."""
+    buffer = UsageWriteBuffer(RecordingWriter(), flush_interval_seconds=0, clock=FakeClock())
+    buffer.add("k1", "2026-01-01", "/x", 200)
+
+    assert buffer.flush_due()
+
+
+def test_failed_writes_are_retried_on_next_flush():
+    """A failed write keeps its counts, merged with requests that arrived since."""
+    writer = RecordingWriter()
+    buffer = UsageWriteBuffer(writer)
+    buffer.add("k1", "2026-01-01", "/x", 200)
+    writer.fail = True
+
+    assert buffer.flush() == 0
+    assert buffer.stats["write_failures"] == 1
+
+    buffer.add("k1", "2026-01-01", "/y", 200)
+    writer.fail = False
+    assert buffer.flush() == 1
+    assert writer.writes[0][2].endpoints == {"/x": 1, "/y": 1}
+
+
+def test_default_flush_interval(monkeypatch):
+    """Lambda flushes after every response unless configured otherwise."""
+    monkeypatch.delenv("USAGE_FLUSH_INTERVAL_SECONDS", raising=False)
+    monkeypatch.delenv("AWS_LAMBDA_FUNCTION_NAME", raising=False)
+    assert default_flush_interval() == 5.0
+
+    monkeypatch.setenv("AWS_LAMBDA_FUNCTION_NAME", "api")
+    assert default_flush_interval() == 0.0
+
+    monkeypatch.setenv("USAGE_FLUSH_INTERVAL_SECONDS", "2")
+    assert default_flush_interval() == 2.0
@@ -0,0 +1,389 @@
+"""Unit tests for the SQLite work queue and the queue-backed analyzer worker."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.analysis.worker import AnalysisWorker
+from src.models.common import JobStatus
+from src.utils.work_queue import SQLiteWorkQueue, SQSWorkQueue, get_work_queue
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# ============================================================
+# SQLITE WORK QUEUE
+# ============================================================
+
+
+def test_received_message_is_hidden_until_visibility_expires():
+    """A received message is redelivered only after its visibility timeout."""
+    clock = FakeClock()
+    queue = SQLiteWorkQueue(clock=clock)
+    queue.send({"sub_id": "S1"})
+
+    first = queue.receive(visibility_timeout=30)
+    assert [i.body for i in first] == [{"sub_id": "S1"}]
+    assert queue.receive(visibility_timeout=30) == []
+
+    clock.now += 31
+    again = queue.receive(visibility_timeout=30)
+    assert again[0].receive_count == 2
+    assert again[0].receipt_handle != first[0].receipt_handle
+
+
+def test_delete_and_stale_receipt_handles():
+    """Only the latest receipt handle can delete or extend a message."""
+    clock = FakeClock()
+    queue = SQLiteWorkQueue(clock=clock)
+    queue.send({"sub_id": "S1"})
+    stale = queue.receive(visibility_timeout=10)[0]
+    clock.now += 11
+    current = queue.receive(visibility_timeout=10)[0]
+
+    queue.delete(stale.receipt_handle)
+    assert queue.count() == 1
+
+    queue.delete(current.receipt_handle)
+    assert queue.count() == 0
+
+
+def test_change_visibility_extends_and_releases():
+    """Heartbeats extend the timeout; zero makes the message visible now."""
+    clock = FakeClock()
+    queue = SQLiteWorkQueue(clock=clock)
+    queue.send({"sub_id": "S1"})
+    item = queue.receive(visibility_timeout=10)[0]
+
+    clock.now += 8
+    queue.change_visibility(item.receipt_handle, 10)
+    clock.now += 8
+    assert queue.receive() == []
+
+    queue.change_visibility(item.receipt_handle, 0)
+    assert len(queue.receive()) == 1
+
+
+def test_messages_are_dead_lettered_after_max_receives():
+    """Poison messages stop being delivered after max_receive_count."""
+    queue = SQLiteWorkQueue(max_receive_count=2)
+    queue.send({"sub_id": "S1"})
+
+    for _ in range(2):
+        item = queue.receive()[0]
+        queue.change_visibility(item.receipt_handle, 0)
+
+    assert queue.receive() == []
+    assert queue.count() == 0
+
+
+def test_receive_respects_max_messages_and_order():
+    """Messages are delivered oldest first, at most max_messages at a time."""
+    clock = FakeClock()
+    queue = SQLiteWorkQueue(clock=clock)
+    for i in range(5):
+        clock.now += 1
+        queue.send({"n": i})
+
+    assert [i.body["n"] for i in queue.receive(max_messages=3)] == [0, 1, 2]
+    assert [i.body["n"] for i in queue.receive(max_messages=3)] == [3, 4]
+
+
+def test_get_work_queue_selects_backend():
+    """sqlite:/// URLs are local queues, anything else is SQS."""
+    assert isinstance(get_work_queue("sqlite:///:memory:"), SQLiteWorkQueue)
+    sqs = get_work_queue("https://sqs.us-east-1.amazonaws.com/123/analysis")
+    assert isinstance(sqs, SQSWorkQueue)
+
+
+# ============================================================
+# ANALYSIS WORKER
+# ============================================================
+
+
+def _worker(queue, handler, concurrency=4, **kwargs) -> AnalysisWorker:
+    return AnalysisWorker(
+        queue=queue,
+        concurrency=concurrency,
+        poll_wait_seconds=0.01,
+        executor=ThreadPoolExecutor(max_workers=concurrency),
+        handler=handler,
+        **kwargs,
+    )
+
+
+def test_worker_drains_queue_concurrently():
+    """All items are processed and deleted; throughput scales with concurrency."""
+    queue = SQLiteWorkQueue()
+    for i in range(8):
+        queue.send({"n": i})
+    seen: list[int] = []
+
+    def handler(body):
+        time.sleep(0.05)
+        seen.append(body["n"])
+
+    started = time.perf_counter()
+    stats = _worker(queue, handler, concurrency=4).run(drain=True)
+    elapsed = time.perf_counter() - started
+
+    assert sorted(seen) == list(range(8))
+    assert stats["processed"] == 8
+    assert queue.count() == 0
+    assert elapsed < 8 * 0.05
+
+
+def _double(body):
+    return body["n"] * 2
+
+
+def test_worker_default_process_pool():
+    """Without an injected executor the worker runs items in its own process pool."""
+    queue = SQLiteWorkQueue()
+    for i in range(3):
+        queue.send({"n": i})
+
+    stats = AnalysisWorker(queue=queue, concurrency=2, poll_wait_seconds=0.01, handler=_double).run(
+        drain=True
+    )
+
+    assert stats["processed"] == 3
+    assert queue.count() == 0
+
+
+def test_worker_releases_failed_items_for_redelivery():
+    """A handler error puts the item back on the queue instead of deleting it."""
+    queue = SQLiteWorkQueue(max_receive_count=3)
+    queue.send({"n": 1})
+    attempts: list[int] = []
+
+    def handler(body):
+        attempts.append(1)
+        if len(attempts) < 2:
+            raise RuntimeError("transient")
+
+    stats = _worker(queue, handler, concurrency=1).run(drain=True)
+
+    assert len(attempts) == 2
+    assert stats["errors"] == 1
+    assert stats["released"] == 1
+    assert stats["processed"] == 1
+    assert queue.count() == 0
+
+
+def test_worker_heartbeats_long_running_items():
+    """Visibility is extended while an item takes longer than half the timeout."""
+    clock = FakeClock()
+    queue = MagicMock()
+    source = SQLiteWorkQueue(clock=clock)
+    source.send({"n": 1})
+    received = source.receive(visibility_timeout=10)
+    queue.receive.side_effect = [received] + [[]] * 100
+    release = threading.Event()
+
+    def handler(body):
+        release.wait(5)
+
+    worker = _worker(queue, handler, concurrency=1, visibility_timeout=10, clock=clock)
+    runner = threading.Thread(target=worker.run, kwargs={"drain": True})
+    runner.start()
+    time.sleep(0.05)
+    clock.now += 6
+    time.sleep(0.05)
+    release.set()
+    runner.join(5)
+
+    assert worker.stats["heartbeats"] >= 1
+    queue.change_visibility.assert_any_call(received[0].receipt_handle, 10)
+    queue.delete.assert_called_once_with(received[0].receipt_handle)
+
+
+def test_worker_shutdown_lets_in_flight_items_finish():
+    """After a shutdown request no new items are received; running ones complete."""
+    queue = SQLiteWorkQueue()
+    for i in range(4):
+        queue.send({"n": i})
+    started = threading.Event()
+    finished: list[int] = []
+
+    def handler(body):
+        started.set()
+        time.sleep(0.1)
+        finished.append(body["n"])
+
+    worker = _worker(queue, handler, concurrency=1)
+    runner = threading.Thread(target=worker.run)
+    runner.start()
+    started.wait(5)
+    worker.request_shutdown()
+    runner.join(5)
+
+    assert not runner.is_alive()
+    assert len(finished) == 1
+    assert worker.stats["processed"] == 1
+    assert queue.count() == 3
+
+
+# ============================================================
+# END TO END (moto)
+# ============================================================
+
+
+def test_queue_mode_job_runs_to_completion(dynamodb_helper, monkeypatch):
+    """Enqueued submissions are analyzed by workers and the job finalized once."""
+    from src.analysis import worker as worker_module
+    from src.services.analysis_service import AnalysisService
+
+    monkeypatch.setattr(worker_module, "_services", None)
+    monkeypatch.setenv("ANALYSIS_QUEUE_URL", "sqlite:///:memory:")
+    dynamodb_helper.table.put_item(Item={"PK": "HACK#H1", "SK": "META", "hack_id": "H1"})
+
+    service = AnalysisService(dynamodb_helper)
+    job = service.trigger_analysis("H1", ["S1", "S2", "S3"])
+
+    result = {
+        "success": True,
+        "overall_score": 70.0,
+        "dimension_scores": {},
+        "weighted_scores": {},
+        "recommendation": "solid_submission",
+        "confidence": 0.8,
+        "agent_scores": {},
+        "strengths": [],
+        "weaknesses": [],
+        "repo_meta": {},
+        "cost": 0.02,
+        "tokens": 10,
+        "duration_ms": 5,
+        "cost_records": [],
+    }
+    summary = MagicMock()
+    with (
+        patch.object(worker_module, "get_dynamodb_helper", return_value=dynamodb_helper),
+        patch.object(worker_module.HackathonService, "get_hackathon", return_value=MagicMock()),
+        patch.object(
+            worker_module.SubmissionService,
+            "get_submission",
+            side_effect=lambda sub_id: MagicMock(sub_id=sub_id, team_name=f"Team {sub_id}"),
+        ),
+        patch.object(worker_module.SubmissionService, "update_submission_status"),
+        patch.object(worker_module.SubmissionService, "update_submission_with_scores"),
+        patch.object(worker_module.CostService, "update_hackathon_cost_summary", summary),
+        patch("src.analysis.lambda_handler.analyze_single_submission", return_value=result),
+    ):
+        stats = _worker(service.work_queue, worker_module.run_work_item, concurrency=3).run(
+            drain=True
+        )
+
+    record = dynamodb_helper.get_analysis_job("H1", job.job_id)
+    assert stats["processed"] == 3
+    assert record["status"] == "completed"
+    assert record["completed_submissions"] == 3
+    assert record["total_cost_usd"] == Decimal("0.06")
+    assert summary.call_count == 1
+
+
+def test_queue_mode_job_without_submissions_completes_at_once(dynamodb_helper, monkeypatch):
+    """A job with nothing to enqueue is completed rather than left for workers to finalize."""
+    from src.services.analysis_service import AnalysisService
+
+    monkeypatch.setenv("ANALYSIS_QUEUE_URL", "sqlite:///:memory:")
+    dynamodb_helper.table.put_item(Item={"PK": "HACK#H1", "SK": "META", "hack_id": "H1"})
+    service = AnalysisService(dynamodb_helper)
+
+    reservation = {"amount": "0.5", "levels": [{"entity_type": "hackathon", "entity_id": "H1"}]}
+    with patch("src.services.analysis_service.BudgetService") as budget:
+        job = service.trigger_analysis("H1", [], budget_reservation=reservation)
+
+    record = dynamodb_helper.get_analysis_job("H1", job.job_id)
+    assert job.status == JobStatus.COMPLETED
+    assert record["status"] == "completed"
+    assert "budget_reservation" not in record
+    assert service.work_queue.receive(10) == []
+    # The hackathon was never locked, and the reservation was returned
+    assert "analysis_status" not in dynamodb_helper.get_hackathon("H1")
+    released = budget.return_value.release.call_args.args[0]
+    assert (released.amount, released.levels) == (0.5, [("hackathon", "H1")])
+
+
+def test_queue_mode_job_fails_when_a_message_cannot_be_sent(dynamodb_helper, monkeypatch):
+    """A failed enqueue fails the job, unlocks the hackathon and hands back the reservation."""
+    from src.analysis import worker as worker_module
+    from src.services.analysis_service import AnalysisService
+
+    monkeypatch.setattr(worker_module, "_services", None)
+    monkeypatch.setenv("ANALYSIS_QUEUE_URL", "sqlite:///:memory:")
+    dynamodb_helper.table.put_item(Item={"PK": "HACK#H1", "SK": "META", "hack_id": "H1"})
+    service = AnalysisService(dynamodb_helper)
+    queue = service.work_queue
+    send = queue.send
+
+    def flaky_send(body):
+        if body["sub_id"] == "S2":
+            raise OSError("queue unavailable")
+        return send(body)
+
+    monkeypatch.setattr(queue, "send", flaky_send)
+
+    reservation = {"amount": "0.5", "levels": [{"entity_type": "hackathon", "entity_id": "H1"}]}
+    with (
+        patch("src.services.analysis_service.BudgetService") as budget,
+        pytest.raises(RuntimeError, match="submission 2 of 3"),
+    ):
+        service.trigger_analysis("H1", ["S1", "S2", "S3"], budget_reservation=reservation)
+
+    job = dynamodb_helper.get_latest_analysis_job("H1")
+    assert job["status"] == JobStatus.FAILED.value
+    assert "budget_reservation" not in job
+    assert dynamodb_helper.get_hackathon("H1")["analysis_status"] == "not_started"
+    # The request's failure response releases the reservation, not the job
+    budget.return_value.reconcile.assert_not_called()
+    budget.return_value.release.assert_not_called()
+
+    # The message sent before the failure is acknowledged without analysis
+    (item,) = queue.receive(10)
+    with (
+        patch.object(worker_module, "get_dynamodb_helper", return_value=dynamodb_helper),
+        patch.object(worker_module, "process_submission") as process,
+    ):
+        assert worker_module.run_work_item(item.body)["status"] == "job_failed"
+    process.assert_not_called()
+
+
+@pytest.mark.parametrize("processed", [["S1"], []])
+def test_run_work_item_skips_duplicates_and_unknown_jobs(dynamodb_helper, monkeypatch, processed):
+    """Redelivered messages are acknowledged without analyzing again."""
+    from src.analysis import worker as worker_module
+
+    monkeypatch.setattr(worker_module, "_services", None)
+    if processed:
+        dynamodb_helper.put_analysis_job(
+            {
+                "PK": "HACK#H1",
+                "SK": "JOB#J1",
+                "job_id": "J1",
+                "hack_id": "H1",
+                "processed_submission_ids": processed,
+            }
+        )
+
+    with (
+        patch.object(worker_module, "get_dynamodb_helper", return_value=dynamodb_helper),
+        patch.object(worker_module, "process_submission") as process,
+    ):
+        outcome = worker_module.run_work_item({"job_id": "J1", "hack_id": "H1", "sub_id": "S1"})
+
+    assert outcome["status"] == ("duplicate" if processed else "job_not_found")
+    process.assert_not_called()
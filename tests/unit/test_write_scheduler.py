@@ -0,0 +1,147 @@
+"""Unit tests for the capacity-aware DynamoDB write scheduler."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.utils.write_scheduler import (
+    DynamoDBWriteScheduler,
+    TokenBucket,
+    estimate_write_units,
+    get_write_scheduler,
+)
+
+
+def _client_error(code: str) -> ClientError:
+    return ClientError({"Error": {"Code": code, "Message": code}}, "PutItem")
+
+
+class FakeClock:
+    """Manual clock whose sleep advances time."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_paces_to_rate():
+    """Draining the burst forces waits proportional to the refill rate."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=5, capacity=5, clock=clock, sleep=clock.sleep)
+
+    for _ in range(5):
+        assert bucket.acquire(1) == 0
+    waited = bucket.acquire(5)
+
+    assert waited == pytest.approx(1.0)
+    assert clock.now == pytest.approx(1.0)
+
+
+def test_token_bucket_adjust_debits_overconsumption():
+    """Consumed capacity above the estimate is debited from the bucket."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1, capacity=2, clock=clock, sleep=clock.sleep)
+    bucket.acquire(1)
+    bucket.adjust(-3)
+
+    assert bucket.tokens == pytest.approx(-2)
+    assert bucket.acquire(1) == pytest.approx(3.0)
+
+
+def test_scheduler_requests_consumed_capacity_and_meters_it():
+    """Writes ask for ConsumedCapacity and record it in metrics."""
+    operation = MagicMock(return_value={"ConsumedCapacity": {"CapacityUnits": 3.0}})
+    scheduler = DynamoDBWriteScheduler(write_capacity_units=None)
+
+    scheduler.execute(operation, estimated_units=1.0, Item={"PK": "x"})
+
+    operation.assert_called_once_with(Item={"PK": "x"}, ReturnConsumedCapacity="TOTAL")
+    metrics = scheduler.get_metrics()
+    assert metrics["writes"] == 1
+    assert metrics["consumed_wcu"] == 3.0
+
+
+def test_scheduler_retries_throttled_writes():
+    """Throttled writes are retried with backoff instead of being dropped."""
+    sleeps: list[float] = []
+    operation = MagicMock(
+        side_effect=[
+            _client_error("ProvisionedThroughputExceededException"),
+            _client_error("ThrottlingException"),
+            {},
+        ]
+    )
+    scheduler = DynamoDBWriteScheduler(write_capacity_units=None, sleep=sleeps.append)
+
+    scheduler.execute(operation, Item={"PK": "x"})
+
+    assert operation.call_count == 3
+    assert len(sleeps) == 2
+    metrics = scheduler.get_metrics()
+    assert metrics["throttled"] == 2
+    assert metrics["retries"] == 2
+    assert metrics["failed"] == 0
+
+
+def test_scheduler_gives_up_after_max_retries():
+    """Persistent throttling surfaces the ClientError after max_retries."""
+    operation = MagicMock(side_effect=_client_error("ThrottlingException"))
+    scheduler = DynamoDBWriteScheduler(
+        write_capacity_units=None, max_retries=2, sleep=lambda _s: None
+    )
+
+    with pytest.raises(ClientError):
+        scheduler.execute(operation, Item={"PK": "x"})
+
+    assert operation.call_count == 3
+    assert scheduler.get_metrics()["failed"] == 1
+
+
+def test_scheduler_does_not_retry_validation_errors():
+    """Non-throttling errors fail immediately."""
+    operation = MagicMock(side_effect=_client_error("ValidationException"))
+    scheduler = DynamoDBWriteScheduler(write_capacity_units=None)
+
+    with pytest.raises(ClientError):
+        scheduler.execute(operation, Item={"PK": "x"})
+
+    assert operation.call_count == 1
+
+
+def test_estimate_write_units_rounds_up_per_kb():
+    """WCU estimate is one unit per started KB, minimum one."""
+    assert estimate_write_units(0) == 1
+    assert estimate_write_units(1024) == 1
+    assert estimate_write_units(1025) == 2
+
+
+def test_scheduler_paces_at_its_share_of_table_capacity(monkeypatch):
+    """Concurrent writers split the table's WCUs instead of each taking all of them."""
+    monkeypatch.setattr("src.utils.write_scheduler._schedulers", {})
+    monkeypatch.setenv("DYNAMODB_WRITE_CAPACITY_UNITS", "8")
+    monkeypatch.setenv("DYNAMODB_WRITE_CONCURRENCY", "4")
+
+    scheduler = get_write_scheduler("table-a")
+
+    assert scheduler.write_capacity_units == 2
+    assert scheduler.bucket is not None and scheduler.bucket.rate == 2
+
+    monkeypatch.delenv("DYNAMODB_WRITE_CONCURRENCY")
+    assert get_write_scheduler("table-b").write_capacity_units == 8
+
+
+def test_helper_put_goes_through_scheduler(dynamodb_helper):
+    """DynamoDBHelper writes are metered by the shared scheduler."""
+    before = dynamodb_helper.write_scheduler.get_metrics()["writes"]
+
+    assert dynamodb_helper.put_organizer({"PK": "ORG#1", "SK": "PROFILE", "org_id": "1"})
+
+    assert dynamodb_helper.write_scheduler.get_metrics()["writes"] == before + 1